@@ -1,7 +1,4 @@
 from dependency_injector import containers, providers
-from sqlalchemy.ext.asyncio.engine import AsyncEngine
-from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.orm.session import sessionmaker
 
 from src.apps.assets_journal.infrastructure.repositories.stationary_asset_repository import (
     StationaryAssetRepositoryImpl,
@@ -12,6 +9,7 @@ from src.apps.assets_journal.services.stationary_asset_service import (
 from src.apps.assets_journal.uow import AssetsJournalUnitOfWorkImpl
 from src.apps.catalogs.services.medical_organizations_catalog_service import MedicalOrganizationsCatalogService
 from src.apps.patients.services.patients_service import PatientService
+from src.core.database.session import ScopedAsyncSession
 from src.core.logger import LoggerService
 
 
@@ -28,26 +26,12 @@ class AssetsJournalContainer(containers.DeclarativeContainer):
 
     # Зависимости из основного контейнера
     logger = providers.Dependency(instance_of=LoggerService)
-    engine = providers.Dependency(instance_of=AsyncEngine)
+    async_db_session = providers.Dependency(instance_of=ScopedAsyncSession)
 
     # Зависимости от других модулей
     patients_service = providers.Dependency(instance_of=PatientService)
     medical_organizations_catalog_service = providers.Dependency(instance_of=MedicalOrganizationsCatalogService)
 
-    # Фабрика сессий
-    session_factory = providers.Singleton(
-        sessionmaker,
-        bind=engine,
-        expire_on_commit=False,
-        class_=AsyncSession
-    )
-
-    # Асинхронная сессия БД
-    async_db_session = providers.Singleton(
-        lambda session_factory: session_factory(),
-        session_factory
-    )
-
     # Unit of Work
     unit_of_work = providers.Factory(
         AssetsJournalUnitOfWorkImpl,
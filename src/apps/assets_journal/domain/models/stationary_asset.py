@@ -6,13 +6,45 @@ from src.apps.assets_journal.domain.enums import (
     AssetDeliveryStatusEnum,
     AssetStatusEnum,
 )
+from src.shared.helpers.change_tracking import ChangeTrackingMixin
 
 
-class StationaryAssetDomain:
+class StationaryAssetDomain(ChangeTrackingMixin):
     """
     Доменная модель актива стационара
     """
 
+    # Без __dict__ у экземпляров: списки строят доменный объект на каждую строку
+    __slots__ = (
+        "id",
+        "bg_asset_id",
+        "card_number",
+        "organization_id",
+        "patient_id",
+        "receive_date",
+        "receive_time",
+        "actual_datetime",
+        "received_from",
+        "is_repeat",
+        "stay_period_start",
+        "stay_period_end",
+        "stay_outcome",
+        "diagnosis",
+        "area",
+        "specialization",
+        "specialist",
+        "note",
+        "status",
+        "delivery_status",
+        "has_confirm",
+        "has_files",
+        "has_refusal",
+        "created_at",
+        "updated_at",
+        "patient_data",
+        "organization_data",
+    )
+
     def __init__(
             self,
             *,
@@ -94,6 +126,7 @@ class StationaryAssetDomain:
 
         self.patient_data = patient_data
         self.organization_data = organization_data
+        self.mark_clean()
 
     def update_status(self, new_status: AssetStatusEnum) -> None:
         """Обновить статус актива"""
@@ -192,13 +225,36 @@ class StationaryAssetDomain:
 
 class StationaryAssetListItemDomain:
     """
-    Доменная модель для списка активов стационара
+    Доменная модель для списка активов стационара (только для чтения):
+    содержит лишь колонки, которые отдает элемент списка
     """
 
+    __slots__ = (
+        "id",
+        "card_number",
+        "organization_id",
+        "organization_name",
+        "patient_id",
+        "patient_full_name",
+        "patient_iin",
+        "patient_birth_date",
+        "diagnosis_name",
+        "specialization",
+        "specialist",
+        "area",
+        "status",
+        "delivery_status",
+        "receive_date",
+        "receive_time",
+        "created_at",
+        "updated_at",
+    )
+
     def __init__(
             self,
             id: UUID,
             card_number: Optional[str],
+            organization_id: Optional[int],
             organization_name: Optional[str],
             patient_id: UUID,
             patient_full_name: str,
@@ -217,6 +273,7 @@ class StationaryAssetListItemDomain:
     ):
         self.id = id
         self.card_number = card_number
+        self.organization_id = organization_id
         self.organization_name = organization_name
         self.patient_id = patient_id
         self.patient_full_name = patient_full_name
@@ -1,5 +1,5 @@
 from datetime import datetime, time
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from uuid import UUID
 
 from pydantic import BaseModel, Field, computed_field
@@ -150,9 +150,11 @@ class StationaryAssetDetailResponseSchema(BaseModel):
     item: StationaryAssetResponseSchema
 
 
-class StationaryAssetStatisticsSchema(BaseModel):
-    """Схема статистики активов стационара"""
+class StationaryAssetStatisticsGroupSchema(BaseModel):
+    """Схема статистики активов стационара по группе"""
 
+    # ID организации, специализация, участок или месяц (YYYY-MM)
+    key: Union[int, str, None]
     total_assets: int
     confirmed_assets: int
     refused_assets: int
@@ -160,6 +162,22 @@ class StationaryAssetStatisticsSchema(BaseModel):
     assets_with_files: int
 
 
+class StationaryAssetStatisticsSchema(BaseModel):
+    """Схема статистики активов стационара"""
+
+    total_assets: int = 0
+    confirmed_assets: int = 0
+    refused_assets: int = 0
+    pending_assets: int = 0
+    assets_with_files: int = 0
+
+    # Разбивки, посчитанные тем же запросом
+    by_organization: List[StationaryAssetStatisticsGroupSchema] = Field(default_factory=list)
+    by_specialization: List[StationaryAssetStatisticsGroupSchema] = Field(default_factory=list)
+    by_area: List[StationaryAssetStatisticsGroupSchema] = Field(default_factory=list)
+    by_month: List[StationaryAssetStatisticsGroupSchema] = Field(default_factory=list)
+
+
 class StationaryAssetsByOrganizationResponseSchema(BaseModel):
     """Схема ответа для активов по организации"""
 
@@ -179,4 +197,16 @@ class PatientStationaryAssetsResponseSchema(BaseModel):
     patient_iin: str
     total_assets: int
     items: List[StationaryAssetListItemSchema]
-    pagination: PaginationMetaDataSchema
\ No newline at end of file
+    pagination: PaginationMetaDataSchema
+
+
+class BgIngestionReportSchema(BaseModel):
+    """Схема отчета о загрузке активов из BG"""
+
+    total_rows: int = 0
+    inserted: int = 0
+    skipped_existing: int = 0
+    unmatched_patients: int = 0
+    invalid_rows: int = 0
+    duration_seconds: float = 0
+    rows_per_second: float = 0
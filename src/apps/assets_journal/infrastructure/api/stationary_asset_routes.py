@@ -1,5 +1,5 @@
 import math
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
@@ -14,6 +14,7 @@ from src.apps.assets_journal.infrastructure.api.schemas.requests.stationary_asse
     UpdateStationaryAssetSchema, CreateStationaryAssetByPatientIdSchema, TransferStationaryAssetSchema,
 )
 from src.apps.assets_journal.infrastructure.api.schemas.responses.stationary_asset_schemas import (
+    BgIngestionReportSchema,
     MultipleStationaryAssetsResponseSchema,
     StationaryAssetResponseSchema,
     StationaryAssetListItemSchema,
@@ -23,6 +24,7 @@ from src.apps.assets_journal.infrastructure.api.schemas.responses.stationary_ass
 from src.apps.assets_journal.mappers import (
     map_stationary_asset_domain_to_full_response,
     map_stationary_asset_domain_to_list_item,
+    map_stationary_asset_list_item_to_schema,
 )
 from src.apps.assets_journal.services.stationary_asset_service import (
     StationaryAssetService,
@@ -82,18 +84,38 @@ async def get_stationary_assets(
         Provide[AssetsJournalContainer.stationary_asset_service]
     ),
 ) -> MultipleStationaryAssetsResponseSchema:
-    """Получить список активов стационара с фильтрацией и пагинацией"""
-    assets, total_count = await stationary_asset_service.get_assets(
-        pagination_params=pagination_params,
-        filter_params=filter_params,
-    )
+    """
+    Получить список активов стационара с фильтрацией и пагинацией.
+    При переданном `cursor` используется курсорная пагинация (next_cursor / prev_cursor).
+    """
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+    if pagination_params.is_cursor_mode:
+        cursor_page, total_count = await stationary_asset_service.get_assets_by_cursor(
+            pagination_params=pagination_params,
+            filter_params=filter_params,
+        )
+        assets = cursor_page.items
+        next_cursor, prev_cursor = cursor_page.next_cursor, cursor_page.prev_cursor
+    else:
+        assets, total_count = await stationary_asset_service.get_assets(
+            pagination_params=pagination_params,
+            filter_params=filter_params,
+        )
 
     # Вычисляем метаданные пагинации
     page: int = pagination_params.page or 1
     limit: int = pagination_params.limit or 30
-    total_pages = math.ceil(total_count / limit) if limit else 1
-    has_next = page < total_pages
-    has_prev = page > 1
+    # В курсорном режиме общее количество считается только по запросу
+    total_pages: Optional[int] = None
+    if total_count is not None:
+        total_pages = math.ceil(total_count / limit) if limit else 1
+    if pagination_params.is_cursor_mode:
+        has_next, has_prev = next_cursor is not None, prev_cursor is not None
+    else:
+        has_next = page < total_pages
+        has_prev = page > 1
 
     pagination_metadata = PaginationMetaDataSchema(
         current_page=page,
@@ -102,10 +124,12 @@ async def get_stationary_assets(
         total_pages=total_pages,
         has_next=has_next,
         has_prev=has_prev,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
     )
 
     return MultipleStationaryAssetsResponseSchema(
-        items=[map_stationary_asset_domain_to_list_item(asset) for asset in assets],
+        items=[map_stationary_asset_list_item_to_schema(asset) for asset in assets],
         pagination=pagination_metadata,
     )
 
@@ -167,7 +191,7 @@ async def get_stationary_assets_by_organization(
         organization_name=organization.name,
         organization_code=organization.code,
         total_assets=total_count,
-        items=[map_stationary_asset_domain_to_list_item(asset) for asset in assets],
+        items=[map_stationary_asset_list_item_to_schema(asset) for asset in assets],
         pagination=pagination_metadata,
     )
 
@@ -226,7 +250,7 @@ async def get_stationary_assets_by_patient(
         patient_full_name=f"{patient.last_name} {patient.first_name} {patient.middle_name or ''}".strip(),
         patient_iin=patient.iin,
         total_assets=total_count,
-        items=[map_stationary_asset_domain_to_list_item(asset) for asset in assets],
+        items=[map_stationary_asset_list_item_to_schema(asset) for asset in assets],
         pagination=pagination_metadata,
     )
 
@@ -384,7 +408,7 @@ async def confirm_stationary_asset(
 
 @stationary_assets_router.post(
     "/stationary-assets/load-from-bg",
-    response_model=List[StationaryAssetListItemSchema],
+    response_model=BgIngestionReportSchema,
     summary="Загрузить активы из файла BG (временно)",
     # dependencies=[
     #     Depends(
@@ -399,13 +423,12 @@ async def load_stationary_assets_from_bg(
     stationary_asset_service: StationaryAssetService = Depends(
         Provide[AssetsJournalContainer.stationary_asset_service]
     ),
-) -> List[StationaryAssetListItemSchema]:
+) -> BgIngestionReportSchema:
     """
     Загрузить активы из файла BG (временная функция для тестирования)
     Позже будет заменена на интеграцию с BG API
     """
-    assets = await stationary_asset_service.load_assets_from_bg_file()
-    return [map_stationary_asset_domain_to_list_item(asset) for asset in assets]
+    return await stationary_asset_service.load_assets_from_bg_file()
 
 
 @stationary_assets_router.post(
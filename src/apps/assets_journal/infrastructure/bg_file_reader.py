@@ -0,0 +1,76 @@
+import asyncio
+import codecs
+import json
+from pathlib import Path
+from typing import AsyncIterator, Union
+
+READ_BLOCK_SIZE = 1 << 16  # 64 KiB
+
+_WHITESPACE = " \t\n\r"
+
+
+async def read_bg_items(
+        file_path: Union[str, Path],
+        block_size: int = READ_BLOCK_SIZE,
+) -> AsyncIterator[dict]:
+    """
+    Потоково прочитать JSON-массив активов из файла BG
+
+    Файл читается блоками, элементы массива разбираются по мере поступления,
+    поэтому в памяти находится только текущий блок, а не весь файл.
+
+    :param file_path: Путь к JSON файлу с данными BG
+    :param block_size: Размер читаемого блока в байтах
+    :raises json.JSONDecodeError: Если файл не является JSON-массивом объектов
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    position = 0
+    array_started = False
+
+    with open(file_path, "rb") as file:
+        while True:
+            block = await asyncio.to_thread(file.read, block_size)
+            is_last_block = not block
+            # Уже разобранная часть буфера больше не нужна
+            buffer = buffer[position:] + text_decoder.decode(block, final=is_last_block)
+            position = 0
+
+            while True:
+                while position < len(buffer) and buffer[position] in _WHITESPACE:
+                    position += 1
+                if position == len(buffer):
+                    break
+
+                char = buffer[position]
+                if not array_started:
+                    if char != "[":
+                        raise json.JSONDecodeError("Ожидался JSON-массив", buffer, position)
+                    array_started = True
+                    position += 1
+                    continue
+
+                if char == ",":
+                    position += 1
+                    continue
+
+                if char == "]":
+                    return
+
+                try:
+                    item, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if is_last_block:
+                        raise
+                    # Элемент не поместился в блок, дочитываем файл
+                    break
+
+                if not isinstance(item, dict):
+                    raise json.JSONDecodeError("Ожидался JSON-объект", buffer, position)
+
+                yield item
+                position = end
+
+            if is_last_block:
+                raise json.JSONDecodeError("Незавершенный JSON-массив", buffer, position)
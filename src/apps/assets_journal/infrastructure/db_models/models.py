@@ -1,6 +1,6 @@
 from datetime import datetime, time
 
-from sqlalchemy import Boolean, DateTime, Enum, String, Text, Time, ForeignKey, Integer
+from sqlalchemy import and_, Boolean, DateTime, Enum, String, Text, Time, ForeignKey, Integer, Index, func
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -101,4 +101,62 @@ class StationaryAsset(Base, PrimaryKey, CreatedAtMixin, ChangedAtMixin):
         "SQLAlchemyPatient",
         foreign_keys=[patient_id],
         lazy="joined",
-    )
\ No newline at end of file
+    )
+
+
+# Курсорная пагинация журнала: сначала новые (дата регистрации или дата создания), затем id
+Index(
+    "ix_stationary_assets_sort_date_id",
+    func.coalesce(StationaryAsset.reg_date, StationaryAsset.created_at).desc(),
+    StationaryAsset.id.desc(),
+)
+
+# Статистика за период: index-only scan по дате регистрации с колонками разбивок и флагами
+Index(
+    "ix_stationary_assets_reg_date_statistics",
+    StationaryAsset.reg_date,
+    postgresql_include=[
+        "created_at",
+        "organization_id",
+        "specialization",
+        "area",
+        "has_confirm",
+        "has_refusal",
+        "has_files",
+    ],
+)
+
+# Частичные индексы для небольших срезов журнала: ожидающие решения и отказы
+Index(
+    "ix_stationary_assets_pending_reg_date",
+    StationaryAsset.reg_date,
+    postgresql_where=and_(~StationaryAsset.has_confirm, ~StationaryAsset.has_refusal),
+)
+Index(
+    "ix_stationary_assets_refused_reg_date",
+    StationaryAsset.reg_date,
+    postgresql_where=StationaryAsset.has_refusal,
+)
+
+# Активы пациента и фильтры журнала по пациенту (ФИО / ИИН ищутся в пациентах)
+Index("ix_stationary_assets_patient_id", StationaryAsset.patient_id)
+
+# Фильтры журнала по подстроке (ILIKE '%...%'): триграммные индексы pg_trgm
+Index(
+    "ix_stationary_assets_specialization_trgm",
+    StationaryAsset.specialization,
+    postgresql_using="gin",
+    postgresql_ops={"specialization": "gin_trgm_ops"},
+)
+Index(
+    "ix_stationary_assets_specialist_trgm",
+    StationaryAsset.specialist,
+    postgresql_using="gin",
+    postgresql_ops={"specialist": "gin_trgm_ops"},
+)
+Index(
+    "ix_stationary_assets_stay_outcome_trgm",
+    StationaryAsset.stay_outcome,
+    postgresql_using="gin",
+    postgresql_ops={"stay_outcome": "gin_trgm_ops"},
+)
@@ -1,12 +1,17 @@
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import func, inspect, literal_column, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, selectinload
 
-from src.apps.assets_journal.domain.models.stationary_asset import StationaryAssetDomain
+from src.apps.assets_journal.domain.models.stationary_asset import (
+    StationaryAssetDomain,
+    StationaryAssetListItemDomain,
+)
 from src.apps.assets_journal.infrastructure.api.schemas.responses.stationary_asset_schemas import (
+    StationaryAssetStatisticsGroupSchema,
     StationaryAssetStatisticsSchema,
 )
 from src.apps.assets_journal.infrastructure.db_models.models import StationaryAsset
@@ -16,10 +21,92 @@ from src.apps.assets_journal.interfaces.repository_interfaces import (
 from src.apps.assets_journal.mappers import (
     map_stationary_asset_db_to_domain,
     map_stationary_asset_domain_to_db,
+    map_stationary_asset_row_to_list_item,
+)
+from src.apps.catalogs.infrastructure.db_models.models import (
+    SQLAlchemyMedicalOrganizationsCatalogue,
 )
 from src.apps.patients.infrastructure.db_models.patients import SQLAlchemyPatient
 from src.core.logger import LoggerService
 from src.shared.infrastructure.base import BaseRepository
+from src.shared.infrastructure.keyset_pagination import (
+    CursorPage,
+    apply_keyset_pagination,
+    build_cursor_page,
+)
+
+# Колонки актива, заполняемые при загрузке из BG (id и reg_date - по умолчанию)
+BG_INSERT_COLUMNS = (
+    "bg_asset_id",
+    "card_number",
+    "organization_id",
+    "patient_id",
+    "receive_date",
+    "receive_time",
+    "actual_datetime",
+    "received_from",
+    "is_repeat",
+    "stay_period_start",
+    "stay_period_end",
+    "stay_outcome",
+    "diagnosis",
+    "area",
+    "specialization",
+    "specialist",
+    "note",
+    "status",
+    "delivery_status",
+    "has_confirm",
+    "has_files",
+    "has_refusal",
+)
+
+# Колонки элемента списка активов: только то, что отдает ответ списка,
+# пациент и организация - колонками тех же строк (без ORM-сущностей)
+ASSET_LIST_ITEM_COLUMNS = (
+    StationaryAsset.id,
+    StationaryAsset.card_number,
+    StationaryAsset.organization_id,
+    StationaryAsset.patient_id,
+    StationaryAsset.diagnosis,
+    StationaryAsset.specialization,
+    StationaryAsset.specialist,
+    StationaryAsset.area,
+    StationaryAsset.status,
+    StationaryAsset.delivery_status,
+    StationaryAsset.receive_date,
+    StationaryAsset.receive_time,
+    StationaryAsset.created_at,
+    StationaryAsset.changed_at,
+    SQLAlchemyMedicalOrganizationsCatalogue.name.label("organization_name"),
+    SQLAlchemyPatient.id.label("patient_ref_id"),
+    SQLAlchemyPatient.iin.label("patient_iin"),
+    SQLAlchemyPatient.first_name.label("patient_first_name"),
+    SQLAlchemyPatient.last_name.label("patient_last_name"),
+    SQLAlchemyPatient.middle_name.label("patient_middle_name"),
+    SQLAlchemyPatient.date_of_birth.label("patient_date_of_birth"),
+)
+
+# Разбивки статистики активов (GROUPING SETS одного запроса)
+STATISTICS_BREAKDOWNS = {
+    "by_organization": StationaryAsset.organization_id,
+    "by_specialization": StationaryAsset.specialization,
+    "by_area": StationaryAsset.area,
+    "by_month": func.date_trunc(
+        literal_column("'month'"),
+        func.coalesce(StationaryAsset.reg_date, StationaryAsset.created_at),
+    ),
+}
+
+STATISTICS_COUNTERS = (
+    func.count().label("total_assets"),
+    func.count().filter(StationaryAsset.has_confirm.is_(True)).label("confirmed_assets"),
+    func.count().filter(StationaryAsset.has_refusal.is_(True)).label("refused_assets"),
+    func.count()
+    .filter(StationaryAsset.has_confirm.is_(False), StationaryAsset.has_refusal.is_(False))
+    .label("pending_assets"),
+    func.count().filter(StationaryAsset.has_files.is_(True)).label("assets_with_files"),
+)
 
 
 class StationaryAssetRepositoryImpl(BaseRepository, StationaryAssetRepositoryInterface):
@@ -65,14 +152,9 @@ class StationaryAssetRepositoryImpl(BaseRepository, StationaryAssetRepositoryInt
             filters: Dict[str, any],
             page: int = 1,
             limit: int = 30,
-    ) -> List[StationaryAssetDomain]:
-        query = (
-            select(StationaryAsset)
-            .options(
-                joinedload(StationaryAsset.patient),
-                joinedload(StationaryAsset.organization),
-            )
-        )
+    ) -> List[StationaryAssetListItemDomain]:
+        # Пациент и организация выбираются колонками того же запроса
+        query = self._select_asset_rows()
 
         # Применяем фильтры
         query = self._apply_filters(query, filters)
@@ -84,10 +166,42 @@ class StationaryAssetRepositoryImpl(BaseRepository, StationaryAssetRepositoryInt
         offset = (page - 1) * limit
         query = query.offset(offset).limit(limit)
 
-        result = await self._async_db_session.execute(query)
-        assets = result.scalars().all()
+        rows = await self._fetch_rows(query)
 
-        return [map_stationary_asset_db_to_domain(asset) for asset in assets]
+        return [map_stationary_asset_row_to_list_item(row) for row in rows]
+
+    async def get_assets_by_cursor(
+            self,
+            filters: Dict[str, any],
+            limit: int = 30,
+            cursor: Optional[str] = None,
+    ) -> CursorPage[StationaryAssetListItemDomain]:
+        # reg_date может быть пустым - для таких записей используется дата создания
+        sort_date = func.coalesce(StationaryAsset.reg_date, StationaryAsset.created_at)
+        query = self._select_asset_rows(sort_date.label("sort_date"))
+        query = self._apply_filters(query, filters)
+
+        # Сначала новые; id - уникальный ключ для записей с одинаковой датой.
+        # Порядок совпадает с индексом ix_stationary_assets_sort_date_id
+        query, direction = apply_keyset_pagination(
+            query,
+            sort_keys=(sort_date, StationaryAsset.id),
+            cursor=cursor,
+            limit=limit,
+            descending=True,
+        )
+
+        page = build_cursor_page(
+            rows=await self._fetch_rows(query),
+            sort_values_getter=lambda row: (row.sort_date, row.id),
+            limit=limit,
+            cursor=cursor,
+            direction=direction,
+        )
+
+        return page._replace(
+            items=[map_stationary_asset_row_to_list_item(row) for row in page.items]
+        )
 
     async def get_total_count(self, filters: Dict[str, any]) -> int:
         query = select(func.count(StationaryAsset.id))
@@ -120,120 +234,128 @@ class StationaryAssetRepositoryImpl(BaseRepository, StationaryAssetRepositoryInt
         return map_stationary_asset_db_to_domain(db_asset_with_relations)
 
     async def update(self, asset: StationaryAssetDomain) -> StationaryAssetDomain:
-        query = (
-            select(StationaryAsset)
-            .options(
-                joinedload(StationaryAsset.patient),
-                joinedload(StationaryAsset.organization),
-            )
-            .where(StationaryAsset.id == asset.id)
+        # Обновляем только измененные колонки актива одним UPDATE ... RETURNING
+        values = {
+            column.key: getattr(asset, column.key)
+            for column in inspect(StationaryAsset).column_attrs
+            if column.key not in ('id', 'created_at') and column.key in asset.changed_fields
+        }
+        if not values:
+            # Ничего не изменилось - запись не выполняется
+            return asset
+
+        db_asset = await self._update_by_id(
+            StationaryAsset,
+            asset.id,
+            values,
+            # Мапперу нужны только колонки пациента и организации: их связи
+            # (в т.ч. все приемы пациента) не загружаются
+            selectinload(StationaryAsset.patient).raiseload("*"),
+            selectinload(StationaryAsset.organization).raiseload("*"),
         )
-        result = await self._async_db_session.execute(query)
-        db_asset = result.scalar_one()
-
-        # Обновляем поля
-        for field, value in asset.__dict__.items():
-            if hasattr(db_asset, field) and field not in ['id', 'created_at', 'patient_data', 'organization_data']:
-                setattr(db_asset, field, value)
-
-        await self._async_db_session.flush()
-        await self._async_db_session.refresh(db_asset)
 
         return map_stationary_asset_db_to_domain(db_asset)
 
     async def delete(self, asset_id: UUID) -> None:
-        query = select(StationaryAsset).where(StationaryAsset.id == asset_id)
-        result = await self._async_db_session.execute(query)
-        asset = result.scalar_one()
-
-        await self._async_db_session.delete(asset)
-        await self._async_db_session.flush()
+        await self._delete_by_id(StationaryAsset, asset_id)
 
     async def get_statistics(self, filters: Dict[str, any]) -> StationaryAssetStatisticsSchema:
-        base_query = select(StationaryAsset)
-        base_query = self._apply_filters(base_query, filters)
-
-        # Общее количество
-        total_query = select(func.count(StationaryAsset.id))
-        total_query = self._apply_filters(total_query, filters)
-        total_result = await self._async_db_session.execute(total_query)
-        total_assets = total_result.scalar_one()
-
-        # Подтвержденные
-        confirmed_query = select(func.count(StationaryAsset.id)).where(
-            StationaryAsset.has_confirm == True
+        # Все счетчики и разбивки считаются за один проход по отфильтрованным активам
+        query = (
+            select(
+                *(
+                    func.grouping(expression).label(f"{name}_grouping")
+                    for name, expression in STATISTICS_BREAKDOWNS.items()
+                ),
+                *(
+                    expression.label(f"{name}_key")
+                    for name, expression in STATISTICS_BREAKDOWNS.items()
+                ),
+                *STATISTICS_COUNTERS,
+            )
+            .select_from(StationaryAsset)
+            .group_by(
+                func.grouping_sets(
+                    tuple_(),
+                    *(tuple_(expression) for expression in STATISTICS_BREAKDOWNS.values()),
+                )
+            )
         )
-        confirmed_query = self._apply_filters(confirmed_query, filters)
-        confirmed_result = await self._async_db_session.execute(confirmed_query)
-        confirmed_assets = confirmed_result.scalar_one()
+        query = self._apply_filters(query, filters)
+        result = await self._async_db_session.execute(query)
 
-        # Отказанные
-        refused_query = select(func.count(StationaryAsset.id)).where(
-            StationaryAsset.has_refusal == True
-        )
-        refused_query = self._apply_filters(refused_query, filters)
-        refused_result = await self._async_db_session.execute(refused_query)
-        refused_assets = refused_result.scalar_one()
+        totals = {}
+        groups = {name: [] for name in STATISTICS_BREAKDOWNS}
+        for row in result.mappings().all():
+            counters = {counter.name: row[counter.name] for counter in STATISTICS_COUNTERS}
+            breakdown = next(
+                (name for name in STATISTICS_BREAKDOWNS if row[f"{name}_grouping"] == 0),
+                None,
+            )
+            if breakdown is None:
+                # Строка без группировки - итог по всем активам
+                totals = counters
+                continue
 
-        # Ожидающие
-        pending_assets = total_assets - confirmed_assets - refused_assets
+            key = row[f"{breakdown}_key"]
+            if breakdown == "by_month" and key is not None:
+                key = key.strftime("%Y-%m")
+            groups[breakdown].append(StationaryAssetStatisticsGroupSchema(key=key, **counters))
 
-        # С файлами
-        files_query = select(func.count(StationaryAsset.id)).where(
-            StationaryAsset.has_files == True
-        )
-        files_query = self._apply_filters(files_query, filters)
-        files_result = await self._async_db_session.execute(files_query)
-        assets_with_files = files_result.scalar_one()
-
-        return StationaryAssetStatisticsSchema(
-            total_assets=total_assets,
-            confirmed_assets=confirmed_assets,
-            refused_assets=refused_assets,
-            pending_assets=pending_assets,
-            assets_with_files=assets_with_files,
-        )
+        for name, breakdown_groups in groups.items():
+            if name == "by_month":
+                breakdown_groups.sort(key=lambda group: group.key or "")
+            else:
+                breakdown_groups.sort(key=lambda group: group.total_assets, reverse=True)
 
-    async def bulk_create(self, assets: List[StationaryAssetDomain]) -> List[StationaryAssetDomain]:
-        db_assets = [map_stationary_asset_domain_to_db(asset) for asset in assets]
+        return StationaryAssetStatisticsSchema(**totals, **groups)
 
-        self._async_db_session.add_all(db_assets)
-        await self._async_db_session.flush()
+    async def insert_bg_assets(self, assets: List[StationaryAssetDomain]) -> List[str]:
+        if not assets:
+            return []
 
-        # Получаем созданные активы со связанными данными
-        asset_ids = [db_asset.id for db_asset in db_assets]
         query = (
-            select(StationaryAsset)
-            .options(
-                joinedload(StationaryAsset.patient),
-                joinedload(StationaryAsset.organization),
-            )
-            .where(StationaryAsset.id.in_(asset_ids))
+            insert(StationaryAsset)
+            .on_conflict_do_nothing(index_elements=[StationaryAsset.bg_asset_id])
+            .returning(StationaryAsset.bg_asset_id)
+        )
+        result = await self._async_db_session.execute(
+            query,
+            [
+                {column: getattr(asset, column) for column in BG_INSERT_COLUMNS}
+                for asset in assets
+            ],
         )
-        result = await self._async_db_session.execute(query)
-        created_assets = result.scalars().all()
 
-        return [map_stationary_asset_db_to_domain(db_asset) for db_asset in created_assets]
+        return list(result.scalars().all())
 
-    async def exists_by_bg_asset_id(self, bg_asset_id: str) -> bool:
-        query = select(func.count(StationaryAsset.id)).where(
-            StationaryAsset.bg_asset_id == bg_asset_id
+    @staticmethod
+    def _select_asset_rows(*columns):
+        """Выборка колонок элемента списка с пациентом и организацией (без ORM-сущностей)"""
+        return (
+            select(*ASSET_LIST_ITEM_COLUMNS, *columns)
+            .select_from(StationaryAsset)
+            .outerjoin(StationaryAsset.organization)
+            .outerjoin(StationaryAsset.patient)
         )
-        result = await self._async_db_session.execute(query)
-        count = result.scalar_one()
-        return count > 0
 
     def _apply_filters(self, query, filters: Dict[str, any]):
         """Применить фильтры к запросу"""
 
-        # Поиск по пациенту (ФИО или ИИН)
+        # Фильтры не добавляют соединений: запросы страницы, количества и статистики
+        # отличаются только выборкой, а условия обслуживаются индексами
+
+        # Поиск по пациенту (ФИО или ИИН) - по триграммным индексам пациентов
         if filters.get("patient_search"):
-            print("PATIENT SEARCH:", filters["patient_search"])
-            search_term = f"%{filters['patient_search']}%"
-            query = query.join(SQLAlchemyPatient).where(
-                or_(
-                    func.lower(func.concat(SQLAlchemyPatient.last_name, ' ', SQLAlchemyPatient.first_name, ' ', SQLAlchemyPatient.middle_name)).like(search_term),
-                    SQLAlchemyPatient.iin.like(search_term)
+            search_term = f"%{' '.join(filters['patient_search'].lower().split())}%"
+            query = query.where(
+                StationaryAsset.patient_id.in_(
+                    select(SQLAlchemyPatient.id).where(
+                        or_(
+                            SQLAlchemyPatient.search_name.like(search_term),
+                            SQLAlchemyPatient.iin.like(search_term),
+                        )
+                    )
                 )
             )
 
@@ -243,7 +365,13 @@ class StationaryAssetRepositoryImpl(BaseRepository, StationaryAssetRepositoryInt
 
         # ИИН пациента
         if filters.get("patient_iin"):
-            query = query.join(SQLAlchemyPatient).where(SQLAlchemyPatient.iin == filters["patient_iin"])
+            query = query.where(
+                StationaryAsset.patient_id.in_(
+                    select(SQLAlchemyPatient.id).where(
+                        SQLAlchemyPatient.iin == filters["patient_iin"]
+                    )
+                )
+            )
 
         # Период по дате регистрации
         if filters.get("date_from"):
@@ -267,18 +395,15 @@ class StationaryAssetRepositoryImpl(BaseRepository, StationaryAssetRepositoryInt
         if filters.get("area"):
             query = query.where(StationaryAsset.area == filters["area"])
 
+        # Поиск подстроки - по триграммным индексам (ILIKE, без lower() над колонкой)
         if filters.get("specialization"):
             query = query.where(
-                func.lower(StationaryAsset.specialization).like(
-                    f"%{filters['specialization'].lower()}%"
-                )
+                StationaryAsset.specialization.ilike(f"%{filters['specialization']}%")
             )
 
         if filters.get("specialist"):
             query = query.where(
-                func.lower(StationaryAsset.specialist).like(
-                    f"%{filters['specialist'].lower()}%"
-                )
+                StationaryAsset.specialist.ilike(f"%{filters['specialist']}%")
             )
 
         # Флаги
@@ -300,9 +425,7 @@ class StationaryAssetRepositoryImpl(BaseRepository, StationaryAssetRepositoryInt
 
         if filters.get("stay_outcome"):
             query = query.where(
-                func.lower(StationaryAsset.stay_outcome).like(
-                    f"%{filters['stay_outcome'].lower()}%"
-                )
+                StationaryAsset.stay_outcome.ilike(f"%{filters['stay_outcome']}%")
             )
 
         return query
\ No newline at end of file
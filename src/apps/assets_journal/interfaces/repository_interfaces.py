@@ -6,6 +6,7 @@ from src.apps.assets_journal.domain.models.stationary_asset import StationaryAss
 from src.apps.assets_journal.infrastructure.api.schemas.responses.stationary_asset_schemas import (
     StationaryAssetStatisticsSchema,
 )
+from src.shared.infrastructure.keyset_pagination import CursorPage
 
 
 class StationaryAssetRepositoryInterface(ABC):
@@ -48,6 +49,23 @@ class StationaryAssetRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_assets_by_cursor(
+            self,
+            filters: Dict[str, any],
+            limit: int = 30,
+            cursor: Optional[str] = None,
+    ) -> CursorPage[StationaryAssetListItemDomain]:
+        """
+        Получить страницу активов с фильтрацией и курсорной (keyset) пагинацией
+
+        :param filters: Словарь фильтров
+        :param limit: Количество записей на странице
+        :param cursor: Курсор соседней страницы (None - первая страница)
+        :return: Страница доменных моделей активов и курсоры соседних страниц
+        """
+        pass
+
     @abstractmethod
     async def get_total_count(self, filters: Dict[str, any]) -> int:
         """
@@ -98,21 +116,12 @@ class StationaryAssetRepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    async def bulk_create(self, assets: List[StationaryAssetDomain]) -> List[StationaryAssetDomain]:
+    async def insert_bg_assets(self, assets: List[StationaryAssetDomain]) -> List[str]:
         """
-        Массовое создание активов
+        Массово вставить активы из BG одним INSERT ... ON CONFLICT (bg_asset_id)
+        DO NOTHING RETURNING
 
         :param assets: Список доменных моделей активов
-        :return: Список созданных доменных моделей активов
+        :return: BG ID вставленных активов (уже существующие пропускаются)
         """
         pass
-
-    @abstractmethod
-    async def exists_by_bg_asset_id(self, bg_asset_id: str) -> bool:
-        """
-        Проверить существование актива по BG ID
-
-        :param bg_asset_id: ID актива в BG системе
-        :return: True если актив существует, False иначе
-        """
-        pass
\ No newline at end of file
@@ -2,7 +2,12 @@ from datetime import datetime, time
 from typing import Optional
 from uuid import UUID
 
-from src.apps.assets_journal.domain.models.stationary_asset import StationaryAssetDomain
+from sqlalchemy import Row
+
+from src.apps.assets_journal.domain.models.stationary_asset import (
+    StationaryAssetDomain,
+    StationaryAssetListItemDomain,
+)
 from src.apps.assets_journal.infrastructure.api.schemas.requests.stationary_asset_schemas import (
     CreateStationaryAssetSchema,
 )
@@ -96,6 +101,34 @@ def map_stationary_asset_db_to_domain(db_asset: StationaryAsset) -> StationaryAs
     )
 
 
+def map_stationary_asset_row_to_list_item(row: Row) -> StationaryAssetListItemDomain:
+    """Маппинг строки колонок элемента списка (без ORM-сущностей) в доменную модель элемента списка"""
+    patient_full_name = None
+    if row.patient_ref_id is not None:
+        patient_full_name = f"{row.patient_last_name} {row.patient_first_name} {row.patient_middle_name or ''}".strip()
+
+    return StationaryAssetListItemDomain(
+        id=row.id,
+        card_number=row.card_number,
+        organization_id=row.organization_id,
+        organization_name=row.organization_name,
+        patient_id=row.patient_id,
+        patient_full_name=patient_full_name,
+        patient_iin=row.patient_iin,
+        patient_birth_date=row.patient_date_of_birth,
+        diagnosis_name=row.diagnosis,
+        specialization=row.specialization,
+        specialist=row.specialist,
+        area=row.area,
+        status=row.status,
+        delivery_status=row.delivery_status,
+        receive_date=row.receive_date,
+        receive_time=row.receive_time,
+        created_at=row.created_at,
+        updated_at=row.changed_at,
+    )
+
+
 def map_stationary_asset_domain_to_full_response(domain: StationaryAssetDomain) -> StationaryAssetResponseSchema:
     """Маппинг доменной модели в полную схему ответа (для детального просмотра)"""
     return StationaryAssetResponseSchema(
@@ -155,6 +188,30 @@ def map_stationary_asset_domain_to_list_item(domain: StationaryAssetDomain) -> S
     )
 
 
+def map_stationary_asset_list_item_to_schema(item: StationaryAssetListItemDomain) -> StationaryAssetListItemSchema:
+    """Маппинг доменной модели элемента списка в схему для списка"""
+    return StationaryAssetListItemSchema(
+        id=item.id,
+        card_number=item.card_number,
+        organization_id=item.organization_id,
+        organization_name=item.organization_name,
+        patient_id=item.patient_id,
+        patient_full_name=item.patient_full_name,
+        patient_iin=item.patient_iin,
+        patient_birth_date=item.patient_birth_date,
+        specialization=item.specialization,
+        specialist=item.specialist,
+        area=item.area,
+        diagnosis=item.diagnosis_name,
+        status=item.status,
+        delivery_status=item.delivery_status,
+        receive_date=item.receive_date,
+        receive_time=item.receive_time,
+        created_at=item.created_at,
+        updated_at=item.updated_at,
+    )
+
+
 def map_create_schema_to_domain(create_schema: CreateStationaryAssetSchema, patient_id: UUID) -> StationaryAssetDomain:
     """Маппинг схемы создания в доменную модель"""
     return StationaryAssetDomain(
@@ -1,4 +1,5 @@
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import List, Tuple, Optional
@@ -14,8 +15,10 @@ from src.apps.assets_journal.infrastructure.api.schemas.requests.stationary_asse
     UpdateStationaryAssetSchema, CreateStationaryAssetByPatientIdSchema,
 )
 from src.apps.assets_journal.infrastructure.api.schemas.responses.stationary_asset_schemas import (
+    BgIngestionReportSchema,
     StationaryAssetStatisticsSchema,
 )
+from src.apps.assets_journal.infrastructure.bg_file_reader import read_bg_items
 from src.apps.assets_journal.interfaces.repository_interfaces import (
     StationaryAssetRepositoryInterface,
 )
@@ -27,8 +30,12 @@ from src.apps.patients.services.patients_service import PatientService
 from src.core.i18n import _
 from src.core.logger import LoggerService
 from src.shared.exceptions import NoInstanceFoundError
+from src.shared.infrastructure.keyset_pagination import CursorPage
 from src.shared.schemas.pagination_schemas import PaginationParams
 
+# Активы BG, сопоставляемые с пациентами и вставляемые одним запросом
+BG_INGESTION_CHUNK_SIZE = 500
+
 
 class StationaryAssetService:
     """Сервис для работы с активами стационара"""
@@ -39,11 +46,13 @@ class StationaryAssetService:
             stationary_asset_repository: StationaryAssetRepositoryInterface,
             patients_service: PatientService,
             logger: LoggerService,
+            bg_chunk_size: int = BG_INGESTION_CHUNK_SIZE,
     ):
         self._uow = uow
         self._stationary_asset_repository = stationary_asset_repository
         self._patients_service = patients_service
         self._logger = logger
+        self._bg_chunk_size = bg_chunk_size
 
     async def get_by_id(self, asset_id: UUID) -> StationaryAssetDomain:
         """
@@ -85,11 +94,41 @@ class StationaryAssetService:
 
         return assets, total_count
 
+    async def get_assets_by_cursor(
+            self,
+            pagination_params: PaginationParams,
+            filter_params: StationaryAssetFilterParams,
+    ) -> Tuple[CursorPage[StationaryAssetListItemDomain], Optional[int]]:
+        """
+        Получить страницу активов с фильтрацией и курсорной пагинацией
+
+        :param pagination_params: Параметры пагинации (limit, cursor и include_total)
+        :param filter_params: Параметры фильтрации
+        :return: Кортеж из страницы активов и общего количества
+            (None, если подсчет не запрошен)
+        """
+        filters = filter_params.to_dict(exclude_none=True)
+
+        page = await self._stationary_asset_repository.get_assets_by_cursor(
+            filters=filters,
+            limit=pagination_params.limit,
+            cursor=pagination_params.cursor,
+        )
+
+        # Подсчет сканирует все отфильтрованные активы - только по запросу
+        total_count = None
+        if pagination_params.include_total:
+            total_count = await self._stationary_asset_repository.get_total_count(
+                filters
+            )
+
+        return page, total_count
+
     async def get_assets_by_organization(
             self,
             pagination_params: PaginationParams,
             filter_params: OrganizationAssetsFilterParams,
-    ) -> Tuple[List[StationaryAssetDomain], int]:
+    ) -> Tuple[List[StationaryAssetListItemDomain], int]:
         """
         Получить список активов по организации
 
@@ -113,7 +152,7 @@ class StationaryAssetService:
             self,
             patient_id: UUID,
             pagination_params: PaginationParams,
-    ) -> Tuple[List[StationaryAssetDomain], int]:
+    ) -> Tuple[List[StationaryAssetListItemDomain], int]:
         """
         Получить список активов пациента
 
@@ -342,56 +381,35 @@ class StationaryAssetService:
 
         return updated_asset
 
-    async def load_assets_from_bg_file(self, file_path: str = None) -> List[StationaryAssetDomain]:
+    async def load_assets_from_bg_file(self, file_path: str = None) -> BgIngestionReportSchema:
         """
         Загрузить активы из файла BG (временно, пока нет интеграции)
 
+        Файл разбирается потоково и загружается порциями: на порцию один запрос
+        находит пациентов по ИИН и один INSERT ... ON CONFLICT (bg_asset_id)
+        DO NOTHING пропускает уже загруженные активы.
+
         :param file_path: Путь к JSON файлу с данными BG
-        :return: Список созданных активов
+        :return: Отчет о загрузке
         """
         if not file_path:
             # Используем файл по умолчанию
             project_root = Path(__file__).parent.parent.parent.parent
             file_path = project_root / "data" / "bg_responses" / "stationary_assets_response.json"
 
+        report = BgIngestionReportSchema()
+        started_at = time.perf_counter()
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                bg_data = json.load(f)
-
-            # Преобразуем данные BG в доменные модели
-            assets_to_create = []
-            for item in bg_data:
-                # Проверяем, что актив еще не существует
-                if not await self._stationary_asset_repository.exists_by_bg_asset_id(item.get("id", "")):
-                    # Находим или создаем пациента по данным из BG
-                    patient_data = item.get("patient", {})
-                    patient_iin = patient_data.get("personin", "")
-
-                    if patient_iin:
-                        # Пытаемся найти существующего пациента
-                        patient = await self._patients_service.get_by_id(patient_iin)
-
-                        if patient:
-                            asset_domain = map_bg_response_to_domain(item, patient.id)
-                            assets_to_create.append(asset_domain)
-                        else:
-                            self._logger.warning(
-                                f"Пациент с ИИН {patient_iin} не найден, пропускаем актив {item.get('id', '')}")
-                    else:
-                        self._logger.warning(f"Отсутствует ИИН пациента в данных BG для актива {item.get('id', '')}")
-
-            if not assets_to_create:
-                self._logger.info("Все активы из файла уже существуют в базе данных")
-                return []
-
-            # Массовое создание активов
-            async with self._uow:
-                created_assets = await self._uow.stationary_asset_repository.bulk_create(
-                    assets_to_create
-                )
+            chunk = []
+            async for item in read_bg_items(file_path):
+                report.total_rows += 1
+                chunk.append(item)
+                if len(chunk) >= self._bg_chunk_size:
+                    await self._ingest_bg_chunk(chunk, report)
+                    chunk = []
 
-            self._logger.info(f"Успешно загружено {len(created_assets)} активов из файла BG")
-            return created_assets
+            if chunk:
+                await self._ingest_bg_chunk(chunk, report)
 
         except FileNotFoundError:
             self._logger.error(f"Файл BG данных не найден: {file_path}")
@@ -401,4 +419,50 @@ class StationaryAssetService:
             raise ValueError(_("Ошибка в формате файла данных BG"))
         except Exception as e:
             self._logger.error(f"Ошибка при загрузке данных из файла BG: {str(e)}")
-            raise ValueError(_("Ошибка при загрузке данных из файла BG"))
\ No newline at end of file
+            raise ValueError(_("Ошибка при загрузке данных из файла BG"))
+
+        report.duration_seconds = round(time.perf_counter() - started_at, 3)
+        if report.duration_seconds:
+            report.rows_per_second = round(report.total_rows / report.duration_seconds, 1)
+
+        self._logger.info(
+            f"Загрузка активов из BG: строк {report.total_rows}, "
+            f"загружено {report.inserted}, уже существуют {report.skipped_existing}, "
+            f"пациент не найден {report.unmatched_patients}, "
+            f"без BG ID или ИИН {report.invalid_rows}, "
+            f"{report.rows_per_second} строк/с"
+        )
+        return report
+
+    async def _ingest_bg_chunk(self, items: List[dict], report: BgIngestionReportSchema) -> None:
+        """Загрузить порцию активов BG"""
+        valid_items = []
+        for item in items:
+            if item.get("id") and (item.get("patient") or {}).get("personin"):
+                valid_items.append(item)
+            else:
+                report.invalid_rows += 1
+
+        patient_ids = await self._patients_service.get_ids_by_iins(
+            {item["patient"]["personin"] for item in valid_items}
+        )
+
+        assets_to_create = []
+        for item in valid_items:
+            patient_id = patient_ids.get(item["patient"]["personin"])
+            if patient_id is None:
+                report.unmatched_patients += 1
+                continue
+
+            assets_to_create.append(map_bg_response_to_domain(item, patient_id))
+
+        if not assets_to_create:
+            return
+
+        async with self._uow:
+            inserted = await self._uow.stationary_asset_repository.insert_bg_assets(
+                assets_to_create
+            )
+
+        report.inserted += len(inserted)
+        report.skipped_existing += len(assets_to_create) - len(inserted)
\ No newline at end of file
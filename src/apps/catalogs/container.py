@@ -1,8 +1,6 @@
 from dependency_injector import containers, providers
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.ext.asyncio.engine import AsyncEngine
-from sqlalchemy.orm.session import sessionmaker
 
+from src.apps.catalogs.infrastructure.catalog_cache import CatalogCache
 from src.apps.catalogs.infrastructure.repositories.citizenship_catalog_repository import (
     SQLAlchemyCitizenshipCatalogueRepositoryImpl,
 )
@@ -39,6 +37,7 @@ from src.apps.catalogs.services.nationalities_catalog_service import (
 from src.apps.catalogs.services.patient_context_attribute_service import (
     PatientContextAttributeService,
 )
+from src.core.database.session import ScopedAsyncSession
 from src.core.logger import LoggerService
 
 
@@ -51,18 +50,9 @@ class CatalogsContainer(containers.DeclarativeContainer):
 
     # Dependencies from core DI-container
     logger = providers.Dependency(instance_of=LoggerService)
-    engine = providers.Dependency(instance_of=AsyncEngine)
+    async_db_session = providers.Dependency(instance_of=ScopedAsyncSession)
     patients_service = providers.Dependency()
-
-    # Session factory
-    session_factory = providers.Singleton(
-        sessionmaker, bind=engine, expire_on_commit=False, class_=AsyncSession
-    )
-
-    # Async session
-    async_db_session = providers.Singleton(
-        lambda session_factory: session_factory(), session_factory
-    )
+    catalog_cache = providers.Dependency(instance_of=CatalogCache)
 
     # Repositories
     citizenship_catalog_repository = providers.Factory(
@@ -106,30 +96,35 @@ class CatalogsContainer(containers.DeclarativeContainer):
         NationalitiesCatalogService,
         logger=logger,
         nationalities_catalog_repository=nationalities_catalog_repository,
+        catalog_cache=catalog_cache,
     )
 
     patient_context_attributes_service = providers.Factory(
         PatientContextAttributeService,
         logger=logger,
         context_attributes_repository=patient_context_attributes_repository,
+        catalog_cache=catalog_cache,
     )
 
     financing_sources_catalog_service = providers.Factory(
         FinancingSourceCatalogService,
         logger=logger,
         financing_sources_catalog_repository=financing_sources_catalog_repository,
+        catalog_cache=catalog_cache,
     )
 
     medical_organizations_catalog_service = providers.Factory(
         MedicalOrganizationsCatalogService,
         logger=logger,
         medical_organizations_catalog_repository=medical_organizations_catalog_repository,
+        catalog_cache=catalog_cache,
     )
 
     citizenship_catalog_service = providers.Factory(
         CitizenshipCatalogService,
         logger=logger,
         citizenship_catalog_repository=citizenship_catalog_repository,
+        catalog_cache=catalog_cache,
     )
 
     insurance_info_catalog_service = providers.Factory(
@@ -0,0 +1,18 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+
+from src.apps.catalogs.container import CatalogsContainer
+from src.apps.catalogs.infrastructure.api.schemas.responses.catalog_cache_schemas import (
+    CatalogCacheStatsSchema,
+)
+from src.apps.catalogs.infrastructure.catalog_cache import CatalogCache
+
+catalog_cache_router = APIRouter(prefix="/monitoring")
+
+
+@catalog_cache_router.get("/catalog-cache", response_model=CatalogCacheStatsSchema)
+@inject
+async def get_catalog_cache_stats(
+    catalog_cache: CatalogCache = Depends(Provide[CatalogsContainer.catalog_cache]),
+) -> CatalogCacheStatsSchema:
+    return CatalogCacheStatsSchema(catalogs=catalog_cache.stats())
@@ -0,0 +1,17 @@
+from typing import Dict
+
+from pydantic import BaseModel
+
+
+class CatalogCacheEntryStatsSchema(BaseModel):
+    version: int
+    size: int
+    localized_size: int
+    hits: int
+    misses: int
+    hit_ratio: float
+    memory_bytes: int
+
+
+class CatalogCacheStatsSchema(BaseModel):
+    catalogs: Dict[str, CatalogCacheEntryStatsSchema]
@@ -0,0 +1,186 @@
+import sys
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+# Catalogs are small, so the whole catalog is expected to fit into a single page
+PRELOAD_LIMIT = 10_000
+
+
+class CatalogName(str, Enum):
+    CITIZENSHIP = "citizenship"
+    NATIONALITIES = "nationalities"
+    FINANCING_SOURCES = "financing_sources"
+    PATIENT_CONTEXT_ATTRIBUTES = "patient_context_attributes"
+    MEDICAL_ORGANIZATIONS = "medical_organizations"
+
+
+@dataclass
+class _CatalogEntries:
+    items: Dict[int, BaseModel] = field(default_factory=dict)
+    localized: Dict[Tuple[int, Hashable], BaseModel] = field(default_factory=dict)
+    version: int = 0
+    loaded_at: float = 0.0
+    hits: int = 0
+    misses: int = 0
+
+
+class CatalogCache:
+    """
+    Versioned in-process read-through cache of the catalog records.
+
+    Full records are cached by ID together with the response schemas already
+    resolved for a locale, so repeated lookups need neither DB access nor
+    Pydantic validation. Catalog services invalidate it on add / update / delete;
+    every invalidation bumps the catalog version, and records loaded from the DB
+    while the version changed are not stored. Records older than `ttl_seconds`
+    are reloaded, which bounds staleness caused by writes of other instances.
+    """
+
+    def __init__(self, ttl_seconds: float = 300):
+        self._ttl_seconds = ttl_seconds
+        self._catalogs: Dict[CatalogName, _CatalogEntries] = {
+            catalog: _CatalogEntries() for catalog in CatalogName
+        }
+
+    async def get(
+        self,
+        catalog: CatalogName,
+        item_id: int,
+        loader: Callable[[int], Awaitable[Optional[BaseModel]]],
+    ) -> Optional[BaseModel]:
+        entries = self._get_fresh_entries(catalog)
+        item = entries.items.get(item_id)
+        if item is not None:
+            entries.hits += 1
+            return item
+
+        entries.misses += 1
+        version = entries.version
+        item = await loader(item_id)
+        if item is not None and entries.version == version:
+            self._store(entries, item_id, item)
+
+        return item
+
+    def get_localized(
+        self,
+        catalog: CatalogName,
+        item_id: int,
+        locale: Hashable,
+        builder: Callable[[], BaseModel],
+    ) -> BaseModel:
+        """
+        Returns the locale-resolved schema of a cached record, building it only once
+        per record version.
+        """
+        entries = self._catalogs[catalog]
+        key = (item_id, locale)
+        localized = entries.localized.get(key)
+        if localized is None:
+            localized = builder()
+            if item_id in entries.items:
+                entries.localized[key] = localized
+
+        return localized
+
+    async def preload(
+        self,
+        catalog: CatalogName,
+        loader: Callable[[int], Awaitable[List[BaseModel]]],
+    ) -> int:
+        """
+        Loads the whole catalog at once.
+
+        :param loader: Coroutine function returning up to the given number of records
+        :return: Number of loaded records
+        """
+        entries = self._catalogs[catalog]
+        version = entries.version
+        items = await loader(PRELOAD_LIMIT)
+        if entries.version != version:
+            return 0
+
+        entries.items.clear()
+        entries.localized.clear()
+        for item in items:
+            self._store(entries, item.id, item)
+        entries.loaded_at = time.monotonic()
+
+        return len(items)
+
+    def invalidate(self, catalog: CatalogName, item_id: Optional[int] = None) -> None:
+        """
+        Drops a single record (or the whole catalog if no ID is given)
+        and bumps the catalog version.
+        """
+        entries = self._catalogs[catalog]
+        entries.version += 1
+        if item_id is None:
+            entries.items.clear()
+            entries.localized.clear()
+            return
+
+        entries.items.pop(item_id, None)
+        for key in [key for key in entries.localized if key[0] == item_id]:
+            del entries.localized[key]
+
+    def version(self, catalog: CatalogName) -> int:
+        return self._catalogs[catalog].version
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        stats = {}
+        for catalog, entries in self._catalogs.items():
+            requests = entries.hits + entries.misses
+            stats[catalog.value] = {
+                "version": entries.version,
+                "size": len(entries.items),
+                "localized_size": len(entries.localized),
+                "hits": entries.hits,
+                "misses": entries.misses,
+                "hit_ratio": round(entries.hits / requests, 4) if requests else 0.0,
+                "memory_bytes": _deep_getsizeof(entries.items)
+                + _deep_getsizeof(entries.localized),
+            }
+
+        return stats
+
+    def _get_fresh_entries(self, catalog: CatalogName) -> _CatalogEntries:
+        entries = self._catalogs[catalog]
+        if entries.items and time.monotonic() - entries.loaded_at > self._ttl_seconds:
+            self.invalidate(catalog)
+
+        return entries
+
+    @staticmethod
+    def _store(entries: _CatalogEntries, item_id: int, item: BaseModel) -> None:
+        if not entries.items:
+            entries.loaded_at = time.monotonic()
+        entries.items[item_id] = item
+
+
+def _deep_getsizeof(obj: Any, seen: Optional[set] = None) -> int:
+    """
+    Approximate memory footprint of an object graph made of
+    Pydantic models, containers and scalars.
+    """
+    seen = seen if seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, BaseModel):
+        size += _deep_getsizeof(obj.__dict__, seen)
+    elif isinstance(obj, dict):
+        size += sum(
+            _deep_getsizeof(key, seen) + _deep_getsizeof(value, seen)
+            for key, value in obj.items()
+        )
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_getsizeof(item, seen) for item in obj)
+
+    return size
@@ -16,7 +16,7 @@ from src.apps.catalogs.interfaces.citizenship_catalog_repository_interface impor
     CitizenshipCatalogRepositoryInterface,
 )
 from src.core.settings import project_settings
-from src.shared.infrastructure.base import BaseRepository
+from src.shared.infrastructure.base import BaseRepository, schema_columns
 
 
 class SQLAlchemyCitizenshipCatalogueRepositoryImpl(
@@ -91,7 +91,11 @@ class SQLAlchemyCitizenshipCatalogueRepositoryImpl(
         limit: int = 30,
     ) -> List[CitizenshipCatalogFullResponseSchema]:
         offset = (page - 1) * limit
-        query = select(SQLAlchemyCitizenshipCatalogue)
+        query = select(
+            *schema_columns(
+                SQLAlchemyCitizenshipCatalogue, CitizenshipCatalogFullResponseSchema
+            )
+        )
 
         # Filtering...
         if name_filter:
@@ -112,8 +116,7 @@ class SQLAlchemyCitizenshipCatalogueRepositoryImpl(
 
         query = query.offset(offset).limit(limit)
 
-        result = await self._async_db_session.execute(query)
-        records = result.scalars().all()
+        records = await self._fetch_rows(query)
 
         return [
             CitizenshipCatalogFullResponseSchema.model_validate(obj) for obj in records
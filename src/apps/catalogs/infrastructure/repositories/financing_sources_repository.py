@@ -18,7 +18,7 @@ from src.apps.catalogs.interfaces.financing_sources_catalog_repository_interface
 )
 from src.core.logger import LoggerService
 from src.core.settings import project_settings
-from src.shared.infrastructure.base import BaseRepository
+from src.shared.infrastructure.base import BaseRepository, schema_columns
 
 
 class SQLAlchemyFinancingSourcesCatalogRepositoryImpl(
@@ -97,7 +97,11 @@ class SQLAlchemyFinancingSourcesCatalogRepositoryImpl(
     ) -> List[FinancingSourceFullResponseSchema]:
         offset = (page - 1) * limit
 
-        query = select(SQLAlchemyFinancingSourcesCatalog)
+        query = select(
+            *schema_columns(
+                SQLAlchemyFinancingSourcesCatalog, FinancingSourceFullResponseSchema
+            )
+        )
 
         # Filtering...
         if name_filter:
@@ -122,8 +126,7 @@ class SQLAlchemyFinancingSourcesCatalogRepositoryImpl(
 
         query = query.offset(offset).limit(limit)
 
-        result = await self._async_db_session.execute(query)
-        records = result.scalars().all()
+        records = await self._fetch_rows(query)
 
         return [
             FinancingSourceFullResponseSchema.model_validate(record)
@@ -23,7 +23,7 @@ from src.apps.catalogs.mappers import (
     map_insurance_info_db_entity_to_response_schema,
     map_insurance_info_update_schema_to_db_entity,
 )
-from src.shared.infrastructure.base import BaseRepository
+from src.shared.infrastructure.base import BaseRepository, schema_columns
 
 
 class SQLAlchemyInsuranceInfoCatalogRepositoryImpl(
@@ -97,14 +97,17 @@ class SQLAlchemyInsuranceInfoCatalogRepositoryImpl(
         limit: int = 30,
     ) -> List[ResponseInsuranceInfoRecordSchema]:
         offset = (page - 1) * limit
-        query = select(SQLAlchemyInsuranceInfoCatalogue)
+        query = select(
+            *schema_columns(
+                SQLAlchemyInsuranceInfoCatalogue, ResponseInsuranceInfoRecordSchema
+            )
+        )
 
         # Filters applying...
         query = self._apply_filters_to_query(query, filters)
 
         query = query.offset(offset).limit(limit)
-        result = await self._async_db_session.execute(query)
-        records = result.scalars().all()
+        records = await self._fetch_rows(query)
 
         return [
             map_insurance_info_db_entity_to_response_schema(record)
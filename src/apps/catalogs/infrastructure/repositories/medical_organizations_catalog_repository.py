@@ -20,7 +20,7 @@ from src.apps.catalogs.interfaces.medical_organizations_catalog_repository_inter
 )
 from src.core.logger import LoggerService
 from src.core.settings import project_settings
-from src.shared.infrastructure.base import BaseRepository
+from src.shared.infrastructure.base import BaseRepository, schema_columns
 
 
 class SQLAlchemyMedicalOrganizationsCatalogCatalogueRepositoryImpl(
@@ -119,7 +119,12 @@ class SQLAlchemyMedicalOrganizationsCatalogCatalogueRepositoryImpl(
     ) -> List[MedicalOrganizationCatalogFullResponseSchema]:
         offset = (page - 1) * limit
 
-        query = select(SQLAlchemyMedicalOrganizationsCatalogue)
+        query = select(
+            *schema_columns(
+                SQLAlchemyMedicalOrganizationsCatalogue,
+                MedicalOrganizationCatalogFullResponseSchema,
+            )
+        )
 
         # Filtering...
         filters = []
@@ -167,8 +172,7 @@ class SQLAlchemyMedicalOrganizationsCatalogCatalogueRepositoryImpl(
             query = query.where(and_(*filters))
 
         query = query.offset(offset).limit(limit)
-        result = await self._async_db_session.execute(query)
-        records = result.scalars().all()
+        records = await self._fetch_rows(query)
 
         return [
             MedicalOrganizationCatalogFullResponseSchema.model_validate(record)
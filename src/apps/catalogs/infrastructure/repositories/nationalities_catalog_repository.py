@@ -18,7 +18,7 @@ from src.apps.catalogs.interfaces.nationalities_catalog_repository_interface imp
 )
 from src.core.logger import LoggerService
 from src.core.settings import project_settings
-from src.shared.infrastructure.base import BaseRepository
+from src.shared.infrastructure.base import BaseRepository, schema_columns
 
 
 class SQLAlchemyNationalitiesCatalogRepositoryImpl(
@@ -83,7 +83,11 @@ class SQLAlchemyNationalitiesCatalogRepositoryImpl(
     ) -> List[NationalityCatalogFullResponseSchema]:
         offset = (page - 1) * limit
 
-        query = select(SQLAlchemyNationalitiesCatalogue)
+        query = select(
+            *schema_columns(
+                SQLAlchemyNationalitiesCatalogue, NationalityCatalogFullResponseSchema
+            )
+        )
 
         # Filtering...
         if name_filter:
@@ -100,8 +104,7 @@ class SQLAlchemyNationalitiesCatalogRepositoryImpl(
 
         query = query.offset(offset).limit(limit)
 
-        result = await self._async_db_session.execute(query)
-        records = result.scalars().all()
+        records = await self._fetch_rows(query)
 
         return [
             NationalityCatalogFullResponseSchema.model_validate(record)
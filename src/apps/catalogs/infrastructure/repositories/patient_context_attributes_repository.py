@@ -18,7 +18,7 @@ from src.apps.catalogs.interfaces.patient_context_attributes_repository_interfac
 )
 from src.core.logger import LoggerService
 from src.core.settings import project_settings
-from src.shared.infrastructure.base import BaseRepository
+from src.shared.infrastructure.base import BaseRepository, schema_columns
 
 
 class SQLAlchemyPatientContextAttributesCatalogueRepositoryImpl(
@@ -87,7 +87,12 @@ class SQLAlchemyPatientContextAttributesCatalogueRepositoryImpl(
     ) -> List[PatientContextAttributeCatalogFullResponseSchema]:
         offset = (page - 1) * limit
 
-        query = select(SQLAlchemyPatientContextAttributesCatalogue)
+        query = select(
+            *schema_columns(
+                SQLAlchemyPatientContextAttributesCatalogue,
+                PatientContextAttributeCatalogFullResponseSchema,
+            )
+        )
 
         # Filtering...
         if name_filter:
@@ -109,8 +114,7 @@ class SQLAlchemyPatientContextAttributesCatalogueRepositoryImpl(
 
         query = query.offset(offset).limit(limit)
 
-        result = await self._async_db_session.execute(query)
-        records = result.scalars().all()
+        records = await self._fetch_rows(query)
 
         return [
             PatientContextAttributeCatalogFullResponseSchema.model_validate(record)
@@ -10,6 +10,7 @@ from src.apps.catalogs.infrastructure.api.schemas.responses.citizenship_catalog_
     CitizenshipCatalogPartialResponseSchema,
     MultipleCitizenshipSchema,
 )
+from src.apps.catalogs.infrastructure.catalog_cache import CatalogCache, CatalogName
 from src.apps.catalogs.interfaces.citizenship_catalog_repository_interface import (
     CitizenshipCatalogRepositoryInterface,
 )
@@ -28,9 +29,11 @@ class CitizenshipCatalogService:
         self,
         logger: LoggerService,
         citizenship_catalog_repository: CitizenshipCatalogRepositoryInterface,
+        catalog_cache: CatalogCache,
     ):
         self._logger = logger
         self._citizenship_catalog_repository = citizenship_catalog_repository
+        self._catalog_cache = catalog_cache
 
     @staticmethod
     def __get_localized_name(
@@ -62,8 +65,10 @@ class CitizenshipCatalogService:
         CitizenshipCatalogFullResponseSchema,
         CitizenshipCatalogPartialResponseSchema,
     ]:
-        full_schema = await self._citizenship_catalog_repository.get_by_id(
-            citizenship_id
+        full_schema = await self._catalog_cache.get(
+            CatalogName.CITIZENSHIP,
+            citizenship_id,
+            self._citizenship_catalog_repository.get_by_id,
         )
         if not full_schema:
             raise NoInstanceFoundError(
@@ -76,15 +81,27 @@ class CitizenshipCatalogService:
             return full_schema
 
         chosen_language = get_locale()
-        localized_name = CitizenshipCatalogService.__get_localized_name(full_schema)
-
-        return CitizenshipCatalogPartialResponseSchema(
-            id=full_schema.id,
-            lang=chosen_language,
-            name=localized_name,
-            country_code=full_schema.country_code,
-            created_at=full_schema.created_at,
-            changed_at=full_schema.changed_at,
+
+        return self._catalog_cache.get_localized(
+            CatalogName.CITIZENSHIP,
+            citizenship_id,
+            chosen_language,
+            lambda: CitizenshipCatalogPartialResponseSchema(
+                id=full_schema.id,
+                lang=chosen_language,
+                name=CitizenshipCatalogService.__get_localized_name(full_schema),
+                country_code=full_schema.country_code,
+                created_at=full_schema.created_at,
+                changed_at=full_schema.changed_at,
+            ),
+        )
+
+    async def preload_cache(self) -> int:
+        return await self._catalog_cache.preload(
+            CatalogName.CITIZENSHIP,
+            lambda limit: self._citizenship_catalog_repository.get_citizenship_records(
+                name_filter=None, country_code_filter=None, limit=limit
+            ),
         )
 
     async def get_citizenship_records(
@@ -186,7 +203,10 @@ class CitizenshipCatalogService:
                     % {"VALUE": value, "CODE": code},
                 )
 
-        return await self._citizenship_catalog_repository.add_citizenship(request_dto)
+        added = await self._citizenship_catalog_repository.add_citizenship(request_dto)
+        self._catalog_cache.invalidate(CatalogName.CITIZENSHIP, added.id)
+
+        return added
 
     async def update_citizenship(
         self,
@@ -259,6 +279,7 @@ class CitizenshipCatalogService:
         updated = await self._citizenship_catalog_repository.update_citizenship(
             citizenship_id, request_dto
         )
+        self._catalog_cache.invalidate(CatalogName.CITIZENSHIP, citizenship_id)
 
         return updated
 
@@ -273,3 +294,4 @@ class CitizenshipCatalogService:
             )
 
         await self._citizenship_catalog_repository.delete_by_id(citizenship_id)
+        self._catalog_cache.invalidate(CatalogName.CITIZENSHIP, citizenship_id)
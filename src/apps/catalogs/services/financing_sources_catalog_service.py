@@ -10,6 +10,7 @@ from src.apps.catalogs.infrastructure.api.schemas.responses.financing_sources_ca
     FinancingSourcePartialResponseSchema,
     MultipleFinancingSourcesSchema,
 )
+from src.apps.catalogs.infrastructure.catalog_cache import CatalogCache, CatalogName
 from src.apps.catalogs.interfaces.financing_sources_catalog_repository_interface import (
     FinancingSourcesCatalogRepositoryInterface,
 )
@@ -28,11 +29,13 @@ class FinancingSourceCatalogService:
         self,
         logger: LoggerService,
         financing_sources_catalog_repository: FinancingSourcesCatalogRepositoryInterface,
+        catalog_cache: CatalogCache,
     ):
         self._logger = logger
         self._financing_sources_catalog_repository = (
             financing_sources_catalog_repository
         )
+        self._catalog_cache = catalog_cache
 
     @staticmethod
     def __get_localized_name(
@@ -64,8 +67,10 @@ class FinancingSourceCatalogService:
         FinancingSourceFullResponseSchema,
         FinancingSourcePartialResponseSchema,
     ]:
-        full_schema = await self._financing_sources_catalog_repository.get_by_id(
-            financing_source_id
+        full_schema = await self._catalog_cache.get(
+            CatalogName.FINANCING_SOURCES,
+            financing_source_id,
+            self._financing_sources_catalog_repository.get_by_id,
         )
         if not full_schema:
             raise NoInstanceFoundError(
@@ -78,15 +83,27 @@ class FinancingSourceCatalogService:
             return full_schema
 
         chosen_language = get_locale()
-        localized_name = FinancingSourceCatalogService.__get_localized_name(full_schema)
-
-        return FinancingSourcePartialResponseSchema(
-            id=full_schema.id,
-            lang=chosen_language,
-            name=localized_name,
-            code=full_schema.financing_source_code,
-            created_at=full_schema.created_at,
-            changed_at=full_schema.changed_at,
+
+        return self._catalog_cache.get_localized(
+            CatalogName.FINANCING_SOURCES,
+            financing_source_id,
+            chosen_language,
+            lambda: FinancingSourcePartialResponseSchema(
+                id=full_schema.id,
+                lang=chosen_language,
+                name=FinancingSourceCatalogService.__get_localized_name(full_schema),
+                code=full_schema.financing_source_code,
+                created_at=full_schema.created_at,
+                changed_at=full_schema.changed_at,
+            ),
+        )
+
+    async def preload_cache(self) -> int:
+        return await self._catalog_cache.preload(
+            CatalogName.FINANCING_SOURCES,
+            lambda limit: self._financing_sources_catalog_repository.get_financing_sources(
+                name_filter=None, code_filter=None, limit=limit
+            ),
         )
 
     async def get_financing_sources(
@@ -192,9 +209,12 @@ class FinancingSourceCatalogService:
                     % {"VALUE": value, "CODE": code},
                 )
 
-        return await self._financing_sources_catalog_repository.add_financing_source(
+        added = await self._financing_sources_catalog_repository.add_financing_source(
             request_dto
         )
+        self._catalog_cache.invalidate(CatalogName.FINANCING_SOURCES, added.id)
+
+        return added
 
     async def update_patient_context_attribute(
         self,
@@ -271,6 +291,9 @@ class FinancingSourceCatalogService:
                 financing_source_id, request_dto
             )
         )
+        self._catalog_cache.invalidate(
+            CatalogName.FINANCING_SOURCES, financing_source_id
+        )
 
         return updated
 
@@ -289,3 +312,6 @@ class FinancingSourceCatalogService:
         await self._financing_sources_catalog_repository.delete_by_id(
             financing_source_id
         )
+        self._catalog_cache.invalidate(
+            CatalogName.FINANCING_SOURCES, financing_source_id
+        )
@@ -13,6 +13,7 @@ from src.apps.catalogs.infrastructure.api.schemas.responses.medical_organization
     MedicalOrganizationCatalogPartialResponseSchema,
     MultipleMedicalOrganizationsSchema,
 )
+from src.apps.catalogs.infrastructure.catalog_cache import CatalogCache, CatalogName
 from src.apps.catalogs.interfaces.medical_organizations_catalog_repository_interface import (
     MedicalOrganizationsCatalogRepositoryInterface,
 )
@@ -31,11 +32,13 @@ class MedicalOrganizationsCatalogService:
         self,
         logger: LoggerService,
         medical_organizations_catalog_repository: MedicalOrganizationsCatalogRepositoryInterface,
+        catalog_cache: CatalogCache,
     ):
         self._logger = logger
         self._medical_organizations_catalog_repository = (
             medical_organizations_catalog_repository
         )
+        self._catalog_cache = catalog_cache
 
     @staticmethod
     def __get_localized_field(
@@ -100,8 +103,10 @@ class MedicalOrganizationsCatalogService:
         MedicalOrganizationCatalogFullResponseSchema,
         MedicalOrganizationCatalogPartialResponseSchema,
     ]:
-        full_schema = await self._medical_organizations_catalog_repository.get_by_id(
-            medical_organization_id
+        full_schema = await self._catalog_cache.get(
+            CatalogName.MEDICAL_ORGANIZATIONS,
+            medical_organization_id,
+            self._medical_organizations_catalog_repository.get_by_id,
         )
         if not full_schema:
             raise NoInstanceFoundError(
@@ -114,21 +119,35 @@ class MedicalOrganizationsCatalogService:
             return full_schema
 
         chosen_language = get_locale()
-        localized_name = MedicalOrganizationsCatalogService.__get_localized_name(
-            full_schema
-        )
-        localized_address = MedicalOrganizationsCatalogService.__get_localized_address(
-            full_schema,
+
+        return self._catalog_cache.get_localized(
+            CatalogName.MEDICAL_ORGANIZATIONS,
+            medical_organization_id,
+            chosen_language,
+            lambda: MedicalOrganizationCatalogPartialResponseSchema(
+                id=full_schema.id,
+                name=MedicalOrganizationsCatalogService.__get_localized_name(
+                    full_schema
+                ),
+                organization_code=full_schema.organization_code,
+                address=MedicalOrganizationsCatalogService.__get_localized_address(
+                    full_schema,
+                ),
+                lang=chosen_language,
+                created_at=full_schema.created_at,
+                changed_at=full_schema.changed_at,
+            ),
         )
 
-        return MedicalOrganizationCatalogPartialResponseSchema(
-            id=full_schema.id,
-            name=localized_name,
-            organization_code=full_schema.organization_code,
-            address=localized_address,
-            lang=chosen_language,
-            created_at=full_schema.created_at,
-            changed_at=full_schema.changed_at,
+    async def preload_cache(self) -> int:
+        return await self._catalog_cache.preload(
+            CatalogName.MEDICAL_ORGANIZATIONS,
+            lambda limit: self._medical_organizations_catalog_repository.get_medical_organizations(
+                name_filter=None,
+                organization_code_filter=None,
+                address_filter=None,
+                limit=limit,
+            ),
         )
 
     async def get_medical_organizations(
@@ -237,9 +256,12 @@ class MedicalOrganizationsCatalogService:
                     % {"VALUE": value, "CODE": code},
                 )
 
-        return await self._medical_organizations_catalog_repository.add_medical_organization(
+        added = await self._medical_organizations_catalog_repository.add_medical_organization(
             request_dto
         )
+        self._catalog_cache.invalidate(CatalogName.MEDICAL_ORGANIZATIONS, added.id)
+
+        return added
 
     async def update_medical_organization(
         self,
@@ -320,6 +342,9 @@ class MedicalOrganizationsCatalogService:
         updated = await self._medical_organizations_catalog_repository.update_medical_organization(
             context_attribute_id, request_dto
         )
+        self._catalog_cache.invalidate(
+            CatalogName.MEDICAL_ORGANIZATIONS, context_attribute_id
+        )
 
         return updated
 
@@ -338,3 +363,6 @@ class MedicalOrganizationsCatalogService:
         await self._medical_organizations_catalog_repository.delete_by_id(
             context_attribute_id
         )
+        self._catalog_cache.invalidate(
+            CatalogName.MEDICAL_ORGANIZATIONS, context_attribute_id
+        )
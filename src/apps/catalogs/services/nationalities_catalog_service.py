@@ -10,6 +10,7 @@ from src.apps.catalogs.infrastructure.api.schemas.responses.nationalities_catalo
     NationalityCatalogFullResponseSchema,
     NationalityCatalogPartialResponseSchema,
 )
+from src.apps.catalogs.infrastructure.catalog_cache import CatalogCache, CatalogName
 from src.apps.catalogs.interfaces.nationalities_catalog_repository_interface import (
     NationalitiesCatalogRepositoryInterface,
 )
@@ -28,9 +29,11 @@ class NationalitiesCatalogService:
         self,
         logger: LoggerService,
         nationalities_catalog_repository: NationalitiesCatalogRepositoryInterface,
+        catalog_cache: CatalogCache,
     ):
         self._logger = logger
         self._nationalities_catalog_repository = nationalities_catalog_repository
+        self._catalog_cache = catalog_cache
 
     @staticmethod
     def __get_localized_name(
@@ -62,8 +65,10 @@ class NationalitiesCatalogService:
         NationalityCatalogFullResponseSchema,
         NationalityCatalogPartialResponseSchema,
     ]:
-        full_schema = await self._nationalities_catalog_repository.get_by_id(
-            nationality_id
+        full_schema = await self._catalog_cache.get(
+            CatalogName.NATIONALITIES,
+            nationality_id,
+            self._nationalities_catalog_repository.get_by_id,
         )
         if not full_schema:
             raise NoInstanceFoundError(
@@ -76,14 +81,26 @@ class NationalitiesCatalogService:
             return full_schema
 
         chosen_language = get_locale()
-        localized_name = NationalitiesCatalogService.__get_localized_name(full_schema)
-
-        return NationalityCatalogPartialResponseSchema(
-            id=full_schema.id,
-            lang=chosen_language,
-            name=localized_name,
-            created_at=full_schema.created_at,
-            changed_at=full_schema.changed_at,
+
+        return self._catalog_cache.get_localized(
+            CatalogName.NATIONALITIES,
+            nationality_id,
+            chosen_language,
+            lambda: NationalityCatalogPartialResponseSchema(
+                id=full_schema.id,
+                lang=chosen_language,
+                name=NationalitiesCatalogService.__get_localized_name(full_schema),
+                created_at=full_schema.created_at,
+                changed_at=full_schema.changed_at,
+            ),
+        )
+
+    async def preload_cache(self) -> int:
+        return await self._catalog_cache.preload(
+            CatalogName.NATIONALITIES,
+            lambda limit: self._nationalities_catalog_repository.get_nationalities(
+                name_filter=None, limit=limit
+            ),
         )
 
     async def get_nationalities(
@@ -174,7 +191,10 @@ class NationalitiesCatalogService:
                     % {"VALUE": value, "CODE": code},
                 )
 
-        return await self._nationalities_catalog_repository.add_nationality(request_dto)
+        added = await self._nationalities_catalog_repository.add_nationality(request_dto)
+        self._catalog_cache.invalidate(CatalogName.NATIONALITIES, added.id)
+
+        return added
 
     async def update_nationality(
         self,
@@ -232,6 +252,7 @@ class NationalitiesCatalogService:
         updated = await self._nationalities_catalog_repository.update_nationality(
             nationality_id, request_dto
         )
+        self._catalog_cache.invalidate(CatalogName.NATIONALITIES, nationality_id)
 
         return updated
 
@@ -248,3 +269,4 @@ class NationalitiesCatalogService:
             )
 
         await self._nationalities_catalog_repository.delete_by_id(nationality_id)
+        self._catalog_cache.invalidate(CatalogName.NATIONALITIES, nationality_id)
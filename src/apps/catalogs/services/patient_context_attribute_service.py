@@ -10,6 +10,7 @@ from src.apps.catalogs.infrastructure.api.schemas.responses.patient_context_attr
     PatientContextAttributeCatalogFullResponseSchema,
     PatientContextAttributeCatalogPartialResponseSchema,
 )
+from src.apps.catalogs.infrastructure.catalog_cache import CatalogCache, CatalogName
 from src.apps.catalogs.interfaces.patient_context_attributes_repository_interface import (
     PatientContextAttributesCatalogRepositoryInterface,
 )
@@ -28,9 +29,11 @@ class PatientContextAttributeService:
         self,
         logger: LoggerService,
         context_attributes_repository: PatientContextAttributesCatalogRepositoryInterface,
+        catalog_cache: CatalogCache,
     ):
         self._logger = logger
         self._context_attributes_repository = context_attributes_repository
+        self._catalog_cache = catalog_cache
 
     @staticmethod
     def __get_localized_name(
@@ -62,8 +65,10 @@ class PatientContextAttributeService:
         PatientContextAttributeCatalogFullResponseSchema,
         PatientContextAttributeCatalogPartialResponseSchema,
     ]:
-        full_schema = await self._context_attributes_repository.get_by_id(
-            context_attribute_id
+        full_schema = await self._catalog_cache.get(
+            CatalogName.PATIENT_CONTEXT_ATTRIBUTES,
+            context_attribute_id,
+            self._context_attributes_repository.get_by_id,
         )
         if not full_schema:
             raise NoInstanceFoundError(
@@ -78,16 +83,26 @@ class PatientContextAttributeService:
             return full_schema
 
         chosen_language = get_locale()
-        localized_name = PatientContextAttributeService.__get_localized_name(
-            full_schema
+
+        return self._catalog_cache.get_localized(
+            CatalogName.PATIENT_CONTEXT_ATTRIBUTES,
+            context_attribute_id,
+            chosen_language,
+            lambda: PatientContextAttributeCatalogPartialResponseSchema(
+                id=full_schema.id,
+                lang=chosen_language,
+                name=PatientContextAttributeService.__get_localized_name(full_schema),
+                created_at=full_schema.created_at,
+                changed_at=full_schema.changed_at,
+            ),
         )
 
-        return PatientContextAttributeCatalogPartialResponseSchema(
-            id=full_schema.id,
-            lang=chosen_language,
-            name=localized_name,
-            created_at=full_schema.created_at,
-            changed_at=full_schema.changed_at,
+    async def preload_cache(self) -> int:
+        return await self._catalog_cache.preload(
+            CatalogName.PATIENT_CONTEXT_ATTRIBUTES,
+            lambda limit: self._context_attributes_repository.get_patient_context_attributes(
+                name_filter=None, limit=limit
+            ),
         )
 
     async def get_patient_context_attributes(
@@ -178,9 +193,12 @@ class PatientContextAttributeService:
                     % {"VALUE": value, "CODE": code},
                 )
 
-        return await self._context_attributes_repository.add_patient_context_attribute(
+        added = await self._context_attributes_repository.add_patient_context_attribute(
             request_dto
         )
+        self._catalog_cache.invalidate(CatalogName.PATIENT_CONTEXT_ATTRIBUTES, added.id)
+
+        return added
 
     async def update_patient_context_attribute(
         self,
@@ -240,6 +258,9 @@ class PatientContextAttributeService:
                 context_attribute_id, request_dto
             )
         )
+        self._catalog_cache.invalidate(
+            CatalogName.PATIENT_CONTEXT_ATTRIBUTES, context_attribute_id
+        )
 
         return updated
 
@@ -256,3 +277,6 @@ class PatientContextAttributeService:
             )
 
         await self._context_attributes_repository.delete_by_id(context_attribute_id)
+        self._catalog_cache.invalidate(
+            CatalogName.PATIENT_CONTEXT_ATTRIBUTES, context_attribute_id
+        )
@@ -1,28 +1,14 @@
 from dependency_injector import containers, providers
-from sqlalchemy.ext.asyncio.engine import AsyncEngine
-from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.orm.session import sessionmaker
 
-from src.apps.catalogs.services.citizenship_catalog_service import (
-    CitizenshipCatalogService,
-)
-from src.apps.catalogs.services.financing_sources_catalog_service import (
-    FinancingSourceCatalogService,
-)
-from src.apps.catalogs.services.medical_organizations_catalog_service import (
-    MedicalOrganizationsCatalogService,
-)
-from src.apps.catalogs.services.nationalities_catalog_service import (
-    NationalitiesCatalogService,
-)
-from src.apps.catalogs.services.patient_context_attribute_service import (
-    PatientContextAttributeService,
-)
 from src.apps.patients.infrastructure.repositories.patient_repository import (
     SQLAlchemyPatientRepository,
 )
+from src.apps.patients.services.patients_import_service import (
+    PatientsImportService,
+)
 from src.apps.patients.services.patients_service import PatientService
 from src.apps.patients.uow import UnitOfWorkImpl
+from src.core.database.session import ScopedAsyncSession
 from src.core.logger import LoggerService
 
 
@@ -36,30 +22,7 @@ class PatientsContainer(containers.DeclarativeContainer):
 
     # Dependencies from core DI-container
     logger = providers.Dependency(instance_of=LoggerService)
-    engine = providers.Dependency(instance_of=AsyncEngine)
-    citizenship_service = providers.Dependency(instance_of=CitizenshipCatalogService)
-    nationalities_service = providers.Dependency(
-        instance_of=NationalitiesCatalogService
-    )
-    medical_org_service = providers.Dependency(
-        instance_of=MedicalOrganizationsCatalogService
-    )
-    financing_source_service = providers.Dependency(
-        instance_of=FinancingSourceCatalogService
-    )
-    patient_context_attributes_service = providers.Dependency(
-        instance_of=PatientContextAttributeService
-    )
-
-    # Session factory
-    session_factory = providers.Singleton(
-        sessionmaker, bind=engine, expire_on_commit=False, class_=AsyncSession
-    )
-
-    # Async session
-    async_db_session = providers.Singleton(
-        lambda session_factory: session_factory(), session_factory
-    )
+    async_db_session = providers.Dependency(instance_of=ScopedAsyncSession)
 
     # UOW
     unit_of_work = providers.Factory(
@@ -78,9 +41,10 @@ class PatientsContainer(containers.DeclarativeContainer):
         PatientService,
         uow=unit_of_work,
         patients_repository=patients_repository,
-        citizenship_service=citizenship_service,
-        nationalities_service=nationalities_service,
-        medical_org_service=medical_org_service,
-        financing_source_service=financing_source_service,
-        patient_context_attributes_service=patient_context_attributes_service,
+    )
+
+    patients_import_service = providers.Factory(
+        PatientsImportService,
+        uow=unit_of_work,
+        logger=logger,
     )
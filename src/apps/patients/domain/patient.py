@@ -8,9 +8,33 @@ from src.apps.patients.domain.enums import (
     PatientProfileStatusEnum,
     PatientSocialStatusEnum,
 )
+from src.shared.helpers.change_tracking import ChangeTrackingMixin
 
 
-class PatientDomain:
+class PatientDomain(ChangeTrackingMixin):
+    # No per-instance __dict__: list endpoints build a domain object per row
+    __slots__ = (
+        "id",
+        "iin",
+        "first_name",
+        "last_name",
+        "middle_name",
+        "maiden_name",
+        "date_of_birth",
+        "gender",
+        "citizenship_id",
+        "nationality_id",
+        "financing_sources_ids",
+        "context_attributes_ids",
+        "social_status",
+        "marital_status",
+        "attachment_data",
+        "relatives",
+        "addresses",
+        "contact_info",
+        "profile_status",
+    )
+
     def __init__(
         self,
         *,
@@ -53,3 +77,4 @@ class PatientDomain:
         self.addresses = addresses or []
         self.contact_info = contact_info or []
         self.profile_status = profile_status
+        self.mark_clean()
@@ -1,8 +1,9 @@
 import math
+from typing import List, Optional
 from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
 
 from src.apps.patients.container import PatientsContainer
 from src.apps.patients.domain.patient import PatientDomain
@@ -17,10 +18,20 @@ from src.apps.patients.infrastructure.api.schemas.responses.patient_response_sch
     MultiplePatientsResponseSchema,
     ResponsePatientSchema,
 )
+from src.apps.patients.infrastructure.api.schemas.responses.patients_import_schemas import (
+    PatientsImportReportSchema,
+)
+from src.apps.patients.infrastructure.import_readers import (
+    ImportFileFormat,
+    read_import_rows,
+)
 from src.apps.patients.mappers import (
     map_create_schema_to_domain,
     map_patient_domain_to_response_schema,
 )
+from src.apps.patients.services.patients_import_service import (
+    PatientsImportService,
+)
 from src.apps.patients.services.patients_service import PatientService
 from src.shared.schemas.pagination_schemas import (
     PaginationMetaDataSchema,
@@ -30,6 +41,26 @@ from src.shared.schemas.pagination_schemas import (
 patients_router = APIRouter(prefix="/patients")
 
 
+@patients_router.get("/search", response_model=List[ResponsePatientSchema])
+@inject
+async def search_patients(
+    text: str = Query(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="IIN prefix (digits only) or patient's full name (typos are tolerated)",
+    ),
+    limit: int = Query(20, ge=1, le=100),
+    service: PatientService = Depends(Provide[PatientsContainer.patients_service]),
+) -> List[ResponsePatientSchema]:
+    """
+    Searches patients by an IIN prefix (ordered by IIN) or by their full name
+    (ordered by the similarity to the given text).
+    """
+    patients = await service.search_patients(text, limit)
+    return [map_patient_domain_to_response_schema(patient) for patient in patients]
+
+
 @patients_router.get("/{patient_id}", response_model=ResponsePatientSchema)
 @inject
 async def get_by_id(
@@ -47,16 +78,32 @@ async def get_patients(
     pagination_params: PaginationParams = Depends(),
     service: PatientService = Depends(Provide[PatientsContainer.patients_service]),
 ) -> MultiplePatientsResponseSchema:
-    patients, total_number_of_items = await service.get_patients(
-        filter_params, pagination_params
-    )
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+    if pagination_params.is_cursor_mode:
+        cursor_page, total_number_of_items = await service.get_patients_by_cursor(
+            filter_params, pagination_params
+        )
+        patients = cursor_page.items
+        next_cursor, prev_cursor = cursor_page.next_cursor, cursor_page.prev_cursor
+    else:
+        patients, total_number_of_items = await service.get_patients(
+            filter_params, pagination_params
+        )
 
     # Calculate pagination metadata
     page: int = pagination_params.page or 1  # for mypy
     limit: int = pagination_params.limit or 30  # for mypy
-    total_pages = math.ceil(total_number_of_items / limit) if limit else 1
-    has_next = page < total_pages
-    has_prev = page > 1
+    # Not counted in cursor mode unless requested
+    total_pages: Optional[int] = None
+    if total_number_of_items is not None:
+        total_pages = math.ceil(total_number_of_items / limit) if limit else 1
+    if pagination_params.is_cursor_mode:
+        has_next, has_prev = next_cursor is not None, prev_cursor is not None
+    else:
+        has_next = page < total_pages
+        has_prev = page > 1
 
     pagination_metadata = PaginationMetaDataSchema(
         current_page=page,
@@ -65,6 +112,8 @@ async def get_patients(
         total_pages=total_pages,
         has_next=has_next,
         has_prev=has_prev,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
     )
 
     response_schema = MultiplePatientsResponseSchema(
@@ -90,6 +139,24 @@ async def create_patient(
     return map_patient_domain_to_response_schema(created)
 
 
+@patients_router.post("/import", response_model=PatientsImportReportSchema)
+@inject
+async def import_patients(
+    request: Request,
+    file_format: ImportFileFormat = Query(ImportFileFormat.CSV, alias="format"),
+    service: PatientsImportService = Depends(
+        Provide[PatientsContainer.patients_import_service]
+    ),
+) -> PatientsImportReportSchema:
+    """
+    Imports patients from a CSV (header row of patient fields, nested fields as JSON)
+    or NDJSON request body. The body is streamed, rows are validated and saved
+    in chunks; invalid rows are skipped and listed in the report.
+    """
+    rows = read_import_rows(request.stream(), file_format)
+    return await service.import_patients(rows)
+
+
 @patients_router.patch("/{patient_id}", response_model=ResponsePatientSchema)
 @inject
 async def update_patient(
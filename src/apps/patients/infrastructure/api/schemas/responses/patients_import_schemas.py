@@ -0,0 +1,16 @@
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class PatientsImportRowErrorSchema(BaseModel):
+    row: int
+    iin: Optional[str] = None
+    errors: List[str]
+
+
+class PatientsImportReportSchema(BaseModel):
+    total_rows: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[PatientsImportRowErrorSchema] = []
@@ -3,7 +3,7 @@ from typing import Any, Dict, List
 
 from sqlalchemy import Date
 from sqlalchemy import Enum as SAEnum
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import Computed, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql.json import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -37,6 +37,14 @@ class SQLAlchemyPatient(Base, PrimaryKey, ChangedAtMixin, CreatedAtMixin):
     first_name: Mapped[str] = mapped_column(String(100), nullable=False)
     last_name: Mapped[str] = mapped_column(String(100), nullable=False)
     middle_name: Mapped[str] = mapped_column(String(100), nullable=True)
+    # Lowercase full name ("last first middle") for the trigram search
+    search_name: Mapped[str] = mapped_column(
+        Text,
+        Computed(
+            "lower(last_name || ' ' || first_name || coalesce(' ' || middle_name, ''))",
+            persisted=True,
+        ),
+    )
     maiden_name: Mapped[str] = mapped_column(
         String(100),
         nullable=True,
@@ -175,3 +183,22 @@ class SQLAlchemyPatient(Base, PrimaryKey, ChangedAtMixin, CreatedAtMixin):
         back_populates="patient",
         lazy="selectin",
     )
+
+    __table_args__ = (
+        # Keyset pagination of patients (ordered by creation date, id)
+        Index("ix_patients_created_at_id", "created_at", "id"),
+        # Name search: ILIKE '%part%' and word similarity (pg_trgm)
+        Index(
+            "ix_patients_search_name",
+            "search_name",
+            postgresql_using="gin",
+            postgresql_ops={"search_name": "gin_trgm_ops"},
+        ),
+        # Search of the stationary assets journal by a part of the IIN
+        Index(
+            "ix_patients_iin_trgm",
+            "iin",
+            postgresql_using="gin",
+            postgresql_ops={"iin": "gin_trgm_ops"},
+        ),
+    )
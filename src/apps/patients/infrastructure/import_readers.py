@@ -0,0 +1,138 @@
+import codecs
+import csv
+import io
+import json
+from enum import Enum
+from typing import Any, AsyncIterable, AsyncIterator, Dict, NamedTuple, Optional
+
+# CSV cells holding JSON (nested objects and lists of IDs)
+CSV_JSON_COLUMNS = {
+    "financing_sources_ids",
+    "context_attributes_ids",
+    "attachment_data",
+    "relatives",
+    "addresses",
+    "contact_info",
+}
+
+
+class ImportFileFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class ImportRow(NamedTuple):
+    """
+    A single record of an import file.
+
+    `number` is the line of the file the record starts on, `error` is set
+    (and `data` is None) if the record couldn't be parsed.
+    """
+
+    number: int
+    data: Optional[Dict[str, Any]]
+    error: Optional[str] = None
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """
+    Splits a stream of UTF-8 bytes into lines (line endings are kept).
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    tail = ""
+    async for chunk in chunks:
+        # The last line may continue in the next chunk
+        *lines, tail = (tail + decoder.decode(chunk)).split("\n")
+        for line in lines:
+            yield line + "\n"
+
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+async def read_ndjson_rows(chunks: AsyncIterable[bytes]) -> AsyncIterator[ImportRow]:
+    line_number = 0
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if not line.strip():
+            continue
+
+        try:
+            data = json.loads(line)
+        except ValueError as err:
+            yield ImportRow(line_number, None, f"Invalid JSON: {err}")
+            continue
+
+        if not isinstance(data, dict):
+            yield ImportRow(line_number, None, "A JSON object is expected.")
+            continue
+
+        yield ImportRow(line_number, data)
+
+
+async def read_csv_rows(chunks: AsyncIterable[bytes]) -> AsyncIterator[ImportRow]:
+    """
+    Reads a CSV file with a header row of patient fields. Empty cells are skipped,
+    cells of `CSV_JSON_COLUMNS` are decoded from JSON (e.g. `[1, 2]`).
+    """
+    header = None
+    line_number = 0
+    record_start = 0
+    pending = ""
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if not pending:
+            record_start = line_number
+        pending += line
+        # A quoted cell continues on the next line until its quotes are balanced
+        if pending.count('"') % 2:
+            continue
+
+        record, pending = pending, ""
+        if not record.strip():
+            continue
+
+        cells = next(csv.reader(io.StringIO(record)))
+        if header is None:
+            header = [cell.strip() for cell in cells]
+            continue
+
+        yield _build_csv_row(record_start, header, cells)
+
+    if pending.strip() and header is not None:
+        yield ImportRow(record_start, None, "Unterminated quoted cell.")
+
+
+def _build_csv_row(number: int, header: list, cells: list) -> ImportRow:
+    if len(cells) != len(header):
+        return ImportRow(
+            number,
+            None,
+            f"Expected {len(header)} cells, got {len(cells)}.",
+        )
+
+    data: Dict[str, Any] = {}
+    for column, cell in zip(header, cells):
+        if cell == "":
+            continue
+
+        if column in CSV_JSON_COLUMNS:
+            try:
+                data[column] = json.loads(cell)
+            except ValueError:
+                # Left as is, so the validation reports the wrong type of the field
+                data[column] = cell
+        else:
+            data[column] = cell
+
+    return ImportRow(number, data)
+
+
+def read_import_rows(
+    chunks: AsyncIterable[bytes], file_format: ImportFileFormat
+) -> AsyncIterator[ImportRow]:
+    if file_format == ImportFileFormat.CSV:
+        return read_csv_rows(chunks)
+
+    return read_ndjson_rows(chunks)
@@ -1,15 +1,44 @@
+import json
+import uuid
+from collections import defaultdict
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Collection, Dict, List, Optional, Set
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import (
+    Column,
+    Table,
+    and_,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.util import identity_key
 
 from src.apps.catalogs.infrastructure.db_models.models import (
+    SQLAlchemyCitizenshipCatalogue,
     SQLAlchemyFinancingSourcesCatalog,
+    SQLAlchemyMedicalOrganizationsCatalogue,
+    SQLAlchemyNationalitiesCatalogue,
     SQLAlchemyPatientContextAttributesCatalogue,
 )
+from src.apps.patients.domain.enums import (
+    PatientGenderEnum,
+    PatientMaritalStatusEnum,
+    PatientProfileStatusEnum,
+    PatientSocialStatusEnum,
+)
 from src.apps.patients.domain.patient import PatientDomain
+from src.apps.patients.infrastructure.db_models.association_tables import (
+    patient_additional_attribute,
+    patient_financing_source,
+)
 from src.apps.patients.infrastructure.db_models.patients import SQLAlchemyPatient
 from src.apps.patients.interfaces.patient_repository_interface import (
     PatientRepositoryInterface,
@@ -17,8 +46,142 @@ from src.apps.patients.interfaces.patient_repository_interface import (
 from src.apps.patients.mappers import (
     map_patient_db_entity_to_domain,
     map_patient_domain_to_db_entity,
+    map_patient_row_to_domain,
+    safe_serialize,
 )
 from src.shared.infrastructure.base import BaseRepository
+from src.shared.infrastructure.keyset_pagination import (
+    CursorPage,
+    apply_keyset_pagination,
+    build_cursor_page,
+)
+
+
+# Catalogs referenced by a patient, keyed by the patient's field
+RELATED_CATALOG_MODELS = {
+    "citizenship_id": SQLAlchemyCitizenshipCatalogue,
+    "nationality_id": SQLAlchemyNationalitiesCatalogue,
+    "attached_clinic_id": SQLAlchemyMedicalOrganizationsCatalogue,
+    "financing_sources_ids": SQLAlchemyFinancingSourcesCatalog,
+    "context_attributes_ids": SQLAlchemyPatientContextAttributesCatalogue,
+}
+
+# IINs consist of exactly this number of digits
+IIN_LENGTH = 12
+
+# Columns written by COPY (created_at / changed_at are filled by the server defaults)
+PATIENT_COPY_COLUMNS = (
+    "id",
+    "iin",
+    "first_name",
+    "last_name",
+    "middle_name",
+    "maiden_name",
+    "date_of_birth",
+    "gender",
+    "citizenship_id",
+    "nationality_id",
+    "social_status",
+    "marital_status",
+    "attachment_data",
+    "relatives",
+    "addresses",
+    "contact_info",
+    "profile_status",
+)
+
+# Fields of the patient's domain written to the columns as is / converted to JSONB
+PATIENT_SCALAR_FIELDS = frozenset(
+    {
+        "iin",
+        "first_name",
+        "last_name",
+        "middle_name",
+        "maiden_name",
+        "date_of_birth",
+        "gender",
+        "citizenship_id",
+        "nationality_id",
+        "social_status",
+        "marital_status",
+        "profile_status",
+    }
+)
+PATIENT_JSONB_FIELDS = frozenset({"attachment_data", "relatives", "addresses", "contact_info"})
+# Relations of the patient's entity, keyed by the domain's field of their IDs
+PATIENT_LINK_RELATIONS = {
+    "financing_sources_ids": "financing_sources",
+    "context_attributes_ids": "additional_attributes",
+}
+
+
+
+def _linked_ids(association_column: Column, patient_id_column: Column):
+    # NULL without links, as the entity mapper gives for empty relations
+    return (
+        select(func.array_agg(aggregate_order_by(association_column, association_column)))
+        .where(patient_id_column == SQLAlchemyPatient.id)
+        .scalar_subquery()
+    )
+
+
+# Columns of the patient's domain, selected as plain rows by the lists
+# (catalog links are aggregated by correlated subqueries)
+PATIENT_COLUMNS = (
+    SQLAlchemyPatient.id,
+    SQLAlchemyPatient.iin,
+    SQLAlchemyPatient.first_name,
+    SQLAlchemyPatient.last_name,
+    SQLAlchemyPatient.middle_name,
+    SQLAlchemyPatient.maiden_name,
+    SQLAlchemyPatient.date_of_birth,
+    SQLAlchemyPatient.gender,
+    SQLAlchemyPatient.citizenship_id,
+    SQLAlchemyPatient.nationality_id,
+    _linked_ids(
+        patient_financing_source.c.financing_source_id,
+        patient_financing_source.c.patient_id,
+    ).label("financing_sources_ids"),
+    _linked_ids(
+        patient_additional_attribute.c.additional_attribute_id,
+        patient_additional_attribute.c.patient_id,
+    ).label("context_attributes_ids"),
+    SQLAlchemyPatient.social_status,
+    SQLAlchemyPatient.marital_status,
+    SQLAlchemyPatient.attachment_data,
+    SQLAlchemyPatient.relatives,
+    SQLAlchemyPatient.addresses,
+    SQLAlchemyPatient.contact_info,
+    SQLAlchemyPatient.profile_status,
+)
+
+
+def _to_jsonb(value: Any) -> Optional[str]:
+    serialized = safe_serialize(value)
+
+    return json.dumps(serialized, ensure_ascii=False) if serialized is not None else None
+
+
+def _to_copy_record(patient: PatientDomain) -> tuple:
+    return (
+        patient.id,
+        patient.iin,
+        patient.first_name,
+        patient.last_name,
+        patient.middle_name,
+        patient.maiden_name,
+        patient.date_of_birth,
+        (patient.gender or PatientGenderEnum.NOT_SPECIFIED).value,
+        patient.citizenship_id,
+        patient.nationality_id,
+        (patient.social_status or PatientSocialStatusEnum.NOT_SPECIFIED).value,
+        (patient.marital_status or PatientMaritalStatusEnum.NOT_SPECIFIED).value,
+        _to_jsonb(patient.attachment_data or {}),
+        _to_jsonb(patient.relatives or []),
+        _to_jsonb(patient.addresses or []),
+        _to_jsonb(patient.contact_info or []),
+        (patient.profile_status or PatientProfileStatusEnum.ACTIVE).value,
+    )
 
 
 class SQLAlchemyPatientRepository(BaseRepository, PatientRepositoryInterface):
@@ -26,6 +189,44 @@ class SQLAlchemyPatientRepository(BaseRepository, PatientRepositoryInterface):
     SQLAlchemy repository for working with patients.
     """
 
+    def _apply_filters(self, query, filters: Optional[Dict[str, Any]]):
+        if not filters:
+            return query
+
+        # Copy, so the caller's filters are not mutated
+        filters = dict(filters)
+
+        # Every part of the full name is searched in the first, last and middle
+        # names at once (the generated search name is trigram-indexed)
+        full_name = filters.pop("patient_full_name", None)
+        if isinstance(full_name, str):
+            clauses = [
+                SQLAlchemyPatient.search_name.ilike(f"%{part}%")
+                for part in full_name.lower().split()
+            ]
+            if clauses:
+                query = query.where(and_(*clauses))
+
+        # Other filters
+        for attribute, value in filters.items():
+            column = getattr(SQLAlchemyPatient, attribute, None)
+            if column is None or value is None:
+                continue
+
+            # Enum filtering
+            if hasattr(column, "type") and hasattr(column.type, "enums"):
+                enum_value = value.value if isinstance(value, Enum) else value
+                query = query.where(column == enum_value)
+
+            # String *ILIKE filtering
+            elif isinstance(value, str):
+                query = query.where(column.ilike(f"%{value}%"))
+
+            else:
+                query = query.where(column == value)
+
+        return query
+
     async def get_total_number_of_patients(self) -> int:
         query = select(func.count(SQLAlchemyPatient.id))
         result = await self._async_db_session.execute(query)
@@ -49,6 +250,14 @@ class SQLAlchemyPatientRepository(BaseRepository, PatientRepositoryInterface):
 
         return map_patient_db_entity_to_domain(db_patient)
 
+    async def get_many_by_ids(self, patient_ids: List[UUID]) -> List[PatientDomain]:
+        if not patient_ids:
+            return []
+
+        query = select(*PATIENT_COLUMNS).where(SQLAlchemyPatient.id.in_(patient_ids))
+
+        return [map_patient_row_to_domain(row) for row in await self._fetch_rows(query)]
+
     async def get_by_iin(self, patient_iin: str) -> Optional[PatientDomain]:
         query = (
             select(SQLAlchemyPatient)
@@ -72,56 +281,164 @@ class SQLAlchemyPatientRepository(BaseRepository, PatientRepositoryInterface):
         page: int = 1,
         limit: int = 30,
     ) -> List[PatientDomain]:
-        query = select(SQLAlchemyPatient).options(
-            selectinload(SQLAlchemyPatient.financing_sources),
-            selectinload(SQLAlchemyPatient.additional_attributes),
+        query = self._apply_filters(select(*PATIENT_COLUMNS), filters)
+
+        query = query.offset((page - 1) * limit).limit(limit)
+
+        return [map_patient_row_to_domain(row) for row in await self._fetch_rows(query)]
+
+    async def get_patients_by_cursor(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 30,
+        cursor: Optional[str] = None,
+    ) -> CursorPage[PatientDomain]:
+        query = self._apply_filters(
+            select(*PATIENT_COLUMNS, SQLAlchemyPatient.created_at), filters
+        )
+        query, direction = apply_keyset_pagination(
+            query,
+            sort_keys=(SQLAlchemyPatient.created_at, SQLAlchemyPatient.id),
+            cursor=cursor,
+            limit=limit,
+        )
+
+        page = build_cursor_page(
+            rows=await self._fetch_rows(query),
+            sort_values_getter=lambda row: (row.created_at, row.id),
+            limit=limit,
+            cursor=cursor,
+            direction=direction,
         )
 
-        if filters:
-            # Complex filtering by a several fields
-            full_name = filters.pop("patient_full_name", None)
-            if isinstance(full_name, str):
-                text = full_name.strip().lower()
-                if text:
-                    parts = [patient for patient in text.split() if patient]
-                    clauses = [
-                        or_(
-                            func.lower(SQLAlchemyPatient.first_name).ilike(f"%{part}%"),
-                            func.lower(SQLAlchemyPatient.last_name).ilike(f"%{part}%"),
-                            func.lower(
-                                func.coalesce(SQLAlchemyPatient.middle_name, "")
-                            ).ilike(f"%{part}%"),
-                        )
-                        for part in parts
-                    ]
-                    if clauses:
-                        query = query.where(and_(*clauses))
-
-            # Other filters
-            for attribute, value in filters.items():
-                column = getattr(SQLAlchemyPatient, attribute, None)
-                if column is None or value is None:
-                    continue
-
-                # Enum filtering
-                if hasattr(column, "type") and hasattr(column.type, "enums"):
-                    enum_value = value.value if isinstance(value, Enum) else value
-                    query = query.where(column == enum_value)
-
-                # String *ILIKE filtering
-                elif isinstance(value, str):
-                    query = query.where(column.ilike(f"%{value}%"))
-
-                else:
-                    query = query.where(column == value)
+        return page._replace(
+            items=[map_patient_row_to_domain(row) for row in page.items]
+        )
 
-        query = query.offset((page - 1) * limit).limit(limit)
+    async def search_patients(self, text: str, limit: int = 20) -> List[PatientDomain]:
+        text = " ".join(text.lower().split())
+        if not text:
+            return []
+
+        query = select(*PATIENT_COLUMNS)
+
+        if text.isdigit():
+            if len(text) > IIN_LENGTH:
+                return []
+
+            # IIN prefix as a range of the unique IIN index
+            query = query.where(
+                SQLAlchemyPatient.iin.between(
+                    text.ljust(IIN_LENGTH, "0"), text.ljust(IIN_LENGTH, "9")
+                )
+            ).order_by(SQLAlchemyPatient.iin)
+        else:
+            # Names, ranked by the similarity to their closest part (pg_trgm)
+            similarity = func.word_similarity(text, SQLAlchemyPatient.search_name)
+            query = query.where(
+                SQLAlchemyPatient.search_name.bool_op("%>")(text)
+            ).order_by(similarity.desc(), SQLAlchemyPatient.search_name)
+
+        rows = await self._fetch_rows(query.limit(limit))
+
+        return [map_patient_row_to_domain(row) for row in rows]
+
+    async def get_missing_related_ids(
+        self, related_ids: Dict[str, Collection[int]]
+    ) -> Dict[str, List[int]]:
+        ids_by_field: Dict[str, Set[int]] = {
+            field: set(ids) for field, ids in related_ids.items() if ids
+        }
+        if not ids_by_field:
+            return {}
+
+        # One UNION ALL query for all catalogs: (field, id) of every existing record
+        queries = [
+            select(
+                literal(field).label("field"),
+                RELATED_CATALOG_MODELS[field].id.label("id"),
+            ).where(RELATED_CATALOG_MODELS[field].id.in_(ids))
+            for field, ids in ids_by_field.items()
+        ]
+        query = queries[0] if len(queries) == 1 else union_all(*queries)
+        result = await self._async_db_session.execute(query)
+
+        existing_ids: Dict[str, Set[int]] = defaultdict(set)
+        for field, item_id in result.all():
+            existing_ids[field].add(item_id)
+
+        missing_ids = {
+            field: sorted(ids - existing_ids[field])
+            for field, ids in ids_by_field.items()
+        }
+
+        return {field: ids for field, ids in missing_ids.items() if ids}
+
+    async def get_existing_iins(self, iins: Collection[str]) -> Set[str]:
+        if not iins:
+            return set()
+
+        query = select(SQLAlchemyPatient.iin).where(SQLAlchemyPatient.iin.in_(set(iins)))
         result = await self._async_db_session.execute(query)
-        db_patients = result.scalars().all()
 
-        return [
-            map_patient_db_entity_to_domain(db_patient) for db_patient in db_patients
+        return set(result.scalars().all())
+
+    async def get_ids_by_iins(self, iins: Collection[str]) -> Dict[str, UUID]:
+        if not iins:
+            return {}
+
+        query = select(SQLAlchemyPatient.iin, SQLAlchemyPatient.id).where(
+            SQLAlchemyPatient.iin.in_(set(iins))
+        )
+        result = await self._async_db_session.execute(query)
+
+        return {iin: patient_id for iin, patient_id in result.all()}
+
+    async def copy_patients(self, patients: List[PatientDomain]) -> int:
+        if not patients:
+            return 0
+
+        for patient in patients:
+            patient.id = patient.id or uuid.uuid4()
+
+        connection = await self._async_db_session.connection()
+        raw_connection = (await connection.get_raw_connection()).driver_connection
+        # COPY joins the session transaction only after SQLAlchemy has issued BEGIN,
+        # which it does lazily on the first statement
+        if not raw_connection.is_in_transaction():
+            await connection.execute(select(literal(1)))
+
+        await raw_connection.copy_records_to_table(
+            SQLAlchemyPatient.__tablename__,
+            records=[_to_copy_record(patient) for patient in patients],
+            columns=PATIENT_COPY_COLUMNS,
+        )
+
+        financing_sources = [
+            (patient.id, source_id)
+            for patient in patients
+            for source_id in set(patient.financing_sources_ids or [])
+        ]
+        if financing_sources:
+            await raw_connection.copy_records_to_table(
+                patient_financing_source.name,
+                records=financing_sources,
+                columns=("patient_id", "financing_source_id"),
+            )
+
+        context_attributes = [
+            (patient.id, attribute_id)
+            for patient in patients
+            for attribute_id in set(patient.context_attributes_ids or [])
         ]
+        if context_attributes:
+            await raw_connection.copy_records_to_table(
+                patient_additional_attribute.name,
+                records=context_attributes,
+                columns=("patient_id", "additional_attribute_id"),
+            )
+
+        return len(patients)
 
     async def create_patient(self, patient_domain: PatientDomain) -> PatientDomain:
         # Convert domain model to database entity
@@ -168,78 +485,94 @@ class SQLAlchemyPatientRepository(BaseRepository, PatientRepositoryInterface):
         return map_patient_db_entity_to_domain(db_patient)
 
     async def update_patient(self, patient_domain: PatientDomain) -> PatientDomain:
-        # Fetch existing patient entity
-        result = await self._async_db_session.execute(
-            select(SQLAlchemyPatient)
-            .options(
-                selectinload(SQLAlchemyPatient.financing_sources),
-                selectinload(SQLAlchemyPatient.additional_attributes),
+        """
+        Writes only the changed fields of the patient: a single UPDATE of the
+        changed columns, and the links of the changed catalogs are replaced.
+        """
+        changed_fields = patient_domain.changed_fields
+        if not changed_fields:
+            return patient_domain
+
+        values = {
+            field: getattr(patient_domain, field)
+            for field in PATIENT_SCALAR_FIELDS & changed_fields
+        }
+        jsonb_fields = PATIENT_JSONB_FIELDS & changed_fields
+        if jsonb_fields:
+            # Map domain to temp entity for JSONB conversion
+            mapped_patient = map_patient_domain_to_db_entity(patient_domain)
+            for field in jsonb_fields:
+                values[field] = getattr(mapped_patient, field)
+
+        if values:
+            # Only the ID is returned: the patient entity isn't loaded back,
+            # which would select its selectin collections (appointments included)
+            result = await self._async_db_session.execute(
+                update(SQLAlchemyPatient)
+                .where(SQLAlchemyPatient.id == patient_domain.id)
+                .values(values)
+                .returning(SQLAlchemyPatient.id)
+            )
+            if result.scalar_one_or_none() is None:
+                raise self._not_found_error(patient_domain.id)
+
+        # Replace links of the changed catalogs
+        if "financing_sources_ids" in changed_fields:
+            await self._replace_links(
+                patient_financing_source,
+                patient_financing_source.c.financing_source_id,
+                SQLAlchemyFinancingSourcesCatalog,
+                patient_domain.id,
+                patient_domain.financing_sources_ids,
+            )
+        if "context_attributes_ids" in changed_fields:
+            await self._replace_links(
+                patient_additional_attribute,
+                patient_additional_attribute.c.additional_attribute_id,
+                SQLAlchemyPatientContextAttributesCatalogue,
+                patient_domain.id,
+                patient_domain.context_attributes_ids,
             )
-            .where(SQLAlchemyPatient.id == patient_domain.id)
-        )
-        db_patient = result.scalars().first()
 
-        # Map domain to temp entity for JSONB conversion
-        mapped_patient = map_patient_domain_to_db_entity(patient_domain)
-
-        # Update JSONB fields with primitive data
-        db_patient.attachment_data = mapped_patient.attachment_data
-        db_patient.relatives = mapped_patient.relatives
-        db_patient.addresses = mapped_patient.addresses
-        db_patient.contact_info = mapped_patient.contact_info
-
-        # Update scalar fields from domain
-        SCALAR_FIELDS = [
-            "iin",
-            "first_name",
-            "last_name",
-            "middle_name",
-            "maiden_name",
-            "date_of_birth",
-            "gender",
-            "citizenship_id",
-            "nationality_id",
-            "social_status",
-            "marital_status",
-            "profile_status",
+        # The loaded patient keeps the former links otherwise (no expiry on commit)
+        changed_relations = [
+            relation
+            for field, relation in PATIENT_LINK_RELATIONS.items()
+            if field in changed_fields
         ]
-        for field in SCALAR_FIELDS:
-            setattr(db_patient, field, getattr(patient_domain, field))
-
-        # Refresh financing sources if IDs provided
-        if patient_domain.financing_sources_ids is not None:
-            if patient_domain.financing_sources_ids:
-                financing_sources_query = select(
-                    SQLAlchemyFinancingSourcesCatalog
-                ).where(
-                    SQLAlchemyFinancingSourcesCatalog.id.in_(
-                        patient_domain.financing_sources_ids
-                    )
-                )
-                result = await self._async_db_session.execute(financing_sources_query)
-                db_patient.financing_sources = list(result.scalars().all())
-            else:
-                db_patient.financing_sources = []
-
-        # Refresh context attributes if IDs provided
-        if patient_domain.context_attributes_ids is not None:
-            if patient_domain.context_attributes_ids:
-                context_attrs_query = select(
-                    SQLAlchemyPatientContextAttributesCatalogue
-                ).where(
-                    SQLAlchemyPatientContextAttributesCatalogue.id.in_(
-                        patient_domain.context_attributes_ids
-                    )
-                )
-                result = await self._async_db_session.execute(context_attrs_query)
-                db_patient.additional_attributes = list(result.scalars().all())
-            else:
-                db_patient.additional_attributes = []
+        db_patient = self._async_db_session.identity_map.get(
+            identity_key(SQLAlchemyPatient, patient_domain.id)
+        )
+        if changed_relations and db_patient is not None:
+            self._async_db_session.expire(db_patient, changed_relations)
 
-        # Flush updates and reload entity
-        await self._async_db_session.flush()
+        patient_domain.mark_clean()
 
-        return map_patient_db_entity_to_domain(db_patient)
+        return patient_domain
+
+    async def _replace_links(
+        self,
+        association_table: Table,
+        catalog_column: Column,
+        catalog_model: Any,
+        patient_id: UUID,
+        catalog_ids: Optional[List[int]],
+    ) -> None:
+        await self._async_db_session.execute(
+            delete(association_table).where(
+                association_table.c.patient_id == patient_id
+            )
+        )
+        if catalog_ids:
+            # Only existing catalog entries are linked
+            await self._async_db_session.execute(
+                insert(association_table).from_select(
+                    [association_table.c.patient_id, catalog_column],
+                    select(literal(patient_id), catalog_model.id).where(
+                        catalog_model.id.in_(catalog_ids)
+                    ),
+                )
+            )
 
     async def delete_by_id(self, patient_id: UUID) -> None:
         query = select(SQLAlchemyPatient).where(SQLAlchemyPatient.id == patient_id)
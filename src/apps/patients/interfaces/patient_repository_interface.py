@@ -1,8 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Collection, Dict, List, Optional, Set
 from uuid import UUID
 
 from src.apps.patients.domain.patient import PatientDomain
+from src.shared.infrastructure.keyset_pagination import CursorPage
 
 
 class PatientRepositoryInterface(ABC):
@@ -25,6 +26,16 @@ class PatientRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_many_by_ids(self, patient_ids: List[UUID]) -> List[PatientDomain]:
+        """
+        Retrieves patients by their ids from the DB with a single query.
+
+        :param patient_ids: Patients' unique identifiers
+        :return: List of found patient domain objects (missing ids are skipped).
+        """
+        pass
+
     @abstractmethod
     async def get_by_iin(self, patient_iin: str) -> Optional[PatientDomain]:
         """
@@ -53,6 +64,84 @@ class PatientRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_patients_by_cursor(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 30,
+        cursor: Optional[str] = None,
+    ) -> CursorPage[PatientDomain]:
+        """
+        Retrieves a page of patients based on the given filters using keyset pagination
+        (ordered by creation date).
+
+        :param filters: Parameters to filter patients by
+        :param limit: Pagination parameter (items per page)
+        :param cursor: Opaque cursor of the neighbour page (None for the first page)
+
+        :return: Page of patient domain objects with the cursors of the neighbour pages.
+        """
+        pass
+
+    @abstractmethod
+    async def search_patients(self, text: str, limit: int = 20) -> List[PatientDomain]:
+        """
+        Searches patients by the beginning of their IIN (if the text consists of digits)
+        or by their full name, tolerating typos and partial words.
+
+        :param text: IIN prefix or (a part of) the full name
+        :param limit: Maximum number of patients to return
+
+        :return: Patient domain objects ordered by IIN or by the name similarity.
+        """
+        pass
+
+    @abstractmethod
+    async def get_missing_related_ids(
+        self, related_ids: Dict[str, Collection[int]]
+    ) -> Dict[str, List[int]]:
+        """
+        Checks with a single query that the catalog records referenced by a patient exist.
+
+        :param related_ids: Referenced IDs keyed by the patient's field
+            ('citizenship_id', 'nationality_id', 'attached_clinic_id',
+            'financing_sources_ids', 'context_attributes_ids')
+        :return: Sorted missing IDs keyed by the patient's field
+            (fields without missing IDs are omitted).
+        """
+        pass
+
+    @abstractmethod
+    async def get_existing_iins(self, iins: Collection[str]) -> Set[str]:
+        """
+        Retrieves which of the given IINs are already taken with a single query.
+
+        :param iins: IINs to check
+        :return: Set of IINs already present in the DB.
+        """
+        pass
+
+    @abstractmethod
+    async def get_ids_by_iins(self, iins: Collection[str]) -> Dict[str, UUID]:
+        """
+        Retrieves IDs of the patients with the given IINs with a single query.
+
+        :param iins: IINs to look up
+        :return: Patient IDs keyed by IIN (unknown IINs are omitted).
+        """
+        pass
+
+    @abstractmethod
+    async def copy_patients(self, patients: List[PatientDomain]) -> int:
+        """
+        Writes already validated patients and their financing sources and context
+        attributes with PostgreSQL COPY. Must be called inside a transaction (UOW).
+
+        :param patients: Patient domain objects (missing IDs are generated)
+        :return: Number of written patients.
+        """
+        pass
+
     @abstractmethod
     async def create_patient(self, patient_domain: PatientDomain) -> PatientDomain:
         """
@@ -1,6 +1,8 @@
 from datetime import date
 from enum import Enum
 
+from sqlalchemy import Row
+
 from src.apps.patients.domain.patient import PatientDomain
 from src.apps.patients.infrastructure.api.schemas.jsonb_fields_schemas import (
     PatientAddressItemSchema,
@@ -92,6 +94,34 @@ def map_patient_db_entity_to_domain(db_patient: SQLAlchemyPatient) -> PatientDom
     )
 
 
+def map_patient_row_to_domain(row: Row) -> PatientDomain:
+    """
+    Maps a row of the patient's columns and aggregated catalog IDs, selected
+    without building an ORM entity (read-only lists).
+    """
+    return PatientDomain(
+        id=row.id,
+        iin=row.iin,
+        first_name=row.first_name,
+        last_name=row.last_name,
+        middle_name=row.middle_name,
+        maiden_name=row.maiden_name,
+        date_of_birth=row.date_of_birth,
+        gender=row.gender,
+        citizenship_id=row.citizenship_id,
+        nationality_id=row.nationality_id,
+        financing_sources_ids=row.financing_sources_ids,
+        context_attributes_ids=row.context_attributes_ids,
+        social_status=row.social_status,
+        marital_status=row.marital_status,
+        attachment_data=row.attachment_data,
+        relatives=row.relatives,
+        addresses=row.addresses,
+        contact_info=row.contact_info,
+        profile_status=row.profile_status,
+    )
+
+
 def map_patient_domain_to_db_entity(patient: PatientDomain) -> SQLAlchemyPatient:
     relatives_json = safe_serialize(patient.relatives or [])
     addresses_json = safe_serialize(patient.addresses or [])
@@ -234,7 +264,8 @@ def map_update_schema_to_domain(
     schema: UpdatePatientSchema, existing_patient: PatientDomain
 ) -> PatientDomain:
     """
-    Maps a schema to an existing patient domain model.
+    Applies a schema to an existing patient domain model in place, so that
+    the model tracks the changed fields.
     Updates only those fields that are explicitly defined in the schema.
     """
 
@@ -257,30 +288,30 @@ def map_update_schema_to_domain(
         # If the field is not passed, we leave the old one
         return old_value
 
-    return PatientDomain(
-        id=existing_patient.id,
-        iin=use(schema, "iin", existing_patient.iin),
-        first_name=use(schema, "first_name", existing_patient.first_name),
-        last_name=use(schema, "last_name", existing_patient.last_name),
-        middle_name=use(schema, "middle_name", existing_patient.middle_name),
-        maiden_name=use(schema, "maiden_name", existing_patient.maiden_name),
-        date_of_birth=use(schema, "date_of_birth", existing_patient.date_of_birth),
-        gender=use(schema, "gender", existing_patient.gender),
-        citizenship_id=use(schema, "citizenship_id", existing_patient.citizenship_id),
-        nationality_id=use(schema, "nationality_id", existing_patient.nationality_id),
-        financing_sources_ids=use(
-            schema, "financing_sources_ids", existing_patient.financing_sources_ids
-        ),
-        context_attributes_ids=use(
-            schema, "context_attributes_ids", existing_patient.context_attributes_ids
-        ),
-        social_status=use(schema, "social_status", existing_patient.social_status),
-        marital_status=use(schema, "marital_status", existing_patient.marital_status),
-        attachment_data=use(
-            schema, "attachment_data", existing_patient.attachment_data
-        ),
-        relatives=use(schema, "relatives", existing_patient.relatives),
-        addresses=use(schema, "addresses", existing_patient.addresses),
-        contact_info=use(schema, "contact_info", existing_patient.contact_info),
-        profile_status=use(schema, "profile_status", existing_patient.profile_status),
-    )
+    for field_name in (
+        "iin",
+        "first_name",
+        "last_name",
+        "middle_name",
+        "maiden_name",
+        "date_of_birth",
+        "gender",
+        "citizenship_id",
+        "nationality_id",
+        "financing_sources_ids",
+        "context_attributes_ids",
+        "social_status",
+        "marital_status",
+        "attachment_data",
+        "relatives",
+        "addresses",
+        "contact_info",
+        "profile_status",
+    ):
+        setattr(
+            existing_patient,
+            field_name,
+            use(schema, field_name, getattr(existing_patient, field_name)),
+        )
+
+    return existing_patient
@@ -0,0 +1,210 @@
+from collections import defaultdict
+from typing import AsyncIterable, Dict, List, Optional, Set, Tuple
+
+from pydantic import ValidationError
+
+from src.apps.patients.domain.patient import PatientDomain
+from src.apps.patients.infrastructure.api.schemas.requests.patient_request_schemas import (
+    CreatePatientSchema,
+)
+from src.apps.patients.infrastructure.api.schemas.responses.patients_import_schemas import (
+    PatientsImportReportSchema,
+    PatientsImportRowErrorSchema,
+)
+from src.apps.patients.infrastructure.import_readers import ImportRow
+from src.apps.patients.interfaces.uow_interface import UnitOfWorkInterface
+from src.apps.patients.mappers import map_create_schema_to_domain
+from src.apps.patients.services.patients_service import (
+    format_missing_related_ids,
+    get_related_ids,
+)
+from src.core.i18n import _
+from src.core.logger import LoggerService
+
+# Patients validated against the DB and written with COPY at once
+DEFAULT_CHUNK_SIZE = 1000
+
+
+class PatientsImportService:
+    """
+    Bulk import of patients (e.g. onboarding of a clinic's patient registry).
+
+    Rows are validated while the file is being read and written in chunks:
+    per chunk one query finds taken IINs, one query finds missing catalog
+    records and the valid rows are written with COPY in their own transaction.
+    Invalid rows are skipped and reported, they don't stop the import.
+    """
+
+    def __init__(
+        self,
+        uow: UnitOfWorkInterface,
+        logger: LoggerService,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self._uow = uow
+        self._logger = logger
+        self._chunk_size = chunk_size
+
+    async def import_patients(
+        self, rows: AsyncIterable[ImportRow]
+    ) -> PatientsImportReportSchema:
+        report = PatientsImportReportSchema()
+        rows_by_iin: Dict[str, int] = {}
+        chunk: List[Tuple[int, PatientDomain]] = []
+
+        async for row in rows:
+            report.total_rows += 1
+            patient = self._validate_row(row, rows_by_iin, report)
+            if patient is None:
+                continue
+
+            chunk.append((row.number, patient))
+            if len(chunk) >= self._chunk_size:
+                await self._import_chunk(chunk, report)
+                chunk = []
+
+        if chunk:
+            await self._import_chunk(chunk, report)
+
+        report.failed = report.total_rows - report.imported
+        report.errors.sort(key=lambda row_error: row_error.row)
+
+        return report
+
+    @staticmethod
+    def _validate_row(
+        row: ImportRow,
+        rows_by_iin: Dict[str, int],
+        report: PatientsImportReportSchema,
+    ) -> Optional[PatientDomain]:
+        if row.data is None:
+            report.errors.append(
+                PatientsImportRowErrorSchema(row=row.number, errors=[row.error])
+            )
+            return None
+
+        raw_iin = row.data.get("iin")
+        iin = raw_iin if isinstance(raw_iin, str) else None
+        try:
+            schema = CreatePatientSchema.model_validate(row.data)
+        except ValidationError as err:
+            report.errors.append(
+                PatientsImportRowErrorSchema(
+                    row=row.number,
+                    iin=iin,
+                    errors=[
+                        f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+                        for error in err.errors()
+                    ],
+                )
+            )
+            return None
+        except (TypeError, ValueError) as err:
+            report.errors.append(
+                PatientsImportRowErrorSchema(row=row.number, iin=iin, errors=[str(err)])
+            )
+            return None
+
+        first_row = rows_by_iin.setdefault(schema.iin, row.number)
+        if first_row != row.number:
+            report.errors.append(
+                PatientsImportRowErrorSchema(
+                    row=row.number,
+                    iin=schema.iin,
+                    errors=[
+                        _("IIN: '%(IIN)s' is already used in row %(ROW)s.")
+                        % {"IIN": schema.iin, "ROW": first_row}
+                    ],
+                )
+            )
+            return None
+
+        return map_create_schema_to_domain(schema)
+
+    async def _import_chunk(
+        self,
+        chunk: List[Tuple[int, PatientDomain]],
+        report: PatientsImportReportSchema,
+    ) -> None:
+        row_errors: List[PatientsImportRowErrorSchema] = []
+        valid_patients: List[Tuple[int, PatientDomain]] = []
+        try:
+            async with self._uow:
+                patients_repository = self._uow.patients_repository
+                taken_iins = await patients_repository.get_existing_iins(
+                    [patient.iin for row_number, patient in chunk]
+                )
+                missing_ids = await patients_repository.get_missing_related_ids(
+                    self._collect_related_ids(chunk)
+                )
+
+                for row_number, patient in chunk:
+                    errors = self._check_row(patient, taken_iins, missing_ids)
+                    if errors:
+                        row_errors.append(
+                            PatientsImportRowErrorSchema(
+                                row=row_number, iin=patient.iin, errors=errors
+                            )
+                        )
+                    else:
+                        valid_patients.append((row_number, patient))
+
+                await patients_repository.copy_patients(
+                    [patient for row_number, patient in valid_patients]
+                )
+        except Exception as err:
+            # E.g. an IIN taken by a concurrent request: the whole chunk is rolled back
+            self._logger.error(f"Patients import: chunk couldn't be saved: {err}")
+            report.errors.extend(
+                PatientsImportRowErrorSchema(
+                    row=row_number,
+                    iin=patient.iin,
+                    errors=[
+                        _("Patient couldn't be saved: %(ERROR)s.")
+                        % {"ERROR": type(err).__name__}
+                    ],
+                )
+                for row_number, patient in chunk
+            )
+            return
+
+        report.errors.extend(row_errors)
+        report.imported += len(valid_patients)
+
+    @staticmethod
+    def _collect_related_ids(
+        chunk: List[Tuple[int, PatientDomain]],
+    ) -> Dict[str, Set[int]]:
+        related_ids: Dict[str, Set[int]] = defaultdict(set)
+        for row_number, patient in chunk:
+            for field, ids in get_related_ids(patient).items():
+                related_ids[field].update(ids)
+
+        return related_ids
+
+    @staticmethod
+    def _check_row(
+        patient: PatientDomain,
+        taken_iins: Set[str],
+        missing_ids: Dict[str, List[int]],
+    ) -> List[str]:
+        errors = []
+        if patient.iin in taken_iins:
+            errors.append(
+                _("Patient with IIN: '%(IIN)s' already exists.") % {"IIN": patient.iin}
+            )
+
+        patient_missing_ids = {
+            field: [item_id for item_id in ids if item_id in missing_ids.get(field, [])]
+            for field, ids in get_related_ids(patient).items()
+        }
+        patient_missing_ids = {
+            field: ids for field, ids in patient_missing_ids.items() if ids
+        }
+        if patient_missing_ids:
+            errors.append(
+                _("Related entities were not found: %(MISSING)s.")
+                % {"MISSING": format_missing_related_ids(patient_missing_ids)}
+            )
+
+        return errors
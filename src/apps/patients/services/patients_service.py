@@ -1,21 +1,6 @@
-from typing import List, Tuple
+from typing import Collection, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from src.apps.catalogs.services.citizenship_catalog_service import (
-    CitizenshipCatalogService,
-)
-from src.apps.catalogs.services.financing_sources_catalog_service import (
-    FinancingSourceCatalogService,
-)
-from src.apps.catalogs.services.medical_organizations_catalog_service import (
-    MedicalOrganizationsCatalogService,
-)
-from src.apps.catalogs.services.nationalities_catalog_service import (
-    NationalitiesCatalogService,
-)
-from src.apps.catalogs.services.patient_context_attribute_service import (
-    PatientContextAttributeService,
-)
 from src.apps.patients.domain.patient import PatientDomain
 from src.apps.patients.infrastructure.api.schemas.requests.patient_request_schemas import (
     UpdatePatientSchema,
@@ -34,47 +19,58 @@ from src.shared.exceptions import (
     InstanceAlreadyExistsError,
     NoInstanceFoundError,
 )
+from src.shared.infrastructure.keyset_pagination import CursorPage
 from src.shared.schemas.pagination_schemas import PaginationParams
 
 
+def get_related_ids(patient: PatientDomain) -> Dict[str, List[int]]:
+    """
+    Returns IDs of the catalog records referenced by a patient, keyed by the patient's field.
+    """
+    attached_clinic_id = None
+    if patient.attachment_data:
+        attached_clinic_id = patient.attachment_data.get("attached_clinic_id")
+
+    return {
+        # ONE-to-ONE relations
+        "citizenship_id": [patient.citizenship_id],
+        "nationality_id": [patient.nationality_id],
+        "attached_clinic_id": [attached_clinic_id] if attached_clinic_id else [],
+        # MANY-to-MANY relations
+        "financing_sources_ids": patient.financing_sources_ids or [],
+        "context_attributes_ids": patient.context_attributes_ids or [],
+    }
+
+
+def format_missing_related_ids(missing_ids: Dict[str, List[int]]) -> str:
+    return "; ".join(
+        f"{field}: {', '.join(map(str, ids))}" for field, ids in missing_ids.items()
+    )
+
+
 class PatientService:
     def __init__(
         self,
         uow: UnitOfWorkInterface,
         patients_repository: SQLAlchemyPatientRepository,
-        citizenship_service: CitizenshipCatalogService,
-        nationalities_service: NationalitiesCatalogService,
-        medical_org_service: MedicalOrganizationsCatalogService,
-        financing_source_service: FinancingSourceCatalogService,
-        patient_context_attributes_service: PatientContextAttributeService,
     ):
         self._uow = uow
         self._patients_repository = patients_repository
-        self._citizenship_service = citizenship_service
-        self._nationalities_service = nationalities_service
-        self._medical_org_service = medical_org_service
-        self._financing_source_service = financing_source_service
-        self._patient_context_attributes_service = patient_context_attributes_service
 
     async def _validate_related_entities(self, patient: PatientDomain) -> None:
-        """Checks that all FK and M2M connections for a patient exist by calling catalog services."""
-        # ONE-to-ONE relations
-        await self._citizenship_service.get_by_id(patient.citizenship_id)
-        await self._nationalities_service.get_by_id(patient.nationality_id)
-
-        attachment_data = patient.attachment_data
-        if attachment_data:
-            attached_clinic_id = attachment_data.get("attached_clinic_id")
-            if attached_clinic_id:
-                await self._medical_org_service.get_by_id(attached_clinic_id)
-
-        # MANY-to-MANY relations
-        for source_id in patient.financing_sources_ids:
-            await self._financing_source_service.get_by_id(source_id)
-
-        if patient.context_attributes_ids:
-            for attribute_id in patient.context_attributes_ids:
-                await self._patient_context_attributes_service.get_by_id(attribute_id)
+        """
+        Checks that all FK and M2M connections for a patient exist with a single query
+        and reports all missing IDs at once.
+        """
+        missing_ids = await self._patients_repository.get_missing_related_ids(
+            get_related_ids(patient)
+        )
+        if missing_ids:
+            raise NoInstanceFoundError(
+                status_code=404,
+                detail=_("Related entities were not found: %(MISSING)s.")
+                % {"MISSING": format_missing_related_ids(missing_ids)},
+            )
 
     async def get_by_id(self, patient_id: UUID) -> PatientDomain:
         patient = await self._patients_repository.get_by_id(patient_id)
@@ -86,6 +82,15 @@ class PatientService:
 
         return patient
 
+    async def get_many_by_ids(self, patient_ids: List[UUID]) -> List[PatientDomain]:
+        return await self._patients_repository.get_many_by_ids(patient_ids)
+
+    async def search_patients(self, text: str, limit: int) -> List[PatientDomain]:
+        """
+        Searches patients by an IIN prefix or their full name (ranked by similarity).
+        """
+        return await self._patients_repository.search_patients(text, limit)
+
     async def get_by_iin(self, patient_iin: str) -> PatientDomain:
         patient = await self._patients_repository.get_by_iin(patient_iin)
         if not patient:
@@ -97,6 +102,9 @@ class PatientService:
 
         return patient
 
+    async def get_ids_by_iins(self, iins: Collection[str]) -> Dict[str, UUID]:
+        return await self._patients_repository.get_ids_by_iins(iins)
+
     async def get_patients(
         self,
         filter_params: PatientsFilterParams,
@@ -114,6 +122,29 @@ class PatientService:
 
         return patients, total_amount_of_patients
 
+    async def get_patients_by_cursor(
+        self,
+        filter_params: PatientsFilterParams,
+        pagination_params: PaginationParams,
+    ) -> Tuple[CursorPage[PatientDomain], Optional[int]]:
+        """
+        The total is counted only if `include_total` is requested:
+        the count scans all of the patients.
+        """
+        total_amount_of_patients: Optional[int] = None
+        if pagination_params.include_total:
+            total_amount_of_patients = (
+                await self._patients_repository.get_total_number_of_patients()
+            )
+
+        page = await self._patients_repository.get_patients_by_cursor(
+            filters=filter_params.to_dict(exclude_none=True),
+            limit=pagination_params.limit,
+            cursor=pagination_params.cursor,
+        )
+
+        return page, total_amount_of_patients
+
     async def create_patient(self, patient: PatientDomain) -> PatientDomain:
         # Check if this IIN is not taken already
         existing_patient_by_iin = await self._patients_repository.get_by_iin(
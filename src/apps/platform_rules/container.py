@@ -1,11 +1,19 @@
 from dependency_injector import containers, providers
-from sqlalchemy.ext.asyncio.engine import AsyncEngine
-from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.orm.session import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine
 
+from src.apps.platform_rules.infrastructure.platform_rules_listener import (
+    PlatformRulesListener,
+)
+from src.apps.platform_rules.infrastructure.platform_rules_store import (
+    PlatformRulesStore,
+)
+from src.apps.platform_rules.infrastructure.repositories.cached_platform_rules_repository import (
+    CachedPlatformRulesRepositoryImpl,
+)
 from src.apps.platform_rules.infrastructure.repositories.platform_rules_repository import (
     SQLAlchemyPlatformRulesRepositoryImpl,
 )
+from src.core.database.session import ScopedAsyncSession
 from src.core.logger import LoggerService
 
 
@@ -19,21 +27,28 @@ class PlatformRulesContainer(containers.DeclarativeContainer):
 
     # Dependencies from core DI-container
     logger = providers.Dependency(instance_of=LoggerService)
+    async_db_session = providers.Dependency(instance_of=ScopedAsyncSession)
     engine = providers.Dependency(instance_of=AsyncEngine)
+    platform_rules_store = providers.Dependency(instance_of=PlatformRulesStore)
 
-    # Session factory
-    session_factory = providers.Singleton(
-        sessionmaker, bind=engine, expire_on_commit=False, class_=AsyncSession
+    # Repositories
+    platform_rules_db_repository = providers.Factory(
+        SQLAlchemyPlatformRulesRepositoryImpl,
+        async_db_session=async_db_session,
+        logger=logger,
     )
 
-    # Async session
-    async_db_session = providers.Singleton(
-        lambda session_factory: session_factory(), session_factory
+    # Lookups by key are served from the store, writes invalidate it
+    platform_rules_repository = providers.Factory(
+        CachedPlatformRulesRepositoryImpl,
+        platform_rules_repository=platform_rules_db_repository,
+        platform_rules_store=platform_rules_store,
     )
 
-    # Repositories
-    platform_rules_repository = providers.Factory(
-        SQLAlchemyPlatformRulesRepositoryImpl,
-        async_db_session=async_db_session,
+    # Invalidates the store on the writes of the other instances
+    platform_rules_listener = providers.Singleton(
+        PlatformRulesListener,
+        engine=engine,
+        platform_rules_store=platform_rules_store,
         logger=logger,
     )
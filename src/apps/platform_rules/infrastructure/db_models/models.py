@@ -1,6 +1,6 @@
 from typing import Any, Dict, Optional
 
-from sqlalchemy import Integer, String
+from sqlalchemy import Index, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -14,3 +14,8 @@ class SQLAlchemyPlatformRule(Base, CreatedAtMixin, ChangedAtMixin):
     # e.g. {"MAX_SCHEDULE_PERIOD": {"value": 90}} OR {"REDUCED_DAYS": {"dates": {...}}, ...}
     rule_data: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(String(256), nullable=True)
+
+    __table_args__ = (
+        # Serves the lookups by key (`rule_data ? key`)
+        Index("ix_platform_rules_rule_data", "rule_data", postgresql_using="gin"),
+    )
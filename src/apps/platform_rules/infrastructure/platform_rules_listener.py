@@ -0,0 +1,104 @@
+import asyncio
+import contextlib
+from typing import Any, Optional
+
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.apps.platform_rules.infrastructure.platform_rules_store import (
+    PLATFORM_RULES_CHANNEL,
+    PlatformRulesStore,
+)
+from src.core.logger import LoggerService
+
+
+class PlatformRulesListener:
+    """
+    Invalidates the `PlatformRulesStore` when another instance changes
+    the platform rules: LISTENs on the channel notified by the 'platform_rules'
+    table trigger over a dedicated connection of the engine's pool.
+
+    If the connection is lost, the store is invalidated (notifications may have
+    been missed) and the listener reconnects every `reconnect_delay` seconds.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        platform_rules_store: PlatformRulesStore,
+        logger: LoggerService,
+        channel: str = PLATFORM_RULES_CHANNEL,
+        reconnect_delay: float = 5,
+    ):
+        self._engine = engine
+        self._platform_rules_store = platform_rules_store
+        self._logger = logger
+        self._channel = channel
+        self._reconnect_delay = reconnect_delay
+
+        self._connection: Optional[AsyncConnection] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
+        self._stopped = False
+
+    async def start(self) -> None:
+        self._stopped = False
+        self._connection = await self._engine.connect()
+        try:
+            raw_connection = await self._connection.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+
+            await driver_connection.add_listener(self._channel, self._on_notification)
+            driver_connection.add_termination_listener(self._on_termination)
+        except Exception:
+            await self._connection.close()
+            self._connection = None
+            raise
+
+        self._logger.info(f"Listening to the '{self._channel}' channel")
+
+    async def stop(self) -> None:
+        self._stopped = True
+        if self._reconnect_task is not None:
+            self._reconnect_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reconnect_task
+
+        if self._connection is not None:
+            with contextlib.suppress(Exception):
+                await self._connection.close()
+            self._connection = None
+
+    def _on_notification(
+        self, connection: Any, pid: int, channel: str, payload: str
+    ) -> None:
+        self._logger.debug(f"Platform rules changed ({payload}), invalidating the store")
+        self._platform_rules_store.invalidate()
+
+    def _on_termination(self, connection: Any) -> None:
+        self._platform_rules_store.invalidate()
+        if self._stopped:
+            return
+
+        self._logger.warning(
+            f"Connection listening to the '{self._channel}' channel was lost"
+        )
+        self._reconnect_task = asyncio.create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        if self._connection is not None:
+            with contextlib.suppress(Exception):
+                await self._connection.invalidate()
+            self._connection = None
+
+        while not self._stopped:
+            await asyncio.sleep(self._reconnect_delay)
+            try:
+                await self.start()
+            except Exception as err:
+                self._logger.error(
+                    f"Failed to listen to the '{self._channel}' channel: {err}"
+                )
+                continue
+
+            # Changes made while disconnected were not notified
+            self._platform_rules_store.invalidate()
+            return
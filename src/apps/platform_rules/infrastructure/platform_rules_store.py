@@ -0,0 +1,135 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from src.apps.platform_rules.infrastructure.api.schemas.responses.platform_rules_schemas import (
+    ResponsePlatformRuleSchema,
+)
+from src.apps.platform_rules.mappers import map_reduced_days_to_calendar
+
+# Postgres channel notified by the 'platform_rules' table trigger on every write
+PLATFORM_RULES_CHANNEL = "platform_rules_changed"
+
+# Platform rules are few, so all of them are expected to fit into a single page
+PRELOAD_LIMIT = 1_000
+
+
+@dataclass(frozen=True)
+class PlatformRulesSnapshot:
+    rules_by_key: Dict[str, ResponsePlatformRuleSchema] = field(default_factory=dict)
+    # Pre-parsed 'REDUCED_DAYS' rule
+    reduced_days: Dict[date, Dict[str, Any]] = field(default_factory=dict)
+
+    @classmethod
+    def from_rules(
+        cls, rules: List[ResponsePlatformRuleSchema]
+    ) -> "PlatformRulesSnapshot":
+        rules_by_key = {rule.key: rule for rule in rules}
+        reduced_days_rule = rules_by_key.get("REDUCED_DAYS")
+
+        return cls(
+            rules_by_key=rules_by_key,
+            reduced_days=map_reduced_days_to_calendar(
+                reduced_days_rule.rule_data if reduced_days_rule else None
+            ),
+        )
+
+    def get(self, key: str) -> Optional[ResponsePlatformRuleSchema]:
+        return self.rules_by_key.get(key)
+
+
+class PlatformRulesStore:
+    """
+    In-process snapshot of all the platform rules, indexed by key, with the
+    reduced days already parsed into a date-keyed calendar.
+
+    The snapshot is loaded at startup and reloaded on the first access after
+    an invalidation: by the platform rules write paths of this instance and by
+    the Postgres notifications about the writes of the other ones. Every
+    invalidation bumps the version, and snapshots loaded while the version
+    changed are not stored. Snapshots older than `ttl_seconds` are reloaded,
+    which bounds staleness if a notification is lost.
+    """
+
+    def __init__(self, ttl_seconds: float = 300):
+        self._ttl_seconds = ttl_seconds
+        self._snapshot: Optional[PlatformRulesSnapshot] = None
+        self._loaded_at = 0.0
+        self._version = 0
+        self._lock = asyncio.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    async def get_snapshot(
+        self,
+        loader: Callable[[int], Awaitable[List[ResponsePlatformRuleSchema]]],
+    ) -> PlatformRulesSnapshot:
+        snapshot = self._get_fresh_snapshot()
+        if snapshot is not None:
+            self.hits += 1
+            return snapshot
+
+        self.misses += 1
+        # Concurrent misses wait for a single load
+        async with self._lock:
+            snapshot = self._get_fresh_snapshot()
+            if snapshot is not None:
+                return snapshot
+
+            return await self._load(loader)
+
+    async def preload(
+        self,
+        loader: Callable[[int], Awaitable[List[ResponsePlatformRuleSchema]]],
+    ) -> int:
+        """
+        Loads all the platform rules at once.
+
+        :param loader: Coroutine function returning up to the given number of rules
+        :return: Number of loaded rules
+        """
+        async with self._lock:
+            snapshot = await self._load(loader)
+
+        return len(snapshot.rules_by_key)
+
+    def invalidate(self) -> None:
+        self._version += 1
+        self._snapshot = None
+
+    def version(self) -> int:
+        return self._version
+
+    def stats(self) -> Dict[str, Any]:
+        requests = self.hits + self.misses
+        return {
+            "version": self._version,
+            "size": len(self._snapshot.rules_by_key) if self._snapshot else 0,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / requests, 4) if requests else 0.0,
+        }
+
+    def _get_fresh_snapshot(self) -> Optional[PlatformRulesSnapshot]:
+        if (
+            self._snapshot is not None
+            and time.monotonic() - self._loaded_at > self._ttl_seconds
+        ):
+            self.invalidate()
+
+        return self._snapshot
+
+    async def _load(
+        self,
+        loader: Callable[[int], Awaitable[List[ResponsePlatformRuleSchema]]],
+    ) -> PlatformRulesSnapshot:
+        version = self._version
+        snapshot = PlatformRulesSnapshot.from_rules(await loader(PRELOAD_LIMIT))
+        if self._version == version:
+            self._snapshot = snapshot
+            self._loaded_at = time.monotonic()
+
+        return snapshot
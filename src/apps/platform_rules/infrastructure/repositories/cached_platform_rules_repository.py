@@ -0,0 +1,99 @@
+from datetime import date
+from typing import Any, Dict, List, Optional
+
+from src.apps.platform_rules.infrastructure.api.schemas.requests.platform_rules_schemas import (
+    CreatePlatformRuleSchema,
+    UpdatePlatformRuleSchema,
+)
+from src.apps.platform_rules.infrastructure.api.schemas.responses.platform_rules_schemas import (
+    ResponsePlatformRuleSchema,
+)
+from src.apps.platform_rules.infrastructure.platform_rules_store import (
+    PlatformRulesSnapshot,
+    PlatformRulesStore,
+)
+from src.apps.platform_rules.interfaces.platform_rules_repository_interface import (
+    PlatformRulesRepositoryInterface,
+)
+
+
+class CachedPlatformRulesRepositoryImpl(PlatformRulesRepositoryInterface):
+    """
+    Platform rules repository decorator that serves the lookups by key
+    from the in-process `PlatformRulesStore` and invalidates it on writes.
+    Other reads go to the wrapped repository.
+    """
+
+    def __init__(
+        self,
+        platform_rules_repository: PlatformRulesRepositoryInterface,
+        platform_rules_store: PlatformRulesStore,
+    ):
+        self._platform_rules_repository = platform_rules_repository
+        self._platform_rules_store = platform_rules_store
+
+    async def _get_snapshot(self) -> PlatformRulesSnapshot:
+        return await self._platform_rules_store.get_snapshot(
+            lambda limit: self._platform_rules_repository.get_platform_rules(
+                filters={}, limit=limit
+            )
+        )
+
+    async def preload(self) -> int:
+        return await self._platform_rules_store.preload(
+            lambda limit: self._platform_rules_repository.get_platform_rules(
+                filters={}, limit=limit
+            )
+        )
+
+    async def get_total_number_of_platform_rules(self) -> int:
+        return await self._platform_rules_repository.get_total_number_of_platform_rules()
+
+    async def get_by_id(
+        self, platform_rule_id: int
+    ) -> Optional[ResponsePlatformRuleSchema]:
+        return await self._platform_rules_repository.get_by_id(platform_rule_id)
+
+    async def get_by_key(
+        self, platform_rule_key: str
+    ) -> Optional[ResponsePlatformRuleSchema]:
+        return (await self._get_snapshot()).get(platform_rule_key)
+
+    async def get_reduced_days_calendar(self) -> Dict[date, Dict[str, Any]]:
+        return (await self._get_snapshot()).reduced_days
+
+    async def get_platform_rules(
+        self,
+        filters: dict,
+        page: int = 1,
+        limit: int = 30,
+    ) -> List[ResponsePlatformRuleSchema]:
+        return await self._platform_rules_repository.get_platform_rules(
+            filters=filters, page=page, limit=limit
+        )
+
+    async def create_platform_rule(
+        self, request_dto: CreatePlatformRuleSchema
+    ) -> ResponsePlatformRuleSchema:
+        try:
+            return await self._platform_rules_repository.create_platform_rule(
+                request_dto
+            )
+        finally:
+            self._platform_rules_store.invalidate()
+
+    async def update_platform_rule(
+        self, platform_rule_id: int, request_dto: UpdatePlatformRuleSchema
+    ) -> ResponsePlatformRuleSchema:
+        try:
+            return await self._platform_rules_repository.update_platform_rule(
+                platform_rule_id, request_dto
+            )
+        finally:
+            self._platform_rules_store.invalidate()
+
+    async def delete_by_id(self, platform_rule_id: int) -> None:
+        try:
+            await self._platform_rules_repository.delete_by_id(platform_rule_id)
+        finally:
+            self._platform_rules_store.invalidate()
@@ -1,4 +1,5 @@
-from typing import List, Optional
+from datetime import date
+from typing import Any, Dict, List, Optional
 from sqlalchemy import func, select
 
 from src.apps.platform_rules.infrastructure.api.schemas.requests.platform_rules_schemas import (
@@ -14,7 +15,10 @@ from src.apps.platform_rules.infrastructure.db_models.models import (
 from src.apps.platform_rules.interfaces.platform_rules_repository_interface import (
     PlatformRulesRepositoryInterface,
 )
-from src.apps.platform_rules.mappers import map_platform_rule_db_entity_to_schema
+from src.apps.platform_rules.mappers import (
+    map_platform_rule_db_entity_to_schema,
+    map_reduced_days_to_calendar,
+)
 from src.shared.infrastructure.base import BaseRepository
 
 
@@ -55,6 +59,13 @@ class SQLAlchemyPlatformRulesRepositoryImpl(
 
         return None
 
+    async def get_reduced_days_calendar(self) -> Dict[date, Dict[str, Any]]:
+        reduced_days_rule = await self.get_by_key("REDUCED_DAYS")
+
+        return map_reduced_days_to_calendar(
+            reduced_days_rule.rule_data if reduced_days_rule else None
+        )
+
     async def get_platform_rules(
         self,
         filters: dict,
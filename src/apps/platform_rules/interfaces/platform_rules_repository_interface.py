@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import date
+from typing import Any, Dict, List, Optional
 
 from src.apps.platform_rules.infrastructure.api.schemas.requests.platform_rules_schemas import (
     CreatePlatformRuleSchema,
@@ -44,6 +45,15 @@ class PlatformRulesRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_reduced_days_calendar(self) -> Dict[date, Dict[str, Any]]:
+        """
+        Retrieves the days of the 'REDUCED_DAYS' platform rule parsed into a calendar.
+
+        :return: Dict of the reduced days by date (empty if the rule doesn't exist)
+        """
+        pass
+
     @abstractmethod
     async def get_platform_rules(
         self,
@@ -1,5 +1,5 @@
-from datetime import date, time
-from typing import List, Optional
+from datetime import date, datetime, time
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -52,6 +52,38 @@ def map_platform_rule_db_entity_to_schema(
     )
 
 
+def _parse_time(value: Any) -> Optional[time]:
+    if value is None or isinstance(value, time):
+        return value
+
+    return time.fromisoformat(value)
+
+
+def map_reduced_days_to_calendar(
+    rule_data: Optional[Dict[str, Any]],
+) -> Dict[date, Dict[str, Any]]:
+    """
+    Parses the days of the 'REDUCED_DAYS' rule once into a calendar keyed by date,
+    e.g. {date(2025, 3, 7): {"is_active": True, "work_end_time": time(15, 0), ...}}.
+    """
+    calendar: Dict[date, Dict[str, Any]] = {}
+    for entry in (rule_data or {}).get("days", []):
+        day_date = entry["date"]
+        if isinstance(day_date, str):
+            day_date = datetime.fromisoformat(day_date).date()
+
+        calendar[day_date] = {
+            "date": day_date,
+            "is_active": entry.get("is_active", True),
+            "work_start_time": _parse_time(entry.get("work_start_time")),
+            "work_end_time": _parse_time(entry.get("work_end_time")),
+            "break_start_time": _parse_time(entry.get("break_start_time")),
+            "break_end_time": _parse_time(entry.get("break_end_time")),
+        }
+
+    return calendar
+
+
 # Admin-panel Service rules mapping
 RULE_DATA_SCHEMAS = {
     "MAX_SCHEDULE_PERIOD": MaxSchedulePeriodDataSchema,
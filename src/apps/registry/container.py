@@ -1,7 +1,4 @@
 from dependency_injector import containers, providers
-from sqlalchemy.ext.asyncio.engine import AsyncEngine
-from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.orm.session import sessionmaker
 
 from src.apps.registry.infrastructure.repositories.appointment_repository import (
     AppointmentRepositoryImpl,
@@ -13,9 +10,11 @@ from src.apps.registry.infrastructure.repositories.schedule_repository import (
     ScheduleRepositoryImpl,
 )
 from src.apps.registry.services.appointment_service import AppointmentService
+from src.apps.registry.services.free_slots_service import FreeSlotsService
 from src.apps.registry.services.schedule_day_service import ScheduleDayService
 from src.apps.registry.services.schedule_service import ScheduleService
 from src.apps.registry.uow import UnitOfWorkImpl
+from src.core.database.session import ScopedAsyncSession
 from src.core.logger import LoggerService
 
 
@@ -33,17 +32,7 @@ class RegistryContainer(containers.DeclarativeContainer):
     patients_service = providers.Dependency()
     user_repository = providers.Dependency()
     platform_rules_repository = providers.Dependency()
-    engine = providers.Dependency(instance_of=AsyncEngine)
-
-    # Session factory
-    session_factory = providers.Singleton(
-        sessionmaker, bind=engine, expire_on_commit=False, class_=AsyncSession
-    )
-
-    # Async session
-    async_db_session = providers.Singleton(
-        lambda session_factory: session_factory(), session_factory
-    )
+    async_db_session = providers.Dependency(instance_of=ScopedAsyncSession)
 
     # UOW
     unit_of_work = providers.Factory(
@@ -92,6 +81,12 @@ class RegistryContainer(containers.DeclarativeContainer):
         user_repository=user_repository,
     )
 
+    free_slots_service = providers.Factory(
+        FreeSlotsService,
+        logger=logger,
+        schedule_day_repository=schedule_day_repository,
+    )
+
     schedule_service = providers.Factory(
         ScheduleService,
         uow=unit_of_work,
@@ -13,6 +13,14 @@ class AppointmentIsNotAvailableError(AppointmentError):
     pass
 
 
+class AppointmentSlotIsTakenError(AppointmentError):
+    pass
+
+
+class AppointmentIsOutOfWorkTimeError(AppointmentError):
+    pass
+
+
 # ScheduleDomain errors
 class ScheduleError(DomainError):
     pass
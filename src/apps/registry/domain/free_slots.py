@@ -0,0 +1,160 @@
+from datetime import date, datetime, time
+from heapq import merge
+from itertools import groupby
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from uuid import UUID
+
+
+class ScheduleDayAvailability(NamedTuple):
+    """
+    Everything needed to compute the free slots of a schedule day:
+    its working hours and break, the schedule's appointment interval and
+    the start times of the day's non-cancelled appointments.
+    """
+
+    schedule_id: UUID
+    schedule_day_id: UUID
+    doctor_id: UUID
+    date: date
+    work_start_time: time
+    work_end_time: time
+    break_start_time: Optional[time]
+    break_end_time: Optional[time]
+    appointment_interval: int  # minutes
+    booked_times: Tuple[time, ...] = ()
+
+
+class FreeSlot(NamedTuple):
+    start_time: time
+    end_time: time
+
+
+def _to_seconds(value: time) -> int:
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def _to_time(seconds: int) -> time:
+    return time(seconds // 3600, seconds % 3600 // 60, seconds % 60)
+
+
+def _merge_busy_intervals(
+    intervals: Sequence[Tuple[int, int]],
+) -> List[Tuple[int, int]]:
+    """
+    Merges intervals sorted by their start into disjoint ones.
+    """
+    merged: List[Tuple[int, int]] = []
+    for start, end in intervals:
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+def get_busy_intervals(day: ScheduleDayAvailability) -> List[Tuple[int, int]]:
+    """
+    Returns the day's break and appointments as disjoint [start, end) intervals
+    in seconds since midnight, sorted by start.
+    """
+    interval = day.appointment_interval * 60
+    busy = [
+        (_to_seconds(booked), _to_seconds(booked) + interval)
+        for booked in day.booked_times
+    ]
+    if day.break_start_time and day.break_end_time:
+        busy.append(
+            (_to_seconds(day.break_start_time), _to_seconds(day.break_end_time))
+        )
+
+    return _merge_busy_intervals(sorted(busy))
+
+
+def iter_free_slots(day: ScheduleDayAvailability) -> Iterator[FreeSlot]:
+    """
+    Yields the free slots of a day in a single sweep over its busy intervals.
+
+    Slots are laid out from the start of the working day with the schedule's
+    appointment interval. A slot overlapping the break or an appointment is
+    skipped and the grid continues from the end of that busy interval, so
+    appointments booked at an arbitrary time don't hide the rest of the day.
+    """
+    interval = day.appointment_interval * 60
+    if interval <= 0:
+        return
+
+    busy = get_busy_intervals(day)
+    work_end = _to_seconds(day.work_end_time)
+
+    slot_start = _to_seconds(day.work_start_time)
+    busy_index = 0
+    while slot_start + interval <= work_end:
+        # Busy intervals are disjoint, so their ends are sorted too
+        while busy_index < len(busy) and busy[busy_index][1] <= slot_start:
+            busy_index += 1
+
+        if busy_index < len(busy) and busy[busy_index][0] < slot_start + interval:
+            slot_start = max(slot_start, busy[busy_index][1])
+            continue
+
+        yield FreeSlot(_to_time(slot_start), _to_time(slot_start + interval))
+        slot_start += interval
+
+
+def get_free_slots(day: ScheduleDayAvailability) -> List[FreeSlot]:
+    return list(iter_free_slots(day))
+
+
+def _iter_keyed_free_slots(
+    index: int, day: ScheduleDayAvailability
+) -> Iterator[Tuple[time, int, ScheduleDayAvailability, FreeSlot]]:
+    for slot in iter_free_slots(day):
+        yield slot.start_time, index, day, slot
+
+
+def find_earliest_free_slots(
+    days: Iterable[ScheduleDayAvailability],
+    limit: int,
+    not_before: Optional[datetime] = None,
+) -> List[Tuple[ScheduleDayAvailability, FreeSlot]]:
+    """
+    Returns the `limit` earliest free slots across the days of many schedules.
+
+    Days must be ordered by date. The slots of a date are merged lazily
+    (k-way heap merge of the per-day sweeps), and later dates are not swept
+    once enough slots are found, so only the days that can contain the earliest
+    slots are processed. Slots starting before `not_before` are skipped.
+
+    The sweep is kept out of SQL on purpose: a `generate_series` grid can't
+    restart after an appointment booked off the grid, as `iter_free_slots`
+    does, so the slots of this search would differ from the per-day ones.
+    """
+    found: List[Tuple[ScheduleDayAvailability, FreeSlot]] = []
+    if limit <= 0:
+        return found
+
+    for day_date, dated_days in groupby(days, key=lambda day: day.date):
+        if not_before is not None and day_date < not_before.date():
+            continue
+
+        earliest_start = (
+            not_before.time()
+            if not_before is not None and day_date == not_before.date()
+            else None
+        )
+        merged = merge(
+            *(
+                _iter_keyed_free_slots(index, day)
+                for index, day in enumerate(dated_days)
+            )
+        )
+        for start_time, index, day, slot in merged:
+            if earliest_start is not None and start_time < earliest_start:
+                continue
+
+            found.append((day, slot))
+            if len(found) == limit:
+                return found
+
+    return found
@@ -16,17 +16,34 @@ from src.apps.registry.infrastructure.api.schemas.responses.schedule_day_schemas
     ResponseScheduleDaySchema,
 )
 from src.core.i18n import _
+from src.shared.helpers.change_tracking import ChangeTrackingMixin
 
 
-class AppointmentDomain:
+class AppointmentDomain(ChangeTrackingMixin):
     """Appointment domain class"""
 
+    # No per-instance __dict__: list endpoints build a domain object per row
+    __slots__ = (
+        "id",
+        "schedule_day_id",
+        "time",
+        "end_time",
+        "patient_id",
+        "status",
+        "type",
+        "insurance_type",
+        "reason",
+        "additional_services",
+        "cancelled_at",
+    )
+
     def __init__(
         self,
         *,
         id: Optional[int] = None,
         schedule_day_id: UUID,
         time: time,
+        end_time: Optional[time] = None,
         patient_id: Optional[UUID],
         status: AppointmentStatusEnum = AppointmentStatusEnum.BOOKED,
         type: AppointmentTypeEnum,
@@ -38,6 +55,7 @@ class AppointmentDomain:
         self.id = id
         self.schedule_day_id = schedule_day_id
         self.time = time
+        self.end_time = end_time
         self.patient_id = patient_id
         self.status = status
         self.type = type
@@ -47,6 +65,7 @@ class AppointmentDomain:
             additional_services if additional_services is not None else {}
         )
         self.cancelled_at = cancelled_at
+        self.mark_clean()
 
     def book(
         self, schedule: ScheduleDomain, schedule_day: ResponseScheduleDaySchema
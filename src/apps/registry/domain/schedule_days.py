@@ -0,0 +1,20 @@
+from datetime import date, time
+from typing import NamedTuple, Optional
+from uuid import UUID
+
+
+class ScheduleDayRow(NamedTuple):
+    """
+    A generated schedule day: a plain tuple instead of a Pydantic schema,
+    as a schedule of many doctors over a long period means thousands of days
+    which are inserted in bulk.
+    """
+
+    schedule_id: Optional[UUID]
+    date: date
+    day_of_week: int  # 1 - Monday, ..., 7 - Sunday
+    is_active: bool
+    work_start_time: time
+    work_end_time: time
+    break_start_time: Optional[time]
+    break_end_time: Optional[time]
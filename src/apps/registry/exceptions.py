@@ -51,3 +51,7 @@ class InvalidAppointmentInsuranceTypeError(ApplicationRegistryAppError):
 
 class BreakTimeConflictError(ApplicationRegistryAppError):
     pass
+
+
+class InvalidFreeSlotsPeriodError(ApplicationRegistryAppError):
+    pass
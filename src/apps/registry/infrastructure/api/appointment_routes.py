@@ -1,5 +1,5 @@
 import math
-from typing import Annotated, List
+from typing import Annotated, List, Optional
 from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
@@ -77,17 +77,38 @@ async def get_appointments(
     ),
     pagination_params: PaginationParams = Depends(),
 ) -> MultipleAppointmentsResponseSchema:
-    results, total_appointments_amount = await appointment_service.get_appointments(
-        filter_params=filter_params,
-        pagination_params=pagination_params,
-    )
-
-    # Calculate pagination metadata
     page: int = pagination_params.page or 1  # for mypy
     limit: int = pagination_params.limit or 30  # for mypy
-    total_pages = math.ceil(total_appointments_amount / limit) if limit else 1
-    has_next = page < total_pages
-    has_prev = page > 1
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+    if pagination_params.is_cursor_mode:
+        cursor_page, total_appointments_amount = (
+            await appointment_service.get_appointments_by_cursor(
+                filter_params=filter_params,
+                pagination_params=pagination_params,
+            )
+        )
+        results = cursor_page.items
+        next_cursor, prev_cursor = cursor_page.next_cursor, cursor_page.prev_cursor
+    else:
+        results, total_appointments_amount = (
+            await appointment_service.get_appointments(
+                filter_params=filter_params,
+                pagination_params=pagination_params,
+            )
+        )
+
+    # Calculate pagination metadata
+    # Not counted in cursor mode unless requested
+    total_pages: Optional[int] = None
+    if total_appointments_amount is not None:
+        total_pages = math.ceil(total_appointments_amount / limit) if limit else 1
+    if pagination_params.is_cursor_mode:
+        has_next, has_prev = next_cursor is not None, prev_cursor is not None
+    else:
+        has_next = page < total_pages
+        has_prev = page > 1
 
     pagination_metadata = PaginationMetaDataSchema(
         current_page=page,
@@ -96,6 +117,8 @@ async def get_appointments(
         total_pages=total_pages,
         has_next=has_next,
         has_prev=has_prev,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
     )
 
     response_schemas: List[ResponseAppointmentSchema] = []
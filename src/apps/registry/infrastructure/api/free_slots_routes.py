@@ -0,0 +1,85 @@
+from datetime import date
+from typing import List, Optional
+from uuid import UUID
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Query
+
+from src.apps.registry.container import RegistryContainer
+from src.apps.registry.infrastructure.api.schemas.requests.filters.free_slots_filter_params import (
+    EarliestFreeSlotsFilterParams,
+)
+from src.apps.registry.infrastructure.api.schemas.responses.free_slots_schemas import (
+    EarliestFreeSlotSchema,
+    ScheduleDayFreeSlotsSchema,
+)
+from src.apps.registry.services.free_slots_service import FreeSlotsService
+
+free_slots_router = APIRouter()
+
+
+@free_slots_router.get(
+    "/schedules/{schedule_id}/free-slots",
+    response_model=List[ScheduleDayFreeSlotsSchema],
+    summary="Get free appointment slots of a schedule for a period",
+)
+@inject
+async def get_schedule_free_slots(
+    schedule_id: UUID,
+    date_from: Optional[date] = Query(None, description="Defaults to today"),
+    date_to: Optional[date] = Query(
+        None, description="Inclusive, defaults to a week from date_from"
+    ),
+    free_slots_service: FreeSlotsService = Depends(
+        Provide[RegistryContainer.free_slots_service]
+    ),
+) -> List[ScheduleDayFreeSlotsSchema]:
+    return await free_slots_service.get_free_slots(
+        date_from=date_from, date_to=date_to, schedule_id=schedule_id
+    )
+
+
+@free_slots_router.get(
+    "/doctors/{doctor_id}/free-slots",
+    response_model=List[ScheduleDayFreeSlotsSchema],
+    summary="Get free appointment slots of all the doctor's schedules for a period",
+)
+@inject
+async def get_doctor_free_slots(
+    doctor_id: UUID,
+    date_from: Optional[date] = Query(None, description="Defaults to today"),
+    date_to: Optional[date] = Query(
+        None, description="Inclusive, defaults to a week from date_from"
+    ),
+    free_slots_service: FreeSlotsService = Depends(
+        Provide[RegistryContainer.free_slots_service]
+    ),
+) -> List[ScheduleDayFreeSlotsSchema]:
+    return await free_slots_service.get_free_slots(
+        date_from=date_from, date_to=date_to, doctor_id=doctor_id
+    )
+
+
+@free_slots_router.get(
+    "/free-slots/earliest",
+    response_model=List[EarliestFreeSlotSchema],
+    summary="Find the earliest free slots of any doctor matching the filters",
+)
+@inject
+async def find_earliest_free_slots(
+    filter_params: EarliestFreeSlotsFilterParams = Depends(),
+    date_from: Optional[date] = Query(None, description="Defaults to today"),
+    date_to: Optional[date] = Query(
+        None, description="Inclusive, defaults to two weeks from date_from"
+    ),
+    limit: int = Query(10, ge=1, le=100, description="Number of slots to return"),
+    free_slots_service: FreeSlotsService = Depends(
+        Provide[RegistryContainer.free_slots_service]
+    ),
+) -> List[EarliestFreeSlotSchema]:
+    return await free_slots_service.find_earliest_free_slots(
+        filter_params=filter_params,
+        date_from=date_from,
+        date_to=date_to,
+        limit=limit,
+    )
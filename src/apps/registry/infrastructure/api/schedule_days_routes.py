@@ -11,6 +11,7 @@ from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas
 from src.apps.registry.infrastructure.api.schemas.responses.schedule_day_schemas import (
     MultipleScheduleDaysResponseSchema,
     ResponseScheduleDaySchema,
+    ResponseUpdatedScheduleDaySchema,
 )
 from src.apps.registry.services.schedule_day_service import ScheduleDayService
 from src.shared.schemas.pagination_schemas import (
@@ -101,7 +102,7 @@ async def get_all_by_schedule_id(
 
 
 @schedule_days_router.patch(
-    "/schedules/days/{day_id}", response_model=ResponseScheduleDaySchema
+    "/schedules/days/{day_id}", response_model=ResponseUpdatedScheduleDaySchema
 )
 @inject
 async def update(
@@ -110,7 +111,7 @@ async def update(
     schedule_day_service: ScheduleDayService = Depends(
         Provide[RegistryContainer.schedule_day_service]
     ),
-) -> ResponseScheduleDaySchema:
+) -> ResponseUpdatedScheduleDaySchema:
     return await schedule_day_service.update(
         day_id=day_id,
         update_data=update_schema,
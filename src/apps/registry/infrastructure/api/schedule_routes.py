@@ -1,4 +1,5 @@
 import math
+from typing import List
 from uuid import UUID
 
 from dependency_injector.wiring import Provide, inject
@@ -9,12 +10,14 @@ from src.apps.registry.infrastructure.api.schemas.requests.filters.schedule_filt
     ScheduleFilterParams,
 )
 from src.apps.registry.infrastructure.api.schemas.requests.schedule_schemas import (
+    BulkCreateSchedulesSchema,
     CreateScheduleSchema,
     UpdateScheduleSchema,
 )
 from src.apps.registry.infrastructure.api.schemas.responses.schedule_schemas import (
     MultipleSchedulesResponseSchema,
     ResponseScheduleSchema,
+    ResponseUpdatedScheduleSchema,
 )
 from src.apps.registry.services.schedule_service import ScheduleService
 from src.apps.users.mappers import map_user_domain_to_schema
@@ -133,8 +136,40 @@ async def create_schedule(
     return schedule_response_schema
 
 
+@schedule_router.post(
+    "/schedules/bulk",
+    response_model=List[ResponseScheduleSchema],
+    status_code=201,
+    summary="Create the same schedule for many doctors",
+)
+@inject
+async def create_schedules_for_doctors(
+    create_schema: BulkCreateSchedulesSchema,
+    schedule_service: ScheduleService = Depends(
+        Provide[RegistryContainer.schedule_service]
+    ),
+) -> List[ResponseScheduleSchema]:
+    schedules_with_doctors = await schedule_service.create_schedules_for_doctors(
+        create_schema
+    )
+
+    return [
+        ResponseScheduleSchema(
+            id=schedule.id,
+            doctor=map_user_domain_to_schema(doctor),
+            schedule_name=schedule.schedule_name,
+            period_start=schedule.period_start,
+            period_end=schedule.period_end,
+            is_active=schedule.is_active,
+            appointment_interval=schedule.appointment_interval,
+            description=schedule.description,
+        )
+        for schedule, doctor in schedules_with_doctors
+    ]
+
+
 @schedule_router.patch(
-    "/schedules/{schedule_id}", response_model=ResponseScheduleSchema
+    "/schedules/{schedule_id}", response_model=ResponseUpdatedScheduleSchema
 )
 @inject
 async def update_schedule(
@@ -143,12 +178,14 @@ async def update_schedule(
     schedule_service: ScheduleService = Depends(
         Provide[RegistryContainer.schedule_service]
     ),
-) -> ResponseScheduleSchema:
-    updated_schedule, doctor = await schedule_service.update_schedule(
-        schedule_id, update_schema
-    )
+) -> ResponseUpdatedScheduleSchema:
+    (
+        updated_schedule,
+        doctor,
+        cancelled_appointment_ids,
+    ) = await schedule_service.update_schedule(schedule_id, update_schema)
     doctor_response_schema = map_user_domain_to_schema(doctor)
-    schedule_response_schema = ResponseScheduleSchema(
+    schedule_response_schema = ResponseUpdatedScheduleSchema(
         id=updated_schedule.id,
         doctor=doctor_response_schema,
         schedule_name=updated_schedule.schedule_name,
@@ -157,6 +194,7 @@ async def update_schedule(
         is_active=updated_schedule.is_active,
         appointment_interval=updated_schedule.appointment_interval,
         description=updated_schedule.description,
+        cancelled_appointment_ids=cancelled_appointment_ids,
     )
 
     return schedule_response_schema
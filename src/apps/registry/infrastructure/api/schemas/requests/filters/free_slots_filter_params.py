@@ -0,0 +1,27 @@
+from typing import List, Optional
+
+from fastapi import Query
+
+
+class EarliestFreeSlotsFilterParams:
+    def __init__(
+        self,
+        serviced_area_number_filter: Optional[
+            int
+        ] = Query(  # In Russian: "Фильтр по участку"
+            None, description="Serviced area number of the doctors"
+        ),
+        doctor_specializations_filter: Optional[List[str]] = Query(
+            None, description="List of specializations of the doctors"
+        ),
+    ):
+        self.serviced_area_number_filter = serviced_area_number_filter
+        self.doctor_specializations_filter = doctor_specializations_filter
+
+    def to_dict(self, exclude_none: bool = True) -> dict:
+        data = vars(self)
+        return {
+            key: value
+            for key, value in data.items()
+            if not exclude_none or value is not None
+        }
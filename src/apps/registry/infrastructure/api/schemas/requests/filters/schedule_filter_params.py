@@ -33,6 +33,12 @@ class ScheduleFilterParams:
         doctor_specializations_filter: Optional[List[str]] = Query(
             None, description="List of specializations to filter schedules by"
         ),
+        served_patient_type_filter: Optional[str] = Query(
+            None, description="Patient type served by the doctor to filter schedules by"
+        ),
+        served_payment_type_filter: Optional[str] = Query(
+            None, description="Payment type served by the doctor to filter schedules by"
+        ),
     ):
         self.name_filter = name_filter
         self.doctor_full_name_filter = doctor_full_name_filter
@@ -41,6 +47,8 @@ class ScheduleFilterParams:
         self.status_filter = status_filter
         self.serviced_area_number_filter = serviced_area_number_filter
         self.doctor_specializations_filter = doctor_specializations_filter
+        self.served_patient_type_filter = served_patient_type_filter
+        self.served_payment_type_filter = served_payment_type_filter
 
     def to_dict(self, exclude_none: bool = True) -> dict:
         data = vars(self)
@@ -1,5 +1,6 @@
 from datetime import date
-from typing import Optional
+from typing import List, Optional
+from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
@@ -181,3 +182,19 @@ class UpdateScheduleSchema(BaseModel):
             }
         }
     )
+
+
+class BulkCreateSchedulesSchema(BaseModel):
+    doctor_ids: List[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Doctors to create the schedule for.",
+    )
+    schedule: CreateScheduleSchema = Field(
+        ..., description="Template of the schedule, the same for every doctor."
+    )
+
+    @field_validator("doctor_ids")
+    def deduplicate_doctor_ids(cls, v: List[UUID]) -> List[UUID]:
+        return list(dict.fromkeys(v))
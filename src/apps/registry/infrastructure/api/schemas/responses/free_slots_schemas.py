@@ -0,0 +1,28 @@
+from datetime import date, time
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class FreeSlotSchema(BaseModel):
+    start_time: time
+    end_time: time
+
+
+class ScheduleDayFreeSlotsSchema(BaseModel):
+    schedule_id: UUID
+    schedule_day_id: UUID
+    doctor_id: UUID
+    date: date
+    appointment_interval: int
+    free_slots: List[FreeSlotSchema]
+
+
+class EarliestFreeSlotSchema(BaseModel):
+    doctor_id: UUID
+    schedule_id: UUID
+    schedule_day_id: UUID
+    date: date
+    start_time: time
+    end_time: time
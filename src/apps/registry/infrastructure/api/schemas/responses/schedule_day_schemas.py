@@ -19,6 +19,11 @@ class ResponseScheduleDaySchema(BaseModel):
     date: date
 
 
+class ResponseUpdatedScheduleDaySchema(ResponseScheduleDaySchema):
+    # Booked appointments moved to the waiting list by the update
+    cancelled_appointment_ids: List[int] = []
+
+
 class MultipleScheduleDaysResponseSchema(BaseModel):
     items: List[ResponseScheduleDaySchema]
     pagination: PaginationMetaDataSchema
@@ -22,6 +22,11 @@ class ResponseScheduleSchema(BaseModel):
         from_attributes = True
 
 
+class ResponseUpdatedScheduleSchema(ResponseScheduleSchema):
+    # Booked appointments moved to the waiting list by the update
+    cancelled_appointment_ids: List[int] = []
+
+
 class MultipleSchedulesResponseSchema(BaseModel):
     items: List[ResponseScheduleSchema]
     pagination: PaginationMetaDataSchema
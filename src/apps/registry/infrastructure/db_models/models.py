@@ -9,12 +9,15 @@ from sqlalchemy import (
     Date,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     Time,
+    func,
+    literal_column,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, ExcludeConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql.sqltypes import DateTime
 
@@ -32,6 +35,8 @@ from src.shared.infrastructure.base import (
 
 # flake8: noqa: F821
 
+APPOINTMENTS_NO_OVERLAP_CONSTRAINT = "ex_appointments_schedule_day_id_time_range"
+
 
 class Schedule(Base, PrimaryKey, CreatedAtMixin, ChangedAtMixin):
     __tablename__ = "schedules"
@@ -100,6 +105,8 @@ class ScheduleDay(Base, PrimaryKey, CreatedAtMixin, ChangedAtMixin):
         CheckConstraint(
             "day_of_week BETWEEN 1 AND 7", name="ck_schedule_days_day_of_week"
         ),
+        # Keyset pagination of appointments (ordered by day date, time, id)
+        Index("ix_schedule_days_date_id", "date", "id"),
     )
 
 
@@ -108,6 +115,8 @@ class Appointment(Base, CreatedAtMixin, ChangedAtMixin):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     time: Mapped[time] = mapped_column(Time, nullable=False)
+    # Stored so that the database itself can reject overlapping appointments
+    end_time: Mapped[time] = mapped_column(Time, nullable=False)
     patient_id: Mapped[uuid.UUID] = mapped_column(
         sqlalchemy_UUID(as_uuid=True),
         ForeignKey("patients.id", ondelete="CASCADE"),
@@ -144,3 +153,25 @@ class Appointment(Base, CreatedAtMixin, ChangedAtMixin):
     schedule_day: Mapped["ScheduleDay"] = relationship(
         "ScheduleDay", back_populates="appointments"
     )
+
+    __table_args__ = (
+        # Keyset pagination of appointments (ordered by day date, time, id)
+        Index(
+            "ix_appointments_schedule_day_id_time_id", "schedule_day_id", "time", "id"
+        ),
+        # Two non-cancelled appointments of a day can't overlap. Times are
+        # anchored to a fixed date as PostgreSQL has no built-in time range type.
+        ExcludeConstraint(
+            ("schedule_day_id", "="),
+            (
+                func.tsrange(
+                    literal_column("DATE '2000-01-01'") + literal_column("time"),
+                    literal_column("DATE '2000-01-01'") + literal_column("end_time"),
+                ),
+                "&&",
+            ),
+            name=APPOINTMENTS_NO_OVERLAP_CONSTRAINT,
+            using="gist",
+            where="status <> 'CANCELLED'",
+        ),
+    )
@@ -1,16 +1,56 @@
-from typing import Any, Callable, Dict, List, Optional
+from contextlib import contextmanager
+from datetime import time, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Select, and_, func, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import joinedload
 
+from src.apps.patients.infrastructure.db_models.patients import SQLAlchemyPatient
+from src.apps.registry.domain.enums import AppointmentStatusEnum
+from src.apps.registry.domain.exceptions import (
+    AppointmentIsOutOfWorkTimeError,
+    AppointmentSlotIsTakenError,
+)
 from src.apps.registry.domain.models.appointment import AppointmentDomain
-from src.apps.registry.infrastructure.db_models.models import Appointment, ScheduleDay
+from src.apps.registry.infrastructure.db_models.models import (
+    APPOINTMENTS_NO_OVERLAP_CONSTRAINT,
+    Appointment,
+    Schedule,
+    ScheduleDay,
+)
 from src.apps.registry.interfaces.repository_interfaces import (
     AppointmentRepositoryInterface,
 )
-from src.apps.registry.mappers import map_appointment_db_entity_to_domain
+from src.apps.registry.mappers import (
+    map_appointment_db_entity_to_domain,
+    map_appointment_row_to_domain,
+)
+from src.apps.users.infrastructure.db_models.models import DoctorSpecialization
 from src.shared.infrastructure.base import BaseRepository
+from src.shared.infrastructure.keyset_pagination import (
+    CursorPage,
+    apply_keyset_pagination,
+    build_cursor_page,
+)
+
+EXCLUSION_VIOLATION_SQLSTATE = "23P01"
+
+# Columns of the appointment's domain, selected as plain rows by the lists
+APPOINTMENT_COLUMNS = (
+    Appointment.id,
+    Appointment.schedule_day_id,
+    Appointment.time,
+    Appointment.end_time,
+    Appointment.patient_id,
+    Appointment.status,
+    Appointment.type,
+    Appointment.insurance_type,
+    Appointment.reason,
+    Appointment.additional_services,
+    Appointment.cancelled_at,
+)
 
 
 class AppointmentRepositoryImpl(BaseRepository, AppointmentRepositoryInterface):
@@ -27,8 +67,32 @@ class AppointmentRepositoryImpl(BaseRepository, AppointmentRepositoryInterface):
         "appointment_status_filter": lambda value: AppointmentRepositoryImpl._filter_by_status(
             value
         ),
+        "patient_iin_filter": lambda value: AppointmentRepositoryImpl._filter_by_patient_iin(
+            value
+        ),
+        "patient_full_name_filter": lambda value: AppointmentRepositoryImpl._filter_by_patient_full_name(
+            value
+        ),
+        "attached_area_number_filter": lambda value: AppointmentRepositoryImpl._filter_by_attached_area_number(
+            value
+        ),
+        "doctor_id_filter": lambda value: AppointmentRepositoryImpl._filter_by_doctor_id(
+            value
+        ),
+        "doctor_specialization_filter": lambda value: AppointmentRepositoryImpl._filter_by_doctor_specialization(
+            value
+        ),
     }
 
+    # Filters which need the patient / schedule / doctor tables to be joined
+    _patient_filters = {
+        "patient_iin_filter",
+        "patient_full_name_filter",
+        "attached_area_number_filter",
+    }
+    _schedule_filters = {"doctor_id_filter", "doctor_specialization_filter"}
+    _doctor_filters = {"doctor_specialization_filter"}
+
     @staticmethod
     def _filter_by_schedule_id(value):
         return ScheduleDay.schedule_id == value
@@ -45,6 +109,53 @@ class AppointmentRepositoryImpl(BaseRepository, AppointmentRepositoryInterface):
     def _filter_by_status(value):
         return Appointment.status == value
 
+    @staticmethod
+    def _filter_by_patient_iin(value):
+        return SQLAlchemyPatient.iin == value
+
+    @staticmethod
+    def _filter_by_patient_full_name(value):
+        full_name = func.concat_ws(
+            " ",
+            SQLAlchemyPatient.last_name,
+            SQLAlchemyPatient.first_name,
+            SQLAlchemyPatient.middle_name,
+            SQLAlchemyPatient.maiden_name,
+        )
+        return full_name.ilike(f"%{value.strip()}%")
+
+    @staticmethod
+    def _filter_by_attached_area_number(value):
+        # Compared as text: '->>' extracts the value without failing on non-numeric data
+        return SQLAlchemyPatient.attachment_data["area_number"].astext == str(value)
+
+    @staticmethod
+    def _filter_by_doctor_id(value):
+        return Schedule.doctor_id == value
+
+    @staticmethod
+    def _filter_by_doctor_specialization(value):
+        return DoctorSpecialization.name_key == value.strip().lower()
+
+    @staticmethod
+    @contextmanager
+    def _overlapping_guard() -> Iterator[None]:
+        """
+        Translates the violation of the constraint forbidding overlapping
+        appointments into a domain error.
+        """
+        try:
+            yield
+        except IntegrityError as err:
+            if (
+                getattr(err.orig, "sqlstate", None) == EXCLUSION_VIOLATION_SQLSTATE
+                and APPOINTMENTS_NO_OVERLAP_CONSTRAINT in str(err.orig)
+            ):
+                raise AppointmentSlotIsTakenError(
+                    detail="The appointment overlaps another appointment of the day."
+                ) from err
+            raise
+
     def _build_filters(self, filters: dict) -> list:
         conditions = []
         for key, value in filters.items():
@@ -57,8 +168,41 @@ class AppointmentRepositoryImpl(BaseRepository, AppointmentRepositoryInterface):
 
         return conditions
 
-    async def get_total_number_of_appointments(self) -> int:
-        query = select(func.count(Appointment.id))
+    def _apply_filters(self, stmt: Select, filters: Optional[dict]) -> Select:
+        """
+        Joins the tables required by the given filters and applies their predicates.
+        Used both for the page and for the total, so they always match.
+        """
+        filters = {
+            key: value for key, value in (filters or {}).items() if value is not None
+        }
+
+        if self._patient_filters & filters.keys():
+            stmt = stmt.join(
+                SQLAlchemyPatient, Appointment.patient_id == SQLAlchemyPatient.id
+            )
+        if self._schedule_filters & filters.keys():
+            stmt = stmt.join(Schedule, ScheduleDay.schedule_id == Schedule.id)
+        if self._doctor_filters & filters.keys():
+            # At most one row per doctor and specialization (the primary key)
+            stmt = stmt.join(
+                DoctorSpecialization,
+                Schedule.doctor_id == DoctorSpecialization.doctor_id,
+            )
+
+        conditions = self._build_filters(filters)
+        if conditions:
+            stmt = stmt.where(and_(*conditions))
+
+        return stmt
+
+    async def get_total_number_of_appointments(
+        self, filters: Optional[dict] = None
+    ) -> int:
+        query = self._apply_filters(
+            select(func.count(Appointment.id)).join(Appointment.schedule_day),
+            filters,
+        )
         result = await self._async_db_session.execute(query)
 
         return result.scalar_one()
@@ -112,27 +256,47 @@ class AppointmentRepositoryImpl(BaseRepository, AppointmentRepositoryInterface):
         page: int = 1,
     ):
         stmt = (
-            select(Appointment)
+            select(*APPOINTMENT_COLUMNS)
             .join(Appointment.schedule_day)
-            .options(joinedload(Appointment.schedule_day))
             .order_by(ScheduleDay.date, Appointment.time)
         )
-
-        conditions = self._build_filters(filters)
-        if conditions:
-            stmt = stmt.where(and_(*conditions))
+        stmt = self._apply_filters(stmt, filters)
 
         stmt = stmt.limit(limit).offset((page - 1) * limit)
 
-        result = await self._async_db_session.execute(stmt)
-        rows = result.scalars().all()
+        return [map_appointment_row_to_domain(row) for row in await self._fetch_rows(stmt)]
 
-        return [map_appointment_db_entity_to_domain(row) for row in rows]
+    async def get_appointments_by_cursor(
+        self,
+        filters: dict,
+        limit: int = 30,
+        cursor: Optional[str] = None,
+    ) -> CursorPage[AppointmentDomain]:
+        # Same order as `get_appointments`, with the id as a unique tie-breaker
+        sort_keys = (ScheduleDay.date, Appointment.time, Appointment.id)
+        stmt = select(*APPOINTMENT_COLUMNS, ScheduleDay.date).join(
+            Appointment.schedule_day
+        )
+        stmt = self._apply_filters(stmt, filters)
+        stmt, direction = apply_keyset_pagination(stmt, sort_keys, cursor, limit)
+
+        page = build_cursor_page(
+            rows=await self._fetch_rows(stmt),
+            sort_values_getter=lambda row: (row.date, row.time, row.id),
+            limit=limit,
+            cursor=cursor,
+            direction=direction,
+        )
+
+        return page._replace(
+            items=[map_appointment_row_to_domain(row) for row in page.items]
+        )
 
     async def add(self, appointment: AppointmentDomain) -> AppointmentDomain:
         new_appointment = Appointment(
             schedule_day_id=appointment.schedule_day_id,
             time=appointment.time,
+            end_time=appointment.end_time,
             patient_id=appointment.patient_id,
             status=appointment.status,
             type=appointment.type,
@@ -142,20 +306,17 @@ class AppointmentRepositoryImpl(BaseRepository, AppointmentRepositoryInterface):
             cancelled_at=appointment.cancelled_at,
         )
         self._async_db_session.add(new_appointment)
-        await self._async_db_session.flush()
+        with self._overlapping_guard():
+            await self._async_db_session.flush()
         await self._async_db_session.refresh(new_appointment)
 
         return map_appointment_db_entity_to_domain(new_appointment)
 
     async def update(self, appointment: AppointmentDomain) -> AppointmentDomain:
-        result = await self._async_db_session.execute(
-            select(Appointment).where(Appointment.id == appointment.id)
-        )
-        existing = result.scalar_one_or_none()
-
         fields_to_update = [
             "schedule_day_id",
             "time",
+            "end_time",
             "patient_id",
             "status",
             "type",
@@ -164,26 +325,99 @@ class AppointmentRepositoryImpl(BaseRepository, AppointmentRepositoryInterface):
             "additional_services",
             "cancelled_at",
         ]
+        values = {
+            field: getattr(appointment, field)
+            for field in fields_to_update
+            if field in appointment.changed_fields
+        }
+        if not values:
+            # Nothing has changed, the row is not written
+            return appointment
 
         self._logger.debug(
-            f"Updating appointment with ID {appointment.id} with fields: {appointment.__dict__}"
+            f"Updating appointment with ID {appointment.id} with fields: {values}"
         )
 
-        # Updating fields...
-        for field in fields_to_update:
-            setattr(existing, field, getattr(appointment, field))
-
-        self._async_db_session.add(existing)
-        await self._async_db_session.flush()
-        await self._async_db_session.refresh(existing)
+        with self._overlapping_guard():
+            updated = await self._update_by_id(Appointment, appointment.id, values)
+
+        return map_appointment_db_entity_to_domain(updated)
+
+    async def update_end_times_by_schedule_id(
+        self, schedule_id: UUID, appointment_interval: int
+    ) -> None:
+        interval = timedelta(minutes=appointment_interval)
+        # Time values wrap past midnight, while the difference of two times
+        # is an interval, so the remaining work time is compared instead
+        remaining_work_time = ScheduleDay.work_end_time - Appointment.time
+        is_out_of_work_time = await self._async_db_session.scalar(
+            select(
+                select(Appointment.id)
+                .join(ScheduleDay, Appointment.schedule_day_id == ScheduleDay.id)
+                .where(
+                    ScheduleDay.schedule_id == schedule_id,
+                    Appointment.status != AppointmentStatusEnum.CANCELLED,
+                    remaining_work_time < interval,
+                )
+                .exists()
+            )
+        )
+        if is_out_of_work_time:
+            raise AppointmentIsOutOfWorkTimeError(
+                detail="The appointments would end after the end of the work day."
+            )
+
+        with self._overlapping_guard():
+            await self._async_db_session.execute(
+                update(Appointment)
+                .where(
+                    Appointment.schedule_day_id == ScheduleDay.id,
+                    ScheduleDay.schedule_id == schedule_id,
+                )
+                .values(
+                    # Only the cancelled appointments can be cut short here:
+                    # they are clamped to the end of the work day, so that
+                    # the end time never wraps past midnight
+                    end_time=Appointment.time
+                    + func.least(interval, remaining_work_time)
+                )
+            )
+
+    async def _cancel_booked(self, *conditions) -> List[int]:
+        result = await self._async_db_session.execute(
+            update(Appointment)
+            .where(Appointment.status == AppointmentStatusEnum.BOOKED, *conditions)
+            .values(status=AppointmentStatusEnum.CANCELLED, cancelled_at=func.now())
+            .returning(Appointment.id)
+            .execution_options(synchronize_session=False)
+        )
 
-        return map_appointment_db_entity_to_domain(existing)
+        return list(result.scalars().all())
 
-    async def delete_by_id(self, id: int) -> None:
-        result = await self._async_db_session.execute(
-            select(Appointment).where(Appointment.id == id)
+    async def cancel_booked_by_day_ids(
+        self,
+        schedule_day_ids: List[UUID],
+        time_range: Optional[Tuple[time, time]] = None,
+    ) -> List[int]:
+        if not schedule_day_ids:
+            return []
+
+        conditions = [Appointment.schedule_day_id.in_(schedule_day_ids)]
+        if time_range is not None:
+            range_start, range_end = time_range
+            conditions += [
+                Appointment.time < range_end,
+                Appointment.end_time > range_start,
+            ]
+
+        return await self._cancel_booked(*conditions)
+
+    async def cancel_booked_by_schedule_id(self, schedule_id: UUID) -> List[int]:
+        return await self._cancel_booked(
+            Appointment.schedule_day_id.in_(
+                select(ScheduleDay.id).where(ScheduleDay.schedule_id == schedule_id)
+            )
         )
-        existing = result.scalar_one_or_none()
 
-        await self._async_db_session.delete(existing)
-        await self._async_db_session.commit()
+    async def delete_by_id(self, id: int) -> None:
+        await self._delete_by_id(Appointment, id)
@@ -1,8 +1,13 @@
 from datetime import date
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, delete, func, insert, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+
+from src.apps.registry.domain.enums import AppointmentStatusEnum
+from src.apps.registry.domain.free_slots import ScheduleDayAvailability
+from src.apps.registry.domain.schedule_days import ScheduleDayRow
 
 from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas import (
     CreateScheduleDaySchema,
@@ -11,7 +16,14 @@ from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas
 from src.apps.registry.infrastructure.api.schemas.responses.schedule_day_schemas import (
     ResponseScheduleDaySchema,
 )
-from src.apps.registry.infrastructure.db_models.models import ScheduleDay
+from src.apps.registry.infrastructure.db_models.models import (
+    Appointment,
+    Schedule,
+    ScheduleDay,
+)
+from src.apps.registry.infrastructure.repositories.schedule_repository import (
+    apply_schedule_filters,
+)
 from src.apps.registry.interfaces.repository_interfaces import (
     ScheduleDayRepositoryInterface,
 )
@@ -36,6 +48,19 @@ class ScheduleDayRepositoryImpl(BaseRepository, ScheduleDayRepositoryInterface):
 
         return None
 
+    async def get_many_by_ids(self, ids: List[UUID]) -> List[ResponseScheduleDaySchema]:
+        if not ids:
+            return []
+
+        result = await self._async_db_session.execute(
+            select(ScheduleDay).where(ScheduleDay.id.in_(ids))
+        )
+
+        return [
+            map_schedule_day_db_entity_to_schema(schedule_day)
+            for schedule_day in result.scalars().all()
+        ]
+
     async def get_by_schedule_and_day_of_week(
         self, schedule_id: UUID, day_of_week: int
     ) -> Optional[ResponseScheduleDaySchema]:
@@ -80,6 +105,75 @@ class ScheduleDayRepositoryImpl(BaseRepository, ScheduleDayRepositoryInterface):
 
         return [map_schedule_day_db_entity_to_schema(sd) for sd in schedule_days]
 
+    async def get_availability(
+        self,
+        date_from: date,
+        date_to: date,
+        schedule_id: Optional[UUID] = None,
+        doctor_id: Optional[UUID] = None,
+        schedule_filters: Optional[Dict[str, Any]] = None,
+    ) -> List[ScheduleDayAvailability]:
+        # Start times of the day's non-cancelled appointments, aggregated in the DB
+        booked_times = func.array_agg(
+            aggregate_order_by(Appointment.time, Appointment.time)
+        ).filter(Appointment.id.is_not(None))
+        query = (
+            select(
+                ScheduleDay.schedule_id,
+                ScheduleDay.id,
+                Schedule.doctor_id,
+                ScheduleDay.date,
+                ScheduleDay.work_start_time,
+                ScheduleDay.work_end_time,
+                ScheduleDay.break_start_time,
+                ScheduleDay.break_end_time,
+                Schedule.appointment_interval,
+                booked_times,
+            )
+            .join(Schedule, Schedule.id == ScheduleDay.schedule_id)
+            .outerjoin(
+                Appointment,
+                and_(
+                    Appointment.schedule_day_id == ScheduleDay.id,
+                    Appointment.status != AppointmentStatusEnum.CANCELLED,
+                ),
+            )
+            .where(
+                ScheduleDay.date.between(date_from, date_to),
+                ScheduleDay.is_active.is_(True),
+                Schedule.is_active.is_(True),
+            )
+            .group_by(ScheduleDay.id, Schedule.id)
+            .order_by(ScheduleDay.date, ScheduleDay.work_start_time, ScheduleDay.id)
+        )
+        if schedule_id:
+            query = query.where(ScheduleDay.schedule_id == schedule_id)
+        if doctor_id:
+            query = query.where(Schedule.doctor_id == doctor_id)
+        if schedule_filters:
+            # Same doctor filters (area, specializations...) as the schedules list
+            query = apply_schedule_filters(query, schedule_filters)
+
+        result = await self._async_db_session.execute(query)
+
+        return [
+            ScheduleDayAvailability(*row[:-1], booked_times=tuple(row[-1] or ()))
+            for row in result.all()
+        ]
+
+    async def add_many(self, days: List[ScheduleDayRow]) -> int:
+        if not days:
+            return 0
+
+        # With RETURNING the rows are sent as multi-row INSERT ... VALUES
+        # statements (1000 rows each) instead of a statement per row
+        result = await self._async_db_session.execute(
+            insert(ScheduleDay).returning(ScheduleDay.id),
+            [day._asdict() for day in days],
+        )
+
+        return len(result.all())
+
     async def add(
         self, create_day_schema: CreateScheduleDaySchema
     ) -> ResponseScheduleDaySchema:
@@ -101,29 +195,31 @@ class ScheduleDayRepositoryImpl(BaseRepository, ScheduleDayRepositoryInterface):
     async def update(
         self, day_id: UUID, schema: UpdateScheduleDaySchema
     ) -> ResponseScheduleDaySchema:
-        result = await self._async_db_session.execute(
-            select(ScheduleDay).where(ScheduleDay.id == day_id)
+        schedule_day = await self._update_by_id(
+            ScheduleDay,
+            day_id,
+            {
+                "is_active": schema.is_active,
+                "work_start_time": schema.work_start_time,
+                "work_end_time": schema.work_end_time,
+                "break_start_time": schema.break_start_time,
+                "break_end_time": schema.break_end_time,
+            },
         )
-        schedule_day = result.scalar_one_or_none()
-
-        # Updating fields...
-        schedule_day.is_active = schema.is_active
-        schedule_day.work_start_time = schema.work_start_time
-        schedule_day.work_end_time = schema.work_end_time
-        schedule_day.break_start_time = schema.break_start_time
-        schedule_day.break_end_time = schema.break_end_time
-
-        self._async_db_session.add(schedule_day)
-        await self._async_db_session.flush()
-        await self._async_db_session.refresh(schedule_day)
 
         return map_schedule_day_db_entity_to_schema(schedule_day)
 
     async def delete_by_id(self, id: UUID) -> None:
+        await self._delete_by_id(ScheduleDay, id)
+
+    async def delete_many_by_ids(self, ids: List[UUID]) -> int:
+        if not ids:
+            return 0
+
         result = await self._async_db_session.execute(
-            select(ScheduleDay).where(ScheduleDay.id == id)
+            delete(ScheduleDay)
+            .where(ScheduleDay.id.in_(ids))
+            .execution_options(synchronize_session=False)
         )
-        schedule_day = result.scalar_one_or_none()
 
-        await self._async_db_session.delete(schedule_day)
-        await self._async_db_session.flush()
+        return result.rowcount
@@ -1,10 +1,8 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 from uuid import UUID
 
-from sqlalchemy import Integer, and_, cast, func, or_, select
-from sqlalchemy.dialects.postgresql.json import JSONB
+from sqlalchemy import and_, func, insert, or_, select
 from sqlalchemy.orm import aliased
-from sqlalchemy.sql.expression import column
 
 from src.apps.registry.domain.models.schedule import ScheduleDomain
 from src.apps.registry.infrastructure.db_models.models import Schedule, ScheduleDay
@@ -15,69 +13,88 @@ from src.apps.registry.mappers import (
     map_schedule_db_entity_to_domain,
     map_schedule_domain_to_db_entity,
 )
-from src.apps.users.infrastructure.db_models.models import User
+from src.apps.users.infrastructure.db_models.models import (
+    DoctorArea,
+    DoctorServedType,
+    DoctorSpecialization,
+    User,
+)
 from src.shared.infrastructure.base import BaseRepository
 
 
-class ScheduleRepositoryImpl(BaseRepository, ScheduleRepositoryInterface):
-    @staticmethod
-    def _apply_filters_to_query(query, filters: Dict[str, Any]):
+def apply_schedule_filters(query, filters: Dict[str, Any]):
+    """
+    Applies the schedules list filters to a query selecting from the schedules:
+    the doctor filters are joins and semi-joins on the doctor directory.
+    """
+    # Only the IIN and the full name are read from the users table, the rest
+    # of the doctor filters are lookups in the doctor directory
+    if filters.get("doctor_iin_filter") or filters.get("doctor_full_name_filter"):
         DoctorAlias = aliased(User)
         query = query.join(DoctorAlias, Schedule.doctor)
 
-        if filters.get("name_filter"):
-            query = query.where(Schedule.schedule_name == filters["name_filter"])
+    if filters.get("name_filter"):
+        query = query.where(Schedule.schedule_name == filters["name_filter"])
 
-        if filters.get("doctor_id_filter"):
-            query = query.where(Schedule.doctor_id == filters["doctor_id_filter"])
+    if filters.get("doctor_id_filter"):
+        query = query.where(Schedule.doctor_id == filters["doctor_id_filter"])
 
-        if "status_filter" in filters:
-            query = query.where(Schedule.is_active == filters["status_filter"])
+    if "status_filter" in filters:
+        query = query.where(Schedule.is_active == filters["status_filter"])
 
-        if filters.get("doctor_iin_filter"):
-            query = query.where(DoctorAlias.iin == filters["doctor_iin_filter"])
+    if filters.get("doctor_iin_filter"):
+        query = query.where(DoctorAlias.iin == filters["doctor_iin_filter"])
 
-        if filters.get("serviced_area_number_filter") is not None:
-            query = query.where(
-                and_(
-                    DoctorAlias.attachment_data["area_number"].isnot(None),
-                    cast(DoctorAlias.attachment_data["area_number"].astext, Integer)
-                    == filters["serviced_area_number_filter"],
+    if filters.get("serviced_area_number_filter") is not None:
+        query = query.join(
+            DoctorArea, DoctorArea.doctor_id == Schedule.doctor_id
+        ).where(DoctorArea.area_number == filters["serviced_area_number_filter"])
+
+    if filters.get("doctor_full_name_filter"):
+        full_value = filters["doctor_full_name_filter"].strip().lower()
+        query = query.where(
+            func.lower(DoctorAlias.full_name).ilike(f"%{full_value}%")
+        )
+
+    specialization_names = [
+        name.strip().lower()
+        for name in filters.get("doctor_specializations_filter") or []
+        if name and name.strip()
+    ]
+    if specialization_names:
+        # A semi-join: a doctor may match several of the names
+        query = query.where(
+            Schedule.doctor_id.in_(
+                select(DoctorSpecialization.doctor_id).where(
+                    or_(
+                        *(
+                            DoctorSpecialization.name_key.like(f"%{name}%")
+                            for name in specialization_names
+                        )
+                    )
                 )
             )
+        )
 
-        if filters.get("doctor_full_name_filter"):
-            full_value = filters["doctor_full_name_filter"].strip().lower()
-            query = query.where(
-                func.lower(DoctorAlias.full_name).ilike(f"%{full_value}%")
+    for filter_name, kind in (
+        ("served_patient_type_filter", User.served_patient_types.key),
+        ("served_payment_type_filter", User.served_payment_types.key),
+    ):
+        if filters.get(filter_name):
+            ServedTypeAlias = aliased(DoctorServedType)
+            query = query.join(
+                ServedTypeAlias,
+                and_(
+                    ServedTypeAlias.doctor_id == Schedule.doctor_id,
+                    ServedTypeAlias.kind == kind,
+                    ServedTypeAlias.value == filters[filter_name],
+                ),
             )
 
-        specialization_names = filters.get("doctor_specializations_filter") or []
-        if specialization_names:
-            elements_source = func.jsonb_array_elements(
-                DoctorAlias.specializations
-            ).table_valued(column("value", JSONB), name="unnested_specs_alias")
-            element_name_as_text = elements_source.c.value.op("->>")("name")
-
-            specialization_clauses = []
-            for specialization in specialization_names:
-                if specialization:
-                    exists_clause = (
-                        select(True)
-                        .select_from(elements_source)
-                        .where(
-                            func.lower(element_name_as_text).ilike(
-                                f"%{specialization.lower()}%"
-                            )
-                        )
-                        .exists()
-                    )
-                    specialization_clauses.append(exists_clause)
-            if specialization_clauses:
-                query = query.where(or_(*specialization_clauses))
+    return query
 
-        return query
 
+class ScheduleRepositoryImpl(BaseRepository, ScheduleRepositoryInterface):
     async def get_total_number_of_schedules(self) -> int:
         query = select(func.count(Schedule.id))
         result = await self._async_db_session.execute(query)
@@ -94,6 +111,19 @@ class ScheduleRepositoryImpl(BaseRepository, ScheduleRepositoryInterface):
 
         return None
 
+    async def get_many_by_ids(self, ids: List[UUID]) -> List[ScheduleDomain]:
+        if not ids:
+            return []
+
+        result = await self._async_db_session.execute(
+            select(Schedule).where(Schedule.id.in_(ids))
+        )
+
+        return [
+            map_schedule_db_entity_to_domain(schedule)
+            for schedule in result.scalars().unique().all()
+        ]
+
     async def get_schedule_by_day_id(self, day_id: UUID) -> Optional[ScheduleDomain]:
         query = select(Schedule).join(ScheduleDay).where(ScheduleDay.id == day_id)
 
@@ -115,7 +145,7 @@ class ScheduleRepositoryImpl(BaseRepository, ScheduleRepositoryInterface):
     ) -> List[ScheduleDomain]:
         query = select(Schedule)
         # Applying filters...
-        query = self._apply_filters_to_query(query, filters)
+        query = apply_schedule_filters(query, filters)
 
         # Pagination
         query = query.limit(limit).offset((page - 1) * limit)
@@ -134,31 +164,61 @@ class ScheduleRepositoryImpl(BaseRepository, ScheduleRepositoryInterface):
 
         return map_schedule_db_entity_to_domain(new_schedule)
 
-    async def update(self, schedule_domain: ScheduleDomain) -> ScheduleDomain:
-        result = await self._async_db_session.execute(
-            select(Schedule).where(Schedule.id == schedule_domain.id)
+    async def add_many(self, schedules: List[ScheduleDomain]) -> List[ScheduleDomain]:
+        if not schedules:
+            return []
+
+        result = await self._async_db_session.scalars(
+            insert(Schedule).returning(Schedule, sort_by_parameter_order=True),
+            [
+                {
+                    "doctor_id": schedule.doctor_id,
+                    "schedule_name": schedule.schedule_name,
+                    "period_start": schedule.period_start,
+                    "period_end": schedule.period_end,
+                    "is_active": schedule.is_active,
+                    "appointment_interval": schedule.appointment_interval,
+                    "description": schedule.description,
+                }
+                for schedule in schedules
+            ],
         )
-        existing = result.scalar_one_or_none()
 
-        # Updating fields...
-        existing.doctor_id = schedule_domain.doctor_id
-        existing.schedule_name = schedule_domain.schedule_name
-        existing.period_start = schedule_domain.period_start
-        existing.period_end = schedule_domain.period_end
-        existing.is_active = schedule_domain.is_active
-        existing.appointment_interval = schedule_domain.appointment_interval
+        return [map_schedule_db_entity_to_domain(schedule) for schedule in result.all()]
 
-        self._async_db_session.add(existing)
-        await self._async_db_session.flush()
-        await self._async_db_session.refresh(existing)
-
-        return map_schedule_db_entity_to_domain(existing)
+    async def get_doctor_ids_with_schedule_name(
+        self, doctor_ids: List[UUID], schedule_name: str
+    ) -> Set[UUID]:
+        if not doctor_ids:
+            return set()
 
-    async def delete(self, id: UUID) -> None:
         result = await self._async_db_session.execute(
-            select(Schedule).where(Schedule.id == id)
+            select(Schedule.doctor_id)
+            .where(
+                Schedule.doctor_id.in_(doctor_ids),
+                Schedule.schedule_name == schedule_name,
+            )
+            .distinct()
+        )
+
+        return set(result.scalars().all())
+
+    async def update(self, schedule_domain: ScheduleDomain) -> ScheduleDomain:
+        updated = await self._update_by_id(
+            Schedule,
+            schedule_domain.id,
+            {
+                "doctor_id": schedule_domain.doctor_id,
+                "schedule_name": schedule_domain.schedule_name,
+                "period_start": schedule_domain.period_start,
+                "period_end": schedule_domain.period_end,
+                "is_active": schedule_domain.is_active,
+                "appointment_interval": schedule_domain.appointment_interval,
+            },
         )
-        schedule = result.scalar_one_or_none()
 
-        await self._async_db_session.delete(schedule)
-        await self._async_db_session.commit()
+        return map_schedule_db_entity_to_domain(updated)
+
+    async def delete(self, id: UUID) -> None:
+        # Days and their appointments are removed by the FK cascade
+        await self._delete_by_id(Schedule, id)
@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
-from datetime import date
-from typing import Any, Dict, List, Optional
+from datetime import date, time
+from typing import Any, Dict, List, Optional, Set, Tuple
 from uuid import UUID
 
+from src.apps.registry.domain.free_slots import ScheduleDayAvailability
 from src.apps.registry.domain.models.appointment import AppointmentDomain
 from src.apps.registry.domain.models.schedule import ScheduleDomain
+from src.apps.registry.domain.schedule_days import ScheduleDayRow
 from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas import (
     CreateScheduleDaySchema,
     UpdateScheduleDaySchema,
@@ -12,15 +14,20 @@ from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas
 from src.apps.registry.infrastructure.api.schemas.responses.schedule_day_schemas import (
     ResponseScheduleDaySchema,
 )
+from src.shared.infrastructure.keyset_pagination import CursorPage
 
 
 class AppointmentRepositoryInterface(ABC):
     @abstractmethod
-    async def get_total_number_of_appointments(self) -> int:
+    async def get_total_number_of_appointments(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
         """
-        Retrieve a number of ALL appointments from the Registry Service DB.
+        Retrieve a number of appointments from the Registry Service DB
+        matching the provided filters (ALL appointments if no filters are given).
 
-        :return: Number of ALL appointments from the Registry Service DB as INT
+        :param filters: The same filters as for `get_appointments`
+        :return: Number of matching appointments from the Registry Service DB as INT
         """
         pass
 
@@ -59,12 +66,77 @@ class AppointmentRepositoryInterface(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_appointments_by_cursor(
+        self,
+        filters: Dict[str, Any],
+        limit: int = 30,
+        cursor: Optional[str] = None,
+    ) -> CursorPage[AppointmentDomain]:
+        """
+        Returns a page of appointments filtered by the provided params using keyset pagination.
+
+        :param filters: The same filters as for `get_appointments`
+        :param limit: Pagination limit per page.
+        :param cursor: Opaque cursor of the neighbour page (None for the first page).
+
+        :return: Page of 'AppointmentDomain' objects with the cursors of the neighbour pages.
+        """
+        pass
+
     @abstractmethod
     async def add(self, appointment: AppointmentDomain) -> AppointmentDomain:
+        """
+        :raises AppointmentSlotIsTakenError: If the appointment overlaps
+            a non-cancelled appointment of the same day.
+        """
         pass
 
     @abstractmethod
     async def update(self, appointment: AppointmentDomain) -> AppointmentDomain:
+        """
+        :raises AppointmentSlotIsTakenError: If the appointment overlaps
+            a non-cancelled appointment of the same day.
+        """
+        pass
+
+    @abstractmethod
+    async def update_end_times_by_schedule_id(
+        self, schedule_id: UUID, appointment_interval: int
+    ) -> None:
+        """
+        Recomputes the end time of every appointment of the schedule
+        after its appointment interval has changed.
+
+        :raises AppointmentIsOutOfWorkTimeError: If a non-cancelled appointment
+            would end after the end of its work day.
+        :raises AppointmentSlotIsTakenError: If the appointments would overlap.
+        """
+        pass
+
+    @abstractmethod
+    async def cancel_booked_by_day_ids(
+        self,
+        schedule_day_ids: List[UUID],
+        time_range: Optional[Tuple[time, time]] = None,
+    ) -> List[int]:
+        """
+        Cancels (moves to the waiting list) the booked appointments of the days
+        with a single UPDATE ... RETURNING. If a time range is given, only the
+        appointments overlapping it are cancelled.
+
+        :return: IDs of the cancelled appointments.
+        """
+        pass
+
+    @abstractmethod
+    async def cancel_booked_by_schedule_id(self, schedule_id: UUID) -> List[int]:
+        """
+        Cancels the booked appointments of every day of the schedule
+        with a single UPDATE ... RETURNING.
+
+        :return: IDs of the cancelled appointments.
+        """
         pass
 
     @abstractmethod
@@ -86,6 +158,10 @@ class ScheduleDayRepositoryInterface(ABC):
     async def get_by_id(self, id: UUID) -> Optional[ResponseScheduleDaySchema]:
         pass
 
+    @abstractmethod
+    async def get_many_by_ids(self, ids: List[UUID]) -> List[ResponseScheduleDaySchema]:
+        pass
+
     @abstractmethod
     async def get_by_schedule_and_day_of_week(
         self, schedule_id: UUID, day_of_week: int
@@ -104,12 +180,42 @@ class ScheduleDayRepositoryInterface(ABC):
     ) -> List[ResponseScheduleDaySchema]:
         pass
 
+    @abstractmethod
+    async def get_availability(
+        self,
+        date_from: date,
+        date_to: date,
+        schedule_id: Optional[UUID] = None,
+        doctor_id: Optional[UUID] = None,
+        schedule_filters: Optional[Dict[str, Any]] = None,
+    ) -> List[ScheduleDayAvailability]:
+        """
+        Retrieve the active days of active schedules in the period together with
+        the start times of their non-cancelled appointments, with a single query.
+
+        :param schedule_filters: Filters of the schedules list
+            (e.g. `serviced_area_number_filter`, `doctor_specializations_filter`)
+
+        :return: Days ordered by date and working hours.
+        """
+        pass
+
     @abstractmethod
     async def add(
         self, day_schema: CreateScheduleDaySchema
     ) -> ResponseScheduleDaySchema:
         pass
 
+    @abstractmethod
+    async def add_many(self, days: List[ScheduleDayRow]) -> int:
+        """
+        Inserts the generated days with multi-row INSERT statements
+        instead of a flush per day.
+
+        :return: Number of inserted days.
+        """
+        pass
+
     @abstractmethod
     async def update(
         self, day_id: UUID, schema: UpdateScheduleDaySchema
@@ -120,6 +226,15 @@ class ScheduleDayRepositoryInterface(ABC):
     async def delete_by_id(self, id: UUID) -> None:
         pass
 
+    @abstractmethod
+    async def delete_many_by_ids(self, ids: List[UUID]) -> int:
+        """
+        Deletes the days with a single DELETE statement.
+
+        :return: Number of deleted days.
+        """
+        pass
+
 
 class ScheduleRepositoryInterface(ABC):
     @abstractmethod
@@ -135,6 +250,10 @@ class ScheduleRepositoryInterface(ABC):
     async def get_by_id(self, id: UUID) -> Optional[ScheduleDomain]:
         pass
 
+    @abstractmethod
+    async def get_many_by_ids(self, ids: List[UUID]) -> List[ScheduleDomain]:
+        pass
+
     @abstractmethod
     async def get_schedule_by_day_id(self, day_id: UUID) -> Optional[ScheduleDomain]:
         pass
@@ -162,6 +281,23 @@ class ScheduleRepositoryInterface(ABC):
     async def add(self, schedule: ScheduleDomain) -> ScheduleDomain:
         pass
 
+    @abstractmethod
+    async def add_many(self, schedules: List[ScheduleDomain]) -> List[ScheduleDomain]:
+        """
+        Inserts the schedules with a single INSERT ... RETURNING,
+        keeping the order of the given schedules.
+        """
+        pass
+
+    @abstractmethod
+    async def get_doctor_ids_with_schedule_name(
+        self, doctor_ids: List[UUID], schedule_name: str
+    ) -> Set[UUID]:
+        """
+        Returns the IDs of the given doctors who already have a schedule with the name.
+        """
+        pass
+
     @abstractmethod
     async def update(self, schedule: ScheduleDomain) -> ScheduleDomain:
         pass
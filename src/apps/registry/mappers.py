@@ -2,6 +2,8 @@ from datetime import date, time
 from typing import Optional
 from zoneinfo import ZoneInfo
 
+from sqlalchemy import Row
+
 from src.apps.patients.infrastructure.api.schemas.responses.patient_response_schemas import (
     ResponsePatientSchema,
 )
@@ -28,6 +30,7 @@ def map_appointment_db_entity_to_domain(
         id=appointment_from_db.id,
         schedule_day_id=appointment_from_db.schedule_day_id,
         time=appointment_from_db.time,
+        end_time=appointment_from_db.end_time,
         patient_id=appointment_from_db.patient_id,
         status=appointment_from_db.status,
         type=appointment_from_db.type,
@@ -38,6 +41,26 @@ def map_appointment_db_entity_to_domain(
     )
 
 
+def map_appointment_row_to_domain(row: Row) -> AppointmentDomain:
+    """
+    Maps a row of the appointment's columns, selected without building
+    an ORM entity (read-only lists).
+    """
+    return AppointmentDomain(
+        id=row.id,
+        schedule_day_id=row.schedule_day_id,
+        time=row.time,
+        end_time=row.end_time,
+        patient_id=row.patient_id,
+        status=row.status,
+        type=row.type,
+        insurance_type=row.insurance_type,
+        reason=row.reason,
+        additional_services=row.additional_services,
+        cancelled_at=row.cancelled_at,
+    )
+
+
 def map_appointment_domain_to_response_schema(
     appointment: AppointmentDomain,
     appointment_end_time: time,
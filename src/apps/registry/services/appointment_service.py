@@ -5,6 +5,7 @@ from uuid import UUID
 from src.apps.patients.domain.patient import PatientDomain
 from src.apps.patients.services.patients_service import PatientService
 from src.apps.registry.domain.enums import AppointmentStatusEnum
+from src.apps.registry.domain.exceptions import AppointmentSlotIsTakenError
 from src.apps.registry.domain.exceptions import (
     ScheduleDayIsNotActiveError as ScheduleDayIsNotActiveErrorDomain,
 )
@@ -41,6 +42,8 @@ from src.apps.users.services.user_service import UserService
 from src.core.i18n import _
 from src.core.logger import LoggerService
 from src.shared.exceptions import ApplicationError
+from src.shared.helpers.batch_loader import BatchLoader
+from src.shared.infrastructure.keyset_pagination import CursorPage
 from src.shared.schemas.pagination_schemas import PaginationParams
 
 
@@ -135,40 +138,6 @@ class AppointmentService:
                 detail=_(error_message),
             )
 
-    @staticmethod
-    def _check_appointment_overlapping(
-        appointment_start_datetime: datetime,
-        appointment_end_datetime: datetime,
-        existing_appointments: List[AppointmentDomain],
-        schedule_day_date: date,
-        appointment_interval_minutes: int,
-        current_appointment_id: Optional[int] = None,
-    ) -> None:
-        for existing_appointment in existing_appointments:
-            if (
-                current_appointment_id is not None
-                and existing_appointment.id == current_appointment_id
-            ):
-                continue
-
-            if existing_appointment.status == AppointmentStatusEnum.CANCELLED:
-                continue
-
-            existing_start = datetime.combine(
-                schedule_day_date, existing_appointment.time
-            )
-            existing_end = existing_start + timedelta(
-                minutes=appointment_interval_minutes
-            )
-
-            if (appointment_start_datetime < existing_end) and (
-                appointment_end_datetime > existing_start
-            ):
-                raise AppointmentOverlappingError(
-                    status_code=409,
-                    detail=_("The selected appointment slot is already booked."),
-                )
-
     @staticmethod
     def _check_appointment_exists(
         appointment: Optional[AppointmentDomain], appointment_id: int
@@ -204,71 +173,6 @@ class AppointmentService:
             )
         return schedule_day
 
-    @staticmethod
-    async def _load_entities_by_ids(ids: set, load_function):
-        results = []
-        for entity_id in ids:
-            entity = await load_function(entity_id)
-            if entity is not None:
-                results.append(entity)
-        return {entity.id: entity for entity in results}
-
-    @staticmethod
-    def _appointment_passes_filters(
-        patient: Optional[PatientDomain],
-        schedule_day,
-        schedule,
-        doctors_map: dict[int, UserDomain],
-        filter_params: AppointmentFilterParams,
-    ) -> bool:
-        if filter_params.patient_iin_filter:
-            if not patient or patient.iin != filter_params.patient_iin_filter:
-                return False
-
-        if schedule_day is None or schedule is None:
-            return False
-
-        if (
-            filter_params.doctor_id_filter
-            and schedule.doctor_id != filter_params.doctor_id_filter
-        ):
-            return False
-
-        if filter_params.patient_full_name_filter:
-            if not patient:
-                return False
-
-            full_name = (
-                f"{patient.last_name} {patient.first_name} {patient.middle_name or ''}"
-                f" {patient.maiden_name or ''}"
-            ).lower()
-            if filter_params.patient_full_name_filter.lower() not in full_name:
-                return False
-
-        if filter_params.doctor_specialization_filter:
-            doctor = doctors_map.get(schedule.doctor_id)
-            if not doctor:
-                return False
-
-            specialization_filter = (
-                filter_params.doctor_specialization_filter.strip().lower()
-            )
-            if not any(
-                specialization.get("name", "").strip().lower() == specialization_filter
-                for specialization in (doctor.specializations or [])
-            ):
-                return False
-
-        if filter_params.attached_area_number_filter:
-            if not patient or not patient.attachment_data:
-                return False
-
-            area_number = patient.attachment_data.get("area_number")
-            if area_number != filter_params.attached_area_number_filter:
-                return False
-
-        return True
-
     async def get_by_id(
         self, appointment_id: int
     ) -> Tuple[AppointmentDomain, Optional[PatientDomain], UserDomain, time, date]:
@@ -321,11 +225,57 @@ class AppointmentService:
         )
 
         total_amount_of_records = (
-            await self._appointment_repository.get_total_number_of_appointments()
+            await self._appointment_repository.get_total_number_of_appointments(
+                filters=filters_dict
+            )
+        )
+
+        return (
+            await self._attach_related_entities(appointments),
+            total_amount_of_records,
+        )
+
+    async def get_appointments_by_cursor(
+        self,
+        filter_params: AppointmentFilterParams,
+        pagination_params: PaginationParams,
+    ) -> Tuple[
+        CursorPage[
+            Tuple[AppointmentDomain, Optional[PatientDomain], UserDomain, time, date]
+        ],
+        Optional[int],
+    ]:
+        """
+        The total is counted only if `include_total` is requested:
+        the count scans all of the filtered appointments.
+        """
+        filters_dict = filter_params.to_dict(exclude_none=True)
+        page = await self._appointment_repository.get_appointments_by_cursor(
+            filters=filters_dict,
+            limit=pagination_params.limit,
+            cursor=pagination_params.cursor,
         )
 
+        total_amount_of_records: Optional[int] = None
+        if pagination_params.include_total:
+            total_amount_of_records = (
+                await self._appointment_repository.get_total_number_of_appointments(
+                    filters=filters_dict
+                )
+            )
+
+        return (
+            page._replace(items=await self._attach_related_entities(page.items)),
+            total_amount_of_records,
+        )
+
+    async def _attach_related_entities(
+        self, appointments: List[AppointmentDomain]
+    ) -> List[
+        Tuple[AppointmentDomain, Optional[PatientDomain], UserDomain, time, date]
+    ]:
         if not appointments:
-            return [], total_amount_of_records
+            return []
 
         patient_ids = {
             appointment.patient_id
@@ -334,38 +284,37 @@ class AppointmentService:
         }
         schedule_day_ids = {appointment.schedule_day_id for appointment in appointments}
 
-        patients_map = await self._load_entities_by_ids(
-            patient_ids, self._patients_service.get_by_id
-        )
-        schedule_days_map = await self._load_entities_by_ids(
-            schedule_day_ids, self._schedule_day_repository.get_by_id
-        )
+        # Every related entity type is resolved with a single IN (...) query
+        patients_map = await BatchLoader(
+            self._patients_service.get_many_by_ids
+        ).load_many(patient_ids)
+        schedule_days_map = await BatchLoader(
+            self._schedule_day_repository.get_many_by_ids
+        ).load_many(schedule_day_ids)
 
         schedule_ids = {
             schedule_day.schedule_id for schedule_day in schedule_days_map.values()
         }
-        schedules_map = await self._load_entities_by_ids(
-            schedule_ids, self._schedule_repository.get_by_id
-        )
+        schedules_map = await BatchLoader(
+            self._schedule_repository.get_many_by_ids
+        ).load_many(schedule_ids)
 
         doctor_ids = {
             schedule.doctor_id
             for schedule in schedules_map.values()
             if schedule.doctor_id
         }
-        doctors_map = await self._load_entities_by_ids(
-            doctor_ids, self._user_repository.get_by_id
-        )
+        doctors_map = await BatchLoader(
+            self._user_repository.get_many_by_ids
+        ).load_many(doctor_ids)
 
-        filtered_results = []
+        results = []
         for appointment in appointments:
             patient = patients_map.get(appointment.patient_id)
             schedule_day = schedule_days_map.get(appointment.schedule_day_id)
             schedule = schedule_day and schedules_map.get(schedule_day.schedule_id)
 
-            if not self._appointment_passes_filters(
-                patient, schedule_day, schedule, doctors_map, filter_params
-            ):
+            if schedule_day is None or schedule is None:
                 continue
 
             end_datetime = self.__add_interval(
@@ -375,11 +324,11 @@ class AppointmentService:
 
             doctor = schedule and doctors_map.get(schedule.doctor_id)
 
-            filtered_results.append(
+            results.append(
                 (appointment, patient, doctor, end_time, schedule_day.date)
             )
 
-        return filtered_results, total_amount_of_records
+        return results
 
     async def update_appointment(
         self, appointment_id: int, schema: UpdateAppointmentSchema
@@ -485,22 +434,11 @@ class AppointmentService:
                         detail=_("The appointment cannot overlap with the break time."),
                     )
 
-            existing_appointments = (
-                await self._appointment_repository.get_appointments_by_day_id(
-                    schedule_day_id
-                )
-            )
-            self._check_appointment_overlapping(
-                appointment_start_datetime,
-                appointment_end_datetime,
-                existing_appointments,
-                schedule_day.date,
-                appointment_interval_minutes,
-                current_appointment_id=appointment.id,
-            )
-
+            # Overlapping with the other appointments of the day is rejected
+            # by the database when the appointment is saved
             appointment.schedule_day_id = schedule_day_id
             appointment.time = new_appointment_time
+            appointment.end_time = appointment_end_datetime.time()
 
         update_data = schema.model_dump(exclude_unset=True)
         old_status = appointment.status
@@ -538,10 +476,16 @@ class AppointmentService:
                         detail=_("Associated schedule day is inactive or not found."),
                     ) from err
 
-        async with self._uow:
-            updated_appointment = await self._uow.appointment_repository.update(
-                appointment
-            )
+        try:
+            async with self._uow:
+                updated_appointment = await self._uow.appointment_repository.update(
+                    appointment
+                )
+        except AppointmentSlotIsTakenError as err:
+            raise AppointmentOverlappingError(
+                status_code=409,
+                detail=_("The selected appointment slot is already booked."),
+            ) from err
 
         patient = (
             await self._patients_service.get_by_id(updated_appointment.patient_id)
@@ -648,32 +592,28 @@ class AppointmentService:
                     detail=_("The appointment cannot overlap with the break time."),
                 )
 
-        existing_appointments = (
-            await self._appointment_repository.get_appointments_by_day_id(
-                schedule_day_id
-            )
-        )
-        self._check_appointment_overlapping(
-            appointment_start_datetime,
-            appointment_end_datetime,
-            existing_appointments,
-            schedule_day.date,
-            schedule.appointment_interval,
-        )
-
+        # Overlapping with the other appointments of the day is rejected
+        # by the database, so concurrent bookings of a slot can't both succeed
         appointment = AppointmentDomain(
             schedule_day_id=schedule_day_id,
             time=schema.time,
+            end_time=appointment_end_datetime.time(),
             patient_id=schema.patient_id,
             type=schema.type,
             insurance_type=schema.insurance_type,
             reason=schema.reason,
             additional_services=schema.additional_services or {},
         )
-        async with self._uow:
-            created_appointment = await self._uow.appointment_repository.add(
-                appointment
-            )
+        try:
+            async with self._uow:
+                created_appointment = await self._uow.appointment_repository.add(
+                    appointment
+                )
+        except AppointmentSlotIsTakenError as err:
+            raise AppointmentOverlappingError(
+                status_code=409,
+                detail=_("The selected appointment slot is already booked."),
+            ) from err
 
         patient = (
             await self._patients_service.get_by_id(schema.patient_id)
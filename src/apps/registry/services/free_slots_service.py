@@ -0,0 +1,131 @@
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from src.apps.registry.domain.free_slots import (
+    find_earliest_free_slots,
+    get_free_slots,
+)
+from src.apps.registry.exceptions import InvalidFreeSlotsPeriodError
+from src.apps.registry.infrastructure.api.schemas.requests.filters.free_slots_filter_params import (
+    EarliestFreeSlotsFilterParams,
+)
+from src.apps.registry.infrastructure.api.schemas.responses.free_slots_schemas import (
+    EarliestFreeSlotSchema,
+    FreeSlotSchema,
+    ScheduleDayFreeSlotsSchema,
+)
+from src.apps.registry.interfaces.repository_interfaces import (
+    ScheduleDayRepositoryInterface,
+)
+from src.core.i18n import _
+from src.core.logger import LoggerService
+
+
+class FreeSlotsService:
+    """
+    Computes free appointment slots of schedules for a period.
+
+    The days of the period are fetched with a single range query (with the start
+    times of their appointments aggregated) and every day is swept once.
+    """
+
+    DEFAULT_PERIOD_DAYS = 7
+    DEFAULT_SEARCH_PERIOD_DAYS = 14
+    MAX_PERIOD_DAYS = 31
+
+    def __init__(
+        self,
+        logger: LoggerService,
+        schedule_day_repository: ScheduleDayRepositoryInterface,
+    ):
+        self._logger = logger
+        self._schedule_day_repository = schedule_day_repository
+
+    def _get_period(
+        self,
+        date_from: Optional[date],
+        date_to: Optional[date],
+        default_days: int = DEFAULT_PERIOD_DAYS,
+    ) -> Tuple[date, date]:
+        date_from = date_from or date.today()
+        date_to = date_to or date_from + timedelta(days=default_days - 1)
+
+        if date_to < date_from:
+            raise InvalidFreeSlotsPeriodError(
+                status_code=400,
+                detail=_("The end of the period must not be earlier than its start."),
+            )
+
+        if (date_to - date_from).days >= self.MAX_PERIOD_DAYS:
+            raise InvalidFreeSlotsPeriodError(
+                status_code=400,
+                detail=_("The period must not be longer than %(DAYS)s days.")
+                % {"DAYS": self.MAX_PERIOD_DAYS},
+            )
+
+        return date_from, date_to
+
+    async def get_free_slots(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        schedule_id: Optional[UUID] = None,
+        doctor_id: Optional[UUID] = None,
+    ) -> List[ScheduleDayFreeSlotsSchema]:
+        date_from, date_to = self._get_period(date_from, date_to)
+        days = await self._schedule_day_repository.get_availability(
+            date_from=date_from,
+            date_to=date_to,
+            schedule_id=schedule_id,
+            doctor_id=doctor_id,
+        )
+
+        return [
+            ScheduleDayFreeSlotsSchema(
+                schedule_id=day.schedule_id,
+                schedule_day_id=day.schedule_day_id,
+                doctor_id=day.doctor_id,
+                date=day.date,
+                appointment_interval=day.appointment_interval,
+                free_slots=[
+                    FreeSlotSchema(start_time=slot.start_time, end_time=slot.end_time)
+                    for slot in get_free_slots(day)
+                ],
+            )
+            for day in days
+        ]
+
+    async def find_earliest_free_slots(
+        self,
+        filter_params: EarliestFreeSlotsFilterParams,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        limit: int = 10,
+    ) -> List[EarliestFreeSlotSchema]:
+        """
+        Finds the earliest free slots among all doctors matching the filters
+        (e.g. any cardiologist serving area 12 in the next 14 days).
+        """
+        date_from, date_to = self._get_period(
+            date_from, date_to, default_days=self.DEFAULT_SEARCH_PERIOD_DAYS
+        )
+        days = await self._schedule_day_repository.get_availability(
+            date_from=date_from,
+            date_to=date_to,
+            schedule_filters=filter_params.to_dict(exclude_none=True),
+        )
+
+        return [
+            EarliestFreeSlotSchema(
+                doctor_id=day.doctor_id,
+                schedule_id=day.schedule_id,
+                schedule_day_id=day.schedule_day_id,
+                date=day.date,
+                start_time=slot.start_time,
+                end_time=slot.end_time,
+            )
+            for day, slot in find_earliest_free_slots(
+                days, limit, not_before=datetime.now()
+            )
+        ]
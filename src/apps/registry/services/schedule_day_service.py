@@ -1,15 +1,13 @@
-from datetime import date, datetime, timedelta
 from typing import List, Tuple
 from uuid import UUID
 
-from src.apps.registry.domain.enums import AppointmentStatusEnum
-from src.apps.registry.domain.models.schedule import ScheduleDomain
 from src.apps.registry.exceptions import NoInstanceFoundError
 from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas import (
     UpdateScheduleDaySchema,
 )
 from src.apps.registry.infrastructure.api.schemas.responses.schedule_day_schemas import (
     ResponseScheduleDaySchema,
+    ResponseUpdatedScheduleDaySchema,
 )
 from src.apps.registry.interfaces.repository_interfaces import (
     AppointmentRepositoryInterface,
@@ -63,11 +61,16 @@ class ScheduleDayService:
         self,
         day_id: UUID,
         update_data: UpdateScheduleDaySchema,
-    ) -> ResponseScheduleDaySchema:
+    ) -> ResponseUpdatedScheduleDaySchema:
         """
         Updates the parameters of one day:
             - Checks for conflicts with existing tricks.
             - Calls the repository for a partial update.
+
+        Booked appointments overlapping the new break (or all of them, if the day
+        is deactivated) are moved to the waiting list with a single statement.
+
+        :return: The updated day with the IDs of the cancelled appointments.
         """
         # Check if the day exists
         day = await self._repository.get_by_id(day_id)
@@ -76,34 +79,15 @@ class ScheduleDayService:
                 status_code=404, detail=f"Day with ID: {day_id} not found."
             )
 
-        # Get a day's schedule
-        schedule: ScheduleDomain = await self._uow.schedule_repository.get_by_id(
-            day.schedule_id
-        )
-        if not schedule:
-            raise NoInstanceFoundError(
-                status_code=404,
-                detail=_("Schedule with ID: %(ID)s not found.")
-                % {"ID": day.schedule_id},
-            )
-        appointment_interval = schedule.appointment_interval
-
-        # Get day's appointments
-        appointments = await self._appointment_repository.get_appointments_by_day_id(
-            schedule_day_id=day.id
-        )
-        booked_appointments = [
-            appointment
-            for appointment in appointments
-            if appointment.status == AppointmentStatusEnum.BOOKED
-        ]
-
         new_start = update_data.work_start_time or day.work_start_time
         new_end = update_data.work_end_time or day.work_end_time
 
         break_start_provided = "break_start_time" in update_data.model_fields_set
         break_end_provided = "break_end_time" in update_data.model_fields_set
 
+        # A break explicitly set by the update: booked appointments overlapping it are cancelled
+        new_break_range = None
+
         if (break_start_provided and update_data.break_start_time is None) or (
             break_end_provided and update_data.break_end_time is None
         ):
@@ -137,27 +121,8 @@ class ScheduleDayService:
                 update_data.break_end_time if break_end_provided else day.break_end_time
             )
 
-            if booked_appointments and effective_break_start and effective_break_end:
-                for booked_appointment in booked_appointments:
-                    appointment_start_time = datetime.combine(
-                        date.min, booked_appointment.time
-                    )
-                    appointment_end_time = appointment_start_time + timedelta(
-                        minutes=appointment_interval
-                    )
-                    break_start = datetime.combine(date.min, effective_break_start)
-                    break_end = datetime.combine(date.min, effective_break_end)
-
-                    if not (
-                        appointment_end_time <= break_start
-                        or appointment_start_time >= break_end
-                    ):
-                        # Cancel the appointment (appointment -> 'Cancel list')
-                        async with self._uow:
-                            booked_appointment.cancel()
-                            await self._uow.appointment_repository.update(
-                                booked_appointment
-                            )
+            if effective_break_start and effective_break_end:
+                new_break_range = (effective_break_start, effective_break_end)
 
         # Check if the day is deactivated (is_active changes from True to False)
         is_deactivating = False
@@ -166,13 +131,6 @@ class ScheduleDayService:
             if day.is_active and (new_is_active is False):
                 is_deactivating = True
 
-        # If deactivation, we cancel all booked appointments
-        if is_deactivating and booked_appointments:
-            for booked_appointment in booked_appointments:
-                async with self._uow:
-                    booked_appointment.cancel()
-                    await self._uow.appointment_repository.update(booked_appointment)
-
         update_schema = UpdateScheduleDaySchema(
             is_active=(
                 update_data.is_active
@@ -186,16 +144,37 @@ class ScheduleDayService:
         )
 
         async with self._uow:
+            cancelled_appointment_ids: List[int] = []
+            # If deactivation, we cancel all booked appointments
+            # (appointment -> 'Cancel list')
+            if is_deactivating:
+                cancelled_appointment_ids = (
+                    await self._uow.appointment_repository.cancel_booked_by_day_ids(
+                        [day_id]
+                    )
+                )
+            elif new_break_range:
+                cancelled_appointment_ids = (
+                    await self._uow.appointment_repository.cancel_booked_by_day_ids(
+                        [day_id], time_range=new_break_range
+                    )
+                )
+
             updated_day = await self._uow.schedule_day_repository.update(
                 day_id=day_id,
                 schema=update_schema,
             )
 
-            return updated_day
+        return ResponseUpdatedScheduleDaySchema(
+            **updated_day.model_dump(),
+            cancelled_appointment_ids=cancelled_appointment_ids,
+        )
 
-    async def delete(self, day_id: UUID) -> None:
+    async def delete(self, day_id: UUID) -> List[int]:
         """
-        Deletes a schedule day.
+        Deletes a schedule day, moving its booked appointments to the waiting list.
+
+        :return: IDs of the cancelled appointments.
         """
         # Check if the day exists
         day: ResponseScheduleDaySchema | None = await self._repository.get_by_id(day_id)
@@ -205,22 +184,11 @@ class ScheduleDayService:
                 detail=_("Day with ID: %(ID)s not found.") % {"ID": day_id},
             )
 
-        # Get day's appointments
-        appointments = await self._appointment_repository.get_appointments_by_day_id(
-            schedule_day_id=day.id
-        )
-        booked_appointments = [
-            appointment
-            for appointment in appointments
-            if appointment.status == AppointmentStatusEnum.BOOKED
-        ]
-
-        if booked_appointments:
-            for booked_appointment in booked_appointments:
-                # Cancel the appointment (appointment -> 'Cancel list')
-                async with self._uow:
-                    booked_appointment.cancel()
-                    await self._uow.appointment_repository.update(booked_appointment)
-
         async with self._uow:
+            # Cancel the appointments (appointment -> 'Cancel list')
+            cancelled_appointment_ids = (
+                await self._uow.appointment_repository.cancel_booked_by_day_ids([day_id])
+            )
             await self._uow.schedule_day_repository.delete_by_id(day_id)
+
+        return cancelled_appointment_ids
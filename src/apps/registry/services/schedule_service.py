@@ -1,4 +1,4 @@
-from datetime import date, datetime, time, timedelta
+from datetime import date, time, timedelta
 from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
@@ -8,10 +8,15 @@ from src.apps.platform_rules.infrastructure.api.schemas.responses.platform_rules
 from src.apps.platform_rules.interfaces.platform_rules_repository_interface import (
     PlatformRulesRepositoryInterface,
 )
-from src.apps.registry.domain.enums import AppointmentStatusEnum
-from src.apps.registry.domain.models.appointment import AppointmentDomain
+from src.apps.registry.domain.exceptions import (
+    AppointmentIsOutOfWorkTimeError,
+    AppointmentSlotIsTakenError,
+)
 from src.apps.registry.domain.models.schedule import ScheduleDomain
+from src.apps.registry.domain.schedule_days import ScheduleDayRow
 from src.apps.registry.exceptions import (
+    AppointmentOverlappingError,
+    InvalidAppointmentTimeError,
     NoInstanceFoundError,
     ScheduleExceedsMaxAllowedPeriod,
     ScheduleInvalidUpdateDatesError,
@@ -21,10 +26,13 @@ from src.apps.registry.infrastructure.api.schemas.requests.filters.schedule_filt
     ScheduleFilterParams,
 )
 from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas import (
-    CreateScheduleDaySchema,
     ScheduleDayTemplateSchema,
 )
+from src.apps.registry.infrastructure.api.schemas.responses.schedule_day_schemas import (
+    ResponseScheduleDaySchema,
+)
 from src.apps.registry.infrastructure.api.schemas.requests.schedule_schemas import (
+    BulkCreateSchedulesSchema,
     CreateScheduleSchema,
     UpdateScheduleSchema,
 )
@@ -40,6 +48,7 @@ from src.apps.users.services.user_service import UserService
 from src.core.i18n import _
 from src.core.logger import LoggerService
 from src.shared.exceptions import ApplicationError
+from src.shared.helpers.batch_loader import BatchLoader
 from src.shared.schemas.pagination_schemas import PaginationParams
 
 
@@ -75,24 +84,26 @@ class ScheduleService:
 
     @staticmethod
     def _generate_days_for_schedule(
-        schedule_id: UUID,
+        schedule_id: Optional[UUID],
         period_start: date,
         period_end: date,
         week_days_template: List[ScheduleDayTemplateSchema],
-        reduced_days: Optional[List[dict]] = None,
-    ) -> List[CreateScheduleDaySchema]:
+        reduced_days: Optional[Dict[date, dict]] = None,
+    ) -> List[ScheduleDayRow]:
         """
         Generates a list of days for the schedule, applying week template and platform rules.
 
         Args:
-            schedule_id (UUID): Schedule UUID (same for all days)
+            schedule_id (Optional[UUID]): Schedule UUID (same for all days). The days generated
+                without it can be reused for many schedules with `row._replace(schedule_id=...)`
             period_start (date): Period start date
             period_end (date): Period end date
             week_days_template (List[ScheduleDayTemplateSchema]): List of patterns for each day of the week
-            reduced_days (Optional[List[dict]]): Rules for 'reduced' days (from platform rules)
+            reduced_days (Optional[Dict[date, dict]]): Rules for 'reduced' days by date
+                (parsed calendar of the platform rule)
 
         Returns:
-            List[CreateScheduleDaySchema]: List of days
+            List[ScheduleDayRow]: List of days, ready to be inserted in bulk
         """
         default_template = {
             "is_active": True,
@@ -106,16 +117,9 @@ class ScheduleService:
             tpl.day_of_week: tpl.model_dump() for tpl in week_days_template
         }
 
-        # Convert the reduced_days list to a dictionary by date
-        reduced_by_date: Dict[date, dict] = {}
-        if reduced_days:
-            for entry in reduced_days:
-                dt = entry["date"]
-                if isinstance(dt, str):
-                    dt = datetime.fromisoformat(dt).date()
-                reduced_by_date[dt] = entry
+        reduced_by_date: Dict[date, dict] = reduced_days or {}
 
-        result: List[CreateScheduleDaySchema] = []
+        result: List[ScheduleDayRow] = []
         current_date = period_start
 
         while current_date <= period_end:
@@ -163,28 +167,65 @@ class ScheduleService:
             template_data["break_start_time"] = br_start
             template_data["break_end_time"] = br_end
 
-            # Assembling the schema
-            day_schema = CreateScheduleDaySchema(
-                schedule_id=schedule_id,
-                date=current_date,
-                day_of_week=dow,
-                is_active=template_data["is_active"],
-                work_start_time=template_data["work_start_time"],
-                work_end_time=template_data["work_end_time"],
-                break_start_time=template_data["break_start_time"],
-                break_end_time=template_data["break_end_time"],
+            result.append(
+                ScheduleDayRow(
+                    schedule_id=schedule_id,
+                    date=current_date,
+                    day_of_week=dow,
+                    is_active=template_data["is_active"],
+                    work_start_time=template_data["work_start_time"],
+                    work_end_time=template_data["work_end_time"],
+                    break_start_time=template_data["break_start_time"],
+                    break_end_time=template_data["break_end_time"],
+                )
             )
-            result.append(day_schema)
             current_date += timedelta(days=1)
 
         return result
 
-    async def _move_appointments_to_waiting_list(
-        self, appointments: List[AppointmentDomain]
-    ):
-        for appointment in appointments:
-            appointment.status = AppointmentStatusEnum.CANCELLED
-            await self._appointment_repository.update(appointment)
+    async def _get_max_schedule_period_days(self) -> int:
+        """
+        Max period for schedule. Being installed from the Admin Panel.
+        """
+        raw_max_schedule_period_days: Optional[ResponsePlatformRuleSchema] = (
+            await self._platform_rules_repository.get_by_key("MAX_SCHEDULE_PERIOD")
+        )
+
+        max_schedule_period_days = 30  # Default value
+        if raw_max_schedule_period_days:
+            try:
+                potential_days: int = raw_max_schedule_period_days.rule_data["value"]
+                if potential_days > 0:
+                    max_schedule_period_days = potential_days
+                else:
+                    self._logger.warning(
+                        f"Platform rule 'MAX_SCHEDULE_PERIOD' has non-positive value "
+                        f"'{raw_max_schedule_period_days}'. Using default {max_schedule_period_days}."
+                    )
+            except (ValueError, TypeError):
+                self._logger.warning(
+                    f"Platform rule 'MAX_SCHEDULE_PERIOD' is invalid type or format:"
+                    f" '{raw_max_schedule_period_days}'. Using default: {max_schedule_period_days}."
+                )
+
+        return max_schedule_period_days
+
+    @staticmethod
+    def _check_schedule_period(
+        period_start: date, period_end: date, max_schedule_period_days: int
+    ) -> None:
+        period_duration = period_end - period_start
+        if period_duration.days > max_schedule_period_days:
+            raise ScheduleExceedsMaxAllowedPeriod(
+                status_code=409,
+                detail=_(
+                    "Schedule period exceeds the maximum allowed period of: %(MAX_VALUE)s days."
+                )
+                % {"MAX_VALUE": max_schedule_period_days},
+            )
+
+    async def _get_reduced_days(self) -> Dict[date, dict]:
+        return await self._platform_rules_repository.get_reduced_days_calendar()
 
     async def get_by_id(self, schedule_id: UUID) -> List[ScheduleDomain | UserDomain]:
         """
@@ -230,10 +271,12 @@ class ScheduleService:
             await self._schedule_repository.get_total_number_of_schedules()
         )
 
-        result = []
-        for schedule in schedules:
-            doctor = await self._user_service.get_by_id(schedule.doctor_id)
-            result.append((schedule, doctor))
+        doctors_map = await BatchLoader(self._user_service.get_many_by_ids).load_many(
+            schedule.doctor_id for schedule in schedules
+        )
+        result = [
+            (schedule, doctors_map.get(schedule.doctor_id)) for schedule in schedules
+        ]
 
         return result, total_amount_of_records
 
@@ -284,72 +327,120 @@ class ScheduleService:
 
         user_domain = await self._user_service.get_by_id(doctor_id)
 
-        # Max period for schedule. Being installed from the Admin Panel.
-        raw_max_schedule_period_days: Optional[ResponsePlatformRuleSchema] = (
-            await self._platform_rules_repository.get_by_key("MAX_SCHEDULE_PERIOD")
-        )
+        max_schedule_period_days = await self._get_max_schedule_period_days()
 
         async with self._uow:
             # Check if the schedule doesn't exceed a max period
-            max_schedule_period_days = 30  # Default value
-            if raw_max_schedule_period_days:
-                try:
-                    potential_days: int = raw_max_schedule_period_days.rule_data[
-                        "value"
-                    ]
-                    if potential_days > 0:
-                        max_schedule_period_days = potential_days
-                    else:
-                        self._logger.warning(
-                            f"Platform rule 'MAX_SCHEDULE_PERIOD' has non-positive value "
-                            f"'{raw_max_schedule_period_days}'. Using default {max_schedule_period_days}."
-                        )
-                except (ValueError, TypeError):
-                    self._logger.warning(
-                        f"Platform rule 'MAX_SCHEDULE_PERIOD' is invalid type or format:"
-                        f" '{raw_max_schedule_period_days}'. Using default: {max_schedule_period_days}."
-                    )
-
-            period_duration = schedule_domain.period_end - schedule_domain.period_start
-            if period_duration.days > max_schedule_period_days:
-                raise ScheduleExceedsMaxAllowedPeriod(
-                    status_code=409,
-                    detail=_(
-                        "Schedule period exceeds the maximum allowed period of: %(MAX_VALUE)s days."
-                    )
-                    % {"MAX_VALUE": max_schedule_period_days},
-                )
+            self._check_schedule_period(
+                schedule_domain.period_start,
+                schedule_domain.period_end,
+                max_schedule_period_days,
+            )
 
             just_created_schedule = await self._uow.schedule_repository.add(
                 schedule_domain
             )
 
             # Generate schedule days using the provided week-days template
-            reduced_days_rule = await self._platform_rules_repository.get_by_key(
-                "REDUCED_DAYS"
-            )
-            reduced_days = (
-                reduced_days_rule.rule_data.get("days", [])
-                if reduced_days_rule
-                else None
-            )
+            reduced_days = await self._get_reduced_days()
 
-            days: List[CreateScheduleDaySchema] = self._generate_days_for_schedule(
+            days: List[ScheduleDayRow] = self._generate_days_for_schedule(
                 just_created_schedule.id,
                 just_created_schedule.period_start,
                 just_created_schedule.period_end,
                 create_schema.week_days_template,
                 reduced_days=reduced_days,
             )
-
-            for day_schema in days:
-                await self._uow.schedule_day_repository.add(day_schema)
+            await self._uow.schedule_day_repository.add_many(days)
 
         return [just_created_schedule, user_domain]
 
+    async def create_schedules_for_doctors(
+        self, create_schema: BulkCreateSchedulesSchema
+    ) -> List[Tuple[ScheduleDomain, UserDomain]]:
+        """
+        Creates the same schedule for many doctors in one transaction.
+        The days are generated once from the template and inserted for all
+        the schedules together, so the number of queries doesn't depend on
+        the number of doctors or on the length of the period.
+
+        :return: List of the created schedules with their doctors.
+        """
+        template = create_schema.schedule
+        doctors = await self._user_service.get_many_by_ids(create_schema.doctor_ids)
+        doctors_map = {doctor.id: doctor for doctor in doctors}
+
+        missing_doctor_ids = [
+            doctor_id
+            for doctor_id in create_schema.doctor_ids
+            if doctor_id not in doctors_map
+        ]
+        if missing_doctor_ids:
+            raise NoInstanceFoundError(
+                status_code=404,
+                detail=_("Users with IDs: %(IDS)s not found or not doctors.")
+                % {"IDS": ", ".join(map(str, missing_doctor_ids))},
+            )
+
+        doctor_ids_with_same_name = (
+            await self._schedule_repository.get_doctor_ids_with_schedule_name(
+                create_schema.doctor_ids, template.schedule_name
+            )
+        )
+        if doctor_ids_with_same_name:
+            raise ScheduleNameIsAlreadyTakenError(
+                status_code=409,
+                detail=_(
+                    "Schedule with name: '%(NAME)s' is already taken for the specialists: %(IDS)s."
+                )
+                % {
+                    "NAME": template.schedule_name,
+                    "IDS": ", ".join(map(str, sorted(doctor_ids_with_same_name))),
+                },
+            )
+
+        self._check_schedule_period(
+            template.period_start,
+            template.period_end,
+            await self._get_max_schedule_period_days(),
+        )
+
+        days_template = self._generate_days_for_schedule(
+            None,
+            template.period_start,
+            template.period_end,
+            template.week_days_template,
+            reduced_days=await self._get_reduced_days(),
+        )
+
+        async with self._uow:
+            schedules = await self._uow.schedule_repository.add_many(
+                [
+                    ScheduleDomain(
+                        doctor_id=doctor_id,
+                        schedule_name=template.schedule_name,
+                        period_start=template.period_start,
+                        period_end=template.period_end,
+                        is_active=template.is_active,
+                        appointment_interval=template.appointment_interval,
+                        description=template.description,
+                    )
+                    for doctor_id in create_schema.doctor_ids
+                ]
+            )
+            await self._uow.schedule_day_repository.add_many(
+                [
+                    day._replace(schedule_id=schedule.id)
+                    for schedule in schedules
+                    for day in days_template
+                ]
+            )
+
+        return [(schedule, doctors_map[schedule.doctor_id]) for schedule in schedules]
+
     async def update_schedule(
         self, schedule_id: UUID, update_schema: UpdateScheduleSchema
-    ) -> List[ScheduleDomain | UserDomain]:
+    ) -> Tuple[ScheduleDomain, UserDomain, List[int]]:
         """
         Updates an existing schedule, including:
           - changing basic info (only provided fields),
@@ -357,10 +448,12 @@ class ScheduleService:
           - updating associated JSONB fields if provided,
           - updating schedule days for the specified days if provided.
 
-        If any day within the new period has active appointments, updating it is forbidden.
+        Booked appointments of the removed days (or of all the days, if the schedule
+        is deactivated) are moved to the waiting list with a single statement.
         All GET queries are executed outside UOW.
 
-        :return: List of ScheduleDomain and UserDomain (doctor) objects.
+        :return: ScheduleDomain and UserDomain (doctor) objects
+        and the IDs of the cancelled appointments.
         """
         # Check if the schedule exists
         schedule = await self._schedule_repository.get_by_id(schedule_id)
@@ -409,28 +502,7 @@ class ScheduleService:
 
         # Check if the schedule doesn't exceed a max period
         if update_schema.period_start or update_schema.period_end:
-            raw_max_schedule_period_days: Optional[ResponsePlatformRuleSchema] = (
-                await self._platform_rules_repository.get_by_key("MAX_SCHEDULE_PERIOD")
-            )
-
-            max_schedule_period_days = 30  # Default value
-            if raw_max_schedule_period_days:
-                try:
-                    potential_days: int = raw_max_schedule_period_days.rule_data[
-                        "value"
-                    ]
-                    if potential_days > 0:
-                        max_schedule_period_days = potential_days
-                    else:
-                        self._logger.warning(
-                            f"Platform rule 'MAX_SCHEDULE_PERIOD' has non-positive value "
-                            f"'{raw_max_schedule_period_days.value}'. Using default {max_schedule_period_days}."
-                        )
-                except (ValueError, TypeError):
-                    self._logger.warning(
-                        f"Platform rule 'MAX_SCHEDULE_PERIOD' is invalid type or format:"
-                        f" '{raw_max_schedule_period_days.value}'. Using default: {max_schedule_period_days}."
-                    )
+            max_schedule_period_days = await self._get_max_schedule_period_days()
 
             period_duration = new_end - new_start
             if period_duration.days > max_schedule_period_days:
@@ -449,6 +521,12 @@ class ScheduleService:
             and update_schema.is_active is False
         )
 
+        # The stored end times of the appointments depend on the interval
+        is_interval_changing = (
+            update_schema.appointment_interval is not None
+            and update_schema.appointment_interval != schedule.appointment_interval
+        )
+
         # Updating fields...
         for field, value in update_schema.model_dump(exclude_unset=True).items():
             setattr(schedule, field, value)
@@ -458,24 +536,20 @@ class ScheduleService:
             schedule.id, limit=1000, page=1
         )
         existing_dates = {day.date for day in existing_days}
+        # The first existing day of each day of the week is the template for the new ones
+        templates_by_day_of_week: Dict[int, ResponseScheduleDaySchema] = {}
+        for day in existing_days:
+            templates_by_day_of_week.setdefault(day.day_of_week, day)
 
         # Generate the required days for the entire new range (if the schedule was extended)
-        reduced_days_rule = await self._platform_rules_repository.get_by_key(
-            "REDUCED_DAYS"
-        )
-        reduced_days = (
-            reduced_days_rule.rule_data.get("days", []) if reduced_days_rule else None
-        )
+        reduced_days = await self._get_reduced_days()
 
         days_to_add = []
         current_date = new_start
         while current_date <= new_end:
             if current_date not in existing_dates:
-                day_of_week = current_date.isoweekday()
-                # Looking for a template among the existing days of the schedule
-                existing_template = next(
-                    (day for day in existing_days if day.day_of_week == day_of_week),
-                    None,
+                existing_template = templates_by_day_of_week.get(
+                    current_date.isoweekday()
                 )
                 if existing_template:
                     week_days_template = [existing_template]
@@ -489,63 +563,66 @@ class ScheduleService:
                     week_days_template,
                     reduced_days=reduced_days,
                 )
-                day_schema = generated_days[0]  # type: ignore[index]
-
-                days_to_add.append(day_schema)
+                days_to_add.append(generated_days[0])
             current_date += timedelta(days=1)
 
         # Delete the existing schedule's days (if the schedule was shortened)
-        days_to_delete: List[UUID] = []
-        for day in existing_days:
-            if day.date < new_start or day.date > new_end:
-                days_to_delete.append(day.id)
-
-        async with self._uow:
-            if is_deactivating:
-                for day in existing_days:
-                    appointments = (
-                        await self._appointment_repository.get_appointments_by_day_id(
-                            day.id
+        days_to_delete: List[UUID] = [
+            day.id for day in existing_days if day.date < new_start or day.date > new_end
+        ]
+
+        try:
+            async with self._uow:
+                # Move the booked appointments to the waiting list: of all the days
+                # if the schedule is deactivated, otherwise of the deleted ones
+                if is_deactivating:
+                    cancelled_appointment_ids = (
+                        await self._uow.appointment_repository.cancel_booked_by_schedule_id(
+                            schedule.id
                         )
                     )
-                    booked_appointments = [
-                        appointment
-                        for appointment in appointments
-                        if appointment.status == AppointmentStatusEnum.BOOKED
-                    ]
-
-                    if booked_appointments:
-                        await self._move_appointments_to_waiting_list(
-                            booked_appointments
+                else:
+                    cancelled_appointment_ids = (
+                        await self._uow.appointment_repository.cancel_booked_by_day_ids(
+                            days_to_delete
                         )
+                    )
 
-            updated_schedule = await self._uow.schedule_repository.update(schedule)
-
-            for day_schema in days_to_add:
-                await self._uow.schedule_day_repository.add(day_schema)
+                updated_schedule = await self._uow.schedule_repository.update(schedule)
 
-            for day_id in days_to_delete:
-                appointments = (
-                    await self._appointment_repository.get_appointments_by_day_id(
-                        day_id
-                    )
+                await self._uow.schedule_day_repository.add_many(days_to_add)
+                await self._uow.schedule_day_repository.delete_many_by_ids(
+                    days_to_delete
                 )
-                booked_appointments = [
-                    appointment
-                    for appointment in appointments
-                    if appointment.status == AppointmentStatusEnum.BOOKED
-                ]
-
-                if booked_appointments:
-                    await self._move_appointments_to_waiting_list(booked_appointments)
 
-                await self._uow.schedule_day_repository.delete_by_id(day_id)
+                if is_interval_changing:
+                    await self._uow.appointment_repository.update_end_times_by_schedule_id(
+                        schedule.id, schedule.appointment_interval
+                    )
+        except AppointmentSlotIsTakenError as err:
+            raise AppointmentOverlappingError(
+                status_code=409,
+                detail=_(
+                    "Existing appointments would overlap with the new appointment interval."
+                ),
+            ) from err
+        except AppointmentIsOutOfWorkTimeError as err:
+            raise InvalidAppointmentTimeError(
+                status_code=409,
+                detail=_(
+                    "Existing appointments would end after working hours "
+                    "with the new appointment interval."
+                ),
+            ) from err
 
-        return [updated_schedule, doctor_domain]
+        return updated_schedule, doctor_domain, cancelled_appointment_ids
 
-    async def delete(self, schedule_id: UUID) -> None:
+    async def delete(self, schedule_id: UUID) -> List[int]:
         """
-        Deletes a schedule and all associated days.
+        Deletes a schedule and all associated days,
+        moving their booked appointments to the waiting list.
+
+        :return: IDs of the cancelled appointments.
         """
         schedule = await self._uow.schedule_repository.get_by_id(schedule_id)
         if not schedule:
@@ -554,24 +631,18 @@ class ScheduleService:
                 detail=_("Schedule with ID: %(ID)s not found.") % {"ID": schedule_id},
             )
 
-        days = await self._schedule_day_repository.get_all_by_schedule_id(
-            schedule_id, limit=1000, page=1
-        )
-        for day in days:
-            appointments = (
-                await self._appointment_repository.get_appointments_by_day_id(day.id)
+        async with self._uow:
+            cancelled_appointment_ids = (
+                await self._uow.appointment_repository.cancel_booked_by_schedule_id(
+                    schedule_id
+                )
             )
-            booked_appointments = [
-                appointment
-                for appointment in appointments
-                if appointment.status == AppointmentStatusEnum.BOOKED
-            ]
-            if booked_appointments:
-                await self._move_appointments_to_waiting_list(booked_appointments)
+            # Delete the schedule itself (its days are deleted in cascade)
+            await self._uow.schedule_repository.delete(schedule_id)
 
-        async with self._uow:
-            await self._schedule_repository.delete(schedule_id)
+        self._logger.info(
+            f"Schedule {schedule_id} deleted, "
+            f"{len(cancelled_appointment_ids)} appointments moved to the waiting list."
+        )
 
-        async with self._uow:
-            # Delete the schedule itself
-            await self._schedule_repository.delete(schedule_id)
+        return cancelled_appointment_ids
@@ -1,14 +1,17 @@
 from dependency_injector import containers, providers
-from sqlalchemy.ext.asyncio.engine import AsyncEngine
-from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.orm.session import sessionmaker
 
+from src.apps.users.infrastructure.kafka.consumer_metrics import ConsumerMetrics
 from src.apps.users.infrastructure.kafka.kafka_consumer import UsersKafkaConsumerImpl
 from src.apps.users.infrastructure.repositories.user_repository import (
     SQLAlchemyUserRepository,
 )
 from src.apps.users.services.user_service import UserService
+from src.apps.users.uow import UsersUnitOfWorkImpl
+from src.core.database.session import ScopedAsyncSession
 from src.core.logger import LoggerService
+from src.shared.infrastructure.auth_service_adapter.permissions_cache import (
+    PermissionsCache,
+)
 
 
 class UsersContainer(containers.DeclarativeContainer):
@@ -27,17 +30,10 @@ class UsersContainer(containers.DeclarativeContainer):
     kafka_group_id = providers.Dependency(
         instance_of=str, default="registry-service-users-group"
     )
-    engine = providers.Dependency(instance_of=AsyncEngine)
-
-    # Session factory
-    session_factory = providers.Singleton(
-        sessionmaker, bind=engine, expire_on_commit=False, class_=AsyncSession
-    )
-
-    # Async session
-    async_db_session = providers.Singleton(
-        lambda session_factory: session_factory(), session_factory
-    )
+    kafka_batch_size = providers.Dependency(instance_of=int, default=500)
+    kafka_linger_ms = providers.Dependency(instance_of=int, default=200)
+    async_db_session = providers.Dependency(instance_of=ScopedAsyncSession)
+    permissions_cache = providers.Dependency(instance_of=PermissionsCache)
 
     # Repositories
     user_repository = providers.Factory(
@@ -46,18 +42,34 @@ class UsersContainer(containers.DeclarativeContainer):
         logger=logger,
     )
 
+    # UOW
+    unit_of_work = providers.Factory(
+        UsersUnitOfWorkImpl,
+        session=async_db_session,
+        logger=logger,
+    )
+
     # Services
     user_service = providers.Factory(
         UserService,
+        uow=unit_of_work,
         user_repository=user_repository,
         logger=logger,
     )
 
+    # Exposed by the monitoring routes
+    users_kafka_consumer_metrics = providers.Singleton(ConsumerMetrics)
+
     users_kafka_consumer = providers.Singleton(
         UsersKafkaConsumerImpl,
         user_service=user_service,
         bootstrap_servers=kafka_bootstrap_servers,
         topic=kafka_users_topic,
         logger=logger,
+        db_session=async_db_session,
+        permissions_cache=permissions_cache,
         group_id=kafka_group_id,
+        batch_size=kafka_batch_size,
+        linger_ms=kafka_linger_ms,
+        metrics=users_kafka_consumer_metrics,
     )
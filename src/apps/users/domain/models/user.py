@@ -3,6 +3,7 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from src.apps.users.infrastructure.validation_helpers import validate_user_client_roles
+from src.shared.helpers.change_tracking import ChangeTrackingMixin
 from src.shared.helpers.validation_helpers import (
     validate_date_of_birth,
     validate_field_not_blank,
@@ -10,7 +11,7 @@ from src.shared.helpers.validation_helpers import (
 )
 
 
-class UserDomain:
+class UserDomain(ChangeTrackingMixin):
     """
     Domain model describing a user from the
     Auth Service in the Registry Service
@@ -66,6 +67,7 @@ class UserDomain:
         self.served_referral_types = served_referral_types or []
         self.served_referral_origins = served_referral_origins or []
         self.served_payment_types = served_payment_types or []
+        self.mark_clean()
 
     @property
     def is_enabled(self) -> bool | None:
@@ -0,0 +1,20 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+
+from src.apps.users.container import UsersContainer
+from src.apps.users.infrastructure.api.schemas import KafkaConsumerStatsSchema
+from src.apps.users.infrastructure.kafka.consumer_metrics import ConsumerMetrics
+
+users_kafka_consumer_router = APIRouter(prefix="/monitoring")
+
+
+@users_kafka_consumer_router.get(
+    "/users-kafka-consumer", response_model=KafkaConsumerStatsSchema
+)
+@inject
+async def get_users_kafka_consumer_stats(
+    metrics: ConsumerMetrics = Depends(
+        Provide[UsersContainer.users_kafka_consumer_metrics]
+    ),
+) -> KafkaConsumerStatsSchema:
+    return KafkaConsumerStatsSchema(**metrics.stats())
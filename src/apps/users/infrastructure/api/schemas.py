@@ -0,0 +1,24 @@
+from typing import Dict
+
+from pydantic import BaseModel
+
+
+class HistogramStatsSchema(BaseModel):
+    count: int
+    sum: float
+    max: float
+    avg: float
+    # Cumulative counts by upper bound
+    buckets: Dict[str, int]
+
+
+class KafkaConsumerStatsSchema(BaseModel):
+    messages: int
+    batches: int
+    messages_per_second: float
+    batch_size: HistogramStatsSchema
+    handler_latency_ms: HistogramStatsSchema
+    errors: Dict[str, int]
+    # Messages behind by "<topic>-<partition>"
+    lag: Dict[str, int]
+    total_lag: int
@@ -1,7 +1,9 @@
+import uuid
 from datetime import date
 from typing import Dict, List, Optional, Union
 
-from sqlalchemy import Boolean, Date, String
+from sqlalchemy import UUID as sqlalchemy_UUID
+from sqlalchemy import Boolean, Date, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql.expression import text
@@ -73,3 +75,64 @@ class User(Base, PrimaryKey, CreatedAtMixin, ChangedAtMixin):
         cascade="all, delete-orphan",
         foreign_keys="Schedule.doctor_id",
     )
+
+
+# Doctor directory: the lookup tables derived from the JSONB columns of the users
+# (see `SQLAlchemyDoctorDirectoryRepository`), so the schedules and appointments
+# are filtered by doctors with indexed joins instead of unnesting every user row.
+# The rows of a user are removed together with them (ON DELETE CASCADE).
+
+
+class DoctorSpecialization(Base):
+    __tablename__ = "doctor_specializations"
+
+    doctor_id: Mapped[uuid.UUID] = mapped_column(
+        sqlalchemy_UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # lower(trim(name)) - the lookup key
+    name_key: Mapped[str] = mapped_column(Text, primary_key=True)
+    name: Mapped[str] = mapped_column(Text, nullable=False)
+    specialization_id: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (
+        # Exact match of a specialization
+        Index("ix_doctor_specializations_name_key", "name_key", "doctor_id"),
+        # Search by a part of a specialization name (LIKE '%...%')
+        Index(
+            "ix_doctor_specializations_name_key_trgm",
+            "name_key",
+            postgresql_using="gin",
+            postgresql_ops={"name_key": "gin_trgm_ops"},
+        ),
+    )
+
+
+class DoctorArea(Base):
+    __tablename__ = "doctor_areas"
+
+    doctor_id: Mapped[uuid.UUID] = mapped_column(
+        sqlalchemy_UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # Serviced area number (attachment_data['area_number'])
+    area_number: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
+
+
+class DoctorServedType(Base):
+    __tablename__ = "doctor_served_types"
+
+    doctor_id: Mapped[uuid.UUID] = mapped_column(
+        sqlalchemy_UUID(as_uuid=True),
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # Name of the source column of the user, e.g. "served_payment_types"
+    kind: Mapped[str] = mapped_column(String(32), primary_key=True)
+    value: Mapped[str] = mapped_column(Text, primary_key=True)
+
+    __table_args__ = (
+        Index("ix_doctor_served_types_kind_value", "kind", "value", "doctor_id"),
+    )
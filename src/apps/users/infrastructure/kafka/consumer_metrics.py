@@ -0,0 +1,109 @@
+import time
+from bisect import bisect_left
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, Sequence, Tuple
+
+BATCH_SIZE_BUCKETS = (1, 10, 50, 100, 250, 500, 1000)
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    """
+    Cumulative histogram with fixed upper bounds, as in Prometheus.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self._buckets = tuple(buckets)
+        # The last counter is for values above the last bound
+        self._counts = [0] * (len(self._buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self._buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def stats(self) -> Dict[str, Any]:
+        buckets = {}
+        cumulative = 0
+        for bound, count in zip(self._buckets, self._counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        buckets["+Inf"] = self.count
+
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 3),
+            "max": round(self.max, 3),
+            "avg": round(self.sum / self.count, 3) if self.count else 0.0,
+            "buckets": buckets,
+        }
+
+
+class ConsumerMetrics:
+    """
+    In-process metrics of a Kafka consumer: throughput, batch sizes,
+    handler latency, errors by kind and lag of every assigned partition.
+
+    The lag of a partition is its high watermark (as of the last fetch) minus
+    the next offset to be consumed, i.e. the number of messages still behind.
+    """
+
+    def __init__(self, throughput_window_seconds: float = 60):
+        self._throughput_window_seconds = throughput_window_seconds
+        self._started_at = time.monotonic()
+        # (monotonic time, number of messages) of the batches within the window
+        self._recent_batches: Deque[Tuple[float, int]] = deque()
+        self.messages = 0
+        self.batches = 0
+        self.batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self.handler_latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.lag: Dict[str, int] = {}
+
+    def record_batch(self, size: int, duration_seconds: float) -> None:
+        now = time.monotonic()
+        self.messages += size
+        self.batches += 1
+        self.batch_sizes.observe(size)
+        self.handler_latency_ms.observe(duration_seconds * 1000)
+        self._recent_batches.append((now, size))
+        self._drop_outdated_batches(now)
+
+    def record_error(self, kind: str) -> None:
+        self.errors[kind] += 1
+
+    def record_lag(self, partition: str, lag: int) -> None:
+        self.lag[partition] = max(lag, 0)
+
+    def messages_per_second(self) -> float:
+        """
+        Returns the throughput over the window (or since the start, if shorter).
+        """
+        now = time.monotonic()
+        self._drop_outdated_batches(now)
+        elapsed = min(now - self._started_at, self._throughput_window_seconds)
+        if elapsed <= 0:
+            return 0.0
+
+        return sum(size for _, size in self._recent_batches) / elapsed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "messages": self.messages,
+            "batches": self.batches,
+            "messages_per_second": round(self.messages_per_second(), 2),
+            "batch_size": self.batch_sizes.stats(),
+            "handler_latency_ms": self.handler_latency_ms.stats(),
+            "errors": dict(self.errors),
+            "lag": dict(self.lag),
+            "total_lag": sum(self.lag.values()),
+        }
+
+    def _drop_outdated_batches(self, now: float) -> None:
+        window_start = now - self._throughput_window_seconds
+        while self._recent_batches and self._recent_batches[0][0] < window_start:
+            self._recent_batches.popleft()
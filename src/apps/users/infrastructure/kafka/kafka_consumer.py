@@ -1,29 +1,54 @@
+import asyncio
 import json
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
-from aiokafka import AIOKafkaConsumer
+from aiokafka import AIOKafkaConsumer, ConsumerRecord, TopicPartition
 
 from src.apps.users.domain.enums import ActionsOnUserEnum
+from src.apps.users.infrastructure.kafka.consumer_metrics import ConsumerMetrics
 from src.apps.users.infrastructure.schemas.user_schemas import UserSchema
 from src.apps.users.interfaces.kafka_consumer_interface import KafkaConsumerInterface
 from src.apps.users.services.user_service import UserService
+from src.core.database.session import ScopedAsyncSession
 from src.core.logger import LoggerService
+from src.shared.infrastructure.auth_service_adapter.permissions_cache import (
+    PermissionsCache,
+)
+
+# How long to wait for the first record of a batch
+POLL_TIMEOUT_MS = 1000
 
 
 class UsersKafkaConsumerImpl(KafkaConsumerInterface):
+    """
+    Consumes the users' events in batches: a batch is stored within a single
+    transaction and its offsets are committed only after that (at-least-once).
+    """
+
     def __init__(
         self,
         user_service: UserService,
         bootstrap_servers: List[str],
         topic: str,
         logger: LoggerService,
+        db_session: ScopedAsyncSession,
+        permissions_cache: PermissionsCache,
         group_id: Optional[str] = "registry-service-users-group",
+        batch_size: int = 500,
+        linger_ms: int = 200,
+        metrics: Optional[ConsumerMetrics] = None,
     ):
         self.user_service = user_service
+        self._db_session = db_session
+        self._permissions_cache = permissions_cache
         self.bootstrap_servers = bootstrap_servers
         self.topic = topic
         self.group_id = group_id
+        self.batch_size = batch_size
+        self.linger_ms = linger_ms
+        self.metrics = metrics or ConsumerMetrics()
         self._logger = logger
         self.consumer = None
         self._running = False
@@ -35,7 +60,7 @@ class UsersKafkaConsumerImpl(KafkaConsumerInterface):
             bootstrap_servers=self.bootstrap_servers,
             value_deserializer=lambda message: json.loads(message.decode("utf-8")),
             group_id=self.group_id,
-            enable_auto_commit=True,
+            enable_auto_commit=False,
         )
         await self.consumer.start()
         self._running = True
@@ -51,18 +76,150 @@ class UsersKafkaConsumerImpl(KafkaConsumerInterface):
             self._logger.info("Kafka consumer stopped.")
 
     async def consume(self):
-        self._logger.info(f"Consuming topic '{self.topic}'")
-        async for msg in self.consumer:
-            if not self._running:
+        self._logger.info(
+            f"Consuming topic '{self.topic}' in batches of up to {self.batch_size} "
+            f"messages (linger: {self.linger_ms} ms)"
+        )
+        while self._running:
+            records = await self._poll_batch()
+            if not records:
+                continue
+
+            started_at = time.perf_counter()
+            await self.handle_batch([record.value for record in records])
+            self.metrics.record_batch(len(records), time.perf_counter() - started_at)
+
+            try:
+                # Offsets are committed only after the batch has been stored
+                await self.consumer.commit()
+            except Exception as err:
+                self.metrics.record_error("commit")
+                self._logger.error(f"Error while committing offsets: {err}")
+
+            self._record_lag(records)
+
+    def _record_lag(self, records: List[ConsumerRecord]) -> None:
+        next_offsets = {
+            TopicPartition(record.topic, record.partition): record.offset + 1
+            for record in records
+        }
+        for partition, next_offset in next_offsets.items():
+            highwater = self.consumer.highwater(partition)
+            if highwater is not None:
+                self.metrics.record_lag(
+                    f"{partition.topic}-{partition.partition}", highwater - next_offset
+                )
+
+    async def _poll_batch(self) -> List[ConsumerRecord]:
+        """
+        Waits for the first records, then lingers for `linger_ms` at most
+        to fill the batch up to `batch_size` records.
+        """
+        loop = asyncio.get_running_loop()
+        records: List[ConsumerRecord] = []
+        timeout_ms = POLL_TIMEOUT_MS
+        linger_deadline = None
+
+        while self._running and len(records) < self.batch_size:
+            fetched = await self.consumer.getmany(
+                timeout_ms=timeout_ms, max_records=self.batch_size - len(records)
+            )
+            # The events of a user share a partition key, so their order is kept
+            for partition_records in fetched.values():
+                records.extend(partition_records)
+
+            if not records:
+                break
+
+            if linger_deadline is None:
+                linger_deadline = loop.time() + self.linger_ms / 1000
+
+            timeout_ms = int((linger_deadline - loop.time()) * 1000)
+            if timeout_ms <= 0:
                 break
+
+        return records
+
+    async def handle_batch(self, events: List[Dict[str, Any]]):
+        """
+        Stores a batch of events within a single DB session and transaction.
+
+        If the batch fails (e.g. an IIN conflict), its events are handled one
+        by one, so a single bad event doesn't block the rest of the batch.
+        """
+        parsed_events = []
+        for event in events:
             try:
-                await self.handle_event(msg.value)
+                parsed_event = self._parse_event(event)
             except Exception as err:
-                error_message = f"Error while handling a message: {err}"
-                self._logger.error(error_message)
+                self.metrics.record_error("parse")
+                self._logger.error(f"Error while parsing a message: {err}")
                 continue
 
+            if parsed_event is not None:
+                self._invalidate_permissions(*parsed_event)
+                parsed_events.append(parsed_event)
+
+        if not parsed_events:
+            return
+
+        try:
+            async with self._db_session.scope():
+                upserted, deleted = await self.user_service.handle_events_batch(
+                    parsed_events
+                )
+            self._logger.debug(
+                f"Handled a batch of {len(parsed_events)} user actions: "
+                f"{upserted} upserted, {deleted} deleted."
+            )
+            return
+        except Exception as err:
+            self.metrics.record_error("batch")
+            self._logger.error(
+                f"Error while handling a batch of {len(parsed_events)} messages, "
+                f"handling them one by one: {err}"
+            )
+
+        for action_enum, user_data in parsed_events:
+            try:
+                # Every message is handled within its own DB session
+                async with self._db_session.scope():
+                    await self.user_service.handle_event(
+                        action=action_enum, user_data=user_data
+                    )
+            except Exception as err:
+                self.metrics.record_error("message")
+                self._logger.error(f"Error while handling a message: {err}")
+
     async def handle_event(self, event: Dict[str, Any]):
+        parsed_event = self._parse_event(event)
+        if parsed_event is None:
+            return
+
+        action_enum, user_data = parsed_event
+        self._invalidate_permissions(action_enum, user_data)
+
+        await self.user_service.handle_event(action=action_enum, user_data=user_data)
+
+        self._logger.debug(
+            f"Handled user action '{action_enum.value}'. ID: '{event.get('sub')}'."
+        )
+
+    def _invalidate_permissions(
+        self, action_enum: ActionsOnUserEnum, user_data: Union[UserSchema, UUID]
+    ) -> None:
+        # Roles and permissions of an updated / deleted user may have changed
+        if action_enum in (ActionsOnUserEnum.UPDATE, ActionsOnUserEnum.DELETE):
+            user_id = user_data.id if isinstance(user_data, UserSchema) else user_data
+            self._permissions_cache.invalidate_user(str(user_id))
+
+    def _parse_event(
+        self, event: Dict[str, Any]
+    ) -> Optional[Tuple[ActionsOnUserEnum, Union[UserSchema, UUID]]]:
+        """
+        Parses an event into its action and a user schema (or their ID for
+        deletion). Returns None for events that are skipped.
+        """
         action_type = event.get("action_type")
         user_id = event.get("sub")
         payload = event.get("payload", {})
@@ -75,7 +232,11 @@ class UsersKafkaConsumerImpl(KafkaConsumerInterface):
                 f"from the Auth Service: '{action_type}'."
             )
             self._logger.info("Skipping this event. Unknown action type was received.")
-            return
+            return None
+
+        if not user_id:
+            self._logger.info("Skipping this event. No user ID was received.")
+            return None
 
         # For creation and update, we form a user schema, for delete - only ID
         if action_enum in (ActionsOnUserEnum.CREATE, ActionsOnUserEnum.UPDATE):
@@ -98,8 +259,6 @@ class UsersKafkaConsumerImpl(KafkaConsumerInterface):
             user_data = UUID(user_id)
         else:
             self._logger.info("Skipping this event. Unknown action type was received.")
-            return
-
-        await self.user_service.handle_event(action=action_enum, user_data=user_data)
+            return None
 
-        self._logger.debug(f"Handled user action '{action_type}'. ID: '{user_id}'.")
+        return action_enum, user_data
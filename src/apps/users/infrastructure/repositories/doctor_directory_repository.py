@@ -0,0 +1,113 @@
+from typing import List
+from uuid import UUID
+
+from sqlalchemy import Integer, String, cast, delete, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.sql.expression import column
+
+from src.apps.users.infrastructure.db_models.models import (
+    DoctorArea,
+    DoctorServedType,
+    DoctorSpecialization,
+    User,
+)
+from src.apps.users.interfaces.doctor_directory_repository_interface import (
+    DoctorDirectoryRepositoryInterface,
+)
+from src.shared.infrastructure.base import BaseRepository
+
+SERVED_TYPE_COLUMNS = (
+    User.served_patient_types,
+    User.served_referral_types,
+    User.served_referral_origins,
+    User.served_payment_types,
+)
+
+
+def select_doctor_specializations(*conditions):
+    """
+    Unnests the specializations of the users: (doctor_id, name_key, name, specialization_id).
+    """
+    specializations = func.jsonb_array_elements(User.specializations).table_valued(
+        column("value", JSONB), name="specialization"
+    )
+    name = specializations.c.value.op("->>")("name")
+    name_key = func.lower(func.trim(name))
+
+    return (
+        select(User.id, name_key, name, specializations.c.value.op("->>")("id"))
+        .select_from(User, specializations)
+        .where(name_key != "", *conditions)
+    )
+
+
+def select_doctor_areas(*conditions):
+    """
+    Serviced area numbers of the users: (doctor_id, area_number).
+    Non-numeric area numbers are skipped.
+    """
+    area_number = User.attachment_data["area_number"].astext
+
+    return select(User.id, cast(area_number, Integer)).where(
+        area_number.op("~")("^[0-9]{1,9}$"), *conditions
+    )
+
+
+def select_doctor_served_types(*conditions):
+    """
+    Unnests the served types of the users: (doctor_id, kind, value).
+    """
+    selects = []
+    for served_column in SERVED_TYPE_COLUMNS:
+        values = func.jsonb_array_elements_text(served_column).table_valued(
+            "value", name=served_column.key
+        )
+        selects.append(
+            select(User.id, literal(served_column.key, String), values.c.value)
+            .select_from(User, values)
+            .where(*conditions)
+        )
+
+    return union_all(*selects)
+
+
+class SQLAlchemyDoctorDirectoryRepository(
+    BaseRepository, DoctorDirectoryRepositoryInterface
+):
+    """
+    SQL Alchemy repository for maintaining the doctor directory.
+    """
+
+    async def refresh(self, user_ids: List[UUID]) -> None:
+        if not user_ids:
+            return
+
+        for model in (DoctorSpecialization, DoctorArea, DoctorServedType):
+            await self._async_db_session.execute(
+                delete(model)
+                .where(model.doctor_id.in_(user_ids))
+                .execution_options(synchronize_session=False)
+            )
+
+        of_users = User.id.in_(user_ids)
+        # Duplicates in the source lists are collapsed by the primary keys
+        await self._async_db_session.execute(
+            insert(DoctorSpecialization)
+            .from_select(
+                ["doctor_id", "name_key", "name", "specialization_id"],
+                select_doctor_specializations(of_users),
+            )
+            .on_conflict_do_nothing()
+        )
+        await self._async_db_session.execute(
+            insert(DoctorArea).from_select(
+                ["doctor_id", "area_number"], select_doctor_areas(of_users)
+            )
+        )
+        await self._async_db_session.execute(
+            insert(DoctorServedType)
+            .from_select(
+                ["doctor_id", "kind", "value"], select_doctor_served_types(of_users)
+            )
+            .on_conflict_do_nothing()
+        )
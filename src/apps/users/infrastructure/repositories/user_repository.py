@@ -1,6 +1,8 @@
+from typing import List
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, literal_column, select
+from sqlalchemy.dialects.postgresql import insert
 
 from src.apps.users.domain.models.user import UserDomain
 from src.apps.users.infrastructure.db_models.models import User
@@ -8,9 +10,14 @@ from src.apps.users.interfaces.user_repository_interface import UserRepositoryIn
 from src.apps.users.mappers import (
     map_user_db_entity_to_domain,
     map_user_domain_to_db_entity,
+    map_user_domain_to_db_row,
 )
 from src.shared.infrastructure.base import BaseRepository
 
+EMPTY_JSONB_ARRAY = literal_column("'[]'::jsonb")
+# The full name is derived from these fields
+NAME_FIELDS = {"first_name", "last_name", "middle_name"}
+
 
 class SQLAlchemyUserRepository(BaseRepository, UserRepositoryInterface):
     """
@@ -27,6 +34,15 @@ class SQLAlchemyUserRepository(BaseRepository, UserRepositoryInterface):
 
         return map_user_db_entity_to_domain(user)
 
+    async def get_many_by_ids(self, user_ids: List[UUID]) -> List[UserDomain]:
+        if not user_ids:
+            return []
+
+        query = select(User).where(User.id.in_(user_ids))
+        result = await self._async_db_session.execute(query)
+
+        return [map_user_db_entity_to_domain(user) for user in result.scalars().all()]
+
     async def get_by_iin(self, iin: str) -> UserDomain | None:
         query = select(User).where(User.iin == iin)
         result = await self._async_db_session.execute(query)
@@ -41,30 +57,95 @@ class SQLAlchemyUserRepository(BaseRepository, UserRepositoryInterface):
         user_to_add = map_user_domain_to_db_entity(user)
 
         self._async_db_session.add(user_to_add)
-        await self._async_db_session.commit()
+        await self._async_db_session.flush()
         await self._async_db_session.refresh(user_to_add)
 
         return map_user_db_entity_to_domain(user_to_add)
 
     async def update(self, user: UserDomain) -> UserDomain:
-        query = select(User).where(User.id == user.id)
-        result = await self._async_db_session.execute(query)
-        user_to_update = result.scalars().first()
+        changed_fields = set(user.changed_fields)
+        if changed_fields & NAME_FIELDS:
+            changed_fields.add("full_name")
 
-        user_as_dict = user.to_dict()
-        # Updating fields
-        for field, value in user_as_dict.items():
-            setattr(user_to_update, field, value)
+        values = {
+            column: value
+            for column, value in map_user_domain_to_db_row(user).items()
+            if column in changed_fields and column != "id"
+        }
+        if not values:
+            # Nothing has changed, the row is not written
+            return user
 
-        await self._async_db_session.commit()
-        await self._async_db_session.refresh(user_to_update)
+        updated_user = await self._update_by_id(User, user.id, values)
 
-        return map_user_db_entity_to_domain(user_to_update)
+        return map_user_db_entity_to_domain(updated_user)
 
     async def delete(self, user_id: UUID) -> None:
-        query = select(User).where(User.id == user_id)
-        result = await self._async_db_session.execute(query)
-        user_to_delete = result.scalars().first()
-
-        await self._async_db_session.delete(user_to_delete)
-        await self._async_db_session.commit()
+        # Schedules of the doctor are removed by the FK cascade
+        await self._delete_by_id(User, user_id)
+
+    async def apply_batch(
+        self, upserted_users: List[UserDomain], deleted_user_ids: List[UUID]
+    ) -> None:
+        if upserted_users:
+            await self._upsert_many(upserted_users)
+
+        if deleted_user_ids:
+            # Schedules of the deleted doctors are removed by the FK cascade
+            await self._async_db_session.execute(
+                delete(User)
+                .where(User.id.in_(deleted_user_ids))
+                .execution_options(synchronize_session=False)
+            )
+
+    async def _upsert_many(self, users: List[UserDomain]) -> None:
+        """
+        Inserts users or updates the existing ones with a single statement.
+
+        Follows the merge rules of a single update: an empty middle name or
+        list keeps the stored value, the attachment data is not changed.
+        """
+        query = insert(User)
+        excluded = query.excluded
+        middle_name = func.coalesce(excluded.middle_name, User.middle_name)
+
+        def keep_if_empty(column):
+            return func.coalesce(
+                func.nullif(excluded[column.key], EMPTY_JSONB_ARRAY), column
+            )
+
+        query = query.on_conflict_do_update(
+            index_elements=[User.id],
+            set_={
+                "first_name": excluded.first_name,
+                "last_name": excluded.last_name,
+                "middle_name": middle_name,
+                "full_name": func.left(
+                    func.concat_ws(
+                        " ",
+                        excluded.last_name,
+                        excluded.first_name,
+                        func.nullif(middle_name, ""),
+                    ),
+                    256,
+                ),
+                "iin": excluded.iin,
+                "date_of_birth": excluded.date_of_birth,
+                "enabled": excluded.enabled,
+                "client_roles": keep_if_empty(User.client_roles),
+                "specializations": keep_if_empty(User.specializations),
+                "served_patient_types": keep_if_empty(User.served_patient_types),
+                "served_referral_types": keep_if_empty(User.served_referral_types),
+                "served_referral_origins": keep_if_empty(User.served_referral_origins),
+                "served_payment_types": keep_if_empty(User.served_payment_types),
+                # Column.onupdate is not applied to ON CONFLICT DO UPDATE
+                "changed_at": func.now(),
+            },
+        )
+
+        # With RETURNING the rows are sent as multi-row INSERT ... VALUES
+        # statements (1000 rows each) instead of a statement per row
+        await self._async_db_session.execute(
+            query.returning(User.id),
+            [map_user_domain_to_db_row(user) for user in users],
+        )
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import List
+from uuid import UUID
+
+
+class DoctorDirectoryRepositoryInterface(ABC):
+    """
+    Repository for maintaining the doctor directory: the lookup tables of
+    specializations, serviced areas and served types derived from the users.
+    """
+
+    @abstractmethod
+    async def refresh(self, user_ids: List[UUID]) -> None:
+        """
+        Rebuilds the directory entries of the given users from their stored
+        rows. Entries of the deleted users are removed. Nothing is committed:
+        the caller commits the entries together with the users.
+        """
+        pass
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+
+from src.apps.users.interfaces.doctor_directory_repository_interface import (
+    DoctorDirectoryRepositoryInterface,
+)
+from src.apps.users.interfaces.user_repository_interface import UserRepositoryInterface
+
+
+class UsersUnitOfWorkInterface(ABC):
+    """
+    Unit of Work of the users: a user write and the doctor directory
+    rebuilt from it are committed or rolled back together.
+    """
+
+    user_repository: UserRepositoryInterface
+    doctor_directory_repository: DoctorDirectoryRepositoryInterface
+
+    @abstractmethod
+    async def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        pass
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List
 from uuid import UUID
 
 from src.apps.users.domain.models.user import UserDomain
@@ -13,6 +14,10 @@ class UserRepositoryInterface(ABC):
     async def get_by_id(self, user_id: UUID) -> UserDomain:
         pass
 
+    @abstractmethod
+    async def get_many_by_ids(self, user_ids: List[UUID]) -> List[UserDomain]:
+        pass
+
     @abstractmethod
     async def get_by_iin(self, iin: str) -> UserDomain:
         pass
@@ -28,3 +33,13 @@ class UserRepositoryInterface(ABC):
     @abstractmethod
     async def delete(self, user_id: UUID) -> None:
         pass
+
+    @abstractmethod
+    async def apply_batch(
+        self, upserted_users: List[UserDomain], deleted_user_ids: List[UUID]
+    ) -> None:
+        """
+        Upserts and deletes users in bulk without committing them.
+        A user must occur in the batch only once.
+        """
+        pass
@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 from src.apps.users.domain.models.user import UserDomain
 from src.apps.users.infrastructure.db_models.models import User
 from src.apps.users.infrastructure.schemas.user_schemas import (
@@ -6,26 +8,33 @@ from src.apps.users.infrastructure.schemas.user_schemas import (
 )
 
 
-def map_user_domain_to_db_entity(user: UserDomain) -> User:
-    return User(
-        id=user.id,
-        first_name=user.first_name,
-        last_name=user.last_name,
-        middle_name=user.middle_name,
-        full_name=" ".join(
+def map_user_domain_to_db_row(user: UserDomain) -> Dict[str, Any]:
+    """
+    Maps a user to the column values of the users table (e.g. for bulk inserts).
+    """
+    return {
+        "id": user.id,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "middle_name": user.middle_name,
+        "full_name": " ".join(
             filter(None, [user.last_name, user.first_name, user.middle_name or ""])
         )[:256],
-        iin=user.iin,
-        date_of_birth=user.date_of_birth,
-        client_roles=user.client_roles,
-        enabled=user.enabled,
-        served_patient_types=user.served_patient_types,
-        served_referral_types=user.served_referral_types,
-        served_referral_origins=user.served_referral_origins,
-        served_payment_types=user.served_payment_types,
-        attachment_data=user.attachment_data,
-        specializations=user.specializations,
-    )
+        "iin": user.iin,
+        "date_of_birth": user.date_of_birth,
+        "client_roles": user.client_roles,
+        "enabled": user.enabled,
+        "served_patient_types": user.served_patient_types,
+        "served_referral_types": user.served_referral_types,
+        "served_referral_origins": user.served_referral_origins,
+        "served_payment_types": user.served_payment_types,
+        "attachment_data": user.attachment_data,
+        "specializations": user.specializations,
+    }
+
+
+def map_user_domain_to_db_entity(user: UserDomain) -> User:
+    return User(**map_user_domain_to_db_row(user))
 
 
 def map_user_db_entity_to_domain(user_from_db: User) -> UserDomain:
@@ -1,9 +1,10 @@
-from typing import Union
+from typing import Dict, List, Sequence, Tuple, Union
 from uuid import UUID
 
 from src.apps.users.domain.enums import ActionsOnUserEnum
 from src.apps.users.domain.models.user import UserDomain
 from src.apps.users.infrastructure.schemas.user_schemas import UserSchema
+from src.apps.users.interfaces.uow_interface import UsersUnitOfWorkInterface
 from src.apps.users.interfaces.user_repository_interface import UserRepositoryInterface
 from src.apps.users.mappers import map_user_schema_to_domain
 from src.core.i18n import _
@@ -18,9 +19,11 @@ from src.shared.exceptions import (
 class UserService:
     def __init__(
         self,
+        uow: UsersUnitOfWorkInterface,
         user_repository: UserRepositoryInterface,
         logger: LoggerService,
     ):
+        self._uow = uow
         self._user_repository = user_repository
         self._logger = logger
 
@@ -39,87 +42,99 @@ class UserService:
 
         return user
 
+    async def get_many_by_ids(self, user_ids: List[UUID]) -> List[UserDomain]:
+        """
+        Retrieves users by their IDs with a single query.
+        Users that were not found are skipped.
+        """
+        return await self._user_repository.get_many_by_ids(user_ids)
+
     async def create(self, dto: UserSchema) -> UserDomain:
         """
-        Creates a user
+        Creates a user. The user and their doctor directory entries
+        are committed together.
 
         :param dto: User Pydantic schema
 
         :raises InstanceAlreadyExistsError: If a user with the same ID already exists
         :return: UserDomain object
         """
-        # Check if a user already exists
-        existing_user_by_id = await self._user_repository.get_by_id(dto.id)
-        if existing_user_by_id:
-            raise InstanceAlreadyExistsError(
-                status_code=409,
-                detail=_(
-                    "User with ID: %(ID)s already exists."
-                    % {"ID": existing_user_by_id.id}
-                ),
-            )
+        async with self._uow:
+            # Check if a user already exists
+            existing_user_by_id = await self._uow.user_repository.get_by_id(dto.id)
+            if existing_user_by_id:
+                raise InstanceAlreadyExistsError(
+                    status_code=409,
+                    detail=_(
+                        "User with ID: %(ID)s already exists."
+                        % {"ID": existing_user_by_id.id}
+                    ),
+                )
 
-        existing_user_by_iin = await self._user_repository.get_by_iin(dto.iin)
-        if existing_user_by_iin:
-            raise InstanceAlreadyExistsError(
-                status_code=409,
-                detail=_(
-                    "User with IIN: %(IIN)s already exists."
-                    % {"IIN": existing_user_by_iin.iin}
-                ),
-            )
+            existing_user_by_iin = await self._uow.user_repository.get_by_iin(dto.iin)
+            if existing_user_by_iin:
+                raise InstanceAlreadyExistsError(
+                    status_code=409,
+                    detail=_(
+                        "User with IIN: %(IIN)s already exists."
+                        % {"IIN": existing_user_by_iin.iin}
+                    ),
+                )
+
+            # Prepare domain object
+            user_domain = map_user_schema_to_domain(dto)
 
-        # Prepare domain object
-        user_domain = map_user_schema_to_domain(dto)
+            created_user = await self._uow.user_repository.create(user_domain)
+            await self._uow.doctor_directory_repository.refresh([created_user.id])
 
-        return await self._user_repository.create(user_domain)
+        return created_user
 
     async def update_user(self, dto: UserSchema) -> UserDomain:
         """
-        Updates a user
+        Updates a user. The user and their doctor directory entries
+        are committed together.
 
         :param dto: User Pydantic schema
 
         :raises NoInstanceFoundError: If a user with given ID doesn't exist
         :return: UserDomain object
         """
-        existing_user = await self._user_repository.get_by_id(dto.id)
-        if not existing_user:
-            raise NoInstanceFoundError(
-                status_code=404,
-                detail=_("User with ID: %(ID)s not found." % {"ID": dto.id}),
-            )
+        async with self._uow:
+            existing_user = await self._uow.user_repository.get_by_id(dto.id)
+            if not existing_user:
+                raise NoInstanceFoundError(
+                    status_code=404,
+                    detail=_("User with ID: %(ID)s not found." % {"ID": dto.id}),
+                )
 
-        incoming_specializations = dto.get_specializations_as_dict()
-        final_specializations = (
-            incoming_specializations
-            if incoming_specializations
-            else existing_user.specializations
-        )
-
-        # Prepare a domain object manually
-        user_domain = UserDomain(
-            id=dto.id,
-            first_name=dto.first_name or existing_user.first_name,
-            last_name=dto.last_name or existing_user.last_name,
-            middle_name=dto.middle_name or existing_user.middle_name,
-            iin=dto.iin or existing_user.iin,
-            date_of_birth=dto.date_of_birth or existing_user.date_of_birth,
-            client_roles=dto.client_roles or existing_user.client_roles,
-            enabled=dto.enabled or existing_user.enabled,
-            served_patient_types=dto.served_patient_types
-            or existing_user.served_patient_types,
-            served_referral_types=dto.served_referral_types
-            or existing_user.served_referral_types,
-            served_referral_origins=dto.served_referral_origins
-            or existing_user.served_referral_origins,
-            served_payment_types=dto.served_payment_types
-            or existing_user.served_payment_types,
-            attachment_data=dto.attachment_data or existing_user.attachment_data,
-            specializations=final_specializations or existing_user.specializations,
-        )
-
-        return await self._user_repository.update(user_domain)
+            # Empty incoming values keep the existing ones. The existing user tracks
+            # the changed fields, so only they are written.
+            for field in (
+                "first_name",
+                "last_name",
+                "middle_name",
+                "iin",
+                "date_of_birth",
+                "client_roles",
+                "enabled",
+                "served_patient_types",
+                "served_referral_types",
+                "served_referral_origins",
+                "served_payment_types",
+                "attachment_data",
+            ):
+                incoming_value = getattr(dto, field)
+                if incoming_value:
+                    setattr(existing_user, field, incoming_value)
+
+            incoming_specializations = dto.get_specializations_as_dict()
+            if incoming_specializations:
+                existing_user.specializations = incoming_specializations
+
+            updated_user = await self._uow.user_repository.update(existing_user)
+            await self._uow.doctor_directory_repository.refresh([updated_user.id])
+
+        return updated_user
 
     async def delete_user(self, user_id: UUID) -> None:
         """
@@ -127,15 +142,63 @@ class UserService:
 
         :raises NoInstanceFoundError: If a user with a given ID doesn't exist
         """
-        # Check if a user doesn't exist
-        existing_user = await self._user_repository.get_by_id(user_id)
-        if not existing_user:
-            raise NoInstanceFoundError(
-                status_code=404,
-                detail=_("User with ID: %(ID)s not found." % {"ID": user_id}),
+        async with self._uow:
+            # Check if a user doesn't exist
+            existing_user = await self._uow.user_repository.get_by_id(user_id)
+            if not existing_user:
+                raise NoInstanceFoundError(
+                    status_code=404,
+                    detail=_("User with ID: %(ID)s not found." % {"ID": user_id}),
+                )
+
+            await self._uow.user_repository.delete(user_id)
+
+    async def handle_events_batch(
+        self,
+        events: Sequence[Tuple[ActionsOnUserEnum, Union[UserSchema, UUID]]],
+    ) -> Tuple[int, int]:
+        """
+        Handles a batch of events from Kafka with a fixed number of statements.
+
+        Events are coalesced per user, so only the last one of each user
+        is applied: creations and updates are upserted at once, deletions
+        are removed at once. The doctor directory of the upserted users
+        is rebuilt in the same transaction, the one of the deleted users
+        is removed by the FK cascade.
+
+        :param events: Pairs of an action and a user schema or theirs UUID,
+            ordered as they were received
+        :return: Numbers of the upserted and deleted users
+        """
+        latest_events: Dict[UUID, Tuple[ActionsOnUserEnum, Union[UserSchema, UUID]]] = {}
+        for action, user_data in events:
+            user_id = user_data.id if isinstance(user_data, UserSchema) else user_data
+            if user_id is None:
+                continue
+
+            latest_events[user_id] = (action, user_data)
+
+        upserted_users = [
+            map_user_schema_to_domain(user_data)
+            for action, user_data in latest_events.values()
+            if action in (ActionsOnUserEnum.CREATE, ActionsOnUserEnum.UPDATE)
+            and isinstance(user_data, UserSchema)
+        ]
+        deleted_user_ids = [
+            user_id
+            for user_id, (action, _user_data) in latest_events.items()
+            if action == ActionsOnUserEnum.DELETE
+        ]
+
+        async with self._uow:
+            await self._uow.user_repository.apply_batch(
+                upserted_users, deleted_user_ids
+            )
+            await self._uow.doctor_directory_repository.refresh(
+                [user.id for user in upserted_users]
             )
 
-        await self._user_repository.delete(user_id)
+        return len(upserted_users), len(deleted_user_ids)
 
     async def handle_event(
         self, action: ActionsOnUserEnum, user_data: Union[UserSchema, UUID]
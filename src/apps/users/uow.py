@@ -0,0 +1,22 @@
+from src.apps.users.infrastructure.repositories.doctor_directory_repository import (
+    SQLAlchemyDoctorDirectoryRepository,
+)
+from src.apps.users.infrastructure.repositories.user_repository import (
+    SQLAlchemyUserRepository,
+)
+from src.apps.users.interfaces.uow_interface import UsersUnitOfWorkInterface
+from src.shared.base_uow import BaseUnitOfWork
+
+
+class UsersUnitOfWorkImpl(BaseUnitOfWork, UsersUnitOfWorkInterface):
+    @property
+    def user_repository(self) -> SQLAlchemyUserRepository:
+        return SQLAlchemyUserRepository(
+            async_db_session=self._session, logger=self._logger
+        )
+
+    @property
+    def doctor_directory_repository(self) -> SQLAlchemyDoctorDirectoryRepository:
+        return SQLAlchemyDoctorDirectoryRepository(
+            async_db_session=self._session, logger=self._logger
+        )
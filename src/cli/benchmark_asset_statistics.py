@@ -0,0 +1,188 @@
+"""
+CLI for benchmarking the statistics of the stationary assets journal.
+Runs as poetry-script module.
+
+Seeds a fixture of synthetic assets (1M rows by default, marked with the `bench-`
+BG ID prefix and reused between runs) and compares the former statistics
+(four COUNT queries) with the single-pass aggregate of the repository, which
+also computes the breakdowns by organization, specialization, area and month.
+Both are measured for the whole journal and for the last 30 days.
+
+Usage:
+    benchmark-asset-statistics --rows 1000000 --repeats 5 --cleanup
+"""
+
+import argparse
+import asyncio
+import datetime
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.apps.assets_journal.infrastructure.db_models.models import StationaryAsset
+from src.apps.assets_journal.infrastructure.repositories.stationary_asset_repository import (
+    StationaryAssetRepositoryImpl,
+)
+from src.core.database.session import ScopedAsyncSession
+from src.core.logger import LoggerService
+from src.core.settings import project_settings
+
+FIXTURE_PREFIX = "bench-"
+
+SEED_FIXTURE_SQL = text(
+    """
+    INSERT INTO stationary_assets (
+        id, bg_asset_id, organization_id, patient_id,
+        receive_date, receive_time, actual_datetime, received_from, is_repeat,
+        stay_period_start, diagnosis, area, specialization, specialist,
+        status, delivery_status, reg_date, has_confirm, has_refusal, has_files
+    )
+    SELECT
+        gen_random_uuid(),
+        CAST(:prefix AS text) || n,
+        organizations.ids[1 + n % coalesce(array_length(organizations.ids, 1), 1)],
+        CAST(:patient_id AS uuid),
+        reg_date, reg_date::time, reg_date, 'Benchmark', false,
+        reg_date, 'Benchmark diagnosis',
+        'Участок ' || n % 50,
+        'Специализация ' || n % 30,
+        'Benchmark specialist',
+        'REGISTERED'::assetstatusenum,
+        'RECEIVED_AUTOMATICALLY'::assetdeliverystatusenum,
+        reg_date,
+        n % 3 = 0,
+        n % 10 = 1,
+        n % 4 = 0
+    FROM generate_series(CAST(:start AS integer), CAST(:stop AS integer)) AS n,
+        LATERAL (SELECT now() - make_interval(mins => n % 1051200) AS reg_date) AS dates,
+        (SELECT array_agg(id) AS ids FROM cat_medical_organizations) AS organizations
+    """
+)
+
+
+async def measure(call: Callable[[], Awaitable[Any]], repeats: int) -> float:
+    """
+    Returns the median duration of the call in milliseconds.
+    """
+    durations = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        await call()
+        durations.append((time.perf_counter() - started_at) * 1000)
+
+    return statistics.median(durations)
+
+
+async def seed_fixture(db_session: ScopedAsyncSession, rows: int) -> None:
+    """
+    Tops up the fixture to the given number of rows (in batches of 100k).
+    """
+    existing = (
+        await db_session.execute(
+            select(func.count()).where(StationaryAsset.bg_asset_id.like(f"{FIXTURE_PREFIX}%"))
+        )
+    ).scalar_one()
+    if existing >= rows:
+        print(f"→ Fixture: {existing} rows")
+        return
+
+    patient_id = (await db_session.execute(text("SELECT id FROM patients LIMIT 1"))).scalar()
+    if patient_id is None:
+        raise SystemExit("At least one patient is required to seed the fixture")
+
+    print(f"→ Seeding {rows - existing} rows...")
+    for start in range(existing + 1, rows + 1, 100_000):
+        await db_session.execute(
+            SEED_FIXTURE_SQL,
+            {
+                "prefix": FIXTURE_PREFIX,
+                "patient_id": patient_id,
+                "start": start,
+                "stop": min(start + 99_999, rows),
+            },
+        )
+        await db_session.commit()
+
+    await db_session.execute(text("ANALYZE stationary_assets"))
+
+
+async def four_count_statistics(
+    db_session: ScopedAsyncSession,
+    repository: StationaryAssetRepositoryImpl,
+    filters: Dict[str, Any],
+) -> None:
+    """
+    The former implementation: a COUNT query per counter.
+    """
+    for condition in (
+        None,
+        StationaryAsset.has_confirm == True,  # noqa: E712
+        StationaryAsset.has_refusal == True,  # noqa: E712
+        StationaryAsset.has_files == True,  # noqa: E712
+    ):
+        query = select(func.count(StationaryAsset.id))
+        if condition is not None:
+            query = query.where(condition)
+        query = repository._apply_filters(query, filters)
+        (await db_session.execute(query)).scalar_one()
+
+
+async def run(rows: int, repeats: int, cleanup: bool):
+    engine = create_async_engine(project_settings.DATABASE_URI)
+    db_session = ScopedAsyncSession(
+        async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    )
+    repository = StationaryAssetRepositoryImpl(db_session, LoggerService("benchmark"))
+    cases = {
+        "all": {},
+        "last 30 days": {
+            "date_from": datetime.datetime.now(datetime.timezone.utc)
+            - datetime.timedelta(days=30)
+        },
+    }
+
+    try:
+        async with db_session.scope():
+            await seed_fixture(db_session, rows)
+
+            print(f"→ Repeats: {repeats} (median, ms)")
+            print(f"{'filters':<16}{'4 x COUNT':>12}{'single pass':>14}")
+            for name, filters in cases.items():
+                four_counts = await measure(
+                    lambda: four_count_statistics(db_session, repository, filters),
+                    repeats,
+                )
+                single_pass = await measure(
+                    lambda: repository.get_statistics(filters), repeats
+                )
+                print(f"{name:<16}{four_counts:>12.2f}{single_pass:>14.2f}")
+
+            if cleanup:
+                await db_session.execute(
+                    delete(StationaryAsset).where(
+                        StationaryAsset.bg_asset_id.like(f"{FIXTURE_PREFIX}%")
+                    )
+                )
+                await db_session.commit()
+                print("Fixture removed")
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stationary assets statistics benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--cleanup", action="store_true", help="Remove the fixture after the benchmark"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args.rows, args.repeats, args.cleanup))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+CLI for benchmarking concurrent booking of appointments.
+Runs as poetry-script module.
+
+Fires N concurrent bookings (200 by default) at the same slots of one active
+schedule day, each in its own session and transaction as an HTTP request
+would. Half of the bookings are shifted by half an interval, so they partially
+overlap two slots. Prints the throughput and checks that the day ended up
+without overlapping appointments, i.e. that every conflict was rejected by
+the exclusion constraint. The created appointments are removed afterwards.
+
+Usage:
+    benchmark-booking --bookings 200 --slots 10 --pool-size 20
+"""
+
+import argparse
+import asyncio
+import datetime
+import time
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.apps.registry.domain.enums import (
+    AppointmentInsuranceType,
+    AppointmentTypeEnum,
+)
+from src.apps.registry.domain.exceptions import AppointmentSlotIsTakenError
+from src.apps.registry.domain.models.appointment import AppointmentDomain
+from src.apps.registry.infrastructure.db_models.models import (
+    Appointment,
+    Schedule,
+    ScheduleDay,
+)
+from src.apps.registry.uow import UnitOfWorkImpl
+from src.core.database.session import ScopedAsyncSession
+from src.core.logger import LoggerService
+from src.core.settings import project_settings
+
+COUNT_OVERLAPS_SQL = text(
+    """
+    SELECT count(*)
+    FROM appointments AS first
+    JOIN appointments AS second
+        ON second.schedule_day_id = first.schedule_day_id AND second.id > first.id
+    WHERE first.schedule_day_id = :schedule_day_id
+        AND first.status <> 'CANCELLED' AND second.status <> 'CANCELLED'
+        AND first.time < second.end_time AND second.time < first.end_time
+    """
+)
+
+
+async def get_schedule_day(
+    db_session: ScopedAsyncSession, schedule_day_id: Optional[UUID]
+) -> ScheduleDay:
+    query = (
+        select(ScheduleDay, Schedule.appointment_interval)
+        .join(Schedule, Schedule.id == ScheduleDay.schedule_id)
+        .where(
+            ScheduleDay.is_active.is_(True),
+            Schedule.is_active.is_(True),
+            Schedule.appointment_interval > 0,
+        )
+        .order_by(ScheduleDay.date.desc())
+        .limit(1)
+    )
+    if schedule_day_id:
+        query = query.where(ScheduleDay.id == schedule_day_id)
+
+    row = (await db_session.execute(query)).first()
+    if row is None:
+        raise SystemExit("An active schedule day of an active schedule is required")
+
+    schedule_day, appointment_interval = row
+    schedule_day.appointment_interval = appointment_interval
+
+    return schedule_day
+
+
+def get_start_times(schedule_day: ScheduleDay, bookings: int, slots: int) -> List[datetime.time]:
+    """
+    Returns the start time of every booking: each slot is targeted by many
+    bookings, every second round is shifted by half an interval.
+    """
+    interval = datetime.timedelta(minutes=schedule_day.appointment_interval)
+    work_start = datetime.datetime.combine(schedule_day.date, schedule_day.work_start_time)
+
+    start_times = []
+    for booking in range(bookings):
+        start = work_start + interval * (booking % slots)
+        if booking // slots % 2:
+            start += interval / 2
+        start_times.append(start.time())
+
+    return start_times
+
+
+async def run(bookings: int, slots: int, pool_size: int, schedule_day_id: Optional[UUID]):
+    engine = create_async_engine(
+        project_settings.DATABASE_URI, pool_size=pool_size, max_overflow=0
+    )
+    db_session = ScopedAsyncSession(
+        async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    )
+    logger = LoggerService("benchmark")
+    created_ids: List[int] = []
+    conflicts = 0
+
+    async def book(start_time: datetime.time) -> None:
+        nonlocal conflicts
+        end_time = (
+            datetime.datetime.combine(schedule_day.date, start_time)
+            + datetime.timedelta(minutes=schedule_day.appointment_interval)
+        ).time()
+        async with db_session.scope():
+            try:
+                async with UnitOfWorkImpl(db_session, logger) as uow:
+                    appointment = await uow.appointment_repository.add(
+                        AppointmentDomain(
+                            schedule_day_id=schedule_day.id,
+                            time=start_time,
+                            end_time=end_time,
+                            patient_id=None,
+                            type=AppointmentTypeEnum.CONSULTATION,
+                            insurance_type=AppointmentInsuranceType.PAID,
+                            reason="Benchmark",
+                        )
+                    )
+                created_ids.append(appointment.id)
+            except AppointmentSlotIsTakenError:
+                conflicts += 1
+
+    try:
+        schedule_day = await get_schedule_day(db_session, schedule_day_id)
+        start_times = get_start_times(schedule_day, bookings, slots)
+        print(
+            f"→ {bookings} concurrent bookings of {slots} slots of the day "
+            f"{schedule_day.id} ({schedule_day.date}), pool size: {pool_size}"
+        )
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(book(start_time) for start_time in start_times))
+        elapsed = time.perf_counter() - started_at
+
+        overlaps = (
+            await db_session.execute(COUNT_OVERLAPS_SQL, {"schedule_day_id": schedule_day.id})
+        ).scalar_one()
+
+        print(f"{'booked':<24}{len(created_ids):>10}")
+        print(f"{'rejected as overlapping':<24}{conflicts:>10}")
+        print(f"{'elapsed, s':<24}{elapsed:>10.3f}")
+        print(f"{'bookings/s':<24}{bookings / elapsed:>10.1f}")
+        print(f"{'overlapping pairs':<24}{overlaps:>10}")
+        if overlaps:
+            print("FAILED: the day contains overlapping appointments")
+    finally:
+        if created_ids:
+            await db_session.execute(delete(Appointment).where(Appointment.id.in_(created_ids)))
+            await db_session.commit()
+        await db_session.dispose()
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent appointment booking benchmark")
+    parser.add_argument("--bookings", type=int, default=200)
+    parser.add_argument("--slots", type=int, default=10)
+    parser.add_argument("--pool-size", type=int, default=20)
+    parser.add_argument(
+        "--schedule-day-id",
+        type=UUID,
+        default=None,
+        help="Schedule day to book (the latest active one by default)",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args.bookings, args.slots, args.pool_size, args.schedule_day_id))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+CLI for benchmarking request-scoped DB sessions under concurrency.
+Runs as poetry-script module.
+
+Simulates N concurrent "requests", each opening its own session scope and
+running a short query, and prints throughput for every pool size given.
+With one session per scope throughput should grow with the pool size until
+the concurrency level is reached.
+
+Usage:
+    benchmark-db-sessions --pool-sizes 1 5 10 20 --concurrency 50 --requests 1000
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.database.session import ScopedAsyncSession
+from src.core.settings import project_settings
+
+
+async def run_benchmark(
+    pool_size: int,
+    concurrency: int,
+    total_requests: int,
+    query_delay: float,
+) -> float:
+    """
+    Returns the number of handled requests per second for the given pool size.
+    """
+    engine = create_async_engine(
+        project_settings.DATABASE_URI,
+        pool_size=pool_size,
+        max_overflow=0,
+    )
+    db_session = ScopedAsyncSession(
+        async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    )
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for request_number in range(total_requests):
+        queue.put_nowait(request_number)
+
+    async def worker() -> None:
+        while not queue.empty():
+            queue.get_nowait()
+            async with db_session.scope():
+                await db_session.execute(
+                    text("SELECT pg_sleep(:delay)"), {"delay": query_delay}
+                )
+
+    try:
+        started_at = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started_at
+    finally:
+        await engine.dispose()
+
+    return total_requests / elapsed
+
+
+async def run(pool_sizes: List[int], concurrency: int, total_requests: int, query_delay: float):
+    print(f"→ Concurrency: {concurrency}, requests: {total_requests}, query delay: {query_delay}s")
+    for pool_size in pool_sizes:
+        throughput = await run_benchmark(pool_size, concurrency, total_requests, query_delay)
+        print(f"pool_size={pool_size:<4} {throughput:10.1f} req/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Request-scoped DB sessions benchmark")
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[1, 5, 10, 20])
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--query-delay", type=float, default=0.01)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.pool_sizes, args.concurrency, args.requests, args.query_delay))
+
+
+if __name__ == "__main__":
+    main()
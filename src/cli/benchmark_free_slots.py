@@ -0,0 +1,120 @@
+"""
+CLI for benchmarking the free-slot engine.
+Runs as poetry-script module.
+
+Generates a synthetic load (500 doctors x 30 days by default: working hours
+with a break and 60-90% of the slots booked at random) and measures computing
+the free slots of every day and the earliest free slots across all doctors,
+i.e. the CPU part of `GET /doctors/{doctor_id}/free-slots` and
+`GET /free-slots/earliest` after their single range query.
+
+Usage:
+    benchmark-free-slots --doctors 500 --days 30 --limit 10 --repeats 5
+"""
+
+import argparse
+import datetime
+import random
+import statistics
+import time
+import uuid
+from typing import Callable, List
+
+from src.apps.registry.domain.free_slots import (
+    ScheduleDayAvailability,
+    find_earliest_free_slots,
+    get_free_slots,
+)
+
+
+def generate_days(doctors: int, days: int, seed: int) -> List[ScheduleDayAvailability]:
+    """
+    Returns the schedule days ordered by date, as the repository does.
+    """
+    rng = random.Random(seed)
+    start_date = datetime.date.today()
+    schedules = [(uuid.uuid4(), uuid.uuid4(), rng.choice((15, 20, 30))) for _ in range(doctors)]
+
+    generated = []
+    for day_offset in range(days):
+        day_date = start_date + datetime.timedelta(days=day_offset)
+        for schedule_id, doctor_id, interval in schedules:
+            work_start = datetime.datetime.combine(day_date, datetime.time(8, 0))
+            slot_starts = [
+                (work_start + datetime.timedelta(minutes=minutes)).time()
+                for minutes in range(0, 10 * 60, interval)
+                if not 4 * 60 <= minutes < 5 * 60
+            ]
+            booked = rng.sample(
+                slot_starts, int(len(slot_starts) * rng.uniform(0.6, 0.9))
+            )
+            generated.append(
+                ScheduleDayAvailability(
+                    schedule_id=schedule_id,
+                    schedule_day_id=uuid.uuid4(),
+                    doctor_id=doctor_id,
+                    date=day_date,
+                    work_start_time=datetime.time(8, 0),
+                    work_end_time=datetime.time(18, 0),
+                    break_start_time=datetime.time(12, 0),
+                    break_end_time=datetime.time(13, 0),
+                    appointment_interval=interval,
+                    booked_times=tuple(sorted(booked)),
+                )
+            )
+
+    return generated
+
+
+def measure(call: Callable[[], object], repeats: int) -> float:
+    """
+    Returns the median duration of the call in milliseconds.
+    """
+    durations = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        call()
+        durations.append((time.perf_counter() - started_at) * 1000)
+
+    return statistics.median(durations)
+
+
+def run(doctors: int, days: int, limit: int, repeats: int, seed: int):
+    schedule_days = generate_days(doctors, days, seed)
+    print(
+        f"→ {doctors} doctors x {days} days ({len(schedule_days)} schedule days), "
+        f"repeats: {repeats} (median, ms)"
+    )
+
+    all_slots = measure(
+        lambda: [get_free_slots(day) for day in schedule_days], repeats
+    )
+    earliest = measure(
+        lambda: find_earliest_free_slots(schedule_days, limit), repeats
+    )
+    # Worst case: only the last day has free slots left
+    fully_booked = [day._replace(appointment_interval=0) for day in schedule_days[:-doctors]]
+    earliest_last_day = measure(
+        lambda: find_earliest_free_slots(fully_booked + schedule_days[-doctors:], limit),
+        repeats,
+    )
+
+    print(f"{'free slots of every day':<40}{all_slots:>10.2f}")
+    print(f"{f'earliest {limit} slots':<40}{earliest:>10.2f}")
+    print(f"{f'earliest {limit} slots, only last day free':<40}{earliest_last_day:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Free-slot engine benchmark")
+    parser.add_argument("--doctors", type=int, default=500)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    run(args.doctors, args.days, args.limit, args.repeats, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+CLI for benchmarking the materialization of the list endpoints' pages.
+Runs as poetry-script module.
+
+For appointments, patients and stationary assets it fetches a page (1000 rows by
+default) and maps it up to what the endpoint serializes, in two ways:
+- former: ORM entities with their eager loads -> domain objects -> response schemas;
+- rows: plain column rows of the repositories (only the columns of the response for
+  the stationary assets) -> slotted domain objects -> response schemas.
+Every call runs in its own session (an empty identity map, as a request has) and
+reports the median time and the median peak of the memory allocated by Python
+while the page is built (tracemalloc, so the times are higher than without it).
+
+Usage:
+    benchmark-list-mapping --rows 1000 --repeats 10
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, List, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import joinedload, selectinload
+
+from src.apps.assets_journal.infrastructure.db_models.models import StationaryAsset
+from src.apps.assets_journal.infrastructure.repositories.stationary_asset_repository import (
+    StationaryAssetRepositoryImpl,
+)
+from src.apps.assets_journal.mappers import (
+    map_stationary_asset_db_to_domain,
+    map_stationary_asset_domain_to_list_item,
+    map_stationary_asset_list_item_to_schema,
+)
+from src.apps.patients.infrastructure.db_models.patients import SQLAlchemyPatient
+from src.apps.patients.infrastructure.repositories.patient_repository import (
+    SQLAlchemyPatientRepository,
+)
+from src.apps.patients.mappers import (
+    map_patient_db_entity_to_domain,
+    map_patient_domain_to_response_schema,
+)
+from src.apps.registry.infrastructure.db_models.models import Appointment, ScheduleDay
+from src.apps.registry.infrastructure.repositories.appointment_repository import (
+    AppointmentRepositoryImpl,
+)
+from src.apps.registry.mappers import map_appointment_db_entity_to_domain
+from src.core.database.session import ScopedAsyncSession
+from src.core.logger import LoggerService
+from src.core.settings import project_settings
+
+
+async def measure(
+    db_session: ScopedAsyncSession, call: Callable[[], Awaitable[Any]], repeats: int
+) -> Tuple[float, float]:
+    """
+    Returns the median duration (ms) and the median peak of allocations (KiB).
+    """
+    durations, peaks = [], []
+    for _ in range(repeats):
+        async with db_session.scope():
+            tracemalloc.start()
+            started_at = time.perf_counter()
+            await call()
+            durations.append((time.perf_counter() - started_at) * 1000)
+            peaks.append(tracemalloc.get_traced_memory()[1] / 1024)
+            tracemalloc.stop()
+
+    return statistics.median(durations), statistics.median(peaks)
+
+
+async def run(rows: int, repeats: int):
+    engine = create_async_engine(project_settings.DATABASE_URI)
+    db_session = ScopedAsyncSession(
+        async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    )
+    logger = LoggerService("benchmark-list-mapping")
+    appointment_repository = AppointmentRepositoryImpl(db_session, logger)
+    patient_repository = SQLAlchemyPatientRepository(db_session, logger)
+    asset_repository = StationaryAssetRepositoryImpl(db_session, logger)
+
+    async def former_appointments() -> List[Any]:
+        query = (
+            select(Appointment)
+            .join(Appointment.schedule_day)
+            .options(joinedload(Appointment.schedule_day))
+            .order_by(ScheduleDay.date, Appointment.time)
+            .limit(rows)
+        )
+        result = await db_session.execute(query)
+
+        return [map_appointment_db_entity_to_domain(row) for row in result.scalars().all()]
+
+    async def former_patients() -> List[Any]:
+        query = (
+            select(SQLAlchemyPatient)
+            .options(
+                selectinload(SQLAlchemyPatient.financing_sources),
+                selectinload(SQLAlchemyPatient.additional_attributes),
+            )
+            .limit(rows)
+        )
+        result = await db_session.execute(query)
+
+        return [
+            map_patient_domain_to_response_schema(map_patient_db_entity_to_domain(patient))
+            for patient in result.scalars().all()
+        ]
+
+    async def former_assets() -> List[Any]:
+        query = (
+            select(StationaryAsset)
+            .options(
+                joinedload(StationaryAsset.patient).raiseload("*"),
+                joinedload(StationaryAsset.organization).raiseload("*"),
+            )
+            .order_by(StationaryAsset.reg_date.desc())
+            .limit(rows)
+        )
+        result = await db_session.execute(query)
+
+        return [
+            map_stationary_asset_domain_to_list_item(map_stationary_asset_db_to_domain(asset))
+            for asset in result.scalars().all()
+        ]
+
+    async def patients() -> List[Any]:
+        return [
+            map_patient_domain_to_response_schema(patient)
+            for patient in await patient_repository.get_patients({}, 1, rows)
+        ]
+
+    async def assets() -> List[Any]:
+        return [
+            map_stationary_asset_list_item_to_schema(asset)
+            for asset in await asset_repository.get_assets({}, 1, rows)
+        ]
+
+    cases = {
+        "appointments": (
+            former_appointments,
+            lambda: appointment_repository.get_appointments({}, rows, 1),
+        ),
+        "patients": (former_patients, patients),
+        "stationary_assets": (former_assets, assets),
+    }
+
+    try:
+        print(f"→ Page of {rows} rows, repeats: {repeats} (medians)")
+        print(f"{'list':<20}{'mode':<10}{'rows':>8}{'ms':>10}{'peak KiB':>12}")
+        for name, (former_call, rows_call) in cases.items():
+            for mode, call in (("former", former_call), ("rows", rows_call)):
+                async with db_session.scope():
+                    fetched = len(await call())
+                duration, peak = await measure(db_session, call, repeats)
+                print(f"{name:<20}{mode:<10}{fetched:>8}{duration:>10.2f}{peak:>12.1f}")
+    finally:
+        await db_session.dispose()
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List pages materialization benchmark")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.rows, args.repeats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+CLI for checking the memory of the process under read-only list requests.
+Runs as poetry-script module.
+
+Serves N list requests (100k by default) in one process, rotating over the
+appointments, patients, stationary assets and catalog lists, each request in
+its own session scope as an HTTP request would. With `--fallback-session` all
+of them run on the process-wide fallback session instead, i.e. a session that
+lives as long as the process: since the lists stream column rows and build no
+ORM entities, its identity map has to stay empty there too.
+
+Every `--report-every` requests it prints the memory allocated by Python
+(tracemalloc, so the requests are slower than without it), the peak RSS of
+the process and the size of the identity map of the fallback session. The
+allocated memory should level off after the first checkpoint.
+
+Usage:
+    benchmark-list-memory --requests 100000 --limit 30 --fallback-session
+"""
+
+import argparse
+import asyncio
+import contextlib
+import resource
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.apps.assets_journal.infrastructure.repositories.stationary_asset_repository import (
+    StationaryAssetRepositoryImpl,
+)
+from src.apps.catalogs.infrastructure.api.schemas.requests.filters.insurance_info_catalog_filters import (
+    InsuranceInfoCatalogFilterParams,
+)
+from src.apps.catalogs.infrastructure.repositories.citizenship_catalog_repository import (
+    SQLAlchemyCitizenshipCatalogueRepositoryImpl,
+)
+from src.apps.catalogs.infrastructure.repositories.financing_sources_repository import (
+    SQLAlchemyFinancingSourcesCatalogRepositoryImpl,
+)
+from src.apps.catalogs.infrastructure.repositories.insurance_info_catalog_repository import (
+    SQLAlchemyInsuranceInfoCatalogRepositoryImpl,
+)
+from src.apps.catalogs.infrastructure.repositories.medical_organizations_catalog_repository import (
+    SQLAlchemyMedicalOrganizationsCatalogCatalogueRepositoryImpl,
+)
+from src.apps.catalogs.infrastructure.repositories.nationalities_catalog_repository import (
+    SQLAlchemyNationalitiesCatalogRepositoryImpl,
+)
+from src.apps.catalogs.infrastructure.repositories.patient_context_attributes_repository import (
+    SQLAlchemyPatientContextAttributesCatalogueRepositoryImpl,
+)
+from src.apps.patients.infrastructure.repositories.patient_repository import (
+    SQLAlchemyPatientRepository,
+)
+from src.apps.registry.infrastructure.repositories.appointment_repository import (
+    AppointmentRepositoryImpl,
+)
+from src.core.database.session import ScopedAsyncSession
+from src.core.logger import LoggerService
+from src.core.settings import project_settings
+
+
+def build_list_requests(
+    db_session: ScopedAsyncSession, limit: int
+) -> Dict[str, Callable[[], Awaitable[Any]]]:
+    """
+    The first page of every read-only list, without filters.
+    """
+    logger = LoggerService("benchmark-list-memory")
+    repository_args = {"async_db_session": db_session, "logger": logger}
+    insurance_filters = InsuranceInfoCatalogFilterParams(
+        patient_id_filter=None,
+        financing_source_id_filter=None,
+        policy_number_filter=None,
+        company_name_filter=None,
+        valid_from_filter=None,
+        valid_till_filter=None,
+    )
+    appointments = AppointmentRepositoryImpl(db_session, logger)
+    patients = SQLAlchemyPatientRepository(db_session, logger)
+    assets = StationaryAssetRepositoryImpl(db_session, logger)
+    citizenship = SQLAlchemyCitizenshipCatalogueRepositoryImpl(**repository_args)
+    financing_sources = SQLAlchemyFinancingSourcesCatalogRepositoryImpl(**repository_args)
+    insurance_info = SQLAlchemyInsuranceInfoCatalogRepositoryImpl(**repository_args)
+    medical_organizations = SQLAlchemyMedicalOrganizationsCatalogCatalogueRepositoryImpl(
+        **repository_args
+    )
+    nationalities = SQLAlchemyNationalitiesCatalogRepositoryImpl(**repository_args)
+    context_attributes = SQLAlchemyPatientContextAttributesCatalogueRepositoryImpl(
+        **repository_args
+    )
+
+    return {
+        "appointments": lambda: appointments.get_appointments({}, limit, 1),
+        "patients": lambda: patients.get_patients({}, 1, limit),
+        "stationary_assets": lambda: assets.get_assets({}, 1, limit),
+        "citizenship": lambda: citizenship.get_citizenship_records(None, None, 1, limit),
+        "financing_sources": lambda: financing_sources.get_financing_sources(
+            None, None, 1, limit
+        ),
+        "insurance_info": lambda: insurance_info.get_insurance_info_records(
+            insurance_filters, 1, limit
+        ),
+        "medical_organizations": lambda: medical_organizations.get_medical_organizations(
+            None, None, None, 1, limit
+        ),
+        "nationalities": lambda: nationalities.get_nationalities(None, 1, limit),
+        "context_attributes": lambda: context_attributes.get_patient_context_attributes(
+            None, 1, limit
+        ),
+    }
+
+
+async def run(total_requests: int, limit: int, report_every: int, fallback_session: bool):
+    engine = create_async_engine(project_settings.DATABASE_URI)
+    db_session = ScopedAsyncSession(
+        async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    )
+    list_requests = list(build_list_requests(db_session, limit).values())
+
+    def request_scope():
+        return contextlib.nullcontext() if fallback_session else db_session.scope()
+
+    print(
+        f"→ {total_requests} list requests, page of {limit} rows, "
+        f"{'fallback session' if fallback_session else 'session per request'}"
+    )
+    print(
+        f"{'requests':>10}{'allocated KiB':>16}{'max RSS KiB':>14}"
+        f"{'identity map':>14}{'req/s':>10}"
+    )
+
+    tracemalloc.start()
+    try:
+        started_at = time.perf_counter()
+        for request_number in range(1, total_requests + 1):
+            async with request_scope():
+                await list_requests[request_number % len(list_requests)]()
+
+            if request_number % report_every == 0:
+                print(
+                    f"{request_number:>10}"
+                    f"{tracemalloc.get_traced_memory()[0] / 1024:>16.1f}"
+                    f"{resource.getrusage(resource.RUSAGE_SELF).ru_maxrss:>14}"
+                    f"{len(db_session().identity_map) if fallback_session else 0:>14}"
+                    f"{request_number / (time.perf_counter() - started_at):>10.1f}"
+                )
+    finally:
+        tracemalloc.stop()
+        await db_session.dispose()
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory of read-only list requests")
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--limit", type=int, default=30)
+    parser.add_argument("--report-every", type=int, default=10_000)
+    parser.add_argument(
+        "--fallback-session",
+        action="store_true",
+        help="Run every request on the process-wide session instead of a scope per request",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args.requests, args.limit, args.report_every, args.fallback_session))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""
+CLI for comparing OFFSET and keyset (cursor) pagination of the list endpoints.
+Runs as poetry-script module.
+
+For appointments, patients and stationary assets it measures fetching the first
+page and a deep page (page 1000 by default) in both modes. The cursor of the deep
+page is built from the sort key of the last row of the previous page (not timed),
+exactly as a client following `next_cursor` would get it.
+OFFSET latency grows with the page number, keyset latency should stay flat.
+
+The OFFSET mode always counts the total of the list, so its rows include the
+COUNT(*). The cursor mode counts it only with `include_total=true`: it is
+measured both without the count (the default) and with it ("cursor+total"),
+the count scanning the whole list whatever the page.
+
+Usage:
+    benchmark-pagination --limit 30 --deep-page 1000 --repeats 5
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Awaitable, Callable, List, Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.apps.assets_journal.infrastructure.db_models.models import StationaryAsset
+from src.apps.assets_journal.infrastructure.repositories.stationary_asset_repository import (
+    StationaryAssetRepositoryImpl,
+)
+from src.apps.patients.infrastructure.db_models.patients import SQLAlchemyPatient
+from src.apps.patients.infrastructure.repositories.patient_repository import (
+    SQLAlchemyPatientRepository,
+)
+from src.apps.registry.infrastructure.db_models.models import Appointment, ScheduleDay
+from src.apps.registry.infrastructure.repositories.appointment_repository import (
+    AppointmentRepositoryImpl,
+)
+from src.core.database.session import ScopedAsyncSession
+from src.core.logger import LoggerService
+from src.core.settings import project_settings
+from src.shared.infrastructure.keyset_pagination import CursorDirection, encode_cursor
+
+
+async def measure(call: Callable[[], Awaitable[Any]], repeats: int) -> float:
+    """
+    Returns the median duration of the call in milliseconds.
+    """
+    durations = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        await call()
+        durations.append((time.perf_counter() - started_at) * 1000)
+
+    return statistics.median(durations)
+
+
+async def cursor_for_page(
+    db_session: ScopedAsyncSession,
+    sort_keys: Sequence[Any],
+    page: int,
+    limit: int,
+    descending: bool = False,
+    join: Any = None,
+) -> str:
+    """
+    Builds the `next_cursor` a client would get on the page preceding the given one.
+    """
+    if page <= 1:
+        return ""
+
+    stmt = select(*sort_keys)
+    if join is not None:
+        stmt = stmt.join(join)
+    stmt = (
+        stmt.order_by(*(key.desc() if descending else key.asc() for key in sort_keys))
+        .offset((page - 1) * limit - 1)
+        .limit(1)
+    )
+    row = (await db_session.execute(stmt)).one_or_none()
+    if row is None:
+        return ""
+
+    return encode_cursor(list(row), CursorDirection.NEXT)
+
+
+async def run(limit: int, deep_page: int, repeats: int):
+    engine = create_async_engine(project_settings.DATABASE_URI)
+    db_session = ScopedAsyncSession(
+        async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    )
+    logger = LoggerService("benchmark-pagination")
+
+    appointment_repository = AppointmentRepositoryImpl(db_session, logger)
+    patient_repository = SQLAlchemyPatientRepository(db_session, logger)
+    asset_repository = StationaryAssetRepositoryImpl(db_session, logger)
+
+    targets: List[tuple] = [
+        (
+            "appointments",
+            lambda page: appointment_repository.get_appointments({}, limit, page),
+            lambda cursor: appointment_repository.get_appointments_by_cursor({}, limit, cursor),
+            lambda: appointment_repository.get_total_number_of_appointments({}),
+            dict(
+                sort_keys=(ScheduleDay.date, Appointment.time, Appointment.id),
+                join=Appointment.schedule_day,
+            ),
+        ),
+        (
+            "patients",
+            lambda page: patient_repository.get_patients({}, page, limit),
+            lambda cursor: patient_repository.get_patients_by_cursor({}, limit, cursor),
+            patient_repository.get_total_number_of_patients,
+            dict(sort_keys=(SQLAlchemyPatient.created_at, SQLAlchemyPatient.id)),
+        ),
+        (
+            "stationary_assets",
+            lambda page: asset_repository.get_assets({}, page, limit),
+            lambda cursor: asset_repository.get_assets_by_cursor({}, limit, cursor),
+            lambda: asset_repository.get_total_count({}),
+            dict(
+                sort_keys=(
+                    func.coalesce(StationaryAsset.reg_date, StationaryAsset.created_at),
+                    StationaryAsset.id,
+                ),
+                descending=True,
+            ),
+        ),
+    ]
+
+    print(f"→ Limit: {limit}, deep page: {deep_page}, repeats: {repeats} (median, ms)")
+    print(f"{'list':<20}{'mode':<14}{'page 1':>10}{f'page {deep_page}':>14}")
+    try:
+        async with db_session.scope():
+            for name, get_page, get_cursor_page, get_total, cursor_options in targets:
+                deep_cursor = await cursor_for_page(
+                    db_session, page=deep_page, limit=limit, **cursor_options
+                )
+
+                async def with_total(page_call: Awaitable[Any]) -> None:
+                    await page_call
+                    await get_total()
+
+                offset_first = await measure(lambda: with_total(get_page(1)), repeats)
+                offset_deep = await measure(
+                    lambda: with_total(get_page(deep_page)), repeats
+                )
+                cursor_first = await measure(lambda: get_cursor_page(""), repeats)
+                cursor_deep = await measure(lambda: get_cursor_page(deep_cursor), repeats)
+                counted_first = await measure(
+                    lambda: with_total(get_cursor_page("")), repeats
+                )
+                counted_deep = await measure(
+                    lambda: with_total(get_cursor_page(deep_cursor)), repeats
+                )
+
+                for mode, first, deep in (
+                    ("offset", offset_first, offset_deep),
+                    ("cursor", cursor_first, cursor_deep),
+                    ("cursor+total", counted_first, counted_deep),
+                ):
+                    print(f"{name:<20}{mode:<14}{first:>10.2f}{deep:>14.2f}")
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OFFSET vs keyset pagination benchmark")
+    parser.add_argument("--limit", type=int, default=30)
+    parser.add_argument("--deep-page", type=int, default=1000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.limit, args.deep_page, args.repeats))
+
+
+if __name__ == "__main__":
+    main()
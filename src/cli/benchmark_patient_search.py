@@ -0,0 +1,224 @@
+"""
+CLI for benchmarking the patient search.
+Runs as poetry-script module.
+
+Seeds a fixture of synthetic patients (2M rows by default, marked with the
+`00000` IIN prefix, which no real IIN has, and reused between runs) and measures
+the latency percentiles of `search_patients` by full names (with typos and
+partial words) and by IIN prefixes, together with the former `patient_full_name`
+filter of the patients list for comparison.
+
+Usage:
+    benchmark-patient-search --rows 2000000 --repeats 50 --cleanup
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import Any, Awaitable, Callable, List
+
+from sqlalchemy import and_, delete, func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.apps.patients.infrastructure.db_models.patients import SQLAlchemyPatient
+from src.apps.patients.infrastructure.repositories.patient_repository import (
+    SQLAlchemyPatientRepository,
+)
+from src.core.database.session import ScopedAsyncSession
+from src.core.logger import LoggerService
+from src.core.settings import project_settings
+
+FIXTURE_IIN_PREFIX = "00000"
+
+LAST_NAMES = [
+    "Ахметов", "Иванов", "Сейткали", "Нурланов", "Смагулов", "Петров", "Жумабаев",
+    "Касымов", "Оспанов", "Кузнецов", "Абенов", "Бекмухамбетов", "Сидоров", "Тулегенов",
+]
+FIRST_NAMES = [
+    "Айдар", "Иван", "Ержан", "Алия", "Дана", "Сергей", "Нурсултан", "Асель",
+    "Мария", "Бауыржан", "Жанар", "Алексей", "Тимур", "Гульнара",
+]
+MIDDLE_NAMES = [
+    "Серикович", "Иванович", "Маратович", "Ержановна", "Петровна", "Кайратович", "",
+]
+
+SEED_FIXTURE_SQL = text(
+    """
+    INSERT INTO patients (
+        id, iin, first_name, last_name, middle_name, date_of_birth,
+        citizenship_id, nationality_id
+    )
+    SELECT
+        gen_random_uuid(),
+        CAST(:prefix AS text) || lpad(n::text, 7, '0'),
+        (CAST(:first_names AS text[]))[1 + n % cardinality(CAST(:first_names AS text[]))],
+        (CAST(:last_names AS text[]))[1 + (n / 7) % cardinality(CAST(:last_names AS text[]))]
+            || CASE WHEN n % 3 = 0 THEN 'а' ELSE '' END
+            || n % 997,
+        nullif(
+            (CAST(:middle_names AS text[]))[1 + (n / 3) % cardinality(CAST(:middle_names AS text[]))],
+            ''
+        ),
+        DATE '1950-01-01' + n % 25000,
+        (SELECT id FROM cat_citizenship ORDER BY id LIMIT 1),
+        (SELECT id FROM cat_nationalities ORDER BY id LIMIT 1)
+    FROM generate_series(CAST(:start AS integer), CAST(:stop AS integer)) AS n
+    """
+)
+
+
+async def measure(call: Callable[[], Awaitable[Any]], repeats: int) -> List[float]:
+    """
+    Returns the durations of the calls in milliseconds.
+    """
+    durations = []
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        await call()
+        durations.append((time.perf_counter() - started_at) * 1000)
+
+    return durations
+
+
+def percentile(durations: List[float], percent: int) -> float:
+    return statistics.quantiles(durations, n=100, method="inclusive")[percent - 1]
+
+
+async def seed_fixture(db_session: ScopedAsyncSession, rows: int) -> None:
+    """
+    Tops up the fixture to the given number of rows (in batches of 100k).
+    """
+    existing = (
+        await db_session.execute(
+            select(func.count()).where(SQLAlchemyPatient.iin.like(f"{FIXTURE_IIN_PREFIX}%"))
+        )
+    ).scalar_one()
+    if existing >= rows:
+        print(f"→ Fixture: {existing} rows")
+        return
+
+    print(f"→ Seeding {rows - existing} rows...")
+    for start in range(existing + 1, rows + 1, 100_000):
+        await db_session.execute(
+            SEED_FIXTURE_SQL,
+            {
+                "prefix": FIXTURE_IIN_PREFIX,
+                "first_names": FIRST_NAMES,
+                "last_names": LAST_NAMES,
+                "middle_names": MIDDLE_NAMES,
+                "start": start,
+                "stop": min(start + 99_999, rows),
+            },
+        )
+        await db_session.commit()
+
+    await db_session.execute(text("ANALYZE patients"))
+
+
+def build_name_queries(count: int, seed: int) -> List[str]:
+    """
+    Full names, partial words and names with a typo, as typed by the staff.
+    """
+    rng = random.Random(seed)
+    queries = []
+    for number in range(count):
+        last_name = f"{rng.choice(LAST_NAMES)}{rng.randrange(997)}"
+        first_name = rng.choice(FIRST_NAMES)
+        if number % 3 == 0:
+            queries.append(f"{last_name} {first_name}")
+        elif number % 3 == 1:
+            queries.append(last_name[:-2])
+        else:
+            position = rng.randrange(1, len(last_name) - 1)
+            queries.append(f"{last_name[:position]}{last_name[position + 1:]} {first_name}")
+
+    return queries
+
+
+async def former_full_name_filter(db_session: ScopedAsyncSession, name: str) -> None:
+    """
+    The former implementation: ILIKE '%part%' over the three name columns.
+    """
+    clauses = [
+        or_(
+            func.lower(SQLAlchemyPatient.first_name).ilike(f"%{part}%"),
+            func.lower(SQLAlchemyPatient.last_name).ilike(f"%{part}%"),
+            func.lower(func.coalesce(SQLAlchemyPatient.middle_name, "")).ilike(f"%{part}%"),
+        )
+        for part in name.lower().split()
+    ]
+    query = select(SQLAlchemyPatient.id).where(and_(*clauses)).limit(20)
+    (await db_session.execute(query)).all()
+
+
+async def run(rows: int, repeats: int, limit: int, seed: int, cleanup: bool):
+    engine = create_async_engine(project_settings.DATABASE_URI)
+    db_session = ScopedAsyncSession(
+        async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    )
+    repository = SQLAlchemyPatientRepository(db_session, LoggerService("benchmark"))
+    names = build_name_queries(repeats, seed)
+    rng = random.Random(seed)
+    iin_prefixes = [
+        f"{FIXTURE_IIN_PREFIX}{rng.randrange(10 ** 7):07d}"[: rng.randint(6, 11)]
+        for _ in range(repeats)
+    ]
+
+    try:
+        async with db_session.scope():
+            await seed_fixture(db_session, rows)
+
+            name_queries = iter(names)
+            iin_queries = iter(iin_prefixes)
+            former_queries = iter(names)
+            cases = {
+                "search by name": lambda: repository.search_patients(
+                    next(name_queries), limit
+                ),
+                "search by IIN prefix": lambda: repository.search_patients(
+                    next(iin_queries), limit
+                ),
+                "former full name filter": lambda: former_full_name_filter(
+                    db_session, next(former_queries)
+                ),
+            }
+
+            print(f"→ Repeats: {repeats}, limit: {limit} (ms)")
+            print(f"{'case':<28}{'p50':>10}{'p95':>10}{'max':>10}")
+            for name, call in cases.items():
+                durations = await measure(call, repeats)
+                print(
+                    f"{name:<28}{percentile(durations, 50):>10.2f}"
+                    f"{percentile(durations, 95):>10.2f}{max(durations):>10.2f}"
+                )
+
+            if cleanup:
+                await db_session.execute(
+                    delete(SQLAlchemyPatient).where(
+                        SQLAlchemyPatient.iin.like(f"{FIXTURE_IIN_PREFIX}%")
+                    )
+                )
+                await db_session.commit()
+                print("Fixture removed")
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Patient search benchmark")
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--cleanup", action="store_true", help="Remove the fixture after the benchmark"
+    )
+    args = parser.parse_args()
+
+    asyncio.run(run(args.rows, args.repeats, args.limit, args.seed, args.cleanup))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+CLI for the bulk import of patients from a CSV or NDJSON file.
+Runs as poetry-script module.
+
+The file is read in blocks and imported by the same pipeline as
+`POST /patients/import`: rows are validated in chunks and valid patients are
+written with COPY. Invalid rows don't stop the import, they are listed
+in the report (printed, or saved as JSON with --report).
+
+Usage:
+    import-patients patients.csv --chunk-size 1000 --report report.json
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+from typing import AsyncIterator, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.apps.patients.infrastructure.import_readers import (
+    ImportFileFormat,
+    read_import_rows,
+)
+from src.apps.patients.services.patients_import_service import (
+    DEFAULT_CHUNK_SIZE,
+    PatientsImportService,
+)
+from src.apps.patients.uow import UnitOfWorkImpl
+from src.core.database.session import ScopedAsyncSession
+from src.core.logger import LoggerService
+from src.core.settings import project_settings
+
+READ_BLOCK_SIZE = 1 << 20  # 1 MiB
+
+
+async def read_file(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as file:
+        while block := await asyncio.to_thread(file.read, READ_BLOCK_SIZE):
+            yield block
+
+
+def detect_format(path: Path) -> ImportFileFormat:
+    if path.suffix.lower() in (".ndjson", ".jsonl"):
+        return ImportFileFormat.NDJSON
+
+    return ImportFileFormat.CSV
+
+
+async def run(
+    path: Path,
+    file_format: ImportFileFormat,
+    chunk_size: int,
+    report_path: Optional[Path],
+):
+    engine = create_async_engine(project_settings.DATABASE_URI)
+    db_session = ScopedAsyncSession(
+        async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    )
+    logger = LoggerService("import-patients")
+    service = PatientsImportService(
+        uow=UnitOfWorkImpl(session=db_session, logger=logger),
+        logger=logger,
+        chunk_size=chunk_size,
+    )
+
+    print(f"→ Importing {path} ({file_format.value}), chunk size: {chunk_size}")
+    started_at = time.perf_counter()
+    try:
+        async with db_session.scope():
+            report = await service.import_patients(
+                read_import_rows(read_file(path), file_format)
+            )
+    finally:
+        await engine.dispose()
+    duration = time.perf_counter() - started_at
+
+    rate = report.imported / duration * 60 if duration else 0
+    print(
+        f"Rows: {report.total_rows}, imported: {report.imported}, "
+        f"failed: {report.failed} in {duration:.1f} s ({rate:.0f} patients/min)"
+    )
+    if report_path is not None:
+        report_path.write_text(report.model_dump_json(indent=2), encoding="utf-8")
+        print(f"Report saved to {report_path}")
+    else:
+        for row_error in report.errors:
+            print(f"  row {row_error.row}: {'; '.join(row_error.errors)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import of patients")
+    parser.add_argument("path", type=Path)
+    parser.add_argument(
+        "--format",
+        choices=[file_format.value for file_format in ImportFileFormat],
+        help="File format (by default detected from the file extension)",
+    )
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--report", type=Path, help="Save the JSON report to the file")
+    args = parser.parse_args()
+
+    file_format = (
+        ImportFileFormat(args.format) if args.format else detect_format(args.path)
+    )
+    asyncio.run(run(args.path, file_format, args.chunk_size, args.report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+CLI for replaying a recorded dump of the users topic through the consumer.
+Runs as poetry-script module.
+
+Feeds the events of the dump to `UsersKafkaConsumerImpl` as fast as it polls
+them (no broker involved), so the users are stored into the configured
+database as in production, and prints the consumer metrics: the ceiling of
+its throughput for the given batch size and linger. Run it against a local
+database, the users of the dump are written to it.
+
+The dump holds an event (the JSON value of a message) per line, e.g.:
+    kcat -C -b kafka:9092 -t auth_service-registry_service -e -f '%s\\n' > users.jsonl
+
+Usage:
+    replay-users-topic users.jsonl --batch-size 500 --linger-ms 200
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, List
+
+from aiokafka import ConsumerRecord, TopicPartition
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.apps.users.infrastructure.kafka.consumer_metrics import ConsumerMetrics
+from src.apps.users.infrastructure.kafka.kafka_consumer import UsersKafkaConsumerImpl
+from src.apps.users.infrastructure.repositories.user_repository import (
+    SQLAlchemyUserRepository,
+)
+from src.apps.users.services.user_service import UserService
+from src.apps.users.uow import UsersUnitOfWorkImpl
+from src.core.database.session import ScopedAsyncSession
+from src.core.logger import LoggerService
+from src.core.settings import project_settings
+from src.shared.infrastructure.auth_service_adapter.permissions_cache import (
+    PermissionsCache,
+)
+
+TOPIC = "users-replay"
+
+
+class DumpConsumer:
+    """
+    Serves the dump as a single partition in place of `AIOKafkaConsumer`.
+    """
+
+    def __init__(self, events: List[Dict[str, Any]]):
+        self._partition = TopicPartition(TOPIC, 0)
+        self._records = [
+            ConsumerRecord(
+                topic=TOPIC,
+                partition=0,
+                offset=offset,
+                timestamp=0,
+                timestamp_type=0,
+                key=None,
+                value=event,
+                checksum=None,
+                serialized_key_size=0,
+                serialized_value_size=0,
+                headers=(),
+            )
+            for offset, event in enumerate(events)
+        ]
+        self._position = 0
+        self.committed = 0
+        self.done = asyncio.Event()
+
+    async def getmany(self, timeout_ms: int, max_records: int):
+        if self._position >= len(self._records):
+            await asyncio.sleep(timeout_ms / 1000)
+            return {}
+
+        records = self._records[self._position : self._position + max_records]
+        self._position += len(records)
+
+        return {self._partition: records}
+
+    async def commit(self) -> None:
+        self.committed = self._position
+        if self.committed == len(self._records):
+            self.done.set()
+
+    def highwater(self, partition: TopicPartition) -> int:
+        return len(self._records)
+
+    async def stop(self) -> None:
+        pass
+
+
+def read_dump(path: str) -> List[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as dump:
+        return [json.loads(line) for line in dump if line.strip()]
+
+
+async def run(path: str, batch_size: int, linger_ms: int):
+    events = read_dump(path)
+    if not events:
+        raise SystemExit("The dump is empty")
+
+    engine = create_async_engine(project_settings.DATABASE_URI)
+    db_session = ScopedAsyncSession(
+        async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+    )
+    logger = LoggerService("replay")
+    metrics = ConsumerMetrics()
+    users_consumer = UsersKafkaConsumerImpl(
+        user_service=UserService(
+            UsersUnitOfWorkImpl(db_session, logger),
+            SQLAlchemyUserRepository(db_session, logger),
+            logger,
+        ),
+        bootstrap_servers=[],
+        topic=TOPIC,
+        logger=logger,
+        db_session=db_session,
+        permissions_cache=PermissionsCache(),
+        batch_size=batch_size,
+        linger_ms=linger_ms,
+        metrics=metrics,
+    )
+    dump_consumer = DumpConsumer(events)
+    users_consumer.consumer = dump_consumer
+    users_consumer._running = True
+    print(f"→ Replaying {len(events)} events, batch size: {batch_size}, linger: {linger_ms} ms")
+
+    try:
+        started_at = time.perf_counter()
+        consuming = asyncio.create_task(users_consumer.consume())
+        await dump_consumer.done.wait()
+        elapsed = time.perf_counter() - started_at
+        await users_consumer.stop()
+        await consuming
+    finally:
+        await db_session.dispose()
+        await engine.dispose()
+
+    stats = metrics.stats()
+    latency = stats["handler_latency_ms"]
+    print(f"{'events':<28}{len(events):>12}")
+    print(f"{'batches':<28}{stats['batches']:>12}")
+    print(f"{'avg batch size':<28}{stats['batch_size']['avg']:>12.1f}")
+    print(f"{'elapsed, s':<28}{elapsed:>12.3f}")
+    print(f"{'events/s':<28}{len(events) / elapsed:>12.1f}")
+    print(f"{'avg batch latency, ms':<28}{latency['avg']:>12.2f}")
+    print(f"{'max batch latency, ms':<28}{latency['max']:>12.2f}")
+    print(f"{'errors':<28}{json.dumps(stats['errors']):>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Users topic replay through the consumer")
+    parser.add_argument("dump", help="File with an event (JSON) per line")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--linger-ms", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.dump, args.batch_size, args.linger_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,19 @@
 from dependency_injector import containers, providers
 from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.apps.assets_journal.container import AssetsJournalContainer
 from src.apps.catalogs.container import CatalogsContainer
+from src.apps.catalogs.infrastructure.catalog_cache import CatalogCache
 from src.apps.medical_staff_journal.container import MedicalStaffJournalContainer
 from src.apps.patients.container import PatientsContainer
 from src.apps.platform_rules.container import PlatformRulesContainer
+from src.apps.platform_rules.infrastructure.platform_rules_store import (
+    PlatformRulesStore,
+)
 from src.apps.registry.container import RegistryContainer
 from src.apps.users.container import UsersContainer
+from src.core.database.session import ScopedAsyncSession
 from src.core.logger import LoggerService
 from src.core.resources.fastapi_resource import FastAPIResource
 from src.core.resources.httpx_resource import HttpxClientResource
@@ -18,6 +24,9 @@ from src.core.utils import get_exception_handlers, get_routers
 from src.shared.infrastructure.auth_service_adapter.container import (
     AuthServiceContainer,
 )
+from src.shared.infrastructure.auth_service_adapter.permissions_cache import (
+    PermissionsCache,
+)
 
 
 class CoreContainer(containers.DeclarativeContainer):
@@ -39,6 +48,17 @@ class CoreContainer(containers.DeclarativeContainer):
         max_overflow=project_settings.MAX_OVERFLOW,
     )
 
+    # Session factory
+    session_factory = providers.Singleton(
+        async_sessionmaker, bind=engine, expire_on_commit=False, class_=AsyncSession
+    )
+
+    # Async session, scoped to the current HTTP request / Kafka message
+    async_db_session = providers.Singleton(
+        ScopedAsyncSession,
+        session_factory=session_factory,
+    )
+
     routers = providers.Callable(get_routers)
     exception_handlers = providers.Callable(get_exception_handlers)
 
@@ -53,6 +73,7 @@ class CoreContainer(containers.DeclarativeContainer):
         debug=config.API_ENABLE_DOCS,
         enable_docs=config.API_ENABLE_DOCS,
         backend_cors_origins=config.BACKEND_CORS_ORIGINS,
+        db_session=async_db_session,
     )
 
     # ASGI server
@@ -72,20 +93,44 @@ class CoreContainer(containers.DeclarativeContainer):
         max_connections=config.MAX_CONNECTIONS,
     )
 
+    # Permissions received from the Auth Service (invalidated by the users Kafka consumer)
+    permissions_cache = providers.Singleton(
+        PermissionsCache,
+        ttl_seconds=config.PERMISSIONS_CACHE_TTL,
+        max_size=config.PERMISSIONS_CACHE_MAX_SIZE,
+    )
+
+    # Catalog records (invalidated by the catalog services)
+    catalog_cache = providers.Singleton(
+        CatalogCache,
+        ttl_seconds=config.CATALOG_CACHE_TTL,
+    )
+
+    # Platform rules (invalidated by their writes and the Postgres notifications)
+    platform_rules_store = providers.Singleton(
+        PlatformRulesStore,
+        ttl_seconds=config.PLATFORM_RULES_STORE_TTL,
+    )
+
     # Apps containers
     users_container = providers.Container(
         UsersContainer,
         logger=logger,
-        engine=engine,
+        async_db_session=async_db_session,
+        permissions_cache=permissions_cache,
         kafka_bootstrap_servers=config.kafka.KAFKA_BOOTSTRAP_SERVERS,
         kafka_users_topic=config.kafka.ACTIONS_ON_USERS_KAFKA_TOPIC,
         kafka_group_id=config.kafka.KAFKA_GROUP_ID,
+        kafka_batch_size=config.kafka.USERS_CONSUMER_BATCH_SIZE,
+        kafka_linger_ms=config.kafka.USERS_CONSUMER_LINGER_MS,
     )
 
     platform_rules_container = providers.Container(
         PlatformRulesContainer,
         logger=logger,
+        async_db_session=async_db_session,
         engine=engine,
+        platform_rules_store=platform_rules_store,
     )
 
     medical_staff_journal_container = providers.Container(
@@ -95,70 +140,44 @@ class CoreContainer(containers.DeclarativeContainer):
         logger=logger,
     )
 
-    catalogs_container = providers.Container(
-        CatalogsContainer,
+    patients_container = providers.Container(
+        PatientsContainer,
         logger=logger,
-        engine=engine,
-        # patients_container is below
+        async_db_session=async_db_session,
     )
 
-    patients_container = providers.Container(
-        PatientsContainer,
+    catalogs_container = providers.Container(
+        CatalogsContainer,
         logger=logger,
-        engine=engine,
-        # catalogs are below
+        async_db_session=async_db_session,
+        catalog_cache=catalog_cache,
+        patients_service=patients_container.patients_service,
     )
 
     registry_container = providers.Container(
         RegistryContainer,
         logger=logger,
-        engine=engine,
+        async_db_session=async_db_session,
         user_service=users_container.user_service,
         patients_service=patients_container.patients_service,
         user_repository=users_container.user_repository,
         platform_rules_repository=platform_rules_container.platform_rules_repository,
     )
 
-    # OVERRIDE --------------------------------------------------------------------------------------------------------
-    """
-    Override is needed here because of the cyclic dependency between catalogs container and patients container.
-    """
-    catalogs_container.override(
-        providers.Container(
-            CatalogsContainer,
-            logger=logger,
-            engine=engine,
-            patients_service=patients_container.patients_service,
-        )
-    )
-
-    patients_container.override(
-        providers.Container(
-            PatientsContainer,
-            logger=logger,
-            engine=engine,
-            citizenship_service=catalogs_container.citizenship_catalog_service,
-            nationalities_service=catalogs_container.nationalities_catalog_service,
-            medical_org_service=catalogs_container.medical_organizations_catalog_service,
-            financing_source_service=catalogs_container.financing_sources_catalog_service,
-            patient_context_attributes_service=catalogs_container.patient_context_attributes_service,
-        )
-    )
-    # --------------------------------------------------------------------------------------------------------
-
     # Shared adapters containers
     auth_container = providers.Container(
         AuthServiceContainer,
         httpx_client=httpx_client,
         base_url=config.AUTH_SERVICE_BASE_URL,
         logger=logger,
+        permissions_cache=permissions_cache,
     )
 
     # Assets Journal container
     assets_journal_container = providers.Container(
         AssetsJournalContainer,
         logger=logger,
-        engine=engine,
+        async_db_session=async_db_session,
         patients_service=patients_container.patients_service,
         medical_organizations_catalog_service=catalogs_container.medical_organizations_catalog_service,
     )
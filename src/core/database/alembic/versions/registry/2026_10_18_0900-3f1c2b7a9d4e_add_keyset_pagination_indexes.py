@@ -0,0 +1,50 @@
+"""add keyset pagination indexes
+
+Revision ID: 3f1c2b7a9d4e
+Revises: a07c66b626f7, aaaaecb39ecf
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2b7a9d4e'
+down_revision: Union[str, Sequence[str], None] = ('a07c66b626f7', 'aaaaecb39ecf')
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_schedule_days_date_id', 'schedule_days', ['date', 'id'], unique=False
+    )
+    op.create_index(
+        'ix_appointments_schedule_day_id_time_id',
+        'appointments',
+        ['schedule_day_id', 'time', 'id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_patients_created_at_id', 'patients', ['created_at', 'id'], unique=False
+    )
+    op.create_index(
+        'ix_stationary_assets_sort_date_id',
+        'stationary_assets',
+        [sa.text('coalesce(reg_date, created_at) DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_stationary_assets_sort_date_id', table_name='stationary_assets')
+    op.drop_index('ix_patients_created_at_id', table_name='patients')
+    op.drop_index(
+        'ix_appointments_schedule_day_id_time_id', table_name='appointments'
+    )
+    op.drop_index('ix_schedule_days_date_id', table_name='schedule_days')
@@ -0,0 +1,64 @@
+"""add stationary asset statistics indexes
+
+Revision ID: 8b2d4e6f1a3c
+Revises: 3f1c2b7a9d4e
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2d4e6f1a3c'
+down_revision: Union[str, Sequence[str], None] = '3f1c2b7a9d4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_stationary_assets_reg_date_statistics',
+        'stationary_assets',
+        ['reg_date'],
+        unique=False,
+        postgresql_include=[
+            'created_at',
+            'organization_id',
+            'specialization',
+            'area',
+            'has_confirm',
+            'has_refusal',
+            'has_files',
+        ],
+    )
+    op.create_index(
+        'ix_stationary_assets_pending_reg_date',
+        'stationary_assets',
+        ['reg_date'],
+        unique=False,
+        postgresql_where=sa.text('NOT has_confirm AND NOT has_refusal'),
+    )
+    op.create_index(
+        'ix_stationary_assets_refused_reg_date',
+        'stationary_assets',
+        ['reg_date'],
+        unique=False,
+        postgresql_where=sa.text('has_refusal'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'ix_stationary_assets_refused_reg_date', table_name='stationary_assets'
+    )
+    op.drop_index(
+        'ix_stationary_assets_pending_reg_date', table_name='stationary_assets'
+    )
+    op.drop_index(
+        'ix_stationary_assets_reg_date_statistics', table_name='stationary_assets'
+    )
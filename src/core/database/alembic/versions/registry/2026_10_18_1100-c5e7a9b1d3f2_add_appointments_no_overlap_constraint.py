@@ -0,0 +1,62 @@
+"""add appointments no overlap constraint
+
+Revision ID: c5e7a9b1d3f2
+Revises: 8b2d4e6f1a3c
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e7a9b1d3f2'
+down_revision: Union[str, Sequence[str], None] = '8b2d4e6f1a3c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Fails if the table already contains overlapping non-cancelled appointments:
+    they have to be resolved (e.g. cancelled) before the upgrade. The end times
+    of the appointments running past midnight are clamped to the end of the day.
+    """
+    # GiST operator class for the equality on schedule_day_id (uuid)
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+
+    op.add_column('appointments', sa.Column('end_time', sa.Time(), nullable=True))
+    op.execute(
+        """
+        UPDATE appointments
+        SET end_time = appointments.time + LEAST(
+            make_interval(mins => schedules.appointment_interval),
+            TIME '23:59:59.999999' - appointments.time
+        )
+        FROM schedule_days
+        JOIN schedules ON schedules.id = schedule_days.schedule_id
+        WHERE schedule_days.id = appointments.schedule_day_id
+        """
+    )
+    op.alter_column('appointments', 'end_time', nullable=False)
+
+    op.execute(
+        """
+        ALTER TABLE appointments
+        ADD CONSTRAINT ex_appointments_schedule_day_id_time_range
+        EXCLUDE USING gist (
+            schedule_day_id WITH =,
+            tsrange(DATE '2000-01-01' + time, DATE '2000-01-01' + end_time) WITH &&
+        )
+        WHERE (status <> 'CANCELLED')
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('ex_appointments_schedule_day_id_time_range', 'appointments')
+    op.drop_column('appointments', 'end_time')
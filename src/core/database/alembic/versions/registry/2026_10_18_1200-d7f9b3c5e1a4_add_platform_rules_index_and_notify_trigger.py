@@ -0,0 +1,62 @@
+"""add platform rules index and notify trigger
+
+Revision ID: d7f9b3c5e1a4
+Revises: c5e7a9b1d3f2
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7f9b3c5e1a4'
+down_revision: Union[str, Sequence[str], None] = 'c5e7a9b1d3f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Every write to the platform rules notifies the 'platform_rules_changed'
+    channel (on commit), so the instances of the service reload their
+    in-process platform rules store.
+    """
+    op.create_index(
+        'ix_platform_rules_rule_data',
+        'platform_rules',
+        ['rule_data'],
+        unique=False,
+        postgresql_using='gin',
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_platform_rules_changed() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('platform_rules_changed', TG_OP);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER platform_rules_changed
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON platform_rules
+        FOR EACH STATEMENT EXECUTE FUNCTION notify_platform_rules_changed()
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('DROP TRIGGER IF EXISTS platform_rules_changed ON platform_rules')
+    op.execute('DROP FUNCTION IF EXISTS notify_platform_rules_changed()')
+    op.drop_index(
+        'ix_platform_rules_rule_data',
+        table_name='platform_rules',
+        postgresql_using='gin',
+    )
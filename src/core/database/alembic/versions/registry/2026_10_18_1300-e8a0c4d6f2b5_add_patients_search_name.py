@@ -0,0 +1,54 @@
+"""add patients search name
+
+Revision ID: e8a0c4d6f2b5
+Revises: d7f9b3c5e1a4
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8a0c4d6f2b5'
+down_revision: Union[str, Sequence[str], None] = 'd7f9b3c5e1a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Adding the stored generated column rewrites the patients table,
+    so the upgrade holds an exclusive lock on it for the time of the rewrite.
+    """
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    op.add_column(
+        'patients',
+        sa.Column(
+            'search_name',
+            sa.Text(),
+            sa.Computed(
+                "lower(last_name || ' ' || first_name || coalesce(' ' || middle_name, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'ix_patients_search_name',
+        'patients',
+        ['search_name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'search_name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_patients_search_name', table_name='patients', postgresql_using='gin')
+    op.drop_column('patients', 'search_name')
@@ -0,0 +1,53 @@
+"""add stationary assets filter indexes
+
+Revision ID: f1b3d5a7c9e2
+Revises: e8a0c4d6f2b5
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1b3d5a7c9e2'
+down_revision: Union[str, Sequence[str], None] = 'e8a0c4d6f2b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_INDEXES = (
+    ('ix_stationary_assets_specialization_trgm', 'stationary_assets', 'specialization'),
+    ('ix_stationary_assets_specialist_trgm', 'stationary_assets', 'specialist'),
+    ('ix_stationary_assets_stay_outcome_trgm', 'stationary_assets', 'stay_outcome'),
+    ('ix_patients_iin_trgm', 'patients', 'iin'),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    The pg_trgm extension is created by the previous revision.
+    """
+    op.create_index(
+        'ix_stationary_assets_patient_id',
+        'stationary_assets',
+        ['patient_id'],
+        unique=False,
+    )
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(TRIGRAM_INDEXES):
+        op.drop_index(name, table_name=table, postgresql_using='gin')
+    op.drop_index('ix_stationary_assets_patient_id', table_name='stationary_assets')
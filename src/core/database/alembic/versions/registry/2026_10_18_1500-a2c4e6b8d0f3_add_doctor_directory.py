@@ -0,0 +1,137 @@
+"""add doctor directory
+
+Revision ID: a2c4e6b8d0f3
+Revises: f1b3d5a7c9e2
+Create Date: 2026-10-18 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2c4e6b8d0f3'
+down_revision: Union[str, Sequence[str], None] = 'f1b3d5a7c9e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SERVED_TYPE_COLUMNS = (
+    'served_patient_types',
+    'served_referral_types',
+    'served_referral_origins',
+    'served_payment_types',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    The tables are filled from the current users, afterwards they are
+    maintained by the users service on the Kafka events.
+    """
+    op.create_table(
+        'doctor_specializations',
+        sa.Column('doctor_id', sa.UUID(), nullable=False),
+        sa.Column('name_key', sa.Text(), nullable=False),
+        sa.Column('name', sa.Text(), nullable=False),
+        sa.Column('specialization_id', sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ['doctor_id'], ['users.id'],
+            name=op.f('fk_doctor_specializations_doctor_id_users'),
+            ondelete='CASCADE',
+        ),
+        sa.PrimaryKeyConstraint('doctor_id', 'name_key', name=op.f('pk_doctor_specializations')),
+    )
+    op.create_index(
+        'ix_doctor_specializations_name_key',
+        'doctor_specializations',
+        ['name_key', 'doctor_id'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_doctor_specializations_name_key_trgm',
+        'doctor_specializations',
+        ['name_key'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name_key': 'gin_trgm_ops'},
+    )
+
+    op.create_table(
+        'doctor_areas',
+        sa.Column('doctor_id', sa.UUID(), nullable=False),
+        sa.Column('area_number', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['doctor_id'], ['users.id'],
+            name=op.f('fk_doctor_areas_doctor_id_users'),
+            ondelete='CASCADE',
+        ),
+        sa.PrimaryKeyConstraint('doctor_id', name=op.f('pk_doctor_areas')),
+    )
+    op.create_index(
+        op.f('ix_doctor_areas_area_number'), 'doctor_areas', ['area_number'], unique=False
+    )
+
+    op.create_table(
+        'doctor_served_types',
+        sa.Column('doctor_id', sa.UUID(), nullable=False),
+        sa.Column('kind', sa.String(length=32), nullable=False),
+        sa.Column('value', sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['doctor_id'], ['users.id'],
+            name=op.f('fk_doctor_served_types_doctor_id_users'),
+            ondelete='CASCADE',
+        ),
+        sa.PrimaryKeyConstraint('doctor_id', 'kind', 'value', name=op.f('pk_doctor_served_types')),
+    )
+    op.create_index(
+        'ix_doctor_served_types_kind_value',
+        'doctor_served_types',
+        ['kind', 'value', 'doctor_id'],
+        unique=False,
+    )
+
+    op.execute(
+        """
+        INSERT INTO doctor_specializations (doctor_id, name_key, name, specialization_id)
+        SELECT users.id, lower(trim(specialization.value ->> 'name')),
+            specialization.value ->> 'name', specialization.value ->> 'id'
+        FROM users, jsonb_array_elements(users.specializations) AS specialization
+        WHERE lower(trim(specialization.value ->> 'name')) <> ''
+        ON CONFLICT DO NOTHING
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO doctor_areas (doctor_id, area_number)
+        SELECT users.id, CAST(users.attachment_data ->> 'area_number' AS INTEGER)
+        FROM users
+        WHERE (users.attachment_data ->> 'area_number') ~ '^[0-9]{1,9}$'
+        """
+    )
+    for column in SERVED_TYPE_COLUMNS:
+        op.execute(
+            f"""
+            INSERT INTO doctor_served_types (doctor_id, kind, value)
+            SELECT users.id, '{column}', served_type.value
+            FROM users, jsonb_array_elements_text(users.{column}) AS served_type
+            ON CONFLICT DO NOTHING
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_doctor_served_types_kind_value', table_name='doctor_served_types')
+    op.drop_table('doctor_served_types')
+    op.drop_index(op.f('ix_doctor_areas_area_number'), table_name='doctor_areas')
+    op.drop_table('doctor_areas')
+    op.drop_index(
+        'ix_doctor_specializations_name_key_trgm',
+        table_name='doctor_specializations',
+        postgresql_using='gin',
+    )
+    op.drop_index('ix_doctor_specializations_name_key', table_name='doctor_specializations')
+    op.drop_table('doctor_specializations')
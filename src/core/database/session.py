@@ -0,0 +1,71 @@
+import contextlib
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+_current_session: ContextVar[Optional[AsyncSession]] = ContextVar(
+    "current_db_session", default=None
+)
+
+
+class ScopedAsyncSession:
+    """
+    Proxy to the AsyncSession of the current session scope.
+
+    Repositories and units of work keep a reference to this object and every
+    attribute access is forwarded to the session opened for the current HTTP
+    request / Kafka message, so concurrent scopes use separate connections
+    from the engine pool instead of sharing a single session.
+
+    Outside an open scope (startup code, CLI scripts) a process-wide fallback
+    session is used.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
+        self._session_factory = session_factory
+        self._fallback_session: Optional[AsyncSession] = None
+
+    def __call__(self) -> AsyncSession:
+        session = _current_session.get()
+        if session is not None:
+            return session
+
+        if self._fallback_session is None:
+            self._fallback_session = self._session_factory()
+
+        return self._fallback_session
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self(), name)
+
+    @property
+    def is_scoped(self) -> bool:
+        return _current_session.get() is not None
+
+    @contextlib.asynccontextmanager
+    async def scope(self) -> AsyncIterator[AsyncSession]:
+        """
+        Open a new session for the enclosed block and close it on exit.
+
+        The session is created eagerly so that child tasks spawned inside the
+        block (which copy the current context) share it. Nested scopes reuse
+        the outer session.
+        """
+        if self.is_scoped:
+            yield self()
+            return
+
+        session = self._session_factory()
+        token = _current_session.set(session)
+        try:
+            yield session
+        finally:
+            _current_session.reset(token)
+            await session.close()
+
+    async def dispose(self) -> None:
+        """Close the fallback session, if it was ever opened."""
+        if self._fallback_session is not None:
+            await self._fallback_session.close()
+            self._fallback_session = None
@@ -6,6 +6,9 @@ import typing
 from types import FrameType
 from typing import Any
 
+from src.apps.platform_rules.infrastructure.platform_rules_listener import (
+    PlatformRulesListener,
+)
 from src.apps.users.infrastructure.kafka.kafka_consumer import UsersKafkaConsumerImpl
 from src.core.core_container import CoreContainer
 from src.core.settings import Settings
@@ -30,6 +33,7 @@ class Entrypoint:
         self._signal_event = asyncio.Event()
 
         self._users_kafka_consumer: UsersKafkaConsumerImpl | None = None
+        self._platform_rules_listener: PlatformRulesListener | None = None
         self._uvicorn_server: Any = None
 
         # Kafka consumer & Uvicorn tasks
@@ -50,6 +54,8 @@ class Entrypoint:
     async def startup(self) -> None:
         await asyncify(self._container.init_resources())
         wire_subcontainers(self._container)
+        await self.preload_catalog_cache()
+        await self.start_platform_rules_store()
 
         # Get resource-objects
         self._users_kafka_consumer = (
@@ -66,6 +72,62 @@ class Entrypoint:
         )
         self._asgi_server_task = asyncio.create_task(self._uvicorn_server.serve())
 
+    async def preload_catalog_cache(self) -> None:
+        catalogs_container = self._container.catalogs_container()
+        catalog_services = [
+            catalogs_container.citizenship_catalog_service,
+            catalogs_container.nationalities_catalog_service,
+            catalogs_container.financing_sources_catalog_service,
+            catalogs_container.patient_context_attributes_service,
+            catalogs_container.medical_organizations_catalog_service,
+        ]
+        logger = self._container.logger()
+        db_session = await self._container.async_db_session()
+
+        # The cache is read-through, so the service can start with an empty one
+        async with db_session.scope():
+            for service_provider in catalog_services:
+                service = await asyncify(service_provider())
+                try:
+                    loaded = await service.preload_cache()
+                except Exception as err:
+                    logger.error(
+                        f"Catalog cache: preload by {type(service).__name__} "
+                        f"failed: {err}"
+                    )
+                    continue
+
+                logger.info(
+                    f"Catalog cache: {loaded} records preloaded by "
+                    f"{type(service).__name__}"
+                )
+
+    async def start_platform_rules_store(self) -> None:
+        platform_rules_container = self._container.platform_rules_container()
+        logger = self._container.logger()
+        db_session = await self._container.async_db_session()
+
+        # The store is read-through, so the service can start with an empty one
+        async with db_session.scope():
+            repository = await asyncify(
+                platform_rules_container.platform_rules_repository()
+            )
+            try:
+                loaded = await repository.preload()
+            except Exception as err:
+                logger.error(f"Platform rules store: preload failed: {err}")
+            else:
+                logger.info(f"Platform rules store: {loaded} rules preloaded")
+
+        # Without notifications, changes of other instances are picked up after the TTL
+        self._platform_rules_listener = await asyncify(
+            platform_rules_container.platform_rules_listener()
+        )
+        try:
+            await self._platform_rules_listener.start()
+        except Exception as err:
+            logger.error(f"Platform rules store: listener failed to start: {err}")
+
     async def shutdown(self) -> None:
         # Stop Kafka consumer
         if self._users_kafka_consumer is not None:
@@ -83,6 +145,12 @@ class Entrypoint:
             with contextlib.suppress(asyncio.CancelledError):
                 await self._users_kafka_consumer_task
 
+        # Stop listening to the platform rules changes
+        if self._platform_rules_listener is not None:
+            await self._platform_rules_listener.stop()
+
+        db_session = await self._container.async_db_session()
+        await db_session.dispose()
         await asyncify(self._container.shutdown_resources())
         unwire_subcontainers(self._container)
 
@@ -0,0 +1,24 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.core.database.session import ScopedAsyncSession
+
+
+class DBSessionScopeMiddleware:
+    """
+    Opens a dedicated database session for every HTTP request.
+
+    Implemented as a pure ASGI middleware (not BaseHTTPMiddleware) so the
+    session scope is set in the same context the endpoint runs in.
+    """
+
+    def __init__(self, app: ASGIApp, db_session: ScopedAsyncSession):
+        self.app = app
+        self.db_session = db_session
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async with self.db_session.scope():
+            await self.app(scope, receive, send)
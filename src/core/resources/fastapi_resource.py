@@ -3,6 +3,8 @@ from typing import Any, Dict, List
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from src.core.database.session import ScopedAsyncSession
+from src.core.middlewares.db_session_middleware import DBSessionScopeMiddleware
 from src.core.middlewares.i18n_middleware import LocalesTranslationMiddleware
 
 
@@ -15,6 +17,7 @@ def FastAPIResource(
     debug: bool,
     enable_docs: bool,
     backend_cors_origins: List[str],
+    db_session: ScopedAsyncSession,
 ) -> FastAPI:
     app = FastAPI(
         title=project_name,
@@ -35,6 +38,9 @@ def FastAPIResource(
             allow_headers=["*"],
         )
 
+    # DB session per request
+    app.add_middleware(DBSessionScopeMiddleware, db_session=db_session)
+
     # i18n middleware
     app.add_middleware(LocalesTranslationMiddleware)
 
@@ -8,6 +8,10 @@ class KafkaSettings(BaseSettings):
     KAFKA_BOOTSTRAP_SERVERS: List[str] = []
     ACTIONS_ON_USERS_KAFKA_TOPIC: str = "auth_service.user.actions"
     KAFKA_GROUP_ID: str = "registry-service-users-group"
+    # Users' events are stored in batches of up to this size...
+    USERS_CONSUMER_BATCH_SIZE: int = 500
+    # ...collected for at most this long after the first event
+    USERS_CONSUMER_LINGER_MS: int = 200
 
 
 class Settings(BaseSettings):
@@ -34,6 +38,12 @@ class Settings(BaseSettings):
     LANGUAGES: Set[str] = {"ru", "kk", "en"}
     DEFAULT_LANGUAGE: str = "ru"
 
+    # Catalogs params
+    CATALOG_CACHE_TTL: int = 300  # seconds
+
+    # Platform rules params
+    PLATFORM_RULES_STORE_TTL: int = 300  # seconds
+
     # httpx params
     TIMEOUT: int = 5
     MAX_KEEPALIVE_CONNECTIONS: int = 10
@@ -41,6 +51,8 @@ class Settings(BaseSettings):
 
     # Auth Service params
     AUTH_SERVICE_BASE_URL: str = "https://auth-service-app-dev:8001/api/v1"
+    PERMISSIONS_CACHE_TTL: int = 60  # seconds
+    PERMISSIONS_CACHE_MAX_SIZE: int = 10_000
 
     # RPN Integration Service params
     RPN_INTEGRATION_SERVICE_BASE_URL: str = "https://rpn-integration-service:8010"
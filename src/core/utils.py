@@ -3,6 +3,9 @@ from typing import Any, Awaitable, Dict, List, TypeVar
 
 from dependency_injector import containers, providers
 
+from src.apps.catalogs.infrastructure.api.catalog_cache_routes import (
+    catalog_cache_router,
+)
 from src.apps.catalogs.infrastructure.api.citizenship_catalog_routes import (
     citizenship_catalog_router,
 )
@@ -29,10 +32,14 @@ from src.apps.platform_rules.infrastructure.api.platform_rules_routes import (
     platform_rules_router,
 )
 from src.apps.registry.infrastructure.api.appointment_routes import appointments_router
+from src.apps.registry.infrastructure.api.free_slots_routes import free_slots_router
 from src.apps.registry.infrastructure.api.schedule_days_routes import (
     schedule_days_router,
 )
 from src.apps.registry.infrastructure.api.schedule_routes import schedule_router
+from src.apps.users.infrastructure.api.kafka_consumer_routes import (
+    users_kafka_consumer_router,
+)
 from src.shared.exception_handlers import (
     application_error_handler,
     auth_service_error_handler,
@@ -48,6 +55,9 @@ from src.shared.exceptions import (
 from src.apps.assets_journal.infrastructure.api.stationary_asset_routes import (
     stationary_assets_router,
 )
+from src.shared.infrastructure.auth_service_adapter.api.permissions_cache_routes import (
+    permissions_cache_router,
+)
 
 T = TypeVar("T")
 
@@ -73,6 +83,10 @@ def get_routers() -> List[Dict[str, Any]]:
             "router": appointments_router,
             "tag": ["Appointments routes"],
         },
+        {
+            "router": free_slots_router,
+            "tag": ["Free slots routes"],
+        },
         {
             "router": medical_staff_journal_router,
             "tag": ["Medical staff journal routes"],
@@ -115,6 +129,20 @@ def get_routers() -> List[Dict[str, Any]]:
             "router": stationary_assets_router,
             "tag": ["Stationary assets routes"],
         },
+
+        # Monitoring routes
+        {
+            "router": permissions_cache_router,
+            "tag": ["Monitoring routes"],
+        },
+        {
+            "router": catalog_cache_router,
+            "tag": ["Monitoring routes"],
+        },
+        {
+            "router": users_kafka_consumer_router,
+            "tag": ["Monitoring routes"],
+        },
     ]
 
     return routers
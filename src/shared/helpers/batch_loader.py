@@ -0,0 +1,93 @@
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+class BatchLoader(Generic[KeyT, ValueT]):
+    """
+    DataLoader-style helper that resolves entities by keys in batches.
+
+    Keys requested via `load` within the same event-loop tick, or passed
+    together to `load_many`, are resolved with a single call of
+    `batch_load_function` (typically a repository `get_many_by_ids`, i.e. one
+    `IN (...)` query). Resolved entities are cached for the lifetime of the
+    loader, so a loader should be created per request / per service call.
+    """
+
+    def __init__(
+        self,
+        batch_load_function: Callable[[List[KeyT]], Awaitable[Iterable[ValueT]]],
+        key_getter: Callable[[ValueT], KeyT] = lambda entity: entity.id,
+    ):
+        self._batch_load_function = batch_load_function
+        self._key_getter = key_getter
+        self._cache: Dict[KeyT, Optional[ValueT]] = {}
+        self._pending: Dict[KeyT, asyncio.Future] = {}
+        self._dispatch_task: Optional[asyncio.Task] = None
+
+    async def load(self, key: KeyT) -> Optional[ValueT]:
+        if key in self._cache:
+            return self._cache[key]
+
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                # Dispatch once the currently scheduled coroutines had a chance to add their keys
+                self._dispatch_task = loop.create_task(self._dispatch())
+            future = loop.create_future()
+            self._pending[key] = future
+
+        return await future
+
+    async def load_many(self, keys: Iterable[KeyT]) -> Dict[KeyT, ValueT]:
+        """
+        Resolve all keys at once and return a map of the found entities.
+        Keys without a matching entity are omitted from the result.
+        """
+        keys = [key for key in dict.fromkeys(keys) if key is not None]
+        missing_keys = [key for key in keys if key not in self._cache]
+        if missing_keys:
+            await self._resolve(missing_keys)
+
+        return {
+            key: self._cache[key] for key in keys if self._cache.get(key) is not None
+        }
+
+    def prime(self, key: KeyT, value: ValueT) -> None:
+        self._cache[key] = value
+
+    async def _dispatch(self) -> None:
+        pending, self._pending = self._pending, {}
+        try:
+            await self._resolve(list(pending))
+        except Exception as err:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        for key, future in pending.items():
+            if not future.done():
+                future.set_result(self._cache.get(key))
+
+    async def _resolve(self, keys: List[KeyT]) -> None:
+        entities: Iterable[Any] = await self._batch_load_function(keys)
+        for entity in entities:
+            self._cache[self._key_getter(entity)] = entity
+
+        for key in keys:
+            self._cache.setdefault(key, None)
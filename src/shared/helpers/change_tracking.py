@@ -0,0 +1,39 @@
+from typing import Any, FrozenSet, Optional, Set
+
+_MISSING = object()
+
+
+class ChangeTrackingMixin:
+    """
+    Tracks the public attributes of a domain object assigned with a different
+    value since it was built (or since `mark_clean`), so repositories write only
+    the changed columns and skip the updates that change nothing.
+
+    Tracking starts when the class calls `mark_clean` at the end of `__init__`.
+    Values are compared on assignment: a mutable value (e.g. a JSONB list)
+    modified in place is not detected, it has to be assigned anew.
+    """
+
+    __slots__ = ("_changed_fields",)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        changed_fields: Optional[Set[str]] = getattr(self, "_changed_fields", None)
+        if (
+            changed_fields is not None
+            and not name.startswith("_")
+            and name not in changed_fields
+            and getattr(self, name, _MISSING) != value
+        ):
+            changed_fields.add(name)
+
+        super().__setattr__(name, value)
+
+    @property
+    def changed_fields(self) -> FrozenSet[str]:
+        return frozenset(getattr(self, "_changed_fields", None) or ())
+
+    def mark_clean(self) -> None:
+        """
+        Forgets the changes, e.g. after they were written.
+        """
+        object.__setattr__(self, "_changed_fields", set())
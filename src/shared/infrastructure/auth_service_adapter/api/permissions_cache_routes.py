@@ -0,0 +1,26 @@
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+
+from src.shared.infrastructure.auth_service_adapter.api.schemas import (
+    PermissionsCacheStatsSchema,
+)
+from src.shared.infrastructure.auth_service_adapter.container import (
+    AuthServiceContainer,
+)
+from src.shared.infrastructure.auth_service_adapter.permissions_cache import (
+    PermissionsCache,
+)
+
+permissions_cache_router = APIRouter(prefix="/monitoring")
+
+
+@permissions_cache_router.get(
+    "/permissions-cache", response_model=PermissionsCacheStatsSchema
+)
+@inject
+async def get_permissions_cache_stats(
+    permissions_cache: PermissionsCache = Depends(
+        Provide[AuthServiceContainer.permissions_cache]
+    ),
+) -> PermissionsCacheStatsSchema:
+    return PermissionsCacheStatsSchema(**permissions_cache.stats())
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class PermissionsCacheStatsSchema(BaseModel):
+    size: int
+    max_size: int
+    hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+    invalidations: int
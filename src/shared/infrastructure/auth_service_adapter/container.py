@@ -2,24 +2,41 @@ from dependency_injector import containers, providers
 from httpx import AsyncClient
 
 from src.core.logger import LoggerService
+from src.shared.infrastructure.auth_service_adapter.permissions_cache import (
+    PermissionsCache,
+)
 from src.shared.infrastructure.auth_service_adapter.repositories.auth_service_repository import (
     AuthServiceRepositoryImpl,
 )
+from src.shared.infrastructure.auth_service_adapter.repositories.cached_auth_service_repository import (
+    CachedAuthServiceRepositoryImpl,
+)
 
 
 class AuthServiceContainer(containers.DeclarativeContainer):
     wiring_config = containers.WiringConfiguration(
-        packages=["src.shared.dependencies"],
+        packages=[
+            "src.shared.dependencies",
+            "src.shared.infrastructure.auth_service_adapter.api",
+        ],
     )
 
     # Dependencies from the Core container
     httpx_client = providers.Dependency(instance_of=AsyncClient)
     logger = providers.Dependency(instance_of=LoggerService)
     base_url = providers.Dependency(instance_of=str)
+    permissions_cache = providers.Dependency(instance_of=PermissionsCache)
 
-    auth_service_repository = providers.Factory(
+    auth_service_http_repository = providers.Factory(
         AuthServiceRepositoryImpl,
         http_client=httpx_client,
         base_url=base_url,
         logger=logger,
     )
+
+    # Permissions are requested from the Auth Service only on cache misses
+    auth_service_repository = providers.Factory(
+        CachedAuthServiceRepositoryImpl,
+        auth_service_repository=auth_service_http_repository,
+        permissions_cache=permissions_cache,
+    )
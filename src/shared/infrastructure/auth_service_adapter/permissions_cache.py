@@ -0,0 +1,176 @@
+import asyncio
+import base64
+import binascii
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+Permissions = List[Dict[str, Any]]
+
+
+@dataclass
+class _CacheEntry:
+    permissions: Permissions
+    expires_at: float
+    user_id: Optional[str]
+
+
+class PermissionsCache:
+    """
+    In-process cache of the user permissions received from the Auth Service.
+
+    Entries are keyed by a SHA-256 hash of the access token (raw tokens are never
+    stored), live for `ttl_seconds` and are evicted in LRU order once `max_size`
+    is reached. Concurrent misses for the same token share a single request to
+    the Auth Service. All entries of a user can be dropped with `invalidate_user`
+    (e.g. when the Auth Service reports that the user was updated or deleted).
+    """
+
+    def __init__(self, ttl_seconds: float = 60, max_size: int = 10_000):
+        self._ttl_seconds = ttl_seconds
+        self._max_size = max_size
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._keys_by_user: Dict[str, Set[str]] = {}
+        self._in_flight: Dict[str, Tuple[asyncio.Future, Optional[str]]] = {}
+        self._stale_loads: Set[str] = set()
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    async def get_or_load(
+        self,
+        access_token: str,
+        loader: Callable[[str], Awaitable[Permissions]],
+    ) -> Permissions:
+        key = self._hash_token(access_token)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.permissions
+
+            self._remove(key)
+
+        self.misses += 1
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.coalesced += 1
+            return await asyncio.shield(in_flight[0])
+
+        user_id = self._extract_user_id(access_token)
+        future = asyncio.get_running_loop().create_future()
+        # Errors are re-raised to the caller, waiters retrieve them from the future
+        future.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._in_flight[key] = (future, user_id)
+        try:
+            permissions = await loader(access_token)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            raise
+        else:
+            # Results of the loads started before the invalidation are not cached
+            if key not in self._stale_loads:
+                self._store(key, permissions, user_id)
+            future.set_result(permissions)
+        finally:
+            self._in_flight.pop(key, None)
+            self._stale_loads.discard(key)
+
+        return permissions
+
+    def invalidate_user(self, user_id: UUID | str) -> int:
+        """
+        Drop all cached permissions of the user.
+
+        :return: Number of dropped entries
+        """
+        user_id = str(user_id)
+        keys = self._keys_by_user.pop(user_id, set())
+        for key in keys:
+            self._entries.pop(key, None)
+
+        self._stale_loads.update(
+            key
+            for key, (_, loading_user_id) in self._in_flight.items()
+            if loading_user_id == user_id
+        )
+        self.invalidations += len(keys)
+
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_user.clear()
+        self._stale_loads.update(self._in_flight)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _store(self, key: str, permissions: Permissions, user_id: Optional[str]) -> None:
+        self._entries[key] = _CacheEntry(
+            permissions=permissions,
+            expires_at=time.monotonic() + self._ttl_seconds,
+            user_id=user_id,
+        )
+        self._entries.move_to_end(key)
+        if user_id is not None:
+            self._keys_by_user.setdefault(user_id, set()).add(key)
+
+        while len(self._entries) > self._max_size:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None or entry.user_id is None:
+            return
+
+        user_keys = self._keys_by_user.get(entry.user_id)
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._keys_by_user[entry.user_id]
+
+    @staticmethod
+    def _hash_token(access_token: str) -> str:
+        return hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _extract_user_id(access_token: str) -> Optional[str]:
+        """
+        Reads the `sub` claim of a JWT without verifying it. The claim is only used
+        to find the entries to invalidate; permissions themselves always come
+        from the Auth Service.
+        """
+        try:
+            payload = access_token.split(".")[1]
+            padding = "=" * (-len(payload) % 4)
+            claims = json.loads(base64.urlsafe_b64decode(payload + padding))
+        except (IndexError, binascii.Error, ValueError, UnicodeDecodeError):
+            return None
+
+        subject = claims.get("sub") if isinstance(claims, dict) else None
+
+        return str(subject) if subject is not None else None
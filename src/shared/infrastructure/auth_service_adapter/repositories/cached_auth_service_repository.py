@@ -0,0 +1,29 @@
+from typing import Any, Dict, List
+
+from src.shared.infrastructure.auth_service_adapter.interfaces.auth_service_repository_interface import (
+    AuthServiceRepositoryInterface,
+)
+from src.shared.infrastructure.auth_service_adapter.permissions_cache import (
+    PermissionsCache,
+)
+
+
+class CachedAuthServiceRepositoryImpl(AuthServiceRepositoryInterface):
+    """
+    Auth Service repository decorator that serves user permissions
+    from the in-process `PermissionsCache` and calls the wrapped repository
+    only on cache misses.
+    """
+
+    def __init__(
+        self,
+        auth_service_repository: AuthServiceRepositoryInterface,
+        permissions_cache: PermissionsCache,
+    ):
+        self._auth_service_repository = auth_service_repository
+        self._permissions_cache = permissions_cache
+
+    async def get_permissions(self, access_token: str) -> List[Dict[str, Any]]:
+        return await self._permissions_cache.get_or_load(
+            access_token, self._auth_service_repository.get_permissions
+        )
@@ -1,14 +1,18 @@
 import datetime
 import uuid
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple, Type, TypeVar
 
+from pydantic import BaseModel
 from sqlalchemy import UUID as sqlalchemy_UUID
-from sqlalchemy import DateTime, MetaData, func, orm
+from sqlalchemy import DateTime, MetaData, Row, Select, delete, func, orm, update
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio.session import AsyncSession
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, raiseload
+from sqlalchemy.orm.interfaces import ORMOption
 
+from src.core.i18n import _
 from src.core.logger import LoggerService
+from src.shared.exceptions import NoInstanceFoundError
 
 
 class Base(DeclarativeBase):
@@ -52,7 +56,90 @@ class ChangedAtMixin:
     )
 
 
+EntityT = TypeVar("EntityT", bound=Base)
+
+# Rows fetched per round trip when a read-only list is streamed
+READ_ONLY_YIELD_PER = 500
+
+
+def schema_columns(model: Type[Base], schema: Type[BaseModel]) -> Tuple[Any, ...]:
+    """
+    Columns of the model read by the response schema: one per field, named
+    as the field (or its alias), so the rows validate straight into the schema.
+    """
+    return tuple(
+        getattr(model, field.alias or name) for name, field in schema.model_fields.items()
+    )
+
+
 class BaseRepository:
     def __init__(self, async_db_session: AsyncSession, logger: LoggerService):
         self._async_db_session = async_db_session
         self._logger = logger
+
+    async def _fetch_rows(self, query: Select) -> List[Row]:
+        """
+        Fetches the rows of a read-only column projection from a server-side
+        cursor, `READ_ONLY_YIELD_PER` rows per round trip. No ORM entities are
+        built, so nothing enters the identity map of the session.
+        """
+        result = await self._async_db_session.stream(
+            query.execution_options(yield_per=READ_ONLY_YIELD_PER)
+        )
+
+        return [row async for partition in result.partitions() for row in partition]
+
+    async def _update_by_id(
+        self,
+        model: Type[EntityT],
+        entity_id: Any,
+        values: Dict[str, Any],
+        *options: ORMOption,
+    ) -> EntityT:
+        """
+        Updates the given columns of a row with a single UPDATE ... RETURNING
+        and returns the updated entity (the instance of the session, if loaded).
+
+        The relationships of the entity are not loaded (`raiseload`), unless
+        requested with the options: each requested `selectinload` is one more
+        SELECT, so the relationships of the loaded entities should be cut off
+        too, e.g. `selectinload(Model.relation).raiseload("*")`.
+
+        :param options: Loader options of the returned entity, e.g. `selectinload`
+            (joined eager loads are not applied to RETURNING)
+
+        :raises NoInstanceFoundError: If there is no row with the given ID
+        """
+        result = await self._async_db_session.execute(
+            update(model)
+            .where(model.id == entity_id)
+            .values(values)
+            .returning(model)
+            .options(raiseload("*"), *options)
+            .execution_options(populate_existing=True)
+        )
+        entity = result.scalar_one_or_none()
+        if entity is None:
+            raise self._not_found_error(entity_id)
+
+        return entity
+
+    async def _delete_by_id(self, model: Type[Base], entity_id: Any) -> None:
+        """
+        Deletes a row with a single DELETE ... RETURNING,
+        the deleted instance of the session is expunged.
+
+        :raises NoInstanceFoundError: If there is no row with the given ID
+        """
+        result = await self._async_db_session.execute(
+            delete(model).where(model.id == entity_id).returning(model.id)
+        )
+        if result.scalar_one_or_none() is None:
+            raise self._not_found_error(entity_id)
+
+    @staticmethod
+    def _not_found_error(entity_id: Any) -> NoInstanceFoundError:
+        return NoInstanceFoundError(
+            status_code=404,
+            detail=_("Record with ID: %(ID)s not found.") % {"ID": entity_id},
+        )
@@ -0,0 +1,162 @@
+import base64
+import binascii
+import datetime
+import json
+from enum import Enum
+from typing import Any, Callable, Generic, List, NamedTuple, Optional, Sequence, Tuple, TypeVar
+from uuid import UUID
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.core.i18n import _
+from src.shared.exceptions import InvalidPaginationParamsError
+
+ItemT = TypeVar("ItemT")
+
+
+class CursorDirection(str, Enum):
+    NEXT = "next"
+    PREV = "prev"
+
+
+class CursorPage(NamedTuple, Generic[ItemT]):
+    items: List[ItemT]
+    next_cursor: Optional[str]
+    prev_cursor: Optional[str]
+
+
+# Type tags of the values which can be stored in a cursor
+_ENCODERS: dict[type, Tuple[str, Callable[[Any], Any]]] = {
+    datetime.datetime: ("dt", lambda value: value.isoformat()),
+    datetime.date: ("d", lambda value: value.isoformat()),
+    datetime.time: ("t", lambda value: value.isoformat()),
+    UUID: ("u", str),
+}
+_DECODERS: dict[str, Callable[[Any], Any]] = {
+    "dt": datetime.datetime.fromisoformat,
+    "d": datetime.date.fromisoformat,
+    "t": datetime.time.fromisoformat,
+    "u": UUID,
+}
+
+
+def _encode_value(value: Any) -> Any:
+    # datetime is a subclass of date, so the exact type is looked up first
+    encoder = _ENCODERS.get(type(value))
+    if encoder is None:
+        return value
+
+    tag, to_json = encoder
+    return {tag: to_json(value)}
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        ((tag, raw_value),) = value.items()
+        return _DECODERS[tag](raw_value)
+
+    return value
+
+
+def encode_cursor(sort_values: Sequence[Any], direction: CursorDirection) -> str:
+    """
+    Builds an opaque cursor from the sort key values of the boundary row.
+    """
+    payload = {
+        "v": [_encode_value(value) for value in sort_values],
+        "d": direction.value,
+    }
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[List[Any], CursorDirection]:
+    """
+    :raises InvalidPaginationParamsError: If the cursor is malformed
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        values = [_decode_value(value) for value in payload["v"]]
+        direction = CursorDirection(payload["d"])
+    except (binascii.Error, ValueError, KeyError, TypeError, UnicodeDecodeError):
+        raise InvalidPaginationParamsError(
+            status_code=422,
+            detail=_("Invalid pagination cursor."),
+        )
+
+    return values, direction
+
+
+def apply_keyset_pagination(
+    stmt: Select,
+    sort_keys: Sequence[ColumnElement],
+    cursor: Optional[str],
+    limit: int,
+    descending: bool = False,
+) -> Tuple[Select, CursorDirection]:
+    """
+    Applies keyset (seek) pagination to the statement.
+
+    Rows are ordered by `sort_keys` (the last key must be unique, e.g. the primary key)
+    and filtered with a row-value comparison against the cursor, so the DB can seek
+    the index instead of skipping OFFSET rows. One extra row is fetched to find out
+    whether there is a further page.
+    """
+    direction = CursorDirection.NEXT
+    if cursor:
+        cursor_values, direction = decode_cursor(cursor)
+        if len(cursor_values) != len(sort_keys):
+            raise InvalidPaginationParamsError(
+                status_code=422,
+                detail=_("Invalid pagination cursor."),
+            )
+
+        keys, values = tuple_(*sort_keys), tuple_(*cursor_values)
+        moves_forward = (direction == CursorDirection.NEXT) != descending
+        stmt = stmt.where(keys > values if moves_forward else keys < values)
+
+    # Backward pages are read in reverse order and flipped in `build_cursor_page`
+    reverse = (direction == CursorDirection.PREV) != descending
+    stmt = stmt.order_by(
+        *(key.desc() if reverse else key.asc() for key in sort_keys)
+    ).limit(limit + 1)
+
+    return stmt, direction
+
+
+def build_cursor_page(
+    rows: Sequence[Any],
+    sort_values_getter: Callable[[Any], Sequence[Any]],
+    limit: int,
+    cursor: Optional[str],
+    direction: CursorDirection,
+) -> CursorPage:
+    """
+    Trims the extra row fetched by `apply_keyset_pagination` and builds cursors
+    of the neighbour pages from the boundary rows.
+    """
+    rows = list(rows)
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    if direction == CursorDirection.PREV:
+        rows.reverse()
+        has_next, has_prev = bool(cursor), has_more
+    else:
+        has_next, has_prev = has_more, bool(cursor)
+
+    next_cursor = (
+        encode_cursor(sort_values_getter(rows[-1]), CursorDirection.NEXT)
+        if rows and has_next
+        else None
+    )
+    prev_cursor = (
+        encode_cursor(sort_values_getter(rows[0]), CursorDirection.PREV)
+        if rows and has_prev
+        else None
+    )
+
+    return CursorPage(items=rows, next_cursor=next_cursor, prev_cursor=prev_cursor)
@@ -24,9 +24,28 @@ class PaginationParams:
             ge=1,
             description="Page number",
         ),
+        cursor: Optional[str] = Query(
+            default=None,
+            description=(
+                "Keyset pagination cursor (next_cursor / prev_cursor of the previous "
+                "response). Pass an empty value to start cursor mode from the first page; "
+                "`page` is ignored in this mode"
+            ),
+        ),
+        include_total: bool = Query(
+            default=False,
+            description=(
+                "Cursor mode only: also count the filtered records (`total_items`, "
+                "`total_pages`). The count scans all of them, so it is skipped "
+                "by default; the page mode always counts"
+            ),
+        ),
     ):
         self.limit = limit
         self.page = page
+        self.cursor = cursor
+        # Not a bool when the class is instantiated directly (the Query default)
+        self.include_total = include_total is True
 
         if self.limit:
             try:
@@ -40,11 +59,18 @@ class PaginationParams:
             except ValueError as e:
                 raise InvalidPaginationParamsError(status_code=422, detail=str(e))
 
+    @property
+    def is_cursor_mode(self) -> bool:
+        return isinstance(self.cursor, str)
+
 
 class PaginationMetaDataSchema(BaseModel):
     current_page: int
     per_page: int
-    total_items: int
-    total_pages: int
+    # Not counted in cursor mode unless `include_total` is requested
+    total_items: Optional[int]
+    total_pages: Optional[int]
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
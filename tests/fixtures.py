@@ -1,3 +1,4 @@
+import contextlib
 import datetime
 import importlib
 import uuid
@@ -7,9 +8,11 @@ from httpx import AsyncClient
 
 import pytest
 from sqlalchemy.ext.asyncio.session import AsyncSession
+from sqlalchemy.orm import Mapper
 
 from src.apps.catalogs.infrastructure.api.schemas.requests.insurance_info_catalog_request_schemas import \
     AddInsuranceInfoRecordSchema
+from src.apps.catalogs.infrastructure.catalog_cache import CatalogCache
 from src.apps.catalogs.infrastructure.repositories.citizenship_catalog_repository import \
     SQLAlchemyCitizenshipCatalogueRepositoryImpl
 from src.apps.catalogs.infrastructure.repositories.insurance_info_catalog_repository import \
@@ -58,6 +61,7 @@ from src.apps.registry.domain.enums import (
 )
 from src.apps.registry.domain.models.appointment import AppointmentDomain
 from src.apps.registry.domain.models.schedule import ScheduleDomain
+from src.apps.registry.services.appointment_service import AppointmentService
 from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas import (
     CreateScheduleDaySchema,
     UpdateScheduleDaySchema
@@ -72,6 +76,7 @@ from src.apps.registry.infrastructure.db_models.models import (
 )
 from src.apps.users.infrastructure.db_models.models import User
 from src.apps.users.infrastructure.schemas.user_schemas import UserSchema, AttachmentDataModel, SpecializationModel
+from src.apps.users.interfaces.doctor_directory_repository_interface import DoctorDirectoryRepositoryInterface
 from src.apps.users.interfaces.user_repository_interface import UserRepositoryInterface
 from src.core import i18n
 from src.core.i18n import get_locale
@@ -83,10 +88,82 @@ from src.shared.infrastructure.auth_service_adapter.interfaces.auth_service_repo
 
 
 # General fixtures
+def count_queries(*mocked_objects) -> int:
+    """
+    Counts awaited calls of the given AsyncMock objects (or of the AsyncMock
+    attributes of the given mocks). One awaited call == one statement sent by
+    the code under test.
+
+    Queries emitted by SQLAlchemy itself, e.g. the selectin loads of an entity
+    returned by UPDATE ... RETURNING, are not awaited on the mocks and are not
+    counted: pin the loader options of such statements with `loader_strategies`.
+    """
+    total = 0
+    for mocked_object in mocked_objects:
+        if isinstance(mocked_object, AsyncMock):
+            total += mocked_object.await_count
+            continue
+
+        total += sum(
+            child.await_count
+            for child in mocked_object._mock_children.values()
+            if isinstance(child, AsyncMock)
+        )
+
+    return total
+
+
+def loader_strategies(statement) -> Dict[str, str]:
+    """
+    The loader strategies set by the options of an ORM statement, by the path
+    of the relationship, e.g. {"*": "raise", "patient": "selectin", "patient.*": "raise"}.
+    """
+    strategies = {}
+    for option in statement._with_options:
+        # A wildcard option of the statement itself is not bound to an entity
+        for element in getattr(option, "context", (option,)):
+            path = getattr(element.path, "path", element.path)
+            # Relationships and wildcard tokens ('relationship:*'), without mappers
+            keys = [
+                "*" if isinstance(token, str) else token.key
+                for token in path
+                if not isinstance(token, Mapper)
+            ]
+            strategies[".".join(keys)] = dict(element.strategy)["lazy"]
+
+    return strategies
+
+
+@contextlib.contextmanager
+def assert_num_queries(expected: int, *mocked_objects):
+    """Pins the number of statements sent inside the block (see `count_queries`)."""
+    before = count_queries(*mocked_objects)
+    yield
+    actual = count_queries(*mocked_objects) - before
+    assert actual == expected, f"Expected {expected} queries, {actual} were made"
+
+
+class StreamedRows:
+    """Stands for the result of `AsyncSession.stream`: the rows in one partition."""
+
+    def __init__(self, rows: List[Any]):
+        self.rows = rows
+
+    async def partitions(self):
+        if self.rows:
+            yield self.rows
+
+
+def streamed_query(session):
+    """The statement of the last `stream` call (i.e. of a read-only list)."""
+    return session.stream.await_args.args[0]
+
+
 @pytest.fixture
 def mock_async_db_session(mocker):
     session = mocker.MagicMock(spec=AsyncSession)
     session.execute = AsyncMock()
+    session.stream = AsyncMock(return_value=StreamedRows([]))
     session.commit = AsyncMock()
     session.refresh = AsyncMock()
     session.delete = AsyncMock()
@@ -345,6 +422,34 @@ def dummy_user_repo():
     return repository
 
 
+@pytest.fixture
+def dummy_doctor_directory_repo():
+    repository = MagicMock(spec=DoctorDirectoryRepositoryInterface)
+    repository.refresh = AsyncMock()
+
+    return repository
+
+
+@pytest.fixture
+def dummy_users_uow(dummy_user_repo, dummy_doctor_directory_repo):
+    uow = MagicMock()
+    uow.user_repository = dummy_user_repo
+    uow.doctor_directory_repository = dummy_doctor_directory_repo
+    uow.commit = AsyncMock()
+    uow.rollback = AsyncMock()
+
+    async def exit_uow(exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            await uow.rollback()
+        else:
+            await uow.commit()
+
+    uow.__aenter__ = AsyncMock(return_value=uow)
+    uow.__aexit__ = AsyncMock(side_effect=exit_uow)
+
+    return uow
+
+
 @pytest.fixture
 def dummy_user_id():
     return uuid.uuid4()
@@ -478,12 +583,16 @@ def patient_context_attributes_repository():
 
 @pytest.fixture
 def nationalities_catalog_service(dummy_logger, nationalities_catalog_repository):
-    return NationalitiesCatalogService(dummy_logger, nationalities_catalog_repository)
+    return NationalitiesCatalogService(
+        dummy_logger, nationalities_catalog_repository, CatalogCache()
+    )
 
 
 @pytest.fixture
 def patient_context_attribute_service(dummy_logger, patient_context_attributes_repository):
-    return PatientContextAttributeService(dummy_logger, patient_context_attributes_repository)
+    return PatientContextAttributeService(
+        dummy_logger, patient_context_attributes_repository, CatalogCache()
+    )
 
 
 @pytest.fixture
@@ -589,7 +698,9 @@ def mock_citizenship_repository(mocker, dummy_citizenship_full):
 
 @pytest.fixture
 def financing_sources_catalog_service(dummy_logger, mock_financing_sources_catalog_repository):
-    return FinancingSourceCatalogService(dummy_logger, mock_financing_sources_catalog_repository)
+    return FinancingSourceCatalogService(
+        dummy_logger, mock_financing_sources_catalog_repository, CatalogCache()
+    )
 
 
 @pytest.fixture
@@ -659,12 +770,16 @@ def update_medorg_schema():
 
 @pytest.fixture
 def medical_organizations_service(dummy_logger, medical_organizations_repository):
-    return MedicalOrganizationsCatalogService(dummy_logger, medical_organizations_repository)
+    return MedicalOrganizationsCatalogService(
+        dummy_logger, medical_organizations_repository, CatalogCache()
+    )
 
 
 @pytest.fixture
 def citizenship_service(mock_citizenship_repository, dummy_logger):
-    return CitizenshipCatalogService(dummy_logger, mock_citizenship_repository)
+    return CitizenshipCatalogService(
+        dummy_logger, mock_citizenship_repository, CatalogCache()
+    )
 
 
 # Platform rules fixtures
@@ -715,6 +830,10 @@ def patch_mapper(monkeypatch, dummy_domain_patient):
         "src.apps.patients.infrastructure.repositories.patient_repository.map_patient_db_entity_to_domain",
         lambda db_obj: dummy_domain_patient
     )
+    monkeypatch.setattr(
+        "src.apps.patients.infrastructure.repositories.patient_repository.map_patient_row_to_domain",
+        lambda row: dummy_domain_patient
+    )
 
 
 @pytest.fixture
@@ -725,21 +844,11 @@ def mock_patient_repository():
     repository.get_by_iin = AsyncMock()
     repository.get_patients = AsyncMock()
     repository.get_total_number_of_patients = AsyncMock()
+    repository.get_missing_related_ids = AsyncMock(return_value={})
 
     return repository
 
 
-@pytest.fixture
-def mock_catalog_services():
-    return (
-        AsyncMock(),  # citizenship_service
-        AsyncMock(),  # nationalities_service
-        AsyncMock(),  # medical_org_service
-        AsyncMock(),  # financing_source_service
-        AsyncMock(),  # patient_context_attributes_service
-    )
-
-
 @pytest.fixture
 def mock_uow():
     uow = MagicMock()
@@ -757,23 +866,10 @@ def mock_uow():
 
 
 @pytest.fixture
-def patient_service(mock_uow, mock_patient_repository, mock_catalog_services):
-    (
-        citizenship_service,
-        nationalities_service,
-        medical_org_service,
-        financing_source_service,
-        patient_context_attributes_service
-    ) = mock_catalog_services
-
+def patient_service(mock_uow, mock_patient_repository):
     return PatientService(
         uow=mock_uow,
         patients_repository=mock_patient_repository,
-        citizenship_service=citizenship_service,
-        nationalities_service=nationalities_service,
-        medical_org_service=medical_org_service,
-        financing_source_service=financing_source_service,
-        patient_context_attributes_service=patient_context_attributes_service,
     )
 
 
@@ -868,3 +964,97 @@ def mock_insurance_info_db_entity():
         patient_id=uuid.uuid4(),
         financing_source_id=1
     )
+
+
+# Appointment service fixtures
+@pytest.fixture
+def mock_appointment_service_dependencies():
+    return {
+        "uow": MagicMock(),
+        "logger": MagicMock(),
+        "appointment_repository": MagicMock(
+            get_appointments=AsyncMock(),
+            get_appointments_by_cursor=AsyncMock(),
+            get_total_number_of_appointments=AsyncMock(),
+        ),
+        "schedule_repository": MagicMock(
+            get_by_id=AsyncMock(),
+            get_many_by_ids=AsyncMock(),
+        ),
+        "schedule_day_repository": MagicMock(
+            get_by_id=AsyncMock(),
+            get_many_by_ids=AsyncMock(),
+        ),
+        "user_service": MagicMock(get_by_id=AsyncMock()),
+        "patients_service": MagicMock(
+            get_by_id=AsyncMock(),
+            get_many_by_ids=AsyncMock(),
+        ),
+        "user_repository": MagicMock(
+            get_by_id=AsyncMock(),
+            get_many_by_ids=AsyncMock(),
+        ),
+    }
+
+
+@pytest.fixture
+def appointment_service(mock_appointment_service_dependencies):
+    return AppointmentService(**mock_appointment_service_dependencies)
+
+
+@pytest.fixture
+def dummy_appointments_page():
+    """
+    A page of 30 appointments spread over 3 schedule days (3 schedules, 3 doctors)
+    with a distinct patient per appointment.
+    """
+    doctors = [
+        MagicMock(id=uuid.uuid4(), specializations=[{"name": "Therapist", "id": "1"}])
+        for _ in range(3)
+    ]
+    schedules = [
+        ScheduleDomain(
+            id=uuid.uuid4(),
+            doctor_id=doctor.id,
+            schedule_name=f"Schedule {index}",
+            period_start=datetime.date(2025, 7, 1),
+            period_end=datetime.date(2025, 7, 31),
+            appointment_interval=20,
+        )
+        for index, doctor in enumerate(doctors)
+    ]
+    schedule_days = [
+        ResponseScheduleDaySchema(
+            id=uuid.uuid4(),
+            schedule_id=schedule.id,
+            day_of_week=1,
+            is_active=True,
+            work_start_time=datetime.time(8, 0),
+            work_end_time=datetime.time(18, 0),
+            date=datetime.date(2025, 7, 7),
+        )
+        for schedule in schedules
+    ]
+    patients = [
+        MagicMock(id=uuid.uuid4(), attachment_data={"area_number": 1}) for _ in range(30)
+    ]
+    appointments = [
+        AppointmentDomain(
+            id=index,
+            schedule_day_id=schedule_days[index % 3].id,
+            time=datetime.time(8 + index // 3 % 10, 0),
+            patient_id=patient.id,
+            status=AppointmentStatusEnum.BOOKED,
+            type=AppointmentTypeEnum.CONSULTATION,
+            insurance_type=AppointmentInsuranceType.DMS,
+        )
+        for index, patient in enumerate(patients)
+    ]
+
+    return {
+        "appointments": appointments,
+        "patients": patients,
+        "schedule_days": schedule_days,
+        "schedules": schedules,
+        "doctors": doctors,
+    }
@@ -0,0 +1,33 @@
+from src.apps.users.infrastructure.kafka.consumer_metrics import ConsumerMetrics, Histogram
+
+
+def test_histogram_counts_values_into_cumulative_buckets():
+    histogram = Histogram((1, 10, 100))
+
+    for value in (0.5, 1, 5, 50, 500):
+        histogram.observe(value)
+
+    stats = histogram.stats()
+    assert stats["buckets"] == {"1": 2, "10": 3, "100": 4, "+Inf": 5}
+    assert stats["count"] == 5
+    assert stats["max"] == 500
+
+
+def test_consumer_metrics_stats():
+    metrics = ConsumerMetrics()
+
+    metrics.record_batch(size=100, duration_seconds=0.02)
+    metrics.record_batch(size=50, duration_seconds=0.01)
+    metrics.record_error("batch")
+    metrics.record_lag("users-0", 30)
+    metrics.record_lag("users-1", -1)
+
+    stats = metrics.stats()
+    assert stats["messages"] == 150
+    assert stats["batches"] == 2
+    assert stats["messages_per_second"] > 0
+    assert stats["batch_size"]["avg"] == 75
+    assert stats["handler_latency_ms"]["max"] == 20
+    assert stats["errors"] == {"batch": 1}
+    assert stats["lag"] == {"users-0": 30, "users-1": 0}
+    assert stats["total_lag"] == 30
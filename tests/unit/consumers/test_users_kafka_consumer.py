@@ -0,0 +1,131 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.apps.users.domain.enums import ActionsOnUserEnum
+from src.apps.users.infrastructure.kafka.kafka_consumer import UsersKafkaConsumerImpl
+
+USER_ID = "a5d05a81-4203-4a58-9096-40208fa4182c"
+
+
+@pytest.fixture
+def permissions_cache():
+    return MagicMock()
+
+
+@pytest.fixture
+def users_kafka_consumer(permissions_cache, dummy_logger):
+    return UsersKafkaConsumerImpl(
+        user_service=MagicMock(handle_event=AsyncMock()),
+        bootstrap_servers=["kafka:9092"],
+        topic="auth_service.user.actions",
+        logger=dummy_logger,
+        db_session=MagicMock(),
+        permissions_cache=permissions_cache,
+    )
+
+
+@pytest.mark.asyncio
+async def test_delete_event_invalidates_cached_permissions(
+        users_kafka_consumer,
+        permissions_cache,
+):
+    await users_kafka_consumer.handle_event(
+        {"action_type": ActionsOnUserEnum.DELETE.value, "sub": USER_ID}
+    )
+
+    permissions_cache.invalidate_user.assert_called_once_with(USER_ID)
+    users_kafka_consumer.user_service.handle_event.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_unknown_event_does_not_touch_cached_permissions(
+        users_kafka_consumer,
+        permissions_cache,
+):
+    await users_kafka_consumer.handle_event({"action_type": "UNKNOWN", "sub": USER_ID})
+
+    permissions_cache.invalidate_user.assert_not_called()
+    users_kafka_consumer.user_service.handle_event.assert_not_awaited()
+
+
+def _update_event(first_name="John"):
+    return {
+        "action_type": ActionsOnUserEnum.UPDATE.value,
+        "sub": USER_ID,
+        "payload": {
+            "first_name": first_name,
+            "last_name": "Doe",
+            "iin": "123456789012",
+            "date_of_birth": "1990-01-01",
+            "client_roles": ["Doctor"],
+            "enabled": True,
+            "specializations": [],
+            "served_patient_types": [],
+            "served_referral_types": [],
+            "served_referral_origins": [],
+            "served_payment_types": [],
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_handle_batch_stores_events_with_single_service_call(
+        users_kafka_consumer,
+        permissions_cache,
+):
+    user_service = users_kafka_consumer.user_service
+    user_service.handle_events_batch = AsyncMock(return_value=(1, 0))
+
+    await users_kafka_consumer.handle_batch(
+        [_update_event("Old"), {"action_type": "UNKNOWN"}, _update_event("New")]
+    )
+
+    (events,) = user_service.handle_events_batch.await_args.args
+    assert [user_data.first_name for _, user_data in events] == ["Old", "New"]
+    assert permissions_cache.invalidate_user.call_count == 2
+    user_service.handle_event.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_falls_back_to_event_by_event(users_kafka_consumer):
+    user_service = users_kafka_consumer.user_service
+    user_service.handle_events_batch = AsyncMock(side_effect=Exception("IIN conflict"))
+    user_service.handle_event = AsyncMock(side_effect=[Exception("IIN conflict"), None])
+
+    await users_kafka_consumer.handle_batch([_update_event("Old"), _update_event("New")])
+
+    assert user_service.handle_event.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_consume_commits_offsets_after_the_batch(users_kafka_consumer):
+    calls = []
+
+    async def getmany(timeout_ms, max_records):
+        users_kafka_consumer._running = False
+        return {
+            "partition": [
+                MagicMock(topic="users", partition=0, offset=offset, value=_update_event())
+                for offset in (7, 8)
+            ]
+        }
+
+    async def handle_batch(events):
+        calls.append(("batch", len(events)))
+
+    async def commit():
+        calls.append(("commit",))
+
+    users_kafka_consumer.consumer = MagicMock(
+        getmany=getmany, commit=commit, highwater=MagicMock(return_value=12)
+    )
+    users_kafka_consumer.handle_batch = handle_batch
+    users_kafka_consumer._running = True
+
+    await users_kafka_consumer.consume()
+
+    assert calls == [("batch", 2), ("commit",)]
+    stats = users_kafka_consumer.metrics.stats()
+    assert stats["messages"] == 2
+    assert stats["lag"] == {"users-0": 3}
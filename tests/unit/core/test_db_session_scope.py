@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.core.database.session import ScopedAsyncSession
+
+
+@pytest.fixture
+def session_factory():
+    def factory():
+        session = MagicMock()
+        session.close = AsyncMock()
+        return session
+
+    return MagicMock(side_effect=factory)
+
+
+@pytest.mark.asyncio
+async def test_scope_opens_and_closes_dedicated_session(session_factory):
+    db_session = ScopedAsyncSession(session_factory)
+
+    async with db_session.scope() as session:
+        assert db_session() is session
+        assert db_session.is_scoped
+
+    session.close.assert_awaited_once()
+    assert not db_session.is_scoped
+
+
+@pytest.mark.asyncio
+async def test_concurrent_scopes_get_separate_sessions(session_factory):
+    db_session = ScopedAsyncSession(session_factory)
+    seen_sessions = []
+
+    async def handle_request():
+        async with db_session.scope():
+            await asyncio.sleep(0)
+            seen_sessions.append(db_session())
+
+    await asyncio.gather(*(handle_request() for _ in range(5)))
+
+    assert len({id(session) for session in seen_sessions}) == 5
+
+
+@pytest.mark.asyncio
+async def test_nested_scope_reuses_outer_session(session_factory):
+    db_session = ScopedAsyncSession(session_factory)
+
+    async with db_session.scope() as outer:
+        async with db_session.scope() as inner:
+            assert inner is outer
+        outer.close.assert_not_awaited()
+
+    assert session_factory.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_proxy_forwards_attributes_to_current_session(session_factory):
+    db_session = ScopedAsyncSession(session_factory)
+
+    async with db_session.scope() as session:
+        session.execute = AsyncMock(return_value="result")
+        assert await db_session.execute("query") == "result"
+        session.execute.assert_awaited_once_with("query")
+
+
+@pytest.mark.asyncio
+async def test_fallback_session_outside_of_scope(session_factory):
+    db_session = ScopedAsyncSession(session_factory)
+
+    fallback = db_session()
+    assert db_session() is fallback
+
+    await db_session.dispose()
+    fallback.close.assert_awaited_once()
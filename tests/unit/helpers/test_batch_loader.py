@@ -0,0 +1,57 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.shared.helpers.batch_loader import BatchLoader
+from tests.fixtures import assert_num_queries
+
+
+@pytest.fixture
+def entities():
+    return {key: MagicMock(id=key) for key in range(1, 6)}
+
+
+@pytest.fixture
+def batch_load_function(entities):
+    return AsyncMock(side_effect=lambda keys: [entities[key] for key in keys if key in entities])
+
+
+@pytest.mark.asyncio
+async def test_load_many_resolves_keys_with_one_call(batch_load_function, entities):
+    loader = BatchLoader(batch_load_function)
+
+    with assert_num_queries(1, batch_load_function):
+        result = await loader.load_many([1, 2, 2, 3, None, 404])
+
+    assert result == {1: entities[1], 2: entities[2], 3: entities[3]}
+    batch_load_function.assert_awaited_once_with([1, 2, 3, 404])
+
+
+@pytest.mark.asyncio
+async def test_load_many_uses_cache(batch_load_function):
+    loader = BatchLoader(batch_load_function)
+    await loader.load_many([1, 2])
+
+    with assert_num_queries(1, batch_load_function):
+        await loader.load_many([1, 2, 3])
+
+    batch_load_function.assert_awaited_with([3])
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_are_batched(batch_load_function, entities):
+    loader = BatchLoader(batch_load_function)
+
+    with assert_num_queries(1, batch_load_function):
+        result = await asyncio.gather(*(loader.load(key) for key in (1, 2, 3, 404)))
+
+    assert result == [entities[1], entities[2], entities[3], None]
+
+
+@pytest.mark.asyncio
+async def test_load_propagates_batch_errors():
+    loader = BatchLoader(AsyncMock(side_effect=RuntimeError("DB is down")))
+
+    with pytest.raises(RuntimeError):
+        await asyncio.gather(loader.load(1), loader.load(2))
@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from src.apps.assets_journal.infrastructure.bg_file_reader import read_bg_items
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+@pytest.mark.asyncio
+async def test_read_bg_items_parses_items_split_between_blocks(tmp_path):
+    items = [
+        {"id": str(number), "patient": {"personin": "040806501543"}, "note": "Примечание"}
+        for number in range(20)
+    ]
+    path = tmp_path / "bg.json"
+    path.write_text(json.dumps(items, ensure_ascii=False, indent=4), encoding="utf-8-sig")
+
+    # Blocks smaller than an item and splitting multibyte characters
+    assert await collect(read_bg_items(path, block_size=7)) == items
+
+
+@pytest.mark.asyncio
+async def test_read_bg_items_handles_empty_array(tmp_path):
+    path = tmp_path / "bg.json"
+    path.write_text(" [ ] ")
+
+    assert await collect(read_bg_items(path)) == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content",
+    ['{"id": "1"}', '[{"id": "1"}, 2]', '[{"id": "1"}, {"id": '],
+)
+async def test_read_bg_items_rejects_malformed_files(tmp_path, content):
+    path = tmp_path / "bg.json"
+    path.write_text(content)
+
+    with pytest.raises(json.JSONDecodeError):
+        await collect(read_bg_items(path, block_size=4))
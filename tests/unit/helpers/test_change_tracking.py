@@ -0,0 +1,41 @@
+from src.shared.helpers.change_tracking import ChangeTrackingMixin
+
+
+class DummyDomain(ChangeTrackingMixin):
+    def __init__(self, name: str, tags: list) -> None:
+        self.name = name
+        self.tags = tags
+        self.mark_clean()
+
+
+def test_new_object_has_no_changes():
+    assert DummyDomain("first", []).changed_fields == frozenset()
+
+
+def test_only_assignments_of_different_values_are_tracked():
+    domain = DummyDomain("first", ["a"])
+
+    domain.name = "first"
+    assert domain.changed_fields == frozenset()
+
+    domain.name = "second"
+    domain.tags = ["a", "b"]
+    assert domain.changed_fields == {"name", "tags"}
+
+
+def test_in_place_mutation_is_not_tracked():
+    domain = DummyDomain("first", ["a"])
+
+    domain.tags.append("b")
+
+    assert domain.changed_fields == frozenset()
+
+
+def test_mark_clean_forgets_changes():
+    domain = DummyDomain("first", [])
+    domain.name = "second"
+
+    domain.mark_clean()
+
+    assert domain.changed_fields == frozenset()
+    assert domain.name == "second"
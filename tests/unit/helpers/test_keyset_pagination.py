@@ -0,0 +1,151 @@
+import datetime
+import uuid
+
+import pytest
+from sqlalchemy import Column, Date, Integer, MetaData, Table, select
+from sqlalchemy.dialects import postgresql
+
+from src.shared.exceptions import InvalidPaginationParamsError
+from src.shared.infrastructure.keyset_pagination import (
+    CursorDirection,
+    apply_keyset_pagination,
+    build_cursor_page,
+    decode_cursor,
+    encode_cursor,
+)
+
+items_table = Table(
+    "items",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("day", Date),
+)
+sort_keys = (items_table.c.day, items_table.c.id)
+
+
+def compile_statement(statement) -> str:
+    return str(
+        statement.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def test_cursor_round_trip_keeps_value_types():
+    values = [
+        datetime.date(2025, 7, 1),
+        datetime.time(9, 30),
+        datetime.datetime(2025, 7, 1, 9, 30, tzinfo=datetime.timezone.utc),
+        uuid.UUID("a5d05a81-4203-4a58-9096-40208fa4182c"),
+        42,
+        "text",
+    ]
+
+    cursor = encode_cursor(values, CursorDirection.PREV)
+
+    assert decode_cursor(cursor) == (values, CursorDirection.PREV)
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "eyJ2IjpbXSwiZCI6Inh4In0"])
+def test_decode_invalid_cursor_raises_422(cursor):
+    with pytest.raises(InvalidPaginationParamsError) as exc_info:
+        decode_cursor(cursor)
+
+    assert exc_info.value.status_code == 422
+
+
+def test_apply_keyset_pagination_first_page_has_no_seek_predicate():
+    stmt, direction = apply_keyset_pagination(
+        select(items_table), sort_keys, cursor="", limit=10
+    )
+
+    sql = compile_statement(stmt)
+    assert direction == CursorDirection.NEXT
+    assert "WHERE" not in sql
+    assert "ORDER BY items.day ASC, items.id ASC" in sql
+    assert "LIMIT 11" in sql
+
+
+def test_apply_keyset_pagination_seeks_with_row_comparison():
+    cursor = encode_cursor([datetime.date(2025, 7, 1), 5], CursorDirection.NEXT)
+
+    stmt, _ = apply_keyset_pagination(select(items_table), sort_keys, cursor, limit=10)
+
+    sql = compile_statement(stmt)
+    assert "(items.day, items.id) > ('2025-07-01', 5)" in sql
+    assert "OFFSET" not in sql
+
+
+def test_apply_keyset_pagination_reads_previous_page_backwards():
+    cursor = encode_cursor([datetime.date(2025, 7, 1), 5], CursorDirection.PREV)
+
+    stmt, direction = apply_keyset_pagination(
+        select(items_table), sort_keys, cursor, limit=10
+    )
+
+    sql = compile_statement(stmt)
+    assert direction == CursorDirection.PREV
+    assert "(items.day, items.id) < ('2025-07-01', 5)" in sql
+    assert "ORDER BY items.day DESC, items.id DESC" in sql
+
+
+def test_apply_keyset_pagination_descending_order():
+    cursor = encode_cursor([datetime.date(2025, 7, 1), 5], CursorDirection.NEXT)
+
+    stmt, _ = apply_keyset_pagination(
+        select(items_table), sort_keys, cursor, limit=10, descending=True
+    )
+
+    sql = compile_statement(stmt)
+    assert "(items.day, items.id) < ('2025-07-01', 5)" in sql
+    assert "ORDER BY items.day DESC, items.id DESC" in sql
+
+
+def test_apply_keyset_pagination_rejects_cursor_of_another_ordering():
+    cursor = encode_cursor([5], CursorDirection.NEXT)
+
+    with pytest.raises(InvalidPaginationParamsError):
+        apply_keyset_pagination(select(items_table), sort_keys, cursor, limit=10)
+
+
+def test_build_cursor_page_first_page():
+    page = build_cursor_page(
+        rows=[1, 2, 3],
+        sort_values_getter=lambda row: [row],
+        limit=2,
+        cursor="",
+        direction=CursorDirection.NEXT,
+    )
+
+    assert page.items == [1, 2]
+    assert decode_cursor(page.next_cursor) == ([2], CursorDirection.NEXT)
+    assert page.prev_cursor is None
+
+
+def test_build_cursor_page_last_page():
+    page = build_cursor_page(
+        rows=[5, 6],
+        sort_values_getter=lambda row: [row],
+        limit=2,
+        cursor=encode_cursor([4], CursorDirection.NEXT),
+        direction=CursorDirection.NEXT,
+    )
+
+    assert page.items == [5, 6]
+    assert page.next_cursor is None
+    assert decode_cursor(page.prev_cursor) == ([5], CursorDirection.PREV)
+
+
+def test_build_cursor_page_previous_page_restores_order():
+    # Rows of a backward page come in reverse order with one extra row
+    page = build_cursor_page(
+        rows=[4, 3, 2],
+        sort_values_getter=lambda row: [row],
+        limit=2,
+        cursor=encode_cursor([5], CursorDirection.PREV),
+        direction=CursorDirection.PREV,
+    )
+
+    assert page.items == [3, 4]
+    assert decode_cursor(page.next_cursor) == ([4], CursorDirection.NEXT)
+    assert decode_cursor(page.prev_cursor) == ([3], CursorDirection.PREV)
@@ -0,0 +1,74 @@
+import pytest
+
+from src.apps.patients.infrastructure.import_readers import (
+    ImportFileFormat,
+    iter_lines,
+    read_import_rows,
+)
+
+
+async def stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+@pytest.mark.asyncio
+async def test_iter_lines_joins_lines_split_between_chunks():
+    text = "первая строка\nвторая\n".encode()
+    # Split inside a multibyte character and inside a line
+    chunks = (text[:3], text[3:17], text[17:])
+
+    assert await collect(iter_lines(stream(*chunks))) == ["первая строка\n", "вторая\n"]
+
+
+@pytest.mark.asyncio
+async def test_read_csv_rows_decodes_json_cells_and_skips_empty_ones():
+    content = (
+        "\ufeffiin,first_name,middle_name,financing_sources_ids,addresses\n"
+        '040806501543,Иван,,"[1, 2]","[{""type"": ""actual"",\n'
+        '""value"": ""Almaty"", ""is_primary"": true}]"\n'
+        "040806501544,Петр,,not-json,\n"
+    ).encode()
+
+    rows = await collect(read_import_rows(stream(content), ImportFileFormat.CSV))
+
+    assert [row.number for row in rows] == [2, 4]
+    assert rows[0].data == {
+        "iin": "040806501543",
+        "first_name": "Иван",
+        "financing_sources_ids": [1, 2],
+        "addresses": [{"type": "actual", "value": "Almaty", "is_primary": True}],
+    }
+    # Left as is for the schema validation to report
+    assert rows[1].data["financing_sources_ids"] == "not-json"
+
+
+@pytest.mark.asyncio
+async def test_read_csv_rows_reports_wrong_number_of_cells():
+    content = b"iin,first_name\n040806501543\n"
+
+    rows = await collect(read_import_rows(stream(content), ImportFileFormat.CSV))
+
+    assert rows[0].number == 2
+    assert rows[0].data is None
+    assert "Expected 2 cells" in rows[0].error
+
+
+@pytest.mark.asyncio
+async def test_read_ndjson_rows_reports_invalid_lines():
+    content = b'{"iin": "040806501543"}\n\n[1, 2]\n{broken\n{"iin": "040806501544"}'
+
+    rows = await collect(read_import_rows(stream(content), ImportFileFormat.NDJSON))
+
+    assert [(row.number, row.data) for row in rows] == [
+        (1, {"iin": "040806501543"}),
+        (3, None),
+        (4, None),
+        (5, {"iin": "040806501544"}),
+    ]
+    assert rows[1].error == "A JSON object is expected."
+    assert rows[2].error.startswith("Invalid JSON")
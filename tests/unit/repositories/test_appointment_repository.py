@@ -5,10 +5,26 @@ import pytest
 
 from unittest.mock import Mock, AsyncMock, MagicMock
 
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
 from src.apps.registry.domain.enums import AppointmentStatusEnum
-from src.apps.registry.infrastructure.db_models.models import Appointment
+from src.apps.registry.domain.exceptions import AppointmentIsOutOfWorkTimeError, AppointmentSlotIsTakenError
 from src.apps.registry.infrastructure.repositories.appointment_repository import AppointmentRepositoryImpl
-from tests.fixtures import mock_async_db_session
+from src.shared.exceptions import NoInstanceFoundError
+from src.shared.infrastructure.base import READ_ONLY_YIELD_PER
+from src.shared.infrastructure.keyset_pagination import (
+    CursorDirection,
+    decode_cursor,
+    encode_cursor,
+)
+from tests.fixtures import (
+    StreamedRows,
+    assert_num_queries,
+    loader_strategies,
+    mock_async_db_session,
+    streamed_query,
+)
 
 
 @pytest.mark.asyncio
@@ -109,10 +125,24 @@ async def test_update_appointment(
     mock_async_db_session.execute.return_value = fake_result
 
     repository = AppointmentRepositoryImpl(mock_async_db_session, dummy_logger)
-    result = await repository.update(dummy_domain_appointment)
+    with assert_num_queries(1, mock_async_db_session):
+        result = await repository.update(dummy_domain_appointment)
 
     assert result is not None
     assert result.id == dummy_domain_appointment.id
+    sql = compile_statement(mock_async_db_session.execute.await_args.args[0])
+    assert sql.startswith("UPDATE appointments SET")
+    assert " RETURNING " in sql
+    # Nothing is loaded after the UPDATE: the relationships of the entity raise
+    assert loader_strategies(mock_async_db_session.execute.await_args.args[0]) == {
+        "*": "raise"
+    }
+    assert set(mock_async_db_session.execute.await_args.args[0].compile().params) == {
+        "patient_id",
+        "status",
+        "id_1",
+    }
+    mock_async_db_session.refresh.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -130,9 +160,46 @@ async def test_delete_appointment(
     mock_async_db_session.delete = AsyncMock()
 
     repository = AppointmentRepositoryImpl(mock_async_db_session, dummy_logger)
-    await repository.delete_by_id(dummy_domain_appointment.id)
+    with assert_num_queries(1, mock_async_db_session):
+        await repository.delete_by_id(dummy_domain_appointment.id)
+
+    sql = compile_statement(mock_async_db_session.execute.await_args.args[0])
+    assert sql.startswith("DELETE FROM appointments")
+    assert "RETURNING appointments.id" in sql
+    mock_async_db_session.delete.assert_not_awaited()
+    # The unit of work commits
+    mock_async_db_session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_missing_appointment_raises(
+        mock_async_db_session,
+        dummy_domain_appointment,
+        dummy_logger,
+        mocker
+) -> None:
+    fake_result = mocker.MagicMock()
+    fake_result.scalar_one_or_none = Mock(return_value=None)
+    mock_async_db_session.execute.return_value = fake_result
+
+    dummy_domain_appointment.status = AppointmentStatusEnum.CANCELLED
+
+    repository = AppointmentRepositoryImpl(mock_async_db_session, dummy_logger)
+    with pytest.raises(NoInstanceFoundError):
+        await repository.update(dummy_domain_appointment)
+
+
+@pytest.mark.asyncio
+async def test_update_appointment_without_changes_writes_nothing(
+        mock_async_db_session,
+        dummy_domain_appointment,
+        dummy_logger,
+) -> None:
+    repository = AppointmentRepositoryImpl(mock_async_db_session, dummy_logger)
+    with assert_num_queries(0, mock_async_db_session):
+        result = await repository.update(dummy_domain_appointment)
 
-    mock_async_db_session.delete.assert_called_once_with(dummy_db_appointment)
+    assert result is dummy_domain_appointment
 
 
 @pytest.mark.asyncio
@@ -189,21 +256,18 @@ async def test_get_appointments_success(
         mocker,
         dummy_logger,
 ) -> None:
-    db_appointment_1 = MagicMock(spec=Appointment)
-    db_appointment_2 = MagicMock(spec=Appointment)
-    appointments_in_db = [db_appointment_1, db_appointment_2]
+    row_1 = MagicMock(id=1)
+    row_2 = MagicMock(id=2)
 
-    fake_result = MagicMock()
-    fake_result.scalars.return_value.all.return_value = appointments_in_db
-    mock_async_db_session.execute = AsyncMock(return_value=fake_result)
+    mock_async_db_session.stream.return_value = StreamedRows([row_1, row_2])
 
     mock_conditions = [True]
     repository = AppointmentRepositoryImpl(mock_async_db_session, dummy_logger)
     mocker.patch.object(repository, '_build_filters', return_value=mock_conditions)
 
     mocker.patch(
-        'src.apps.registry.infrastructure.repositories.appointment_repository.map_appointment_db_entity_to_domain',
-        side_effect=lambda x: f"domain_{x}"
+        'src.apps.registry.infrastructure.repositories.appointment_repository.map_appointment_row_to_domain',
+        side_effect=lambda x: f"domain_{x.id}"
     )
 
     filters = {"patient_id": "some-uuid"}
@@ -211,8 +275,17 @@ async def test_get_appointments_success(
     page = 2
     results = await repository.get_appointments(filters, limit, page)
 
-    mock_async_db_session.execute.assert_awaited_once()
-    assert results == [f"domain_{db_appointment_1}", f"domain_{db_appointment_2}"]
+    mock_async_db_session.stream.assert_awaited_once()
+    mock_async_db_session.execute.assert_not_awaited()
+    assert results == ["domain_1", "domain_2"]
+
+    # Plain columns are selected, not the ORM entity with its eager loads,
+    # and streamed from a server-side cursor
+    query = streamed_query(mock_async_db_session)
+    assert query.get_execution_options()["yield_per"] == READ_ONLY_YIELD_PER
+    sql = compile_statement(query)
+    assert sql.startswith("SELECT appointments.id, appointments.schedule_day_id")
+    assert "schedule_days.id AS" not in sql
 
 
 @pytest.mark.asyncio
@@ -221,19 +294,253 @@ async def test_get_appointments_no_filters(mocker):
     mock_logger = MagicMock()
     repository = AppointmentRepositoryImpl(mock_async_db_session, mock_logger)
 
-    db_appointments = []
-    fake_result = MagicMock()
-    fake_result.scalars.return_value.all.return_value = db_appointments
-    mock_async_db_session.execute = AsyncMock(return_value=fake_result)
+    mock_async_db_session.stream = AsyncMock(return_value=StreamedRows([]))
 
     mocker.patch.object(repository, '_build_filters', return_value=[])
 
+    results = await repository.get_appointments({}, 10, 1)
+
+    mock_async_db_session.stream.assert_awaited_once()
+    assert results == []
+
+
+@pytest.fixture
+def all_appointment_filters():
+    return {
+        "patient_iin_filter": "040806501543",
+        "patient_full_name_filter": "Ivanov Ivan",
+        "attached_area_number_filter": 7,
+        "doctor_id_filter": uuid.UUID("a5d05a81-4203-4a58-9096-40208fa4182c"),
+        "doctor_specialization_filter": "Therapist",
+        "appointment_status_filter": AppointmentStatusEnum.BOOKED,
+    }
+
+
+def compile_statement(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_get_appointments_applies_all_filters_in_sql(
+        mock_async_db_session,
+        dummy_logger,
+        all_appointment_filters,
+) -> None:
+    repository = AppointmentRepositoryImpl(mock_async_db_session, dummy_logger)
+    await repository.get_appointments(filters=all_appointment_filters, limit=30, page=1)
+
+    sql = compile_statement(streamed_query(mock_async_db_session))
+    assert "JOIN patients ON" in sql
+    assert "JOIN schedules ON" in sql
+    assert "JOIN doctor_specializations ON" in sql
+    assert "JOIN users ON" not in sql
+    assert "patients.iin =" in sql
+    assert "concat_ws(" in sql
+    assert "patients.attachment_data ->>" in sql
+    assert "schedules.doctor_id =" in sql
+    assert "doctor_specializations.name_key =" in sql
+    assert "jsonb_array_elements" not in sql
+
+
+@pytest.mark.asyncio
+async def test_get_total_number_of_appointments_uses_same_filters_as_page(
+        mock_async_db_session,
+        dummy_logger,
+        all_appointment_filters,
+        mocker
+) -> None:
+    fake_result = mocker.MagicMock()
+    fake_result.scalar_one.return_value = 0
+    mock_async_db_session.execute.return_value = fake_result
+
+    repository = AppointmentRepositoryImpl(mock_async_db_session, dummy_logger)
+    await repository.get_appointments(filters=all_appointment_filters, limit=30, page=1)
+    page_sql = compile_statement(streamed_query(mock_async_db_session))
+
+    await repository.get_total_number_of_appointments(filters=all_appointment_filters)
+    count_sql = compile_statement(mock_async_db_session.execute.await_args.args[0])
+
+    assert count_sql.startswith("SELECT count(appointments.id)")
+    assert count_sql.split("WHERE", 1)[1] in page_sql
+
+
+@pytest.mark.asyncio
+async def test_get_appointments_without_patient_filters_does_not_join_extra_tables(
+        mock_async_db_session,
+        dummy_logger,
+) -> None:
+    repository = AppointmentRepositoryImpl(mock_async_db_session, dummy_logger)
+    await repository.get_appointments(
+        filters={"appointment_status_filter": AppointmentStatusEnum.BOOKED}, limit=30, page=1
+    )
+
+    sql = compile_statement(streamed_query(mock_async_db_session))
+    assert "JOIN schedules ON" not in sql
+    assert "JOIN users ON" not in sql
+    assert "JOIN doctor_specializations ON" not in sql
+
+
+@pytest.mark.asyncio
+async def test_get_appointments_by_cursor_seeks_by_sort_key(
+        mock_async_db_session,
+        dummy_logger,
+        all_appointment_filters,
+        mocker
+) -> None:
+    rows = [
+        MagicMock(date=datetime.date(2025, 7, 1), time=datetime.time(9, 0), id=id_)
+        for id_ in (11, 12, 13)
+    ]
+    mock_async_db_session.stream.return_value = StreamedRows(rows)
     mocker.patch(
-        'src.apps.registry.infrastructure.repositories.appointment_repository.map_appointment_db_entity_to_domain',
-        side_effect=lambda x: f"domain_{x}"
+        'src.apps.registry.infrastructure.repositories.appointment_repository.map_appointment_row_to_domain',
+        side_effect=lambda x: f"domain_{x.id}"
     )
 
-    results = await repository.get_appointments({}, 10, 1)
+    repository = AppointmentRepositoryImpl(mock_async_db_session, dummy_logger)
+    cursor = encode_cursor(
+        [datetime.date(2025, 7, 1), datetime.time(8, 30), 10], CursorDirection.NEXT
+    )
+    page = await repository.get_appointments_by_cursor(
+        filters=all_appointment_filters, limit=2, cursor=cursor
+    )
+
+    sql = compile_statement(streamed_query(mock_async_db_session))
+    assert "(schedule_days.date, appointments.time, appointments.id) >" in sql
+    assert "ORDER BY schedule_days.date ASC, appointments.time ASC, appointments.id ASC" in sql
+    assert "OFFSET" not in sql
+    # Cursor mode reuses the same filters as the offset mode
+    assert "patients.iin =" in sql
+    assert "doctor_specializations.name_key =" in sql
+
+    assert page.items == ["domain_11", "domain_12"]
+    assert decode_cursor(page.next_cursor) == (
+        [datetime.date(2025, 7, 1), datetime.time(9, 0), 12], CursorDirection.NEXT
+    )
+    assert decode_cursor(page.prev_cursor) == (
+        [datetime.date(2025, 7, 1), datetime.time(9, 0), 11], CursorDirection.PREV
+    )
+
+
+def make_integrity_error(sqlstate: str, message: str) -> IntegrityError:
+    orig = Exception(message)
+    orig.sqlstate = sqlstate
+
+    return IntegrityError("INSERT INTO appointments ...", {}, orig)
+
+
+@pytest.mark.asyncio
+async def test_add_appointment_translates_overlap_violation(
+        mock_async_db_session,
+        dummy_domain_appointment,
+        dummy_logger,
+) -> None:
+    mock_async_db_session.flush.side_effect = make_integrity_error(
+        "23P01",
+        'conflicting key value violates exclusion constraint '
+        '"ex_appointments_schedule_day_id_time_range"',
+    )
+    repository = AppointmentRepositoryImpl(mock_async_db_session, dummy_logger)
+
+    with pytest.raises(AppointmentSlotIsTakenError):
+        await repository.add(dummy_domain_appointment)
+
+    mock_async_db_session.refresh.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_add_appointment_reraises_other_integrity_errors(
+        mock_async_db_session,
+        dummy_domain_appointment,
+        dummy_logger,
+) -> None:
+    mock_async_db_session.flush.side_effect = make_integrity_error(
+        "23503", 'violates foreign key constraint "fk_appointments_patient_id_patients"'
+    )
+    repository = AppointmentRepositoryImpl(mock_async_db_session, dummy_logger)
+
+    with pytest.raises(IntegrityError):
+        await repository.add(dummy_domain_appointment)
+
 
+@pytest.mark.asyncio
+async def test_update_end_times_by_schedule_id_checks_work_end_and_updates_at_once(
+        mock_async_db_session,
+        dummy_logger,
+) -> None:
+    repository = AppointmentRepositoryImpl(mock_async_db_session, dummy_logger)
+    mock_async_db_session.scalar.return_value = False
+
+    with assert_num_queries(2, mock_async_db_session):
+        await repository.update_end_times_by_schedule_id(uuid.uuid4(), 30)
+
+    check_sql = str(
+        mock_async_db_session.scalar.await_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    # The remaining work time is an interval, so it can't wrap past midnight
+    assert "schedule_days.work_end_time - appointments.time < " in check_sql
+    assert "appointments.status != " in check_sql
+    sql = str(
+        mock_async_db_session.execute.await_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert sql.startswith("UPDATE appointments SET end_time=(appointments.time + least(")
+    assert "schedule_days.work_end_time - appointments.time" in sql
+    assert "FROM schedule_days" in sql
+
+
+@pytest.mark.asyncio
+async def test_update_end_times_by_schedule_id_rejects_appointments_past_work_end(
+        mock_async_db_session,
+        dummy_logger,
+) -> None:
+    repository = AppointmentRepositoryImpl(mock_async_db_session, dummy_logger)
+    mock_async_db_session.scalar.return_value = True
+
+    with pytest.raises(AppointmentIsOutOfWorkTimeError):
+        await repository.update_end_times_by_schedule_id(uuid.uuid4(), 30)
+
+    mock_async_db_session.execute.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cancel_booked_by_day_ids_is_single_update_returning_ids(
+        mock_async_db_session,
+        dummy_logger,
+) -> None:
+    repository = AppointmentRepositoryImpl(mock_async_db_session, dummy_logger)
+    mock_async_db_session.execute.return_value = MagicMock(
+        scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=[3, 7])))
+    )
+
+    cancelled_ids = await repository.cancel_booked_by_day_ids(
+        [uuid.uuid4() for _ in range(30)],
+        time_range=(datetime.time(12, 0), datetime.time(13, 0)),
+    )
+
+    assert cancelled_ids == [3, 7]
     mock_async_db_session.execute.assert_awaited_once()
-    assert results == []
+    sql = str(
+        mock_async_db_session.execute.await_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert sql.startswith("UPDATE appointments SET status=")
+    assert "cancelled_at=now()" in sql
+    assert "appointments.schedule_day_id IN" in sql
+    assert "appointments.time <" in sql and "appointments.end_time >" in sql
+    assert sql.endswith("RETURNING appointments.id")
+
+
+@pytest.mark.asyncio
+async def test_cancel_booked_by_day_ids_without_days_makes_no_queries(
+        mock_async_db_session,
+        dummy_logger,
+) -> None:
+    repository = AppointmentRepositoryImpl(mock_async_db_session, dummy_logger)
+
+    assert await repository.cancel_booked_by_day_ids([]) == []
+    mock_async_db_session.execute.assert_not_awaited()
@@ -0,0 +1,175 @@
+import asyncio
+import base64
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.shared.exceptions import AuthServiceError
+from src.shared.infrastructure.auth_service_adapter.permissions_cache import (
+    PermissionsCache,
+)
+from src.shared.infrastructure.auth_service_adapter.repositories.cached_auth_service_repository import (
+    CachedAuthServiceRepositoryImpl,
+)
+
+USER_ID = "a5d05a81-4203-4a58-9096-40208fa4182c"
+
+
+def make_token(sub: str, salt: str = "") -> str:
+    payload = base64.urlsafe_b64encode(
+        json.dumps({"sub": sub, "salt": salt}).encode()
+    ).decode().rstrip("=")
+
+    return f"header.{payload}.signature"
+
+
+@pytest.fixture
+def http_repository(dummy_permissions):
+    return AsyncMock(get_permissions=AsyncMock(return_value=dummy_permissions))
+
+
+@pytest.fixture
+def permissions_cache():
+    return PermissionsCache(ttl_seconds=60, max_size=2)
+
+
+@pytest.fixture
+def cached_repository(http_repository, permissions_cache):
+    return CachedAuthServiceRepositoryImpl(
+        auth_service_repository=http_repository,
+        permissions_cache=permissions_cache,
+    )
+
+
+@pytest.mark.asyncio
+async def test_permissions_are_requested_once_per_token(
+        cached_repository,
+        http_repository,
+        permissions_cache,
+        dummy_permissions,
+):
+    token = make_token(USER_ID)
+
+    assert await cached_repository.get_permissions(token) == dummy_permissions
+    assert await cached_repository.get_permissions(token) == dummy_permissions
+
+    http_repository.get_permissions.assert_awaited_once_with(token)
+    assert permissions_cache.stats()["hits"] == 1
+    assert permissions_cache.stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_request(
+        cached_repository,
+        http_repository,
+        permissions_cache,
+        dummy_permissions,
+):
+    async def slow_get_permissions(token):
+        await asyncio.sleep(0.01)
+        return dummy_permissions
+
+    http_repository.get_permissions.side_effect = slow_get_permissions
+    token = make_token(USER_ID)
+
+    results = await asyncio.gather(
+        *(cached_repository.get_permissions(token) for _ in range(5))
+    )
+
+    assert results == [dummy_permissions] * 5
+    http_repository.get_permissions.assert_awaited_once()
+    assert permissions_cache.stats()["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached(cached_repository, http_repository, dummy_permissions):
+    http_repository.get_permissions.side_effect = [
+        AuthServiceError(status_code=401, detail="Unauthorized"),
+        dummy_permissions,
+    ]
+    token = make_token(USER_ID)
+
+    with pytest.raises(AuthServiceError):
+        await cached_repository.get_permissions(token)
+
+    assert await cached_repository.get_permissions(token) == dummy_permissions
+    assert http_repository.get_permissions.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_reloaded(cached_repository, http_repository):
+    token = make_token(USER_ID)
+    path = "src.shared.infrastructure.auth_service_adapter.permissions_cache.time.monotonic"
+
+    with patch(path, return_value=100.0):
+        await cached_repository.get_permissions(token)
+    with patch(path, return_value=161.0):
+        await cached_repository.get_permissions(token)
+
+    assert http_repository.get_permissions.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted(
+        cached_repository,
+        http_repository,
+        permissions_cache,
+):
+    first, second, third = (make_token(USER_ID, salt) for salt in "abc")
+
+    await cached_repository.get_permissions(first)
+    await cached_repository.get_permissions(second)
+    await cached_repository.get_permissions(first)  # "second" is the LRU entry now
+    await cached_repository.get_permissions(third)
+    await cached_repository.get_permissions(first)
+
+    assert http_repository.get_permissions.await_count == 3
+    assert permissions_cache.stats()["size"] == 2
+    assert permissions_cache.stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_user_drops_all_tokens_of_the_user(
+        cached_repository,
+        http_repository,
+        permissions_cache,
+):
+    user_token = make_token(USER_ID)
+    other_user_token = make_token("another-user")
+    await cached_repository.get_permissions(user_token)
+    await cached_repository.get_permissions(other_user_token)
+
+    assert permissions_cache.invalidate_user(USER_ID) == 1
+
+    await cached_repository.get_permissions(user_token)
+    await cached_repository.get_permissions(other_user_token)
+    assert http_repository.get_permissions.await_count == 3
+    assert permissions_cache.stats()["invalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_load_in_flight_during_invalidation_is_not_cached(
+        cached_repository,
+        http_repository,
+        permissions_cache,
+        dummy_permissions,
+):
+    token = make_token(USER_ID)
+
+    async def get_permissions_with_concurrent_update(access_token):
+        permissions_cache.invalidate_user(USER_ID)
+        return dummy_permissions
+
+    http_repository.get_permissions.side_effect = get_permissions_with_concurrent_update
+
+    assert await cached_repository.get_permissions(token) == dummy_permissions
+    assert permissions_cache.stats()["size"] == 0
+
+
+def test_tokens_are_not_stored_in_plain_text(permissions_cache):
+    token = make_token(USER_ID)
+    permissions_cache._store(permissions_cache._hash_token(token), [], USER_ID)
+
+    assert token not in permissions_cache._entries
+    assert PermissionsCache._extract_user_id("not-a-jwt") is None
@@ -0,0 +1,147 @@
+import asyncio
+import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.apps.platform_rules.infrastructure.api.schemas.requests.platform_rules_schemas import (
+    UpdatePlatformRuleSchema,
+)
+from src.apps.platform_rules.infrastructure.api.schemas.responses.platform_rules_schemas import (
+    ResponsePlatformRuleSchema,
+)
+from src.apps.platform_rules.infrastructure.platform_rules_listener import (
+    PlatformRulesListener,
+)
+from src.apps.platform_rules.infrastructure.platform_rules_store import (
+    PLATFORM_RULES_CHANNEL,
+    PlatformRulesStore,
+)
+from src.apps.platform_rules.infrastructure.repositories.cached_platform_rules_repository import (
+    CachedPlatformRulesRepositoryImpl,
+)
+
+RULES = [
+    ResponsePlatformRuleSchema(
+        id=1, key="MAX_SCHEDULE_PERIOD", rule_data={"value": 90}
+    ),
+    ResponsePlatformRuleSchema(
+        id=2,
+        key="REDUCED_DAYS",
+        rule_data={
+            "days": [
+                {
+                    "date": "2025-03-07",
+                    "is_active": True,
+                    "work_start_time": "09:00:00",
+                    "work_end_time": "15:00:00",
+                },
+                {"date": "2025-03-08", "is_active": False},
+            ]
+        },
+    ),
+]
+
+
+@pytest.fixture
+def db_repository():
+    return AsyncMock(get_platform_rules=AsyncMock(return_value=RULES))
+
+
+@pytest.fixture
+def platform_rules_store():
+    return PlatformRulesStore(ttl_seconds=300)
+
+
+@pytest.fixture
+def cached_repository(db_repository, platform_rules_store):
+    return CachedPlatformRulesRepositoryImpl(
+        platform_rules_repository=db_repository,
+        platform_rules_store=platform_rules_store,
+    )
+
+
+@pytest.mark.asyncio
+async def test_rules_are_loaded_once_and_served_by_key(
+    cached_repository, db_repository, platform_rules_store
+):
+    assert (await cached_repository.get_by_key("MAX_SCHEDULE_PERIOD")).rule_data == {
+        "value": 90
+    }
+    assert await cached_repository.get_by_key("UNKNOWN") is None
+    await cached_repository.get_reduced_days_calendar()
+
+    db_repository.get_platform_rules.assert_awaited_once()
+    db_repository.get_by_key.assert_not_awaited()
+    assert platform_rules_store.stats()["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_reduced_days_are_parsed_into_calendar(cached_repository):
+    calendar = await cached_repository.get_reduced_days_calendar()
+
+    assert set(calendar) == {datetime.date(2025, 3, 7), datetime.date(2025, 3, 8)}
+    assert calendar[datetime.date(2025, 3, 7)]["work_end_time"] == datetime.time(15, 0)
+    assert calendar[datetime.date(2025, 3, 8)]["is_active"] is False
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_single_load(cached_repository, db_repository):
+    await asyncio.gather(
+        *(cached_repository.get_by_key("MAX_SCHEDULE_PERIOD") for _ in range(10))
+    )
+
+    db_repository.get_platform_rules.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_store(cached_repository, db_repository):
+    await cached_repository.get_by_key("MAX_SCHEDULE_PERIOD")
+
+    await cached_repository.update_platform_rule(
+        1, UpdatePlatformRuleSchema(key="MAX_SCHEDULE_PERIOD", rule_data={"value": 60})
+    )
+    await cached_repository.get_by_key("MAX_SCHEDULE_PERIOD")
+
+    assert db_repository.get_platform_rules.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_load_racing_with_invalidation_is_not_stored(
+    cached_repository, db_repository, platform_rules_store
+):
+    async def load_during_write(**kwargs):
+        platform_rules_store.invalidate()
+        return RULES
+
+    db_repository.get_platform_rules.side_effect = load_during_write
+
+    await cached_repository.get_by_key("MAX_SCHEDULE_PERIOD")
+    await cached_repository.get_by_key("MAX_SCHEDULE_PERIOD")
+
+    assert db_repository.get_platform_rules.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_listener_invalidates_store_on_notification(
+    platform_rules_store, dummy_logger
+):
+    driver_connection = MagicMock(add_listener=AsyncMock())
+    connection = MagicMock(
+        get_raw_connection=AsyncMock(
+            return_value=MagicMock(driver_connection=driver_connection)
+        ),
+        close=AsyncMock(),
+    )
+    engine = MagicMock(connect=AsyncMock(return_value=connection))
+    listener = PlatformRulesListener(engine, platform_rules_store, dummy_logger)
+
+    await listener.start()
+    channel, callback = driver_connection.add_listener.await_args.args
+    version = platform_rules_store.version()
+    callback(driver_connection, 42, channel, "UPDATE")
+    await listener.stop()
+
+    assert channel == PLATFORM_RULES_CHANNEL
+    assert platform_rules_store.version() == version + 1
+    connection.close.assert_awaited_once()
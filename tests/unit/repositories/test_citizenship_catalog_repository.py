@@ -11,6 +11,8 @@ from src.apps.catalogs.infrastructure.api.schemas.responses.citizenship_catalog_
     CitizenshipCatalogFullResponseSchema
 )
 from src.apps.catalogs.infrastructure.db_models.models import SQLAlchemyCitizenshipCatalogue
+from src.shared.infrastructure.base import READ_ONLY_YIELD_PER
+from tests.fixtures import StreamedRows, streamed_query
 
 
 @pytest.mark.asyncio
@@ -100,11 +102,7 @@ async def test_get_citizenship_records(mock_citizenship_catalog_repository, mock
         changed_at=datetime.now(UTC),
     )
 
-    scalars_result = MagicMock()
-    scalars_result.all.return_value = [obj1, obj2]
-    execute_result = MagicMock()
-    execute_result.scalars.return_value = scalars_result
-    mock_async_db_session.execute = AsyncMock(return_value=execute_result)
+    mock_async_db_session.stream.return_value = StreamedRows([obj1, obj2])
 
     result = await mock_citizenship_catalog_repository.get_citizenship_records(name_filter="", country_code_filter="")
 
@@ -112,7 +110,18 @@ async def test_get_citizenship_records(mock_citizenship_catalog_repository, mock
     assert all(isinstance(r, CitizenshipCatalogFullResponseSchema) for r in result)
     assert result[0].country_code == "KZ"
     assert result[1].country_code == "RU"
-    mock_async_db_session.execute.assert_awaited()
+    mock_async_db_session.execute.assert_not_awaited()
+
+    # Only the columns of the response schema are streamed, no ORM entities
+    query = streamed_query(mock_async_db_session)
+    assert query.get_execution_options()["yield_per"] == READ_ONLY_YIELD_PER
+    assert list(query.selected_columns.keys()) == list(
+        CitizenshipCatalogFullResponseSchema.model_fields
+    )
+    assert all(
+        description["type"] is not SQLAlchemyCitizenshipCatalogue
+        for description in query.column_descriptions
+    )
 
 
 @pytest.mark.asyncio
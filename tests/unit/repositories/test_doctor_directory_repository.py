@@ -0,0 +1,48 @@
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.apps.users.infrastructure.repositories.doctor_directory_repository import (
+    SQLAlchemyDoctorDirectoryRepository,
+)
+from tests.fixtures import assert_num_queries
+
+
+@pytest.mark.asyncio
+async def test_refresh_rebuilds_directory_of_users_with_set_based_statements(
+    mock_async_db_session, dummy_logger
+):
+    repo = SQLAlchemyDoctorDirectoryRepository(mock_async_db_session, dummy_logger)
+    mock_async_db_session.execute.return_value = MagicMock()
+
+    with assert_num_queries(6, mock_async_db_session):
+        await repo.refresh([uuid.uuid4(), uuid.uuid4()])
+
+    statements = [
+        str(call.args[0].compile(dialect=postgresql.dialect()))
+        for call in mock_async_db_session.execute.await_args_list
+    ]
+    assert [sql.split(" WHERE")[0] for sql in statements[:3]] == [
+        "DELETE FROM doctor_specializations",
+        "DELETE FROM doctor_areas",
+        "DELETE FROM doctor_served_types",
+    ]
+    specializations_sql, areas_sql, served_types_sql = statements[3:]
+    assert specializations_sql.startswith("INSERT INTO doctor_specializations")
+    assert "jsonb_array_elements(users.specializations)" in specializations_sql
+    assert "lower(trim(" in specializations_sql
+    # Non-numeric area numbers are skipped instead of failing the cast
+    assert "~" in areas_sql
+    assert "CAST(users.attachment_data ->>" in areas_sql
+    assert served_types_sql.count("jsonb_array_elements_text(users.served_") == 4
+    mock_async_db_session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_refresh_without_users_makes_no_queries(mock_async_db_session, dummy_logger):
+    repo = SQLAlchemyDoctorDirectoryRepository(mock_async_db_session, dummy_logger)
+
+    with assert_num_queries(0, mock_async_db_session):
+        await repo.refresh([])
@@ -10,6 +10,7 @@ from src.apps.catalogs.infrastructure.api.schemas.requests.financing_sources_cat
     UpdateFinancingSourceSchema,
 )
 from src.core.settings import project_settings
+from tests.fixtures import StreamedRows
 
 
 @pytest.mark.asyncio
@@ -166,10 +167,7 @@ async def test_get_financing_sources_without_filters(
     mock_async_db_session,
     dummy_financing_source_from_db,
 ):
-    scalars = MagicMock(all=MagicMock(return_value=[dummy_financing_source_from_db]))
-    mock_async_db_session.execute = AsyncMock(
-        return_value=MagicMock(scalars=MagicMock(return_value=scalars))
-    )
+    mock_async_db_session.stream.return_value = StreamedRows([dummy_financing_source_from_db])
     with patch.object(
         FinancingSourceFullResponseSchema,
         "model_validate",
@@ -188,10 +186,7 @@ async def test_get_financing_sources_with_filters(
     mock_async_db_session,
     dummy_financing_source_from_db,
 ):
-    scalars = MagicMock(all=MagicMock(return_value=[dummy_financing_source_from_db]))
-    mock_async_db_session.execute = AsyncMock(
-        return_value=MagicMock(scalars=MagicMock(return_value=scalars))
-    )
+    mock_async_db_session.stream.return_value = StreamedRows([dummy_financing_source_from_db])
     with patch.object(
         FinancingSourceFullResponseSchema,
         "model_validate",
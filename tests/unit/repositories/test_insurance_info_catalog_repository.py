@@ -11,6 +11,7 @@ from src.apps.catalogs.mappers import (
     map_insurance_info_create_schema_to_db_entity,
     map_insurance_info_update_schema_to_db_entity
 )
+from tests.fixtures import StreamedRows
 
 
 @pytest.mark.asyncio
@@ -84,9 +85,7 @@ async def test_get_insurance_info_records_WITHOUT_filters(
     # Make them different
     db_patient_2.id = 2
 
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [db_patient_1, db_patient_2]
-    mock_async_db_session.execute.return_value = mock_result
+    mock_async_db_session.stream.return_value = StreamedRows([db_patient_1, db_patient_2])
 
     # Initialize filters object
     empty_filters = InsuranceInfoCatalogFilterParams(
@@ -102,8 +101,7 @@ async def test_get_insurance_info_records_WITHOUT_filters(
         filters=empty_filters,
     )
 
-    mock_async_db_session.execute.assert_called_once()
-    mock_result.scalars.return_value.all.assert_called_once()
+    mock_async_db_session.stream.assert_awaited_once()
 
     assert response is not None
     assert type(response) is list
@@ -124,9 +122,7 @@ async def test_get_insurance_info_records_WITH_filters(
     db_patient_2.id = 2
     db_patient_2.company = 'Different Dummy Company Limited'
 
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [db_patient_2]
-    mock_async_db_session.execute.return_value = mock_result
+    mock_async_db_session.stream.return_value = StreamedRows([db_patient_2])
 
     # Initialize filters object
     filters = InsuranceInfoCatalogFilterParams(
@@ -142,8 +138,7 @@ async def test_get_insurance_info_records_WITH_filters(
         filters=filters,
     )
 
-    mock_async_db_session.execute.assert_called_once()
-    mock_result.scalars.return_value.all.assert_called_once()
+    mock_async_db_session.stream.assert_awaited_once()
 
     assert response is not None
     assert type(response) is list
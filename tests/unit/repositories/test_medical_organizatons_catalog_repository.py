@@ -15,6 +15,7 @@ from src.apps.catalogs.infrastructure.api.schemas.requests.citizenship_catalog_r
     UpdateCitizenshipSchema,
 )
 from src.core.settings import project_settings
+from tests.fixtures import StreamedRows
 
 
 @pytest.fixture
@@ -227,10 +228,7 @@ async def test_get_by_id_not_found(mock_async_db_session, dummy_logger):
 async def test_get_medical_organizations_filters(mock_async_db_session, dummy_logger):
     rec1 = MagicMock(spec=SQLAlchemyMedicalOrganizationsCatalogue)
     rec2 = MagicMock(spec=SQLAlchemyMedicalOrganizationsCatalogue)
-    scalars = MagicMock(all=MagicMock(return_value=[rec1, rec2]))
-    mock_async_db_session.execute = AsyncMock(
-        return_value=MagicMock(scalars=MagicMock(return_value=scalars))
-    )
+    mock_async_db_session.stream = AsyncMock(return_value=StreamedRows([rec1, rec2]))
     repo = SQLAlchemyMedicalOrganizationsCatalogCatalogueRepositoryImpl(
         mock_async_db_session, dummy_logger
     )
@@ -247,7 +245,7 @@ async def test_get_medical_organizations_filters(mock_async_db_session, dummy_lo
         )
         assert result == [rec1, rec2]
 
-    mock_async_db_session.execute.assert_awaited_once()
+    mock_async_db_session.stream.assert_awaited_once()
 
 
 @pytest.mark.asyncio
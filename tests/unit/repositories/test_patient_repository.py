@@ -1,9 +1,26 @@
+import datetime
 from unittest.mock import MagicMock, AsyncMock, patch
 from uuid import uuid4
 
 import pytest
-
-from tests.fixtures import mock_patient_repository_impl
+from sqlalchemy.dialects import postgresql
+
+from src.apps.patients.domain.patient import PatientDomain
+from src.apps.patients.infrastructure.repositories.patient_repository import (
+    PATIENT_COPY_COLUMNS,
+)
+from src.shared.exceptions import NoInstanceFoundError
+from src.shared.infrastructure.keyset_pagination import (
+    CursorDirection,
+    decode_cursor,
+    encode_cursor,
+)
+from tests.fixtures import (
+    StreamedRows,
+    assert_num_queries,
+    mock_patient_repository_impl,
+    streamed_query,
+)
 
 
 @pytest.mark.asyncio
@@ -78,19 +95,15 @@ async def test_get_patients_without_filters_and_pagination_params(
         dummy_domain_patient,
         mock_patient_repository_impl,
 ):
-    result_mock = MagicMock()
-    result_mock.scalars.return_value.all.return_value = [
-        dummy_db_patient,
-        dummy_db_patient,
-        dummy_db_patient
-    ]
-    mock_async_db_session.execute.return_value = result_mock
+    mock_async_db_session.stream.return_value = StreamedRows(
+        [dummy_db_patient, dummy_db_patient, dummy_db_patient]
+    )
 
     result = await mock_patient_repository_impl.get_patients()
 
     assert isinstance(result, list)
     assert len(result) == 3
-    mock_async_db_session.execute.assert_called_once()
+    mock_async_db_session.stream.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -99,7 +112,7 @@ async def test_get_patients_with_filters_and_pagination_params(
         mock_patient_repository_impl,
         monkeypatch,
 ):
-    # Fake DB users (ORM)
+    # Fake rows of the patients' columns
     db_patient_1 = MagicMock()
     db_patient_1.id = 1
     db_patient_1.iin = "040806501543"
@@ -124,13 +137,11 @@ async def test_get_patients_with_filters_and_pagination_params(
         return MagicMock(name="DomainUnknown")
 
     monkeypatch.setattr(
-        "src.apps.patients.infrastructure.repositories.patient_repository.map_patient_db_entity_to_domain",
+        "src.apps.patients.infrastructure.repositories.patient_repository.map_patient_row_to_domain",
         fake_mapper,
     )
 
-    result_mock = MagicMock()
-    result_mock.scalars.return_value.all.return_value = [db_patient_1]
-    mock_async_db_session.execute.return_value = result_mock
+    mock_async_db_session.stream.return_value = StreamedRows([db_patient_1])
 
     result = await mock_patient_repository_impl.get_patients(
         filters={
@@ -146,7 +157,7 @@ async def test_get_patients_with_filters_and_pagination_params(
     assert isinstance(result, list)
     assert len(result) == 1
     assert result[0] is domain_patient_1
-    mock_async_db_session.execute.assert_called_once()
+    mock_async_db_session.stream.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -154,15 +165,13 @@ async def test_get_patients_without_full_name_filter(
     mock_async_db_session,
         mock_patient_repository_impl,
 ):
-    # Fake DB user (ORM)
+    # Fake row of the patient's columns
     db_patient_1 = MagicMock()
     db_patient_1.id = 1
     db_patient_1.iin = "040806501543"
     db_patient_1.maiden_name = "Rusakova"
 
-    result_mock = MagicMock()
-    result_mock.scalars.return_value.all.return_value = [db_patient_1]
-    mock_async_db_session.execute.return_value = result_mock
+    mock_async_db_session.stream.return_value = StreamedRows([db_patient_1])
 
     # Passed dictionary without a full_name filter
     result = await mock_patient_repository_impl.get_patients(
@@ -170,7 +179,7 @@ async def test_get_patients_without_full_name_filter(
     )
 
     assert result
-    mock_async_db_session.execute.assert_called_once()
+    mock_async_db_session.stream.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -213,43 +222,110 @@ async def test_create_patient(
 
 
 
+def make_patient_domain(**kwargs) -> PatientDomain:
+    fields = dict(
+        id=uuid4(),
+        iin="040806501543",
+        first_name="Иван",
+        last_name="Иванов",
+        middle_name=None,
+        maiden_name=None,
+        date_of_birth=datetime.date(1985, 7, 14),
+        citizenship_id=1,
+        nationality_id=2,
+        financing_sources_ids=[3],
+        relatives=None,
+        addresses=None,
+        contact_info=None,
+    )
+    fields.update(kwargs)
+
+    return PatientDomain(**fields)
+
+
 @pytest.mark.asyncio
-async def test_update_patient(
+async def test_update_patient_writes_only_changed_fields(
     mock_async_db_session,
     mock_patient_repository_impl,
-    dummy_db_patient,
-    dummy_domain_patient,
-    monkeypatch,
 ):
-    # Patch the domain -> DB and DB -> domain mappers:
-    monkeypatch.setattr(
-        "src.apps.patients.infrastructure.repositories.patient_repository."
-        "map_patient_domain_to_db_entity",
-        lambda domain: dummy_db_patient,
-    )
-    monkeypatch.setattr(
-        "src.apps.patients.infrastructure.repositories.patient_repository."
-        "map_patient_db_entity_to_domain",
-        lambda db_obj: dummy_domain_patient,
-    )
+    patient = make_patient_domain()
+    patient.first_name = "Пётр"
+    patient.addresses = [{"value": "Астана"}]
 
-    # Give our dummy domain a real .id so the WHERE clause matches
-    dummy_domain_patient.id = dummy_db_patient.id
+    result_mock = MagicMock()
+    result_mock.scalar_one_or_none.return_value = patient.id
+    mock_async_db_session.execute.return_value = result_mock
 
-    # Stub every execute() to return dummy_db_patient
-    fake_result = MagicMock()
-    fake_result.scalars.return_value.first.return_value = dummy_db_patient
-    mock_async_db_session.execute.return_value = fake_result
+    result = await mock_patient_repository_impl.update_patient(patient)
 
-    mock_async_db_session.flush = AsyncMock()
+    assert result is patient
+    assert patient.changed_fields == frozenset()
 
-    result = await mock_patient_repository_impl.update_patient(dummy_domain_patient)
+    mock_async_db_session.execute.assert_awaited_once()
+    query = mock_async_db_session.execute.await_args.args[0]
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE patients SET")
+    # Only the ID is returned, so no patient entity (nor its selectin
+    # collections) is loaded by the statement
+    assert sql.endswith("RETURNING patients.id")
+    assert [column["name"] for column in query.returning_column_descriptions] == ["id"]
+    assert "populate_existing" not in query.get_execution_options()
+    values = query.compile().params
+    assert set(values) - {"id_1"} == {"first_name", "addresses"}
+    assert values["first_name"] == "Пётр"
 
-    assert result is dummy_domain_patient
 
-    assert mock_async_db_session.execute.call_count >= 2
-    assert mock_async_db_session.flush.await_count >= 1
+@pytest.mark.asyncio
+async def test_update_missing_patient_raises(
+    mock_async_db_session,
+    mock_patient_repository_impl,
+):
+    patient = make_patient_domain()
+    patient.first_name = "Пётр"
+
+    result_mock = MagicMock()
+    result_mock.scalar_one_or_none.return_value = None
+    mock_async_db_session.execute.return_value = result_mock
+
+    with pytest.raises(NoInstanceFoundError):
+        await mock_patient_repository_impl.update_patient(patient)
+
+
+@pytest.mark.asyncio
+async def test_update_patient_replaces_links_of_changed_catalogs(
+    mock_async_db_session,
+    mock_patient_repository_impl,
+):
+    patient = make_patient_domain()
+    patient.financing_sources_ids = [4, 5]
+
+    with assert_num_queries(2, mock_async_db_session):
+        await mock_patient_repository_impl.update_patient(patient)
+
+    delete_query, insert_query = [
+        str(call.args[0].compile(dialect=postgresql.dialect()))
+        for call in mock_async_db_session.execute.await_args_list
+    ]
+    assert delete_query.startswith("DELETE FROM patient_financing_source")
+    assert insert_query.startswith(
+        "INSERT INTO patient_financing_source (patient_id, financing_source_id) SELECT"
+    )
+    assert "cat_financing_sources.id IN" in insert_query
+    # The patient's row itself is not written
+    assert "UPDATE patients" not in delete_query + insert_query
+
+
+@pytest.mark.asyncio
+async def test_update_patient_without_changes_writes_nothing(
+    mock_async_db_session,
+    mock_patient_repository_impl,
+):
+    patient = make_patient_domain()
+
+    with assert_num_queries(0, mock_async_db_session):
+        result = await mock_patient_repository_impl.update_patient(patient)
 
+    assert result is patient
 
 
 @pytest.mark.asyncio
@@ -270,4 +346,260 @@ async def test_delete_by_id(
     mock_async_db_session.delete.assert_called_once_with(dummy_db_patient)
 
 
+@pytest.mark.asyncio
+async def test_get_many_by_ids_uses_single_query(
+        mock_async_db_session,
+        dummy_db_patient,
+        dummy_domain_patient,
+        mock_patient_repository_impl
+):
+    mock_async_db_session.stream.return_value = StreamedRows([dummy_db_patient, dummy_db_patient])
+
+    with assert_num_queries(1, mock_async_db_session):
+        result = await mock_patient_repository_impl.get_many_by_ids([uuid4(), uuid4()])
+
+    assert result == [dummy_domain_patient, dummy_domain_patient]
+    sql = str(
+        streamed_query(mock_async_db_session).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    # Catalog links are aggregated in the same query instead of selectin loads
+    assert "array_agg(patient_financing_source.financing_source_id" in sql
+    assert "array_agg(patient_additional_attribute.additional_attribute_id" in sql
+
+
+@pytest.mark.asyncio
+async def test_get_many_by_ids_empty_ids_makes_no_queries(
+        mock_async_db_session,
+        mock_patient_repository_impl
+):
+    with assert_num_queries(0, mock_async_db_session):
+        result = await mock_patient_repository_impl.get_many_by_ids([])
+
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_get_patients_by_cursor_seeks_by_creation_date(
+        mock_async_db_session,
+        mock_patient_repository_impl,
+        monkeypatch,
+):
+    created_at = datetime.datetime(2025, 7, 1, 9, 0, tzinfo=datetime.timezone.utc)
+    db_patients = [MagicMock(created_at=created_at, id=uuid4()) for _ in range(3)]
+    monkeypatch.setattr(
+        "src.apps.patients.infrastructure.repositories.patient_repository.map_patient_row_to_domain",
+        lambda row: row.id,
+    )
+
+    mock_async_db_session.stream.return_value = StreamedRows(db_patients)
+
+    filters = {"patient_full_name": "Ivan Ivanov", "iin": "040806501543"}
+    cursor = encode_cursor([created_at, uuid4()], CursorDirection.NEXT)
+    page = await mock_patient_repository_impl.get_patients_by_cursor(
+        filters=filters, limit=2, cursor=cursor
+    )
+
+    sql = str(
+        streamed_query(mock_async_db_session).compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert "(patients.created_at, patients.id) >" in sql
+    assert "ORDER BY patients.created_at ASC, patients.id ASC" in sql
+    assert "OFFSET" not in sql
+    # Filters of the caller are not mutated by the repository
+    assert filters == {"patient_full_name": "Ivan Ivanov", "iin": "040806501543"}
+
+    assert page.items == [db_patients[0].id, db_patients[1].id]
+    assert decode_cursor(page.next_cursor) == (
+        [created_at, db_patients[1].id], CursorDirection.NEXT
+    )
+    assert decode_cursor(page.prev_cursor) == (
+        [created_at, db_patients[0].id], CursorDirection.PREV
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_missing_related_ids_uses_single_union_query(
+        mock_async_db_session,
+        mock_patient_repository_impl
+):
+    result_mock = MagicMock()
+    result_mock.all.return_value = [
+        ("citizenship_id", 1),
+        ("financing_sources_ids", 3),
+        ("context_attributes_ids", 5),
+    ]
+    mock_async_db_session.execute.return_value = result_mock
+
+    with assert_num_queries(1, mock_async_db_session):
+        missing = await mock_patient_repository_impl.get_missing_related_ids(
+            {
+                "citizenship_id": [1],
+                "nationality_id": [2],
+                "attached_clinic_id": [],
+                "financing_sources_ids": [3, 4, 4],
+                "context_attributes_ids": [5],
+            }
+        )
+
+    assert missing == {"nationality_id": [2], "financing_sources_ids": [4]}
+    sql = str(
+        mock_async_db_session.execute.await_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert sql.count("UNION ALL") == 3
+    assert "cat_medical_organizations" not in sql
+
+
+@pytest.mark.asyncio
+async def test_get_missing_related_ids_without_ids_makes_no_queries(
+        mock_async_db_session,
+        mock_patient_repository_impl
+):
+    with assert_num_queries(0, mock_async_db_session):
+        missing = await mock_patient_repository_impl.get_missing_related_ids(
+            {"attached_clinic_id": [], "financing_sources_ids": []}
+        )
+
+    assert missing == {}
+
+
+@pytest.mark.asyncio
+async def test_get_existing_iins_uses_single_query(
+        mock_async_db_session,
+        mock_patient_repository_impl
+):
+    result_mock = MagicMock()
+    result_mock.scalars.return_value.all.return_value = ["040806501543"]
+    mock_async_db_session.execute.return_value = result_mock
+
+    with assert_num_queries(1, mock_async_db_session):
+        existing = await mock_patient_repository_impl.get_existing_iins(
+            ["040806501543", "040806501544"]
+        )
+
+    assert existing == {"040806501543"}
 
+
+@pytest.mark.asyncio
+async def test_get_ids_by_iins_uses_single_query(
+        mock_async_db_session,
+        mock_patient_repository_impl
+):
+    patient_id = uuid4()
+    result_mock = MagicMock()
+    result_mock.all.return_value = [("040806501543", patient_id)]
+    mock_async_db_session.execute.return_value = result_mock
+
+    with assert_num_queries(1, mock_async_db_session):
+        patient_ids = await mock_patient_repository_impl.get_ids_by_iins(
+            ["040806501543", "040806501544", "040806501543"]
+        )
+
+    assert patient_ids == {"040806501543": patient_id}
+    # No query for an empty chunk
+    assert await mock_patient_repository_impl.get_ids_by_iins([]) == {}
+    assert mock_async_db_session.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_copy_patients_writes_patients_and_associations_with_copy(
+        mock_async_db_session,
+        mock_patient_repository_impl
+):
+    driver_connection = MagicMock(
+        is_in_transaction=MagicMock(return_value=True),
+        copy_records_to_table=AsyncMock(),
+    )
+    connection = MagicMock(
+        get_raw_connection=AsyncMock(
+            return_value=MagicMock(driver_connection=driver_connection)
+        )
+    )
+    mock_async_db_session.connection = AsyncMock(return_value=connection)
+    patient = PatientDomain(
+        id=None,
+        iin="040806501543",
+        first_name="Иван",
+        last_name="Иванов",
+        middle_name=None,
+        maiden_name=None,
+        date_of_birth=datetime.date(1985, 7, 14),
+        citizenship_id=1,
+        nationality_id=2,
+        financing_sources_ids=[3, 3],
+        attachment_data={"area_number": 12, "attached_clinic_id": None},
+        relatives=None,
+        addresses=None,
+        contact_info=None,
+    )
+
+    assert await mock_patient_repository_impl.copy_patients([patient]) == 1
+
+    calls = driver_connection.copy_records_to_table.await_args_list
+    assert [call.args[0] for call in calls] == ["patients", "patient_financing_source"]
+    assert calls[0].kwargs["columns"] == PATIENT_COPY_COLUMNS
+    record = dict(zip(PATIENT_COPY_COLUMNS, calls[0].kwargs["records"][0]))
+    assert record["id"] == patient.id is not None
+    assert record["gender"] == "not_specified"
+    assert record["profile_status"] == "active"
+    assert record["attachment_data"] == '{"area_number": 12, "attached_clinic_id": null}'
+    assert record["relatives"] is None
+    assert calls[1].kwargs["records"] == [(patient.id, 3)]
+
+
+@pytest.mark.asyncio
+async def test_search_patients_by_iin_prefix_uses_iin_range(
+    mock_async_db_session, mock_patient_repository_impl
+):
+    await mock_patient_repository_impl.search_patients(" 0408 ", limit=5)
+
+    query = streamed_query(mock_async_db_session)
+    sql = str(
+        query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+    assert "patients.iin BETWEEN '040800000000' AND '040899999999'" in sql
+    assert "ORDER BY patients.iin" in sql
+    assert "LIMIT 5" in sql
+
+
+@pytest.mark.asyncio
+async def test_search_patients_by_name_ranks_by_word_similarity(
+    mock_async_db_session, mock_patient_repository_impl
+):
+    await mock_patient_repository_impl.search_patients("Ivanov  IVAN")
+
+    query = streamed_query(mock_async_db_session)
+    sql = str(
+        query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+    assert "patients.search_name %%> 'ivanov ivan'" in sql
+    assert "ORDER BY word_similarity('ivanov ivan', patients.search_name) DESC" in sql
+    # Catalogs joined by default are not needed for the search
+    assert "cat_citizenship" not in sql
+
+
+@pytest.mark.asyncio
+async def test_search_patients_skips_query_for_impossible_iin(
+    mock_async_db_session, mock_patient_repository_impl
+):
+    with assert_num_queries(0, mock_async_db_session):
+        assert await mock_patient_repository_impl.search_patients("1234567890123") == []
+        assert await mock_patient_repository_impl.search_patients("   ") == []
+
+
+@pytest.mark.asyncio
+async def test_full_name_filter_searches_every_part_in_search_name(
+    mock_async_db_session, mock_patient_repository_impl
+):
+    await mock_patient_repository_impl.get_patients(filters={"patient_full_name": "Ivan Ov"})
+
+    query = streamed_query(mock_async_db_session)
+    sql = str(
+        query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    )
+    assert "patients.search_name ILIKE '%%ivan%%' AND patients.search_name ILIKE '%%ov%%'" in sql
@@ -0,0 +1,69 @@
+import datetime
+import gc
+import tracemalloc
+from collections import namedtuple
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.cli.benchmark_list_memory import build_list_requests
+from src.core.database.session import ScopedAsyncSession
+from tests.fixtures import StreamedRows
+
+PAGE_SIZE = 30
+
+# Values of the columns the response schemas require, the rest are NULL
+COLUMN_VALUES = {
+    "id": 1,
+    "name": "Name",
+    "lang": "ru",
+    "country_code": "KZ",
+    "code": "001",
+    "address": "Address",
+    "patient_id": uuid4(),
+    "financing_source_id": 1,
+    "created_at": datetime.datetime(2025, 7, 1, tzinfo=datetime.timezone.utc),
+    "changed_at": datetime.datetime(2025, 7, 1, tzinfo=datetime.timezone.utc),
+}
+
+
+class RowsSession(AsyncSession):
+    """A session without a database: every streamed query returns a full page of rows."""
+
+    row_types = {}
+
+    async def stream(self, statement, *args, **kwargs):
+        keys = tuple(statement.selected_columns.keys())
+        if keys not in self.row_types:
+            self.row_types[keys] = namedtuple("Row", keys, rename=True)
+        row = self.row_types[keys](*(COLUMN_VALUES.get(key) for key in keys))
+
+        return StreamedRows([row] * PAGE_SIZE)
+
+
+@pytest.mark.asyncio
+async def test_list_requests_do_not_grow_long_lived_session():
+    # Every request runs on the process-wide fallback session, which lives as
+    # long as the process (`benchmark-list-memory` runs 100k against a database)
+    db_session = ScopedAsyncSession(RowsSession)
+    list_requests = list(build_list_requests(db_session, PAGE_SIZE).values())
+
+    async def serve(count: int) -> None:
+        for request_number in range(count):
+            await list_requests[request_number % len(list_requests)]()
+
+    # Warm-up: statement and validation caches are filled by the first requests
+    await serve(len(list_requests) * 10)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        await serve(len(list_requests) * 100)
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(db_session().identity_map) == 0
+    assert retained < 64 * 1024
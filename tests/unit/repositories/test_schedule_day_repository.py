@@ -0,0 +1,205 @@
+import datetime
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.apps.registry.domain.schedule_days import ScheduleDayRow
+from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas import (
+    UpdateScheduleDaySchema,
+)
+from src.apps.registry.infrastructure.db_models.models import ScheduleDay
+from src.apps.registry.infrastructure.repositories.schedule_day_repostiory import (
+    ScheduleDayRepositoryImpl,
+)
+from src.shared.exceptions import NoInstanceFoundError
+from tests.fixtures import assert_num_queries, loader_strategies
+
+
+@pytest.fixture
+def schedule_day_repository(mock_async_db_session, dummy_logger):
+    return ScheduleDayRepositoryImpl(mock_async_db_session, dummy_logger)
+
+
+@pytest.mark.asyncio
+async def test_get_availability_fetches_period_with_single_query(
+    mock_async_db_session, schedule_day_repository
+):
+    schedule_id, day_id, doctor_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    day_row = (
+        schedule_id,
+        day_id,
+        doctor_id,
+        datetime.date(2025, 7, 7),
+        datetime.time(9, 0),
+        datetime.time(17, 0),
+        datetime.time(12, 0),
+        datetime.time(13, 0),
+        30,
+    )
+    result_mock = MagicMock()
+    result_mock.all.return_value = [
+        (*day_row, [datetime.time(9, 0), datetime.time(10, 0)]),
+        # A day without appointments: the filtered array_agg is NULL
+        (*day_row, None),
+    ]
+    mock_async_db_session.execute.return_value = result_mock
+
+    with assert_num_queries(1, mock_async_db_session):
+        days = await schedule_day_repository.get_availability(
+            date_from=datetime.date(2025, 7, 7),
+            date_to=datetime.date(2025, 7, 13),
+            doctor_id=doctor_id,
+        )
+
+    sql = str(
+        mock_async_db_session.execute.await_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert "LEFT OUTER JOIN appointments" in sql
+    assert "appointments.status != " in sql
+    assert "schedule_days.date BETWEEN" in sql
+    assert days[0].schedule_day_id == day_id
+    assert days[0].booked_times == (datetime.time(9, 0), datetime.time(10, 0))
+    assert days[1].booked_times == ()
+
+
+@pytest.mark.asyncio
+async def test_get_availability_applies_doctor_filters_of_schedules(
+    mock_async_db_session, schedule_day_repository
+):
+    mock_async_db_session.execute.return_value = MagicMock(
+        all=MagicMock(return_value=[])
+    )
+
+    await schedule_day_repository.get_availability(
+        date_from=datetime.date(2025, 7, 7),
+        date_to=datetime.date(2025, 7, 20),
+        schedule_filters={
+            "serviced_area_number_filter": 12,
+            "doctor_specializations_filter": ["Кардиолог"],
+        },
+    )
+
+    sql = str(
+        mock_async_db_session.execute.await_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert "JOIN doctor_areas ON" in sql
+    assert "doctor_specializations.name_key LIKE" in sql
+    assert "JOIN users" not in sql
+
+
+@pytest.mark.asyncio
+async def test_add_many_inserts_days_as_multi_row_statement(
+    mock_async_db_session, schedule_day_repository
+):
+    schedule_id = uuid.uuid4()
+    days = [
+        ScheduleDayRow(
+            schedule_id=schedule_id,
+            date=datetime.date(2025, 7, 1) + datetime.timedelta(days=offset),
+            day_of_week=offset % 7 + 1,
+            is_active=True,
+            work_start_time=datetime.time(9, 0),
+            work_end_time=datetime.time(17, 0),
+            break_start_time=None,
+            break_end_time=None,
+        )
+        for offset in range(365)
+    ]
+    mock_async_db_session.execute.return_value = MagicMock(
+        all=MagicMock(return_value=[(uuid.uuid4(),)] * 365)
+    )
+
+    with assert_num_queries(1, mock_async_db_session):
+        inserted = await schedule_day_repository.add_many(days)
+
+    statement, parameters = mock_async_db_session.execute.await_args.args
+    assert "RETURNING schedule_days.id" in str(
+        statement.compile(dialect=postgresql.dialect())
+    )
+    assert len(parameters) == inserted == 365
+    assert parameters[0]["date"] == datetime.date(2025, 7, 1)
+
+
+@pytest.mark.asyncio
+async def test_add_many_without_days_makes_no_queries(
+    mock_async_db_session, schedule_day_repository
+):
+    with assert_num_queries(0, mock_async_db_session):
+        assert await schedule_day_repository.add_many([]) == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_many_by_ids_is_single_delete(
+    mock_async_db_session, schedule_day_repository
+):
+    mock_async_db_session.execute.return_value = MagicMock(rowcount=20)
+
+    with assert_num_queries(1, mock_async_db_session):
+        deleted = await schedule_day_repository.delete_many_by_ids(
+            [uuid.uuid4() for _ in range(20)]
+        )
+
+    assert deleted == 20
+    assert str(
+        mock_async_db_session.execute.await_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+    ).startswith("DELETE FROM schedule_days WHERE schedule_days.id IN")
+
+
+@pytest.mark.asyncio
+async def test_update_is_single_update_returning(
+    mock_async_db_session, schedule_day_repository
+):
+    day = ScheduleDay(
+        id=uuid.uuid4(),
+        schedule_id=uuid.uuid4(),
+        day_of_week=1,
+        is_active=False,
+        work_start_time=datetime.time(9, 0),
+        work_end_time=datetime.time(13, 0),
+        date=datetime.date(2025, 7, 7),
+    )
+    mock_async_db_session.execute.return_value = MagicMock(
+        scalar_one_or_none=MagicMock(return_value=day)
+    )
+
+    with assert_num_queries(1, mock_async_db_session):
+        result = await schedule_day_repository.update(
+            day.id,
+            UpdateScheduleDaySchema(
+                is_active=False,
+                work_start_time=datetime.time(9, 0),
+                work_end_time=datetime.time(13, 0),
+            ),
+        )
+
+    assert result.id == day.id
+    query = mock_async_db_session.execute.await_args.args[0]
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    # Nothing is loaded after the UPDATE: the relationships of the entity raise
+    assert loader_strategies(query) == {"*": "raise"}
+    assert sql.startswith("UPDATE schedule_days SET")
+    assert " RETURNING " in sql
+    assert query.compile().params["work_end_time"] == datetime.time(13, 0)
+
+
+@pytest.mark.asyncio
+async def test_delete_missing_day_raises(mock_async_db_session, schedule_day_repository):
+    mock_async_db_session.execute.return_value = MagicMock(
+        scalar_one_or_none=MagicMock(return_value=None)
+    )
+
+    with assert_num_queries(1, mock_async_db_session):
+        with pytest.raises(NoInstanceFoundError):
+            await schedule_day_repository.delete_by_id(uuid.uuid4())
+
+    assert str(mock_async_db_session.execute.await_args.args[0]).startswith(
+        "DELETE FROM schedule_days"
+    )
@@ -0,0 +1,175 @@
+import datetime
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.apps.registry.domain.models.schedule import ScheduleDomain
+from src.apps.registry.infrastructure.db_models.models import Schedule
+from src.apps.registry.infrastructure.repositories.schedule_repository import (
+    ScheduleRepositoryImpl,
+)
+from tests.fixtures import assert_num_queries, loader_strategies
+
+
+@pytest.fixture
+def schedule_repository(mock_async_db_session, dummy_logger):
+    return ScheduleRepositoryImpl(mock_async_db_session, dummy_logger)
+
+
+def make_schedule(doctor_id: uuid.UUID) -> ScheduleDomain:
+    return ScheduleDomain(
+        doctor_id=doctor_id,
+        schedule_name="Primary",
+        period_start=datetime.date(2025, 7, 1),
+        period_end=datetime.date(2025, 7, 31),
+        is_active=False,
+        appointment_interval=20,
+    )
+
+
+@pytest.mark.asyncio
+async def test_add_many_inserts_all_schedules_with_one_statement(
+    mock_async_db_session, schedule_repository
+):
+    doctor_ids = [uuid.uuid4() for _ in range(3)]
+    created = [
+        Schedule(
+            id=uuid.uuid4(),
+            doctor_id=doctor_id,
+            schedule_name="Primary",
+            period_start=datetime.date(2025, 7, 1),
+            period_end=datetime.date(2025, 7, 31),
+            is_active=False,
+            appointment_interval=20,
+        )
+        for doctor_id in doctor_ids
+    ]
+    mock_async_db_session.scalars = AsyncMock(
+        return_value=MagicMock(all=MagicMock(return_value=created))
+    )
+
+    with assert_num_queries(1, mock_async_db_session):
+        schedules = await schedule_repository.add_many(
+            [make_schedule(doctor_id) for doctor_id in doctor_ids]
+        )
+
+    statement, parameters = mock_async_db_session.scalars.await_args.args
+    assert "RETURNING" in str(statement.compile(dialect=postgresql.dialect()))
+    assert [row["doctor_id"] for row in parameters] == doctor_ids
+    assert all(row["is_active"] is False for row in parameters)
+    assert [schedule.id for schedule in schedules] == [item.id for item in created]
+
+
+@pytest.mark.asyncio
+async def test_add_many_without_schedules_makes_no_queries(
+    mock_async_db_session, schedule_repository
+):
+    with assert_num_queries(0, mock_async_db_session):
+        assert await schedule_repository.add_many([]) == []
+
+
+@pytest.mark.asyncio
+async def test_get_doctor_ids_with_schedule_name_checks_all_doctors_at_once(
+    mock_async_db_session, schedule_repository
+):
+    doctor_id = uuid.uuid4()
+    result_mock = MagicMock()
+    result_mock.scalars.return_value.all.return_value = [doctor_id]
+    mock_async_db_session.execute.return_value = result_mock
+
+    doctor_ids = await schedule_repository.get_doctor_ids_with_schedule_name(
+        [doctor_id, uuid.uuid4()], "Primary"
+    )
+
+    assert doctor_ids == {doctor_id}
+    sql = str(
+        mock_async_db_session.execute.await_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert "schedules.doctor_id IN" in sql
+    assert "schedules.schedule_name =" in sql
+
+
+@pytest.mark.asyncio
+async def test_get_schedules_filters_doctors_through_doctor_directory(
+    mock_async_db_session, schedule_repository
+):
+    mock_async_db_session.execute.return_value = MagicMock()
+
+    await schedule_repository.get_schedules(
+        {
+            "serviced_area_number_filter": 7,
+            "doctor_specializations_filter": [" Терапевт ", "Хирург"],
+            "served_payment_type_filter": "OSMS",
+        }
+    )
+
+    sql = str(
+        mock_async_db_session.execute.await_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert "JOIN doctor_areas ON" in sql
+    assert "doctor_areas.area_number =" in sql
+    assert "schedules.doctor_id IN (SELECT doctor_specializations.doctor_id" in sql
+    assert sql.count("doctor_specializations.name_key LIKE") == 2
+    assert "JOIN doctor_served_types AS" in sql
+    # No per-row unnesting or casting of the users JSONB columns
+    assert "attachment_data ->>" not in sql
+    assert "jsonb_array_elements" not in sql
+
+
+@pytest.mark.asyncio
+async def test_update_is_single_update_returning(
+    mock_async_db_session, schedule_repository
+):
+    schedule = make_schedule(uuid.uuid4())
+    schedule.id = uuid.uuid4()
+    updated = Schedule(
+        id=schedule.id,
+        doctor_id=schedule.doctor_id,
+        schedule_name=schedule.schedule_name,
+        period_start=schedule.period_start,
+        period_end=schedule.period_end,
+        is_active=schedule.is_active,
+        appointment_interval=schedule.appointment_interval,
+    )
+    mock_async_db_session.execute.return_value = MagicMock(
+        scalar_one_or_none=MagicMock(return_value=updated)
+    )
+
+    with assert_num_queries(1, mock_async_db_session):
+        result = await schedule_repository.update(schedule)
+
+    assert result.id == schedule.id
+    sql = str(
+        mock_async_db_session.execute.await_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert sql.startswith("UPDATE schedules SET")
+    assert " RETURNING " in sql
+    # Nothing is loaded after the UPDATE: the relationships of the entity raise
+    assert loader_strategies(mock_async_db_session.execute.await_args.args[0]) == {
+        "*": "raise"
+    }
+
+
+@pytest.mark.asyncio
+async def test_delete_is_single_delete_returning_without_commit(
+    mock_async_db_session, schedule_repository
+):
+    mock_async_db_session.execute.return_value = MagicMock(
+        scalar_one_or_none=MagicMock(return_value=uuid.uuid4())
+    )
+
+    with assert_num_queries(1, mock_async_db_session):
+        await schedule_repository.delete(uuid.uuid4())
+
+    sql = str(mock_async_db_session.execute.await_args.args[0])
+    assert sql.startswith("DELETE FROM schedules")
+    assert "RETURNING schedules.id" in sql
+    mock_async_db_session.commit.assert_not_awaited()
@@ -0,0 +1,298 @@
+import datetime
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.apps.assets_journal.domain.models.stationary_asset import (
+    StationaryAssetDomain,
+    StationaryAssetListItemDomain,
+)
+from src.apps.assets_journal.infrastructure.repositories.stationary_asset_repository import (
+    StationaryAssetRepositoryImpl,
+)
+from src.shared.infrastructure.base import READ_ONLY_YIELD_PER
+from tests.fixtures import StreamedRows, assert_num_queries, loader_strategies, streamed_query
+
+
+@pytest.fixture
+def stationary_asset_repository(mock_async_db_session, dummy_logger):
+    return StationaryAssetRepositoryImpl(mock_async_db_session, dummy_logger)
+
+
+def make_asset(bg_asset_id: str) -> StationaryAssetDomain:
+    moment = datetime.datetime(2025, 1, 10, 9, 30)
+
+    return StationaryAssetDomain(
+        bg_asset_id=bg_asset_id,
+        organization_id=1,
+        patient_id=uuid4(),
+        receive_date=moment,
+        receive_time=moment.time(),
+        actual_datetime=moment,
+        received_from="",
+        is_repeat=False,
+        stay_period_start=moment,
+        diagnosis="Пневмония",
+        area="Общий",
+        specialization="",
+        specialist="Иванов И.И.",
+    )
+
+
+@pytest.mark.asyncio
+async def test_insert_bg_assets_skips_existing_with_on_conflict(
+        mock_async_db_session,
+        stationary_asset_repository
+):
+    result_mock = MagicMock()
+    result_mock.scalars.return_value.all.return_value = ["2"]
+    mock_async_db_session.execute.return_value = result_mock
+
+    with assert_num_queries(1, mock_async_db_session):
+        inserted = await stationary_asset_repository.insert_bg_assets(
+            [make_asset("1"), make_asset("2")]
+        )
+
+    assert inserted == ["2"]
+    query, rows = mock_async_db_session.execute.await_args.args
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (bg_asset_id) DO NOTHING" in sql
+    assert "RETURNING stationary_assets.bg_asset_id" in sql
+    assert [row["bg_asset_id"] for row in rows] == ["1", "2"]
+    # No query for an empty chunk
+    assert await stationary_asset_repository.insert_bg_assets([]) == []
+
+
+BREAKDOWNS = ("by_organization", "by_specialization", "by_area", "by_month")
+
+
+def statistics_row(grouping: str = None, key=None, total: int = 0, confirmed: int = 0):
+    row = {
+        f"{name}_grouping": 0 if name == grouping else 1
+        for name in BREAKDOWNS
+    }
+    row.update({f"{name}_key": None for name in BREAKDOWNS})
+    if grouping:
+        row[f"{grouping}_key"] = key
+    row.update(
+        total_assets=total,
+        confirmed_assets=confirmed,
+        refused_assets=0,
+        pending_assets=total - confirmed,
+        assets_with_files=0,
+    )
+
+    return row
+
+
+@pytest.mark.asyncio
+async def test_get_statistics_computes_counters_and_breakdowns_in_one_query(
+        mock_async_db_session,
+        stationary_asset_repository
+):
+    result_mock = MagicMock()
+    result_mock.mappings.return_value.all.return_value = [
+        statistics_row("by_organization", 1, total=1),
+        statistics_row("by_organization", 2, total=3, confirmed=1),
+        statistics_row("by_month", datetime.datetime(2025, 2, 1), total=1),
+        statistics_row("by_month", datetime.datetime(2025, 1, 1), total=3, confirmed=1),
+        statistics_row(total=4, confirmed=1),
+    ]
+    mock_async_db_session.execute.return_value = result_mock
+
+    with assert_num_queries(1, mock_async_db_session):
+        statistics = await stationary_asset_repository.get_statistics(
+            {"area": "Общий"}
+        )
+
+    sql = str(
+        mock_async_db_session.execute.await_args.args[0].compile(
+            dialect=postgresql.dialect()
+        )
+    )
+    assert "FILTER (WHERE stationary_assets.has_confirm IS true)" in sql
+    assert "GROUP BY GROUPING SETS((), (stationary_assets.organization_id)" in sql
+    assert (statistics.total_assets, statistics.pending_assets) == (4, 3)
+    # Largest groups first, months in chronological order
+    assert [group.key for group in statistics.by_organization] == [2, 1]
+    assert [group.key for group in statistics.by_month] == ["2025-01", "2025-02"]
+    assert statistics.by_area == []
+
+
+@pytest.mark.asyncio
+async def test_count_and_page_apply_the_same_join_free_filters(
+        mock_async_db_session,
+        stationary_asset_repository
+):
+    mock_async_db_session.execute.return_value = MagicMock()
+    filters = {
+        "patient_search": "  Иванов  ИВАН ",
+        "patient_iin": "040806501543",
+        "specialist": "Петров",
+        "stay_outcome": "Выписан",
+    }
+
+    await stationary_asset_repository.get_total_count(filters)
+    await stationary_asset_repository.get_assets(filters)
+
+    count_sql, page_sql = (
+        str(
+            query.compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+        )
+        for query in (
+            mock_async_db_session.execute.await_args.args[0],
+            streamed_query(mock_async_db_session),
+        )
+    )
+    for sql in (count_sql, page_sql):
+        assert "patients.search_name LIKE '%%иванов иван%%'" in sql
+        assert "stationary_assets.specialist ILIKE '%%Петров%%'" in sql
+        assert "stationary_assets.stay_outcome ILIKE '%%Выписан%%'" in sql
+        assert "lower(" not in sql
+
+    # Patients are joined only to load them into the page
+    assert " JOIN patients" not in count_sql
+    assert page_sql.count(" JOIN patients") == 1
+
+
+def make_asset_row(**joined) -> MagicMock:
+    asset = make_asset("BG-1")
+    columns = {
+        name: getattr(asset, name)
+        for name in (
+            "card_number",
+            "organization_id",
+            "patient_id",
+            "diagnosis",
+            "specialization",
+            "specialist",
+            "area",
+            "status",
+            "delivery_status",
+            "receive_date",
+            "receive_time",
+            "created_at",
+        )
+    }
+    columns.update(id=uuid4(), changed_at=None)
+    columns.update(
+        dict.fromkeys(
+            (
+                "organization_name",
+                "patient_ref_id",
+                "patient_iin",
+                "patient_first_name",
+                "patient_last_name",
+                "patient_middle_name",
+                "patient_date_of_birth",
+            )
+        )
+    )
+    columns.update(joined)
+
+    return MagicMock(**columns)
+
+
+@pytest.mark.asyncio
+async def test_get_assets_streams_only_list_item_columns(
+    mock_async_db_session, stationary_asset_repository
+):
+    with_relations = make_asset_row(
+        organization_name="Городская больница",
+        patient_ref_id=uuid4(),
+        patient_iin="040806501543",
+        patient_first_name="Иван",
+        patient_last_name="Иванов",
+    )
+    without_relations = make_asset_row()
+    mock_async_db_session.stream.return_value = StreamedRows(
+        [with_relations, without_relations]
+    )
+
+    with assert_num_queries(1, mock_async_db_session):
+        assets = await stationary_asset_repository.get_assets({})
+
+    query = streamed_query(mock_async_db_session)
+    assert query.get_execution_options()["yield_per"] == READ_ONLY_YIELD_PER
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    # Только колонки элемента списка - без ORM-сущностей и неиспользуемых колонок
+    assert "LEFT OUTER JOIN cat_medical_organizations" in sql
+    assert "patients.iin AS patient_iin" in sql
+    assert "stationary_assets.note" not in sql
+    assert "cat_medical_organizations.code" not in sql
+    assert "financing" not in sql
+
+    assert all(isinstance(asset, StationaryAssetListItemDomain) for asset in assets)
+    assert assets[0].id == with_relations.id
+    assert assets[0].organization_name == "Городская больница"
+    assert assets[0].patient_full_name == "Иванов Иван"
+    assert assets[0].patient_iin == "040806501543"
+    assert assets[0].diagnosis_name == with_relations.diagnosis
+    assert assets[1].organization_name is None
+    assert assets[1].patient_full_name is None
+
+
+@pytest.mark.asyncio
+async def test_update_is_single_update_returning_with_relations(
+    mock_async_db_session, stationary_asset_repository
+):
+    asset = make_asset("BG-1")
+    asset.id = uuid4()
+    asset.note = "Переведен"
+    db_asset = MagicMock(id=asset.id, patient=None, organization=None)
+    mock_async_db_session.execute.return_value = MagicMock(
+        scalar_one_or_none=MagicMock(return_value=db_asset)
+    )
+
+    with assert_num_queries(1, mock_async_db_session):
+        await stationary_asset_repository.update(asset)
+
+    query = mock_async_db_session.execute.await_args.args[0]
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE stationary_assets SET")
+    assert " RETURNING " in sql
+    params = query.compile().params
+    assert params["note"] == "Переведен"
+    assert "created_at" not in params
+    # Связи догружаются selectin-запросами, а не JOIN в RETURNING: UPDATE и
+    # два SELECT пациента и организации, без их собственных связей
+    assert "JOIN" not in sql
+    assert loader_strategies(query) == {
+        "*": "raise",
+        "patient": "selectin",
+        "patient.*": "raise",
+        "organization": "selectin",
+        "organization.*": "raise",
+    }
+
+
+@pytest.mark.asyncio
+async def test_update_without_changes_writes_nothing(
+    mock_async_db_session, stationary_asset_repository
+):
+    asset = make_asset("BG-1")
+
+    with assert_num_queries(0, mock_async_db_session):
+        result = await stationary_asset_repository.update(asset)
+
+    assert result is asset
+
+
+@pytest.mark.asyncio
+async def test_delete_is_single_delete_returning(
+    mock_async_db_session, stationary_asset_repository
+):
+    mock_async_db_session.execute.return_value = MagicMock(
+        scalar_one_or_none=MagicMock(return_value=uuid4())
+    )
+
+    with assert_num_queries(1, mock_async_db_session):
+        await stationary_asset_repository.delete(uuid4())
+
+    assert str(mock_async_db_session.execute.await_args.args[0]).startswith(
+        "DELETE FROM stationary_assets"
+    )
@@ -3,10 +3,13 @@ import datetime
 import pytest
 from unittest.mock import MagicMock
 
-from src.apps.users.domain.models.user import UserDomain
+from sqlalchemy.dialects import postgresql
+
 from src.apps.users.infrastructure.repositories.user_repository import (
     SQLAlchemyUserRepository
 )
+from src.shared.exceptions import NoInstanceFoundError
+from tests.fixtures import assert_num_queries, loader_strategies
 
 
 @pytest.mark.asyncio
@@ -58,13 +61,14 @@ async def test_get_by_iin_found(mock_async_db_session, dummy_db_user, dummy_user
 
 
 @pytest.mark.asyncio
-async def test_create_calls_commit_and_refresh(dummy_logger, mock_async_db_session, dummy_user_domain, dummy_db_user):
+async def test_create_calls_flush_and_refresh(dummy_logger, mock_async_db_session, dummy_user_domain, dummy_db_user):
     repo = SQLAlchemyUserRepository(mock_async_db_session, dummy_logger)
 
     result = await repo.create(dummy_user_domain)
 
     mock_async_db_session.add.assert_called_once_with(dummy_db_user)
-    mock_async_db_session.commit.assert_awaited_once()
+    mock_async_db_session.flush.assert_awaited_once()
+    mock_async_db_session.commit.assert_not_awaited()
     mock_async_db_session.refresh.assert_awaited_once_with(dummy_db_user)
 
     assert result is dummy_user_domain
@@ -81,43 +85,55 @@ async def test_update_modifies_fields_and_returns_domain(
     repo = SQLAlchemyUserRepository(mock_async_db_session, dummy_logger)
 
     fake_result = MagicMock()
-    fake_result.scalars.return_value.first.return_value = dummy_db_user
+    fake_result.scalar_one_or_none.return_value = dummy_db_user
     mock_async_db_session.execute.return_value = fake_result
 
-    new_domain = UserDomain(
-        id=dummy_user_domain.id,
-        first_name="Alice",
-        last_name="Wonderland",
-        middle_name="L",
-        iin="987654321098",
-        date_of_birth=datetime.date(1985, 5, 5),
-        client_roles=["editor"],
-        enabled=False,
-        served_patient_types=['adult', 'child'],
-        served_referral_types=['with_referral', 'without_referral'],
-        served_referral_origins=["from_external_organization", "self_registration"],
-        served_payment_types = ["GOBMP", "DMS", "OSMS", "paid"],
-        specializations=[
-            {
-                "name": "Therapist",
-                "id": str(uuid.uuid4())
-            }
-        ],
-        attachment_data=dummy_user_domain.attachment_data,
-    )
-
-    result = await repo.update(new_domain)
-
-    assert dummy_db_user.first_name == "Alice"
-    assert dummy_db_user.last_name == "Wonderland"
-    assert dummy_db_user.middle_name == "L"
-    assert dummy_db_user.iin == "987654321098"
-    assert dummy_db_user.date_of_birth == datetime.date(1985, 5, 5)
-    assert dummy_db_user.client_roles == ["editor"]
-    assert dummy_db_user.enabled is False
-
-    mock_async_db_session.commit.assert_awaited_once()
-    mock_async_db_session.refresh.assert_awaited_once_with(dummy_db_user)
+    dummy_user_domain.first_name = "Alice"
+    dummy_user_domain.last_name = "Wonderland"
+    dummy_user_domain.iin = "987654321098"
+    dummy_user_domain.date_of_birth = datetime.date(1985, 5, 5)
+    dummy_user_domain.enabled = False
+
+    with assert_num_queries(1, mock_async_db_session):
+        result = await repo.update(dummy_user_domain)
+
+    query = mock_async_db_session.execute.await_args.args[0]
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("UPDATE users SET")
+    assert "WHERE users.id = " in sql
+    assert " RETURNING " in sql
+    # Nothing is loaded after the UPDATE: the relationships of the entity raise
+    assert loader_strategies(query) == {"*": "raise"}
+    values = query.compile().params
+    assert values["first_name"] == "Alice"
+    assert values["last_name"] == "Wonderland"
+    assert values["full_name"].startswith("Wonderland Alice")
+    assert values["iin"] == "987654321098"
+    assert values["date_of_birth"] == datetime.date(1985, 5, 5)
+    assert values["enabled"] is False
+    # Unchanged columns are not written
+    assert "client_roles" not in values
+    assert "specializations" not in values
+
+    mock_async_db_session.commit.assert_not_awaited()
+    mock_async_db_session.refresh.assert_not_awaited()
+
+    assert result is dummy_user_domain
+
+
+@pytest.mark.asyncio
+async def test_update_without_changes_writes_nothing(
+        mock_async_db_session,
+        dummy_user_domain,
+        dummy_logger,
+):
+    repo = SQLAlchemyUserRepository(mock_async_db_session, dummy_logger)
+
+    # Setting the same value is not a change
+    dummy_user_domain.first_name = dummy_user_domain.first_name
+
+    with assert_num_queries(0, mock_async_db_session):
+        result = await repo.update(dummy_user_domain)
 
     assert result is dummy_user_domain
 
@@ -127,9 +143,77 @@ async def test_delete_calls_session_delete(dummy_logger, mock_async_db_session,
     repo = SQLAlchemyUserRepository(mock_async_db_session, dummy_logger)
 
     fake_result = MagicMock()
-    fake_result.scalars.return_value.first.return_value = dummy_db_user
+    fake_result.scalar_one_or_none.return_value = dummy_db_user.id
+    mock_async_db_session.execute.return_value = fake_result
+
+    with assert_num_queries(1, mock_async_db_session):
+        await repo.delete(dummy_db_user.id)
+
+    sql = str(mock_async_db_session.execute.await_args.args[0])
+    assert sql.startswith("DELETE FROM users")
+    assert "RETURNING users.id" in sql
+    mock_async_db_session.delete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_delete_missing_user_raises(dummy_logger, mock_async_db_session):
+    repo = SQLAlchemyUserRepository(mock_async_db_session, dummy_logger)
+    fake_result = MagicMock()
+    fake_result.scalar_one_or_none.return_value = None
     mock_async_db_session.execute.return_value = fake_result
 
-    await repo.delete(dummy_db_user.id)
+    with pytest.raises(NoInstanceFoundError):
+        await repo.delete(uuid.uuid4())
+
+    mock_async_db_session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_many_by_ids_uses_single_query(
+    mock_async_db_session, dummy_db_user, dummy_user_domain, dummy_logger
+):
+    repo = SQLAlchemyUserRepository(mock_async_db_session, dummy_logger)
+    fake_result = MagicMock()
+    fake_result.scalars.return_value.all.return_value = [dummy_db_user]
+    mock_async_db_session.execute.return_value = fake_result
+
+    with assert_num_queries(1, mock_async_db_session):
+        result = await repo.get_many_by_ids([dummy_db_user.id, uuid.uuid4()])
+
+    assert result == [dummy_user_domain]
+
+
+@pytest.mark.asyncio
+async def test_apply_batch_upserts_and_deletes_with_two_statements(
+    mock_async_db_session, dummy_user_domain, dummy_logger
+):
+    repo = SQLAlchemyUserRepository(mock_async_db_session, dummy_logger)
+    mock_async_db_session.execute.return_value = MagicMock()
+    deleted_id = uuid.uuid4()
+
+    with assert_num_queries(2, mock_async_db_session):
+        await repo.apply_batch([dummy_user_domain], [deleted_id])
+
+    upsert_call, delete_call = mock_async_db_session.execute.await_args_list
+    upsert_sql = str(upsert_call.args[0].compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (id) DO UPDATE" in upsert_sql
+    # Empty lists and a missing middle name keep the stored values
+    assert "coalesce(excluded.middle_name, users.middle_name)" in upsert_sql
+    assert "nullif(excluded.client_roles, '[]'::jsonb)" in upsert_sql
+    assert "attachment_data = " not in upsert_sql
+    assert [row["id"] for row in upsert_call.args[1]] == [dummy_user_domain.id]
+    assert "DELETE FROM users" in str(delete_call.args[0])
+    mock_async_db_session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_apply_batch_without_deletions_skips_delete(
+    mock_async_db_session, dummy_user_domain, dummy_logger
+):
+    repo = SQLAlchemyUserRepository(mock_async_db_session, dummy_logger)
+    mock_async_db_session.execute.return_value = MagicMock()
+
+    with assert_num_queries(1, mock_async_db_session):
+        await repo.apply_batch([dummy_user_domain], [])
 
-    mock_async_db_session.delete.assert_awaited_once_with(dummy_db_user)
+    mock_async_db_session.commit.assert_not_awaited()
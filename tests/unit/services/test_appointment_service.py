@@ -0,0 +1,270 @@
+import datetime
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.apps.registry.domain.exceptions import AppointmentSlotIsTakenError
+from src.apps.registry.exceptions import AppointmentOverlappingError
+from src.apps.registry.infrastructure.api.schemas.requests.appointment_schemas import (
+    CreateAppointmentSchema,
+)
+from src.apps.registry.infrastructure.api.schemas.requests.filters.appointment_filter_params import (
+    AppointmentFilterParams,
+)
+from src.shared.infrastructure.keyset_pagination import CursorPage
+from src.shared.schemas.pagination_schemas import PaginationParams
+from tests.fixtures import assert_num_queries
+
+
+def make_filter_params(**filters) -> AppointmentFilterParams:
+    params = {
+        "schedule_id": None,
+        "period_start": None,
+        "period_end": None,
+        "patient_full_name_filter": None,
+        "patient_iin_filter": None,
+        "doctor_id_filter": None,
+        "appointment_status_filter": None,
+        "attached_area_number_filter": None,
+        "doctor_specialization_filter": None,
+    }
+    params.update(filters)
+
+    return AppointmentFilterParams(**params)
+
+
+@pytest.fixture
+def mocked_page(mock_appointment_service_dependencies, dummy_appointments_page):
+    dependencies = mock_appointment_service_dependencies
+    page = dummy_appointments_page
+
+    dependencies["appointment_repository"].get_appointments.return_value = page["appointments"]
+    dependencies["appointment_repository"].get_total_number_of_appointments.return_value = 30
+    dependencies["patients_service"].get_many_by_ids.return_value = page["patients"]
+    dependencies["schedule_day_repository"].get_many_by_ids.return_value = page["schedule_days"]
+    dependencies["schedule_repository"].get_many_by_ids.return_value = page["schedules"]
+    dependencies["user_repository"].get_many_by_ids.return_value = page["doctors"]
+
+    return page
+
+
+@pytest.mark.asyncio
+async def test_get_appointments_query_count_is_constant_per_page(
+    appointment_service,
+    mock_appointment_service_dependencies,
+    mocked_page,
+):
+    # page + total + patients + schedule days + schedules + doctors
+    with assert_num_queries(6, *mock_appointment_service_dependencies.values()):
+        results, total = await appointment_service.get_appointments(
+            filter_params=make_filter_params(),
+            pagination_params=PaginationParams(limit=30, page=1),
+        )
+
+    assert total == 30
+    assert len(results) == 30
+    mock_appointment_service_dependencies["patients_service"].get_by_id.assert_not_awaited()
+    mock_appointment_service_dependencies["schedule_day_repository"].get_by_id.assert_not_awaited()
+    mock_appointment_service_dependencies["schedule_repository"].get_by_id.assert_not_awaited()
+    mock_appointment_service_dependencies["user_repository"].get_by_id.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_appointments_resolves_related_entities(
+    appointment_service,
+    mocked_page,
+):
+    results, _ = await appointment_service.get_appointments(
+        filter_params=make_filter_params(),
+        pagination_params=PaginationParams(limit=30, page=1),
+    )
+
+    appointment, patient, doctor, end_time, appointment_date = results[4]
+    schedule_day = mocked_page["schedule_days"][4 % 3]
+    schedule = mocked_page["schedules"][4 % 3]
+
+    assert appointment is mocked_page["appointments"][4]
+    assert patient is mocked_page["patients"][4]
+    assert doctor.id == schedule.doctor_id
+    assert appointment_date == schedule_day.date
+    assert end_time.minute == schedule.appointment_interval
+
+
+@pytest.mark.asyncio
+async def test_get_appointments_batches_unique_ids(
+    appointment_service,
+    mock_appointment_service_dependencies,
+    mocked_page,
+):
+    await appointment_service.get_appointments(
+        filter_params=make_filter_params(),
+        pagination_params=PaginationParams(limit=30, page=1),
+    )
+
+    (schedule_day_ids,), _ = mock_appointment_service_dependencies[
+        "schedule_day_repository"
+    ].get_many_by_ids.await_args
+    assert sorted(schedule_day_ids) == sorted(day.id for day in mocked_page["schedule_days"])
+
+
+@pytest.mark.asyncio
+async def test_get_appointments_counts_with_the_same_filters(
+    appointment_service,
+    mock_appointment_service_dependencies,
+    mocked_page,
+):
+    filter_params = make_filter_params(
+        patient_iin_filter="040806501543", attached_area_number_filter=3
+    )
+
+    await appointment_service.get_appointments(
+        filter_params=filter_params,
+        pagination_params=PaginationParams(limit=30, page=1),
+    )
+
+    expected_filters = {"patient_iin_filter": "040806501543", "attached_area_number_filter": 3}
+    repository = mock_appointment_service_dependencies["appointment_repository"]
+    repository.get_appointments.assert_awaited_once_with(filters=expected_filters, limit=30, page=1)
+    repository.get_total_number_of_appointments.assert_awaited_once_with(filters=expected_filters)
+
+
+@pytest.mark.asyncio
+async def test_get_appointments_by_cursor_keeps_cursors_and_query_count(
+    appointment_service,
+    mock_appointment_service_dependencies,
+    mocked_page,
+):
+    dependencies = mock_appointment_service_dependencies
+    dependencies["appointment_repository"].get_appointments_by_cursor.return_value = CursorPage(
+        items=mocked_page["appointments"], next_cursor="next", prev_cursor="prev"
+    )
+
+    # page + patients + schedule days + schedules + doctors, the total is not counted
+    with assert_num_queries(5, *dependencies.values()):
+        page, total = await appointment_service.get_appointments_by_cursor(
+            filter_params=make_filter_params(patient_iin_filter="040806501543"),
+            pagination_params=PaginationParams(limit=30, page=1, cursor="abc"),
+        )
+
+    assert total is None
+    dependencies["appointment_repository"].get_total_number_of_appointments.assert_not_awaited()
+    assert len(page.items) == 30
+    assert (page.next_cursor, page.prev_cursor) == ("next", "prev")
+    assert page.items[4][0] is mocked_page["appointments"][4]
+    dependencies["appointment_repository"].get_appointments_by_cursor.assert_awaited_once_with(
+        filters={"patient_iin_filter": "040806501543"}, limit=30, cursor="abc"
+    )
+    dependencies["appointment_repository"].get_appointments.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_get_appointments_by_cursor_counts_total_on_request(
+    appointment_service,
+    mock_appointment_service_dependencies,
+    mocked_page,
+):
+    dependencies = mock_appointment_service_dependencies
+    dependencies["appointment_repository"].get_appointments_by_cursor.return_value = CursorPage(
+        items=mocked_page["appointments"], next_cursor="next", prev_cursor=None
+    )
+
+    # page + total + patients + schedule days + schedules + doctors
+    with assert_num_queries(6, *dependencies.values()):
+        _, total = await appointment_service.get_appointments_by_cursor(
+            filter_params=make_filter_params(patient_iin_filter="040806501543"),
+            pagination_params=PaginationParams(
+                limit=30, page=1, cursor="abc", include_total=True
+            ),
+        )
+
+    assert total == 30
+    dependencies["appointment_repository"].get_total_number_of_appointments.assert_awaited_once_with(
+        filters={"patient_iin_filter": "040806501543"}
+    )
+
+
+def test_pagination_params_cursor_mode():
+    assert not PaginationParams(limit=30, page=1, cursor=None).is_cursor_mode
+    assert PaginationParams(limit=30, page=1, cursor="").is_cursor_mode
+
+
+@pytest.fixture
+def bookable_day(mock_appointment_service_dependencies):
+    dependencies = mock_appointment_service_dependencies
+    schedule_day = MagicMock(
+        id=uuid.uuid4(),
+        date=datetime.date(2025, 7, 7),
+        is_active=True,
+        work_start_time=datetime.time(9, 0),
+        work_end_time=datetime.time(17, 0),
+        break_start_time=None,
+        break_end_time=None,
+    )
+    dependencies["schedule_day_repository"].get_by_id.return_value = schedule_day
+    dependencies["schedule_repository"].get_schedule_by_day_id = AsyncMock(
+        return_value=MagicMock(is_active=True, appointment_interval=20)
+    )
+    dependencies["user_service"].get_by_id.return_value = MagicMock(
+        served_patient_types=["adult"],
+        served_referral_types=["with_referral"],
+        served_referral_origins=["from_external_organization"],
+        served_payment_types=["OSMS"],
+    )
+    dependencies["appointment_repository"].get_appointments_by_day_id = AsyncMock()
+
+    uow = dependencies["uow"]
+    uow.__aexit__.return_value = False
+    uow.appointment_repository.add = AsyncMock(
+        side_effect=lambda appointment: appointment
+    )
+
+    return schedule_day
+
+
+def make_create_schema() -> CreateAppointmentSchema:
+    return CreateAppointmentSchema(
+        time=datetime.time(10, 0),
+        type="consultation",
+        insurance_type="OSMS",
+        patient_type="adult",
+        referral_type="with_referral",
+        referral_origin="from_external_organization",
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_appointment_leaves_overlap_check_to_database(
+    appointment_service, mock_appointment_service_dependencies, bookable_day
+):
+    appointment, _, _, end_time, _ = await appointment_service.create_appointment(
+        bookable_day.id, make_create_schema()
+    )
+
+    assert (appointment.time, appointment.end_time, end_time) == (
+        datetime.time(10, 0),
+        datetime.time(10, 20),
+        datetime.time(10, 20),
+    )
+    # The appointments of the day are no longer fetched to be checked in Python
+    mock_appointment_service_dependencies[
+        "appointment_repository"
+    ].get_appointments_by_day_id.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_create_appointment_translates_taken_slot_into_conflict(
+    appointment_service, mock_appointment_service_dependencies, bookable_day
+):
+    mock_appointment_service_dependencies[
+        "uow"
+    ].appointment_repository.add.side_effect = AppointmentSlotIsTakenError(
+        detail="Overlapping"
+    )
+
+    with pytest.raises(AppointmentOverlappingError) as exc:
+        await appointment_service.create_appointment(
+            bookable_day.id, make_create_schema()
+        )
+
+    assert exc.value.status_code == 409
@@ -0,0 +1,135 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.apps.catalogs.infrastructure.api.schemas.responses.nationalities_catalog_response_schemas import (
+    NationalityCatalogFullResponseSchema,
+)
+from src.apps.catalogs.infrastructure.catalog_cache import CatalogCache, CatalogName
+from src.shared.exceptions import NoInstanceFoundError
+
+NOW = datetime.now(timezone.utc)
+
+
+def make_nationality(nationality_id: int, name: str = "N"):
+    return NationalityCatalogFullResponseSchema.model_construct(
+        id=nationality_id,
+        name=name,
+        lang="ru",
+        name_locales={"en": f"{name} (en)"},
+        created_at=NOW,
+        changed_at=NOW,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_is_served_from_cache(
+    nationalities_catalog_service,
+    nationalities_catalog_repository,
+):
+    nationalities_catalog_repository.get_by_id.return_value = make_nationality(7)
+
+    first = await nationalities_catalog_service.get_by_id(7)
+    second = await nationalities_catalog_service.get_by_id(7)
+
+    assert first is second
+    nationalities_catalog_repository.get_by_id.assert_awaited_once_with(7)
+
+
+@pytest.mark.asyncio
+async def test_missing_records_are_not_cached():
+    cache = CatalogCache()
+    loader = AsyncMock(return_value=None)
+
+    assert await cache.get(CatalogName.NATIONALITIES, 1, loader) is None
+    assert await cache.get(CatalogName.NATIONALITIES, 1, loader) is None
+
+    assert loader.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_delete_invalidates_cached_record(
+    nationalities_catalog_service,
+    nationalities_catalog_repository,
+):
+    nationalities_catalog_repository.get_by_id.return_value = make_nationality(9)
+    nationalities_catalog_repository.delete_by_id = AsyncMock()
+    await nationalities_catalog_service.get_by_id(9)
+
+    await nationalities_catalog_service.delete_by_id(9)
+    nationalities_catalog_repository.get_by_id.return_value = None
+
+    with pytest.raises(NoInstanceFoundError):
+        await nationalities_catalog_service.get_by_id(9)
+
+
+@pytest.mark.asyncio
+async def test_load_started_before_invalidation_is_not_stored():
+    cache = CatalogCache()
+
+    async def load_with_concurrent_update(item_id):
+        cache.invalidate(CatalogName.CITIZENSHIP, item_id)
+        return make_nationality(item_id, "Old")
+
+    await cache.get(CatalogName.CITIZENSHIP, 1, load_with_concurrent_update)
+
+    assert cache.stats()["citizenship"]["size"] == 0
+    assert cache.version(CatalogName.CITIZENSHIP) == 1
+
+
+@pytest.mark.asyncio
+async def test_localized_schemas_are_built_once_per_locale():
+    cache = CatalogCache()
+    await cache.preload(
+        CatalogName.NATIONALITIES, AsyncMock(return_value=[make_nationality(1)])
+    )
+    builder = lambda: make_nationality(1, "Localized")  # noqa: E731
+
+    first = cache.get_localized(CatalogName.NATIONALITIES, 1, "en", builder)
+    second = cache.get_localized(CatalogName.NATIONALITIES, 1, "en", builder)
+    other_locale = cache.get_localized(CatalogName.NATIONALITIES, 1, "kk", builder)
+
+    assert first is second
+    assert other_locale is not first
+
+    cache.invalidate(CatalogName.NATIONALITIES, 1)
+    assert cache.stats()["nationalities"]["localized_size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_preload_fills_cache_and_reports_stats(
+    nationalities_catalog_service,
+    nationalities_catalog_repository,
+):
+    nationalities_catalog_repository.get_nationalities.return_value = [
+        make_nationality(1),
+        make_nationality(2),
+    ]
+
+    assert await nationalities_catalog_service.preload_cache() == 2
+    await nationalities_catalog_service.get_by_id(1)
+    await nationalities_catalog_service.get_by_id(2)
+
+    nationalities_catalog_repository.get_by_id.assert_not_awaited()
+    stats = nationalities_catalog_service._catalog_cache.stats()["nationalities"]
+    assert stats["size"] == 2
+    assert stats["hits"] == 2
+    assert stats["misses"] == 0
+    assert stats["hit_ratio"] == 1.0
+    assert stats["memory_bytes"] > 0
+
+
+@pytest.mark.asyncio
+async def test_expired_catalog_is_reloaded():
+    cache = CatalogCache(ttl_seconds=300)
+    loader = AsyncMock(return_value=make_nationality(1))
+    path = "src.apps.catalogs.infrastructure.catalog_cache.time.monotonic"
+
+    with patch(path, return_value=100.0):
+        await cache.get(CatalogName.NATIONALITIES, 1, loader)
+        await cache.get(CatalogName.NATIONALITIES, 1, loader)
+    with patch(path, return_value=401.0):
+        await cache.get(CatalogName.NATIONALITIES, 1, loader)
+
+    assert loader.await_count == 2
@@ -0,0 +1,203 @@
+import datetime
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.apps.registry.domain.free_slots import (
+    FreeSlot,
+    ScheduleDayAvailability,
+    find_earliest_free_slots,
+    get_free_slots,
+)
+from src.apps.registry.exceptions import InvalidFreeSlotsPeriodError
+from src.apps.registry.infrastructure.api.schemas.requests.filters.free_slots_filter_params import (
+    EarliestFreeSlotsFilterParams,
+)
+from src.apps.registry.services.free_slots_service import FreeSlotsService
+
+
+def make_day(
+    booked_times=(),
+    work_start_time=datetime.time(9, 0),
+    work_end_time=datetime.time(11, 0),
+    break_start_time=None,
+    break_end_time=None,
+    appointment_interval=30,
+    day_date=datetime.date(2025, 7, 7),
+) -> ScheduleDayAvailability:
+    return ScheduleDayAvailability(
+        schedule_id=uuid.uuid4(),
+        schedule_day_id=uuid.uuid4(),
+        doctor_id=uuid.uuid4(),
+        date=day_date,
+        work_start_time=work_start_time,
+        work_end_time=work_end_time,
+        break_start_time=break_start_time,
+        break_end_time=break_end_time,
+        appointment_interval=appointment_interval,
+        booked_times=tuple(booked_times),
+    )
+
+
+def slot_starts(slots):
+    return [slot.start_time.strftime("%H:%M") for slot in slots]
+
+
+def test_free_slots_cover_working_hours_with_appointment_interval():
+    slots = get_free_slots(make_day(work_end_time=datetime.time(10, 45)))
+
+    # 10:30-11:00 doesn't fit into the working day
+    assert slot_starts(slots) == ["09:00", "09:30", "10:00"]
+    assert slots[0] == FreeSlot(datetime.time(9, 0), datetime.time(9, 30))
+
+
+def test_free_slots_skip_break_and_booked_appointments():
+    day = make_day(
+        booked_times=[datetime.time(9, 30)],
+        work_end_time=datetime.time(13, 0),
+        break_start_time=datetime.time(11, 0),
+        break_end_time=datetime.time(12, 0),
+    )
+
+    assert slot_starts(get_free_slots(day)) == [
+        "09:00",
+        "10:00",
+        "10:30",
+        "12:00",
+        "12:30",
+    ]
+
+
+def test_free_slots_continue_after_appointment_booked_off_the_grid():
+    day = make_day(booked_times=[datetime.time(9, 10)])
+
+    assert slot_starts(get_free_slots(day)) == ["09:40", "10:10"]
+
+
+def test_no_free_slots_for_zero_appointment_interval():
+    assert get_free_slots(make_day(appointment_interval=0)) == []
+
+
+def test_earliest_free_slots_are_merged_across_doctors_by_time():
+    early_doctor = make_day(booked_times=[datetime.time(9, 30)])
+    late_doctor = make_day(work_start_time=datetime.time(9, 15))
+    next_day = make_day(day_date=datetime.date(2025, 7, 8))
+
+    found = find_earliest_free_slots([early_doctor, late_doctor, next_day], limit=4)
+
+    assert [
+        (day.schedule_day_id, slot.start_time.strftime("%H:%M"))
+        for day, slot in found
+    ] == [
+        (early_doctor.schedule_day_id, "09:00"),
+        (late_doctor.schedule_day_id, "09:15"),
+        (late_doctor.schedule_day_id, "09:45"),
+        (early_doctor.schedule_day_id, "10:00"),
+    ]
+
+
+def test_earliest_free_slots_skip_past_slots_and_move_to_next_day():
+    today = make_day(work_end_time=datetime.time(10, 0))
+    tomorrow = make_day(day_date=datetime.date(2025, 7, 8))
+
+    found = find_earliest_free_slots(
+        [make_day(day_date=datetime.date(2025, 7, 6)), today, tomorrow],
+        limit=3,
+        not_before=datetime.datetime(2025, 7, 7, 9, 10),
+    )
+
+    assert [(day.date.day, slot.start_time.strftime("%H:%M")) for day, slot in found] == [
+        (7, "09:30"),
+        (8, "09:00"),
+        (8, "09:30"),
+    ]
+
+
+@pytest.fixture
+def mock_free_slots_schedule_day_repository():
+    return MagicMock(get_availability=AsyncMock(return_value=[]))
+
+
+@pytest.fixture
+def free_slots_service(mock_free_slots_schedule_day_repository, dummy_logger):
+    return FreeSlotsService(
+        logger=dummy_logger,
+        schedule_day_repository=mock_free_slots_schedule_day_repository,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_free_slots_uses_one_range_query_for_the_period(
+    free_slots_service, mock_free_slots_schedule_day_repository
+):
+    fully_booked_day = make_day(
+        booked_times=[datetime.time(9, 0), datetime.time(10, 0)],
+        appointment_interval=60,
+    )
+    mock_free_slots_schedule_day_repository.get_availability.return_value = [
+        make_day(),
+        fully_booked_day,
+    ]
+    doctor_id = uuid.uuid4()
+
+    days = await free_slots_service.get_free_slots(
+        date_from=datetime.date(2025, 7, 7),
+        date_to=datetime.date(2025, 7, 13),
+        doctor_id=doctor_id,
+    )
+
+    mock_free_slots_schedule_day_repository.get_availability.assert_awaited_once_with(
+        date_from=datetime.date(2025, 7, 7),
+        date_to=datetime.date(2025, 7, 13),
+        schedule_id=None,
+        doctor_id=doctor_id,
+    )
+    assert [len(day.free_slots) for day in days] == [4, 0]
+    assert days[1].schedule_day_id == fully_booked_day.schedule_day_id
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "date_from, date_to",
+    [
+        (datetime.date(2025, 7, 7), datetime.date(2025, 7, 6)),
+        (datetime.date(2025, 7, 1), datetime.date(2025, 8, 1)),
+    ],
+)
+async def test_get_free_slots_rejects_invalid_period(
+    free_slots_service, mock_free_slots_schedule_day_repository, date_from, date_to
+):
+    with pytest.raises(InvalidFreeSlotsPeriodError) as exc:
+        await free_slots_service.get_free_slots(date_from=date_from, date_to=date_to)
+
+    assert exc.value.status_code == 400
+    mock_free_slots_schedule_day_repository.get_availability.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_find_earliest_free_slots_passes_doctor_filters_to_range_query(
+    free_slots_service, mock_free_slots_schedule_day_repository
+):
+    tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+    day = make_day(day_date=tomorrow)
+    mock_free_slots_schedule_day_repository.get_availability.return_value = [day]
+
+    slots = await free_slots_service.find_earliest_free_slots(
+        filter_params=EarliestFreeSlotsFilterParams(
+            serviced_area_number_filter=12,
+            doctor_specializations_filter=None,
+        ),
+        limit=2,
+    )
+
+    mock_free_slots_schedule_day_repository.get_availability.assert_awaited_once_with(
+        date_from=datetime.date.today(),
+        date_to=datetime.date.today() + datetime.timedelta(days=13),
+        schedule_filters={"serviced_area_number_filter": 12},
+    )
+    assert [(slot.doctor_id, slot.date) for slot in slots] == [
+        (day.doctor_id, tomorrow),
+        (day.doctor_id, tomorrow),
+    ]
+    assert slot_starts(slots) == ["09:00", "09:30"]
@@ -126,10 +126,6 @@ async def test_get_patients_returns_empty_and_total(patient_service, mock_patien
 @pytest.mark.asyncio
 async def test_create_patient_success(patient_service, mock_patient_repository, mock_uow, dummy_domain_patient):
     mock_patient_repository.get_by_iin.return_value = None
-    for svc in patient_service._citizenship_service, patient_service._nationalities_service, patient_service._medical_org_service:
-        svc.get_by_id.return_value = object()
-    for svc in patient_service._financing_source_service, patient_service._patient_context_attributes_service:
-        svc.get_by_id.return_value = object()
 
     created = object()
     mock_uow.patients_repository.create_patient.return_value = created
@@ -137,12 +133,34 @@ async def test_create_patient_success(patient_service, mock_patient_repository,
     result = await patient_service.create_patient(dummy_domain_patient)
 
     mock_patient_repository.get_by_iin.assert_awaited_once_with(dummy_domain_patient.iin)
-    patient_service._citizenship_service.get_by_id.assert_awaited_once_with(dummy_domain_patient.citizenship_id)
+    mock_patient_repository.get_missing_related_ids.assert_awaited_once()
+    related_ids = mock_patient_repository.get_missing_related_ids.await_args.args[0]
+    assert related_ids["citizenship_id"] == [dummy_domain_patient.citizenship_id]
+    assert related_ids["nationality_id"] == [dummy_domain_patient.nationality_id]
 
     mock_uow.patients_repository.create_patient.assert_awaited_once_with(dummy_domain_patient)
     assert result is created
 
 
+@pytest.mark.asyncio
+async def test_create_patient_reports_all_missing_related_entities(
+        patient_service, mock_patient_repository, mock_uow, dummy_domain_patient
+):
+    mock_patient_repository.get_by_iin.return_value = None
+    mock_patient_repository.get_missing_related_ids.return_value = {
+        "citizenship_id": [5],
+        "financing_sources_ids": [7, 8],
+    }
+
+    with pytest.raises(NoInstanceFoundError) as ei:
+        await patient_service.create_patient(dummy_domain_patient)
+
+    assert ei.value.status_code == 404
+    assert "citizenship_id: 5" in ei.value.detail
+    assert "financing_sources_ids: 7, 8" in ei.value.detail
+    mock_uow.patients_repository.create_patient.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_create_patient_duplicate_iin(patient_service, mock_patient_repository, dummy_domain_patient):
     mock_patient_repository.get_by_iin.return_value = dummy_domain_patient
@@ -173,18 +191,6 @@ async def test_update_patient_success(patient_service, mock_uow, dummy_domain_pa
         lambda dto, existing: updated
     )
 
-    for svc in (
-            patient_service._citizenship_service,
-            patient_service._nationalities_service,
-            patient_service._medical_org_service,
-    ):
-        svc.get_by_id.return_value = object()
-    for svc in (
-            patient_service._financing_source_service,
-            patient_service._patient_context_attributes_service,
-    ):
-        svc.get_by_id.return_value = object()
-
     mock_uow.patients_repository.update_patient.return_value = updated
 
     dto = UpdatePatientSchema(iin="999999999999")
@@ -0,0 +1,111 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.apps.patients.infrastructure.import_readers import ImportRow
+from src.apps.patients.services.patients_import_service import PatientsImportService
+
+
+def make_row(number: int, iin: str, **fields) -> ImportRow:
+    data = {
+        "iin": iin,
+        "first_name": "Иван",
+        "last_name": "Иванов",
+        "date_of_birth": "1985-07-14",
+        "citizenship_id": 1,
+        "nationality_id": 1,
+        "financing_sources_ids": [1],
+    }
+    data.update(fields)
+
+    return ImportRow(number, data)
+
+
+async def stream(*rows: ImportRow):
+    for row in rows:
+        yield row
+
+
+@pytest.fixture
+def import_uow(mock_uow):
+    mock_uow.patients_repository = MagicMock(
+        get_existing_iins=AsyncMock(return_value=set()),
+        get_missing_related_ids=AsyncMock(return_value={}),
+        copy_patients=AsyncMock(side_effect=lambda patients: len(patients)),
+    )
+
+    return mock_uow
+
+
+@pytest.fixture
+def import_service(import_uow, dummy_logger):
+    return PatientsImportService(uow=import_uow, logger=dummy_logger, chunk_size=2)
+
+
+@pytest.mark.asyncio
+async def test_import_writes_valid_rows_in_chunks(import_service, import_uow):
+    rows = [make_row(number, f"04080650154{number}") for number in range(1, 6)]
+
+    report = await import_service.import_patients(stream(*rows))
+
+    assert (report.total_rows, report.imported, report.failed) == (5, 5, 0)
+    assert report.errors == []
+    repository = import_uow.patients_repository
+    # 3 chunks, two set-based checks and one COPY per chunk
+    assert repository.get_existing_iins.await_count == 3
+    assert repository.get_missing_related_ids.await_count == 3
+    assert [
+        len(call.args[0]) for call in repository.copy_patients.await_args_list
+    ] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_import_reports_every_invalid_row(import_service, import_uow):
+    repository = import_uow.patients_repository
+    repository.get_existing_iins.return_value = {"040806501542"}
+    repository.get_missing_related_ids.return_value = {"financing_sources_ids": [9]}
+    rows = [
+        make_row(1, "040806501541"),
+        make_row(2, "040806501542"),
+        ImportRow(3, None, "Invalid JSON"),
+        make_row(4, "040806501541"),
+        make_row(5, "12345"),
+        make_row(6, "040806501546", financing_sources_ids=[1, 9]),
+    ]
+
+    report = await import_service.import_patients(stream(*rows))
+
+    assert (report.total_rows, report.imported, report.failed) == (6, 1, 5)
+    errors = {row_error.row: row_error for row_error in report.errors}
+    assert sorted(errors) == [2, 3, 4, 5, 6]
+    assert "already exists" in errors[2].errors[0]
+    assert errors[3].errors == ["Invalid JSON"]
+    assert "row 1" in errors[4].errors[0]
+    assert errors[5].errors[0].startswith("iin:")
+    assert errors[6].errors == [
+        "Related entities were not found: financing_sources_ids: 9."
+    ]
+    # Only one row of each chunk checked against the DB is valid
+    written = [
+        patient.iin
+        for call in repository.copy_patients.await_args_list
+        for patient in call.args[0]
+    ]
+    assert written == ["040806501541"]
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_is_reported_and_import_goes_on(
+    import_service, import_uow
+):
+    import_uow.patients_repository.copy_patients.side_effect = [
+        RuntimeError("unique violation"),
+        1,
+    ]
+    rows = [make_row(number, f"04080650154{number}") for number in range(1, 4)]
+
+    report = await import_service.import_patients(stream(*rows))
+
+    assert (report.imported, report.failed) == (1, 2)
+    assert [row_error.row for row_error in report.errors] == [1, 2]
+    assert report.errors[0].errors == ["Patient couldn't be saved: RuntimeError."]
@@ -0,0 +1,106 @@
+import datetime
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas import (
+    UpdateScheduleDaySchema,
+)
+from src.apps.registry.infrastructure.api.schemas.responses.schedule_day_schemas import (
+    ResponseScheduleDaySchema,
+)
+from src.apps.registry.services.schedule_day_service import ScheduleDayService
+
+
+@pytest.fixture
+def schedule_day():
+    return ResponseScheduleDaySchema(
+        id=uuid.uuid4(),
+        schedule_id=uuid.uuid4(),
+        day_of_week=1,
+        is_active=True,
+        work_start_time=datetime.time(9, 0),
+        work_end_time=datetime.time(18, 0),
+        date=datetime.date.today() + datetime.timedelta(days=1),
+    )
+
+
+@pytest.fixture
+def schedule_day_service_dependencies(schedule_day):
+    uow = MagicMock()
+    uow.__aexit__.return_value = False
+    uow.appointment_repository.cancel_booked_by_day_ids = AsyncMock(
+        return_value=[4, 5]
+    )
+    uow.schedule_day_repository.update = AsyncMock(
+        side_effect=lambda day_id, schema: schedule_day.model_copy(
+            update=schema.model_dump()
+        )
+    )
+    uow.schedule_day_repository.delete_by_id = AsyncMock()
+
+    return {
+        "uow": uow,
+        "logger": MagicMock(),
+        "schedule_day_repository": MagicMock(
+            get_by_id=AsyncMock(return_value=schedule_day)
+        ),
+        "appointment_repository": MagicMock(),
+    }
+
+
+@pytest.fixture
+def schedule_day_service(schedule_day_service_dependencies):
+    return ScheduleDayService(**schedule_day_service_dependencies)
+
+
+@pytest.mark.asyncio
+async def test_update_cancels_appointments_overlapping_new_break(
+    schedule_day_service, schedule_day_service_dependencies, schedule_day
+):
+    uow = schedule_day_service_dependencies["uow"]
+
+    updated_day = await schedule_day_service.update(
+        schedule_day.id,
+        UpdateScheduleDaySchema(
+            break_start_time=datetime.time(13, 0),
+            break_end_time=datetime.time(14, 0),
+        ),
+    )
+
+    assert updated_day.break_start_time == datetime.time(13, 0)
+    assert updated_day.cancelled_appointment_ids == [4, 5]
+    uow.appointment_repository.cancel_booked_by_day_ids.assert_awaited_once_with(
+        [schedule_day.id], time_range=(datetime.time(13, 0), datetime.time(14, 0))
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_without_break_or_deactivation_cancels_nothing(
+    schedule_day_service, schedule_day_service_dependencies, schedule_day
+):
+    uow = schedule_day_service_dependencies["uow"]
+
+    updated_day = await schedule_day_service.update(
+        schedule_day.id, UpdateScheduleDaySchema(work_end_time=datetime.time(17, 0))
+    )
+
+    assert updated_day.cancelled_appointment_ids == []
+    uow.appointment_repository.cancel_booked_by_day_ids.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_delete_cancels_booked_appointments_of_day(
+    schedule_day_service, schedule_day_service_dependencies, schedule_day
+):
+    uow = schedule_day_service_dependencies["uow"]
+
+    assert await schedule_day_service.delete(schedule_day.id) == [4, 5]
+
+    uow.appointment_repository.cancel_booked_by_day_ids.assert_awaited_once_with(
+        [schedule_day.id]
+    )
+    uow.schedule_day_repository.delete_by_id.assert_awaited_once_with(
+        schedule_day.id
+    )
@@ -0,0 +1,333 @@
+import datetime
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.apps.platform_rules.mappers import map_reduced_days_to_calendar
+from src.apps.registry.domain.exceptions import AppointmentIsOutOfWorkTimeError
+from src.apps.registry.domain.models.schedule import ScheduleDomain
+from src.apps.registry.exceptions import (
+    InvalidAppointmentTimeError,
+    NoInstanceFoundError,
+    ScheduleNameIsAlreadyTakenError,
+)
+from src.apps.registry.infrastructure.api.schemas.requests.schedule_day_schemas import (
+    ScheduleDayTemplateSchema,
+)
+from src.apps.registry.infrastructure.api.schemas.requests.schedule_schemas import (
+    BulkCreateSchedulesSchema,
+    CreateScheduleSchema,
+    UpdateScheduleSchema,
+)
+from src.apps.registry.infrastructure.api.schemas.responses.schedule_day_schemas import (
+    ResponseScheduleDaySchema,
+)
+from src.apps.registry.services.schedule_service import ScheduleService
+from tests.fixtures import assert_num_queries
+
+PERIOD_START = datetime.date.today() + datetime.timedelta(days=1)
+
+
+def make_template(days: int = 30) -> CreateScheduleSchema:
+    return CreateScheduleSchema(
+        schedule_name="Primary",
+        period_start=PERIOD_START,
+        period_end=PERIOD_START + datetime.timedelta(days=days - 1),
+        appointment_interval=20,
+        week_days_template=[
+            ScheduleDayTemplateSchema(
+                day_of_week=day_of_week,
+                is_active=True,
+                work_start_time=datetime.time(9, 0),
+                work_end_time=datetime.time(18, 0),
+            )
+            for day_of_week in range(1, 6)
+        ],
+    )
+
+
+@pytest.fixture
+def schedule_service_dependencies():
+    uow = MagicMock()
+    uow.__aexit__.return_value = False
+    uow.schedule_repository.add_many = AsyncMock(
+        side_effect=lambda schedules: [
+            ScheduleDomain(
+                id=uuid.uuid4(),
+                doctor_id=schedule.doctor_id,
+                schedule_name=schedule.schedule_name,
+                period_start=schedule.period_start,
+                period_end=schedule.period_end,
+                appointment_interval=schedule.appointment_interval,
+            )
+            for schedule in schedules
+        ]
+    )
+    uow.schedule_day_repository.add_many = AsyncMock(
+        side_effect=lambda days: len(days)
+    )
+
+    return {
+        "uow": uow,
+        "logger": MagicMock(),
+        "schedule_repository": MagicMock(
+            get_doctor_ids_with_schedule_name=AsyncMock(return_value=set())
+        ),
+        "appointment_repository": MagicMock(),
+        "schedule_day_repository": MagicMock(),
+        "schedule_day_service": MagicMock(),
+        "user_service": MagicMock(
+            get_many_by_ids=AsyncMock(
+                side_effect=lambda ids: [MagicMock(id=doctor_id) for doctor_id in ids]
+            )
+        ),
+        "platform_rules_repository": MagicMock(
+            get_by_key=AsyncMock(return_value=None),
+            get_reduced_days_calendar=AsyncMock(return_value={}),
+        ),
+    }
+
+
+@pytest.fixture
+def schedule_service(schedule_service_dependencies):
+    return ScheduleService(**schedule_service_dependencies)
+
+
+def test_generated_days_follow_week_template_and_reduced_days():
+    reduced_date = next(
+        PERIOD_START + datetime.timedelta(days=offset)
+        for offset in range(7)
+        if (PERIOD_START + datetime.timedelta(days=offset)).weekday() < 5
+    )
+    days = ScheduleService._generate_days_for_schedule(
+        None,
+        PERIOD_START,
+        PERIOD_START + datetime.timedelta(days=6),
+        make_template().week_days_template,
+        reduced_days=map_reduced_days_to_calendar(
+            {"days": [{"date": reduced_date.isoformat(), "work_end_time": "15:00"}]}
+        ),
+    )
+
+    assert [day.date for day in days] == [
+        PERIOD_START + datetime.timedelta(days=offset) for offset in range(7)
+    ]
+    assert all(day.schedule_id is None for day in days)
+    working_days = {day.date: day for day in days if day.day_of_week <= 5}
+    assert {day.work_start_time for day in working_days.values()} == {
+        datetime.time(9, 0)
+    }
+    assert working_days[reduced_date].work_end_time == datetime.time(15, 0)
+
+
+@pytest.mark.asyncio
+async def test_create_schedules_for_doctors_query_count_is_constant(
+    schedule_service, schedule_service_dependencies
+):
+    doctor_ids = [uuid.uuid4() for _ in range(50)]
+    uow = schedule_service_dependencies["uow"]
+    schedule_service_dependencies["platform_rules_repository"].get_by_key.return_value = (
+        MagicMock(rule_data={"value": 365})
+    )
+
+    with assert_num_queries(
+        6,
+        schedule_service_dependencies["user_service"],
+        schedule_service_dependencies["schedule_repository"],
+        schedule_service_dependencies["platform_rules_repository"],
+        uow.schedule_repository,
+        uow.schedule_day_repository,
+    ):
+        created = await schedule_service.create_schedules_for_doctors(
+            BulkCreateSchedulesSchema(
+                doctor_ids=doctor_ids + doctor_ids[:5], schedule=make_template(days=90)
+            )
+        )
+
+    assert [doctor.id for _, doctor in created] == doctor_ids
+    days = uow.schedule_day_repository.add_many.await_args.args[0]
+    assert len(days) == 50 * 90
+    assert {day.schedule_id for day in days} == {schedule.id for schedule, _ in created}
+
+
+@pytest.mark.asyncio
+async def test_create_schedules_for_doctors_rejects_unknown_doctors(
+    schedule_service, schedule_service_dependencies
+):
+    known_id, unknown_id = uuid.uuid4(), uuid.uuid4()
+    schedule_service_dependencies["user_service"].get_many_by_ids = AsyncMock(
+        return_value=[MagicMock(id=known_id)]
+    )
+
+    with pytest.raises(NoInstanceFoundError) as exc:
+        await schedule_service.create_schedules_for_doctors(
+            BulkCreateSchedulesSchema(
+                doctor_ids=[known_id, unknown_id], schedule=make_template()
+            )
+        )
+
+    assert exc.value.status_code == 404
+    assert str(unknown_id) in exc.value.detail
+    schedule_service_dependencies["uow"].schedule_repository.add_many.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_create_schedules_for_doctors_rejects_taken_schedule_name(
+    schedule_service, schedule_service_dependencies
+):
+    doctor_id = uuid.uuid4()
+    schedule_service_dependencies[
+        "schedule_repository"
+    ].get_doctor_ids_with_schedule_name.return_value = {doctor_id}
+
+    with pytest.raises(ScheduleNameIsAlreadyTakenError) as exc:
+        await schedule_service.create_schedules_for_doctors(
+            BulkCreateSchedulesSchema(doctor_ids=[doctor_id], schedule=make_template())
+        )
+
+    assert exc.value.status_code == 409
+
+
+@pytest.fixture
+def existing_schedule(schedule_service_dependencies):
+    """
+    An active 30-day schedule, whose days start at a different time
+    on each day of the week.
+    """
+    schedule = ScheduleDomain(
+        id=uuid.uuid4(),
+        doctor_id=uuid.uuid4(),
+        schedule_name="Primary",
+        period_start=PERIOD_START,
+        period_end=PERIOD_START + datetime.timedelta(days=29),
+        appointment_interval=20,
+    )
+    days = [
+        ResponseScheduleDaySchema(
+            id=uuid.uuid4(),
+            schedule_id=schedule.id,
+            day_of_week=day_date.isoweekday(),
+            is_active=True,
+            work_start_time=datetime.time(day_date.isoweekday(), 0),
+            work_end_time=datetime.time(18, 0),
+            date=day_date,
+        )
+        for day_date in (
+            PERIOD_START + datetime.timedelta(days=offset) for offset in range(30)
+        )
+    ]
+    schedule_service_dependencies["schedule_repository"].get_by_id = AsyncMock(
+        return_value=schedule
+    )
+    schedule_service_dependencies["schedule_day_repository"].get_all_by_schedule_id = (
+        AsyncMock(return_value=days)
+    )
+    schedule_service_dependencies["user_service"].get_by_id = AsyncMock()
+
+    uow = schedule_service_dependencies["uow"]
+    uow.schedule_repository.update = AsyncMock(side_effect=lambda schedule: schedule)
+    uow.schedule_repository.delete = AsyncMock()
+    uow.schedule_day_repository.delete_many_by_ids = AsyncMock()
+    uow.appointment_repository.cancel_booked_by_day_ids = AsyncMock(
+        return_value=[1, 2]
+    )
+    uow.appointment_repository.cancel_booked_by_schedule_id = AsyncMock(
+        return_value=[1, 2, 3]
+    )
+
+    return schedule, days
+
+
+@pytest.mark.asyncio
+async def test_update_schedule_moves_period_with_set_based_statements(
+    schedule_service, schedule_service_dependencies, existing_schedule
+):
+    schedule, days = existing_schedule
+    uow = schedule_service_dependencies["uow"]
+
+    with assert_num_queries(
+        4,
+        uow.appointment_repository,
+        uow.schedule_repository,
+        uow.schedule_day_repository,
+    ):
+        _, _, cancelled_ids = await schedule_service.update_schedule(
+            schedule.id,
+            UpdateScheduleSchema(
+                period_start=PERIOD_START + datetime.timedelta(days=5),
+                period_end=PERIOD_START + datetime.timedelta(days=34),
+            ),
+        )
+
+    assert cancelled_ids == [1, 2]
+    deleted_ids = [day.id for day in days[:5]]
+    uow.appointment_repository.cancel_booked_by_day_ids.assert_awaited_once_with(
+        deleted_ids
+    )
+    uow.schedule_day_repository.delete_many_by_ids.assert_awaited_once_with(
+        deleted_ids
+    )
+    # New days follow the existing days of the same day of the week
+    added_days = uow.schedule_day_repository.add_many.await_args.args[0]
+    assert [day.date for day in added_days] == [
+        PERIOD_START + datetime.timedelta(days=offset) for offset in range(30, 35)
+    ]
+    assert all(
+        day.work_start_time == datetime.time(day.day_of_week, 0) for day in added_days
+    )
+
+
+@pytest.mark.asyncio
+async def test_update_schedule_deactivation_cancels_appointments_of_schedule(
+    schedule_service, schedule_service_dependencies, existing_schedule
+):
+    schedule, _ = existing_schedule
+    uow = schedule_service_dependencies["uow"]
+
+    _, _, cancelled_ids = await schedule_service.update_schedule(
+        schedule.id, UpdateScheduleSchema(is_active=False)
+    )
+
+    assert cancelled_ids == [1, 2, 3]
+    uow.appointment_repository.cancel_booked_by_schedule_id.assert_awaited_once_with(
+        schedule.id
+    )
+    uow.appointment_repository.cancel_booked_by_day_ids.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_schedule_rejects_interval_running_past_working_hours(
+    schedule_service, schedule_service_dependencies, existing_schedule
+):
+    schedule, _ = existing_schedule
+    uow = schedule_service_dependencies["uow"]
+    uow.appointment_repository.update_end_times_by_schedule_id = AsyncMock(
+        side_effect=AppointmentIsOutOfWorkTimeError(detail="Out of work time")
+    )
+
+    with pytest.raises(InvalidAppointmentTimeError) as exc:
+        await schedule_service.update_schedule(
+            schedule.id, UpdateScheduleSchema(appointment_interval=30)
+        )
+
+    assert exc.value.status_code == 409
+    uow.appointment_repository.update_end_times_by_schedule_id.assert_awaited_once_with(
+        schedule.id, 30
+    )
+
+
+@pytest.mark.asyncio
+async def test_delete_cancels_appointments_and_deletes_schedule_once(
+    schedule_service, schedule_service_dependencies, existing_schedule
+):
+    schedule, _ = existing_schedule
+    uow = schedule_service_dependencies["uow"]
+    uow.schedule_repository.get_by_id = AsyncMock(return_value=schedule)
+
+    assert await schedule_service.delete(schedule.id) == [1, 2, 3]
+
+    uow.appointment_repository.cancel_booked_by_schedule_id.assert_awaited_once_with(
+        schedule.id
+    )
+    uow.schedule_repository.delete.assert_awaited_once_with(schedule.id)
@@ -0,0 +1,111 @@
+import json
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.apps.assets_journal.services.stationary_asset_service import (
+    StationaryAssetService,
+)
+
+
+def make_bg_item(bg_asset_id, iin):
+    return {
+        "id": bg_asset_id,
+        "orgId": 1,
+        "regDate": "2025-01-10T09:30:00",
+        "hospitalDate": "2025-01-09T20:00:00",
+        "patient": {"personin": iin},
+        "sick": {"name": "Пневмония"},
+        "directDoctor": "Иванов И.И.",
+    }
+
+
+@pytest.fixture
+def bg_uow(mock_uow):
+    mock_uow.stationary_asset_repository = MagicMock(
+        insert_bg_assets=AsyncMock(
+            side_effect=lambda assets: [asset.bg_asset_id for asset in assets]
+        ),
+    )
+
+    return mock_uow
+
+
+@pytest.fixture
+def bg_patients_service():
+    return MagicMock(get_ids_by_iins=AsyncMock(return_value={}))
+
+
+@pytest.fixture
+def bg_service(bg_uow, bg_patients_service, dummy_logger):
+    return StationaryAssetService(
+        uow=bg_uow,
+        stationary_asset_repository=bg_uow.stationary_asset_repository,
+        patients_service=bg_patients_service,
+        logger=dummy_logger,
+        bg_chunk_size=2,
+    )
+
+
+@pytest.mark.asyncio
+async def test_load_assets_from_bg_file_resolves_chunks_with_set_based_queries(
+    tmp_path, bg_service, bg_uow, bg_patients_service
+):
+    patient_id = uuid4()
+    bg_patients_service.get_ids_by_iins.return_value = {"040806501543": patient_id}
+    path = tmp_path / "bg.json"
+    path.write_text(
+        json.dumps(
+            [
+                make_bg_item("1", "040806501543"),
+                make_bg_item("2", "040806501543"),
+                make_bg_item("3", "040806501544"),
+                make_bg_item("4", None),
+                make_bg_item("5", "040806501543"),
+            ]
+        )
+    )
+
+    report = await bg_service.load_assets_from_bg_file(str(path))
+
+    assert report.total_rows == 5
+    assert report.inserted == 3
+    assert report.unmatched_patients == 1
+    assert report.invalid_rows == 1
+    assert report.rows_per_second > 0
+    # 3 chunks, one patient lookup per chunk
+    assert [
+        call.args[0] for call in bg_patients_service.get_ids_by_iins.await_args_list
+    ] == [{"040806501543"}, {"040806501544"}, {"040806501543"}]
+    inserted = [
+        [(asset.bg_asset_id, asset.patient_id) for asset in call.args[0]]
+        for call in bg_uow.stationary_asset_repository.insert_bg_assets.await_args_list
+    ]
+    assert inserted == [[("1", patient_id), ("2", patient_id)], [("5", patient_id)]]
+
+
+@pytest.mark.asyncio
+async def test_load_assets_from_bg_file_counts_already_loaded_assets(
+    tmp_path, bg_service, bg_uow, bg_patients_service
+):
+    bg_patients_service.get_ids_by_iins.return_value = {"040806501543": uuid4()}
+    # ON CONFLICT DO NOTHING returns only the newly inserted rows
+    bg_uow.stationary_asset_repository.insert_bg_assets.side_effect = [["2"]]
+    path = tmp_path / "bg.json"
+    path.write_text(
+        json.dumps([make_bg_item("1", "040806501543"), make_bg_item("2", "040806501543")])
+    )
+
+    report = await bg_service.load_assets_from_bg_file(str(path))
+
+    assert (report.inserted, report.skipped_existing) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_load_assets_from_bg_file_reports_malformed_file(tmp_path, bg_service):
+    path = tmp_path / "bg.json"
+    path.write_text('{"id": "1"}')
+
+    with pytest.raises(ValueError, match="Ошибка в формате файла данных BG"):
+        await bg_service.load_assets_from_bg_file(str(path))
@@ -7,14 +7,19 @@ from unittest.mock import AsyncMock
 from src.apps.users.domain.enums import ActionsOnUserEnum
 from src.apps.users.domain.models.user import UserDomain
 from src.apps.users.infrastructure.schemas.user_schemas import UserSchema
+from src.apps.users.mappers import map_user_schema_to_domain
+from src.apps.users.services import user_service as user_service_module
+from src.apps.users.infrastructure.repositories.doctor_directory_repository import SQLAlchemyDoctorDirectoryRepository
+from src.apps.users.infrastructure.repositories.user_repository import SQLAlchemyUserRepository
 from src.apps.users.services.user_service import UserService
+from src.apps.users.uow import UsersUnitOfWorkImpl
 from src.shared.exceptions import InvalidActionTypeError, NoInstanceFoundError, InstanceAlreadyExistsError
 
 
 @pytest.mark.asyncio
-async def test_get_by_id_success(dummy_user_repo, dummy_user_id, dummy_user_domain, dummy_logger):
+async def test_get_by_id_success(dummy_user_repo, dummy_doctor_directory_repo, dummy_users_uow, dummy_user_id, dummy_user_domain, dummy_logger):
     dummy_user_repo.get_by_id.return_value = dummy_user_domain
-    service = UserService(dummy_user_repo, dummy_logger)
+    service = UserService(dummy_users_uow, dummy_user_repo, dummy_logger)
 
     result = await service.get_by_id(dummy_user_id)
 
@@ -23,9 +28,9 @@ async def test_get_by_id_success(dummy_user_repo, dummy_user_id, dummy_user_doma
 
 
 @pytest.mark.asyncio
-async def test_get_by_id_not_found_raises(dummy_user_repo, dummy_user_id, dummy_logger):
+async def test_get_by_id_not_found_raises(dummy_user_repo, dummy_doctor_directory_repo, dummy_users_uow, dummy_user_id, dummy_logger):
     dummy_user_repo.get_by_id.return_value = None
-    service = UserService(dummy_user_repo, dummy_logger)
+    service = UserService(dummy_users_uow, dummy_user_repo, dummy_logger)
 
     with pytest.raises(NoInstanceFoundError) as exc:
         await service.get_by_id(dummy_user_id)
@@ -36,7 +41,7 @@ async def test_get_by_id_not_found_raises(dummy_user_repo, dummy_user_id, dummy_
 
 
 @pytest.mark.asyncio
-async def test_create_user_success(dummy_user_repo, dummy_user_domain, dummy_logger):
+async def test_create_user_success(dummy_user_repo, dummy_doctor_directory_repo, dummy_users_uow, dummy_user_domain, dummy_logger):
     dummy_user_repo.get_by_id.return_value = None
     dummy_user_repo.get_by_iin.return_value = None
     dummy_user_repo.create.return_value = dummy_user_domain
@@ -57,19 +62,21 @@ async def test_create_user_success(dummy_user_repo, dummy_user_domain, dummy_log
         specializations=dummy_user_domain.specializations,
         attachment_data=dummy_user_domain.attachment_data,
     )
-    service = UserService(dummy_user_repo, dummy_logger)
+    service = UserService(dummy_users_uow, dummy_user_repo, dummy_logger)
 
     result = await service.create(dto)
 
     dummy_user_repo.get_by_id.assert_awaited_once_with(dto.id)
     dummy_user_repo.get_by_iin.assert_awaited_once_with(dto.iin)
     dummy_user_repo.create.assert_awaited_once_with(dummy_user_domain)
-    
+    dummy_doctor_directory_repo.refresh.assert_awaited_once_with([dummy_user_domain.id])
+    dummy_users_uow.commit.assert_awaited_once()
+
     assert result is dummy_user_domain
 
 
 @pytest.mark.asyncio
-async def test_create_user_duplicate_id_raises(dummy_user_repo, dummy_user_domain, dummy_logger):
+async def test_create_user_duplicate_id_raises(dummy_user_repo, dummy_doctor_directory_repo, dummy_users_uow, dummy_user_domain, dummy_logger):
     dummy_user_repo.get_by_id.return_value = dummy_user_domain
     dto = UserSchema(
         id=dummy_user_domain.id,
@@ -87,7 +94,7 @@ async def test_create_user_duplicate_id_raises(dummy_user_repo, dummy_user_domai
         specializations=dummy_user_domain.specializations,
         attachment_data=dummy_user_domain.attachment_data,
     )
-    service = UserService(dummy_user_repo, dummy_logger)
+    service = UserService(dummy_users_uow, dummy_user_repo, dummy_logger)
 
     with pytest.raises(InstanceAlreadyExistsError) as exc:
         await service.create(dto)
@@ -98,7 +105,7 @@ async def test_create_user_duplicate_id_raises(dummy_user_repo, dummy_user_domai
 
 
 @pytest.mark.asyncio
-async def test_create_user_duplicate_iin_raises(dummy_user_repo, dummy_user_domain, dummy_logger):
+async def test_create_user_duplicate_iin_raises(dummy_user_repo, dummy_doctor_directory_repo, dummy_users_uow, dummy_user_domain, dummy_logger):
     dummy_user_repo.get_by_id.return_value = None
     dummy_user_repo.get_by_iin.return_value = dummy_user_domain
     other_id = uuid.uuid4()
@@ -118,7 +125,7 @@ async def test_create_user_duplicate_iin_raises(dummy_user_repo, dummy_user_doma
         specializations=dummy_user_domain.specializations,
         attachment_data=dummy_user_domain.attachment_data,
     )
-    service = UserService(dummy_user_repo, dummy_logger)
+    service = UserService(dummy_users_uow, dummy_user_repo, dummy_logger)
 
     with pytest.raises(InstanceAlreadyExistsError) as exc:
         await service.create(dto)
@@ -129,7 +136,7 @@ async def test_create_user_duplicate_iin_raises(dummy_user_repo, dummy_user_doma
 
 
 @pytest.mark.asyncio
-async def test_update_user_not_found_raises(dummy_user_repo, dummy_user_id, dummy_logger, dummy_user_domain):
+async def test_update_user_not_found_raises(dummy_user_repo, dummy_doctor_directory_repo, dummy_users_uow, dummy_user_id, dummy_logger, dummy_user_domain):
     dummy_user_repo.get_by_id.return_value = None
     dto = UserSchema(
         id=dummy_user_id,
@@ -147,14 +154,14 @@ async def test_update_user_not_found_raises(dummy_user_repo, dummy_user_id, dumm
         specializations=dummy_user_domain.specializations,
         attachment_data=dummy_user_domain.attachment_data,
     )
-    service = UserService(dummy_user_repo, dummy_logger)
+    service = UserService(dummy_users_uow, dummy_user_repo, dummy_logger)
 
     with pytest.raises(NoInstanceFoundError):
         await service.update_user(dto)
 
 
 @pytest.mark.asyncio
-async def test_update_user_success(dummy_user_repo, dummy_user_domain, dummy_logger):
+async def test_update_user_success(dummy_user_repo, dummy_doctor_directory_repo, dummy_users_uow, dummy_user_domain, dummy_logger):
     dummy_user_repo.get_by_id.return_value = dummy_user_domain
     updated = UserDomain(**{**dummy_user_domain.__dict__, "first_name": "Alice"})
     dummy_user_repo.update.return_value = updated
@@ -175,7 +182,7 @@ async def test_update_user_success(dummy_user_repo, dummy_user_domain, dummy_log
         specializations=dummy_user_domain.specializations,
         attachment_data=dummy_user_domain.attachment_data,
     )
-    service = UserService(dummy_user_repo, dummy_logger)
+    service = UserService(dummy_users_uow, dummy_user_repo, dummy_logger)
 
     result = await service.update_user(dto)
 
@@ -185,21 +192,22 @@ async def test_update_user_success(dummy_user_repo, dummy_user_domain, dummy_log
     assert sent_domain.first_name == "Alice"
     assert sent_domain.last_name == dummy_user_domain.last_name
     assert result is updated
+    dummy_doctor_directory_repo.refresh.assert_awaited_once_with([updated.id])
 
 
 @pytest.mark.asyncio
-async def test_delete_user_not_found_raises(dummy_user_repo, dummy_user_id, dummy_logger):
+async def test_delete_user_not_found_raises(dummy_user_repo, dummy_doctor_directory_repo, dummy_users_uow, dummy_user_id, dummy_logger):
     dummy_user_repo.get_by_id.return_value = None
-    service = UserService(dummy_user_repo, dummy_logger)
+    service = UserService(dummy_users_uow, dummy_user_repo, dummy_logger)
 
     with pytest.raises(NoInstanceFoundError):
         await service.delete_user(dummy_user_id)
 
 
 @pytest.mark.asyncio
-async def test_delete_user_success(dummy_user_repo, dummy_user_domain, dummy_logger):
+async def test_delete_user_success(dummy_user_repo, dummy_doctor_directory_repo, dummy_users_uow, dummy_user_domain, dummy_logger):
     dummy_user_repo.get_by_id.return_value = dummy_user_domain
-    service = UserService(dummy_user_repo, dummy_logger)
+    service = UserService(dummy_users_uow, dummy_user_repo, dummy_logger)
 
     await service.delete_user(dummy_user_domain.id)
 
@@ -208,8 +216,8 @@ async def test_delete_user_success(dummy_user_repo, dummy_user_domain, dummy_log
 
 
 @pytest.mark.asyncio
-async def test_handle_event_create_calls_create(dummy_user_repo, dummy_user_domain, dummy_logger):
-    service = UserService(dummy_user_repo, dummy_logger)
+async def test_handle_event_create_calls_create(dummy_user_repo, dummy_doctor_directory_repo, dummy_users_uow, dummy_user_domain, dummy_logger):
+    service = UserService(dummy_users_uow, dummy_user_repo, dummy_logger)
     dto = UserSchema(
         id=dummy_user_domain.id,
         first_name=dummy_user_domain.first_name,
@@ -236,8 +244,8 @@ async def test_handle_event_create_calls_create(dummy_user_repo, dummy_user_doma
 
 
 @pytest.mark.asyncio
-async def test_handle_event_update_calls_update(dummy_user_repo, dummy_user_domain, dummy_logger):
-    service = UserService(dummy_user_repo, dummy_logger)
+async def test_handle_event_update_calls_update(dummy_user_repo, dummy_doctor_directory_repo, dummy_users_uow, dummy_user_domain, dummy_logger):
+    service = UserService(dummy_users_uow, dummy_user_repo, dummy_logger)
     dto = UserSchema(
         id=dummy_user_domain.id,
         first_name=dummy_user_domain.first_name,
@@ -264,8 +272,8 @@ async def test_handle_event_update_calls_update(dummy_user_repo, dummy_user_doma
 
 
 @pytest.mark.asyncio
-async def test_handle_event_delete_calls_delete(dummy_user_repo, dummy_user_domain, dummy_logger):
-    service = UserService(dummy_user_repo, dummy_logger)
+async def test_handle_event_delete_calls_delete(dummy_user_repo, dummy_doctor_directory_repo, dummy_users_uow, dummy_user_domain, dummy_logger):
+    service = UserService(dummy_users_uow, dummy_user_repo, dummy_logger)
     dto = UserSchema(
         id=dummy_user_domain.id,
         first_name=dummy_user_domain.first_name,
@@ -292,8 +300,8 @@ async def test_handle_event_delete_calls_delete(dummy_user_repo, dummy_user_doma
 
 
 @pytest.mark.asyncio
-async def test_handle_event_invalid_action_raises(dummy_user_repo, dummy_user_domain, dummy_logger):
-    service = UserService(dummy_user_repo, dummy_logger)
+async def test_handle_event_invalid_action_raises(dummy_user_repo, dummy_doctor_directory_repo, dummy_users_uow, dummy_user_domain, dummy_logger):
+    service = UserService(dummy_users_uow, dummy_user_repo, dummy_logger)
     dto = UserSchema(
         id=dummy_user_domain.id,
         first_name=dummy_user_domain.first_name,
@@ -315,4 +323,93 @@ async def test_handle_event_invalid_action_raises(dummy_user_repo, dummy_user_do
         await service.handle_event("unknown", dto)
 
     err = exc.value
-    assert err.status_code == 500
\ No newline at end of file
+    assert err.status_code == 500
+
+
+def _user_schema(user_id, first_name="John", iin="123456789012"):
+    return UserSchema(
+        id=user_id,
+        first_name=first_name,
+        last_name="Doe",
+        iin=iin,
+        date_of_birth=datetime.date(1990, 1, 1),
+        client_roles=["Doctor"],
+        enabled=True,
+        served_patient_types=[],
+        served_referral_types=[],
+        served_referral_origins=[],
+        served_payment_types=[],
+        specializations=[],
+    )
+
+
+@pytest.mark.asyncio
+async def test_handle_events_batch_applies_last_event_of_each_user(
+        dummy_user_repo, dummy_doctor_directory_repo, dummy_users_uow, dummy_logger, monkeypatch
+):
+    # The real mapper is needed to tell the coalesced events apart
+    monkeypatch.setattr(user_service_module, "map_user_schema_to_domain", map_user_schema_to_domain)
+    dummy_user_repo.apply_batch = AsyncMock()
+    service = UserService(dummy_users_uow, dummy_user_repo, dummy_logger)
+    updated_id, deleted_id = uuid.uuid4(), uuid.uuid4()
+
+    upserted, deleted = await service.handle_events_batch(
+        [
+            (ActionsOnUserEnum.CREATE, _user_schema(updated_id, first_name="Old")),
+            (ActionsOnUserEnum.CREATE, _user_schema(deleted_id, iin="000000000000")),
+            (ActionsOnUserEnum.UPDATE, _user_schema(updated_id, first_name="New")),
+            (ActionsOnUserEnum.DELETE, deleted_id),
+        ]
+    )
+
+    assert (upserted, deleted) == (1, 1)
+    upserted_users, deleted_user_ids = dummy_user_repo.apply_batch.await_args.args
+    assert [(user.id, user.first_name) for user in upserted_users] == [(updated_id, "New")]
+    assert deleted_user_ids == [deleted_id]
+    dummy_doctor_directory_repo.refresh.assert_awaited_once_with([updated_id])
+    dummy_user_repo.get_by_id.assert_not_awaited()
+    dummy_user_repo.get_by_iin.assert_not_awaited()
+    dummy_users_uow.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_handle_events_batch_rolls_back_users_when_directory_refresh_fails(
+        dummy_user_repo, dummy_doctor_directory_repo, dummy_users_uow, dummy_logger
+):
+    dummy_user_repo.apply_batch = AsyncMock()
+    dummy_doctor_directory_repo.refresh.side_effect = RuntimeError("directory is unavailable")
+    service = UserService(dummy_users_uow, dummy_user_repo, dummy_logger)
+
+    with pytest.raises(RuntimeError):
+        await service.handle_events_batch([(ActionsOnUserEnum.CREATE, _user_schema(uuid.uuid4()))])
+
+    dummy_user_repo.apply_batch.assert_awaited_once()
+    dummy_users_uow.rollback.assert_awaited_once()
+    dummy_users_uow.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_create_user_rolls_back_user_when_directory_refresh_fails(
+        mock_async_db_session, dummy_user_repo, dummy_logger, monkeypatch
+):
+    # The user is written and the directory is rebuilt on the same session,
+    # so a failed refresh must not leave the user committed without entries
+    monkeypatch.setattr(SQLAlchemyUserRepository, "get_by_id", AsyncMock(return_value=None))
+    monkeypatch.setattr(SQLAlchemyUserRepository, "get_by_iin", AsyncMock(return_value=None))
+    monkeypatch.setattr(
+        SQLAlchemyDoctorDirectoryRepository,
+        "refresh",
+        AsyncMock(side_effect=RuntimeError("directory is unavailable")),
+    )
+    mock_async_db_session.in_transaction.return_value = True
+    service = UserService(
+        UsersUnitOfWorkImpl(mock_async_db_session, dummy_logger), dummy_user_repo, dummy_logger
+    )
+
+    with pytest.raises(RuntimeError):
+        await service.create(_user_schema(uuid.uuid4()))
+
+    mock_async_db_session.add.assert_called_once()
+    mock_async_db_session.flush.assert_awaited_once()
+    mock_async_db_session.rollback.assert_awaited_once()
+    mock_async_db_session.commit.assert_not_awaited()